@@ -4,16 +4,22 @@ import com.google.gson.JsonArray;
 import com.google.gson.JsonElement;
 import com.google.gson.JsonNull;
 import com.google.gson.JsonObject;
+import com.google.gson.JsonPrimitive;
 import com.pyritone.bridge.command.PyritoneCommand;
 import com.pyritone.bridge.config.BridgeConfig;
 import com.pyritone.bridge.config.BridgeInfoWriter;
 import com.pyritone.bridge.config.TokenManager;
+import com.pyritone.bridge.net.EventFilter;
+import com.pyritone.bridge.net.LineBridgeServer;
 import com.pyritone.bridge.net.ProtocolCodec;
 import com.pyritone.bridge.net.WebSocketBridgeServer;
 import com.pyritone.bridge.runtime.BaritoneGateway;
 import com.pyritone.bridge.runtime.EntityTypeSelector;
+import com.pyritone.bridge.runtime.PathingActivityTracker;
 import com.pyritone.bridge.runtime.PlayerLifecycleTracker;
+import com.pyritone.bridge.runtime.RemoteReferenceTable;
 import com.pyritone.bridge.runtime.StatusSubscriptionRegistry;
+import com.pyritone.bridge.runtime.StatusStreamOptions;
 import com.pyritone.bridge.runtime.TaskRegistry;
 import com.pyritone.bridge.runtime.TaskLifecycleResolver;
 import com.pyritone.bridge.runtime.TaskSnapshot;
@@ -35,6 +41,9 @@ import net.minecraft.registry.Registries;
 import net.minecraft.text.MutableText;
 import net.minecraft.text.Text;
 import net.minecraft.util.Formatting;
+import net.minecraft.util.math.BlockPos;
+import net.minecraft.util.math.ChunkPos;
+import net.minecraft.util.math.Vec3d;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 
@@ -48,6 +57,7 @@ import java.time.Instant;
 import java.util.ArrayList;
 import java.util.Comparator;
 import java.util.HashMap;
+import java.util.HashSet;
 import java.util.List;
 import java.util.Locale;
 import java.util.Map;
@@ -61,6 +71,8 @@ import java.util.concurrent.Callable;
 
 public final class PyritoneBridgeClientMod implements ClientModInitializer {
     private static final Logger LOGGER = LoggerFactory.getLogger(BridgeConfig.MOD_ID);
+    private static final String CAPABILITY_PACKED_ARRAYS = "packed_arrays";
+    private static final String CAPABILITY_CBOR = "cbor";
     private static final Set<String> PAUSE_GATED_METHODS = Set.of(
         "status.get",
         "status.subscribe",
@@ -69,6 +81,9 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
         "api.metadata.get",
         "api.construct",
         "api.invoke",
+        "api.batch",
+        "api.pipeline",
+        "api.watch",
         "baritone.execute",
         "task.cancel"
     );
@@ -80,8 +95,12 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
     private final TaskLifecycleResolver taskLifecycleResolver = new TaskLifecycleResolver();
     private final WatchPatternRegistry watchPatternRegistry = new WatchPatternRegistry();
     private final StatusSubscriptionRegistry statusSubscriptionRegistry = new StatusSubscriptionRegistry();
-    private final TypedApiService typedApiService = new TypedApiService(PyritoneBridgeClientMod.class.getClassLoader());
+    private final TypedApiService typedApiService = new TypedApiService(
+        PyritoneBridgeClientMod.class.getClassLoader(),
+        new RemoteReferenceTable(BridgeConfig.MAX_REMOTE_REFERENCES_PER_SESSION, BridgeConfig.REMOTE_REFERENCE_TTL_MS)
+    );
     private final PlayerLifecycleTracker playerLifecycleTracker = new PlayerLifecycleTracker();
+    private final PathingActivityTracker pathingActivityTracker = new PathingActivityTracker();
     private boolean playerLifecycleInWorld;
     private boolean playerLifecycleSelfJoinEmitted;
     private PlayerLifecycleTracker.PlayerSnapshot lastKnownSelfPlayer;
@@ -94,6 +113,7 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
 
     private BaritoneGateway baritoneGateway;
     private WebSocketBridgeServer server;
+    private LineBridgeServer lineServer;
 
     @Override
     public void onInitializeClient() {
@@ -106,6 +126,7 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
         this.token = TokenManager.loadOrCreateToken(LOGGER);
         this.baritoneGateway = new BaritoneGateway(LOGGER, this::onPathEvent);
         this.typedApiService.registerRoot("baritone", "baritone.api.IBaritone", this::resolvePrimaryBaritone);
+        registerInlineValueCodecs();
         this.baritoneGateway.tickApplyPyritoneChatBranding();
 
         startBridgeServer();
@@ -120,7 +141,8 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
             baritoneGateway.tickApplyPyritoneChatBranding();
             tickPauseState(client);
             tickPlayerLifecycleEvents(client);
-            tickTaskLifecycle();
+            BaritoneGateway.ActivitySnapshot activity = tickPathingActivity();
+            tickTaskLifecycle(activity);
             tickStatusStreams();
         });
         ClientReceiveMessageEvents.CHAT.register(
@@ -212,13 +234,16 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
 
         try {
             this.server.start();
+            startLineServer();
             BridgeInfoWriter.write(
                 LOGGER,
                 BridgeConfig.DEFAULT_HOST,
                 this.server.getBoundPort(),
                 token,
                 BridgeConfig.PROTOCOL_VERSION,
-                serverVersion
+                serverVersion,
+                lineServer != null ? lineServer.getBoundPort() : 0,
+                lineServer != null ? lineServer.getUnixSocketPath() : null
             );
             LOGGER.info("Py-Ritone bridge started on {}:{}", BridgeConfig.DEFAULT_HOST, this.server.getBoundPort());
         } catch (Exception exception) {
@@ -226,6 +251,25 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
         }
     }
 
+    private void startLineServer() {
+        LineBridgeServer nextLineServer = new LineBridgeServer(
+            this.server,
+            BridgeConfig.DEFAULT_HOST,
+            BridgeConfig.DEFAULT_LINE_PORT,
+            BridgeConfig.lineSocketFile(),
+            LOGGER
+        );
+        try {
+            nextLineServer.start();
+            this.lineServer = nextLineServer;
+            LOGGER.info("Py-Ritone line bridge started on {}:{}", BridgeConfig.DEFAULT_HOST, nextLineServer.getBoundPort());
+        } catch (Exception exception) {
+            // WebSocket clients keep working; discovery simply does not advertise the line transport.
+            this.lineServer = null;
+            LOGGER.warn("Failed to start Py-Ritone line bridge on {}:{}", BridgeConfig.DEFAULT_HOST, BridgeConfig.DEFAULT_LINE_PORT, exception);
+        }
+    }
+
     private void shutdownBridgeServer() {
         clearPauseStateForShutdown();
         playerLifecycleTracker.reset();
@@ -234,6 +278,10 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
         lastKnownSelfPlayer = null;
         statusSubscriptionRegistry.clear();
         typedApiService.clear();
+        if (this.lineServer != null) {
+            this.lineServer.close();
+            this.lineServer = null;
+        }
         if (this.server != null) {
             this.server.close();
         }
@@ -267,12 +315,18 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
             return switch (method) {
                 case "auth.login" -> handleAuthLogin(id, params, session);
                 case "ping" -> handlePing(id, session);
-                case "status.get" -> handleStatus(id, session);
-                case "status.subscribe" -> handleStatusSubscribe(id, session);
+                case "status.get" -> handleStatus(id, params, session);
+                case "status.subscribe" -> handleStatusSubscribe(id, params, session);
                 case "status.unsubscribe" -> handleStatusUnsubscribe(id, session);
+                case "events.subscribe" -> handleEventsSubscribe(id, params, session);
                 case "api.metadata.get" -> handleApiMetadataGet(id, params, session);
                 case "api.construct" -> handleApiConstruct(id, params, session);
                 case "api.invoke" -> handleApiInvoke(id, params, session);
+                case "api.batch" -> handleApiBatch(id, params, session);
+                case "api.pipeline" -> handleApiPipeline(id, params, session);
+                case "api.release" -> handleApiRelease(id, params, session);
+                case "api.watch" -> handleApiWatch(id, params, session);
+                case "api.unwatch" -> handleApiUnwatch(id, params, session);
                 case "entities.list" -> handleEntitiesList(id, params);
                 case "baritone.execute" -> handleBaritoneExecute(id, params, session);
                 case "task.cancel" -> handleTaskCancel(id);
@@ -299,13 +353,16 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
         }
 
         session.setAuthenticated(true);
+        JsonArray capabilities = negotiateCapabilities(params, session);
 
         emitPauseStateEventToSession(session, currentPauseStateSnapshot());
+        emitPathingActivityEventToSession(session, pathingActivityTracker.current());
 
         JsonObject result = new JsonObject();
         result.addProperty("protocol_version", BridgeConfig.PROTOCOL_VERSION);
         result.addProperty("server_version", serverVersion);
         result.addProperty("session_id", session.sessionId());
+        result.add("capabilities", capabilities);
 
         int bridgePort = server != null ? server.getBoundPort() : BridgeConfig.DEFAULT_PORT;
         emitPyritoneNotice(
@@ -332,18 +389,36 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
         return ProtocolCodec.successResponse(id, result);
     }
 
-    private JsonObject handleStatus(String id, WebSocketBridgeServer.ClientSession session) {
-        return ProtocolCodec.successResponse(id, buildStatusPayload(session));
+    private JsonObject handleStatus(String id, JsonObject params, WebSocketBridgeServer.ClientSession session) {
+        StatusStreamOptions options;
+        try {
+            options = StatusStreamOptions.fromParams(params, BridgeConfig.STATUS_HEARTBEAT_INTERVAL_MS);
+        } catch (IllegalArgumentException exception) {
+            return ProtocolCodec.errorResponse(id, "BAD_REQUEST", exception.getMessage());
+        }
+        return ProtocolCodec.successResponse(id, buildStatusPayload(session, options));
     }
 
-    private JsonObject handleStatusSubscribe(String id, WebSocketBridgeServer.ClientSession session) {
+    private JsonObject handleStatusSubscribe(String id, JsonObject params, WebSocketBridgeServer.ClientSession session) {
+        StatusStreamOptions options;
+        try {
+            options = StatusStreamOptions.fromParams(params, BridgeConfig.STATUS_HEARTBEAT_INTERVAL_MS);
+        } catch (IllegalArgumentException exception) {
+            return ProtocolCodec.errorResponse(id, "BAD_REQUEST", exception.getMessage());
+        }
+
         long nowMs = System.currentTimeMillis();
-        JsonObject status = buildStatusPayload(session);
-        statusSubscriptionRegistry.subscribe(session.sessionId(), statusDigest(status), nowMs);
+        boolean delta = asBoolean(params, "delta");
+        JsonObject status = buildStatusPayload(session, options);
+        long sequence = statusSubscriptionRegistry.subscribe(session.sessionId(), status, nowMs, delta, options);
 
         JsonObject result = new JsonObject();
         result.addProperty("subscribed", true);
-        result.addProperty("heartbeat_interval_ms", BridgeConfig.STATUS_HEARTBEAT_INTERVAL_MS);
+        result.addProperty("heartbeat_interval_ms", options.heartbeatMs());
+        result.addProperty("min_interval_ms", options.minIntervalMs());
+        result.add("fields", options.toJson().get("fields"));
+        result.addProperty("delta", delta);
+        result.addProperty("seq", sequence);
         result.add("status", status);
         return ProtocolCodec.successResponse(id, result);
     }
@@ -356,6 +431,44 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
         return ProtocolCodec.successResponse(id, result);
     }
 
+    private JsonObject handleEventsSubscribe(String id, JsonObject params, WebSocketBridgeServer.ClientSession session) {
+        EventFilter filter;
+        try {
+            filter = EventFilter.fromParams(params);
+        } catch (IllegalArgumentException exception) {
+            return ProtocolCodec.errorResponse(id, "BAD_REQUEST", exception.getMessage());
+        }
+        session.setEventFilter(filter);
+        return ProtocolCodec.successResponse(id, filter.toJson());
+    }
+
+    private JsonArray negotiateCapabilities(JsonObject params, WebSocketBridgeServer.ClientSession session) {
+        Set<String> requested = new HashSet<>();
+        JsonElement raw = params.get("capabilities");
+        if (raw != null && raw.isJsonArray()) {
+            for (JsonElement item : raw.getAsJsonArray()) {
+                if (item.isJsonPrimitive()) {
+                    requested.add(item.getAsString());
+                }
+            }
+        }
+
+        JsonArray accepted = new JsonArray();
+        boolean packedArrays = requested.contains(CAPABILITY_PACKED_ARRAYS);
+        typedApiService.setPackedArrays(session.sessionId(), packedArrays);
+        if (packedArrays) {
+            accepted.add(CAPABILITY_PACKED_ARRAYS);
+        }
+
+        // Binary frames start with the auth.login response itself.
+        boolean binaryFrames = requested.contains(CAPABILITY_CBOR) && session.supportsBinaryFrames();
+        session.setBinaryFrames(binaryFrames);
+        if (binaryFrames) {
+            accepted.add(CAPABILITY_CBOR);
+        }
+        return accepted;
+    }
+
     private JsonObject handleApiMetadataGet(String id, JsonObject params, WebSocketBridgeServer.ClientSession session) {
         return handleTypedApiRequest(id, () -> typedApiService.metadata(session.sessionId(), params));
     }
@@ -368,6 +481,35 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
         return handleTypedApiRequest(id, () -> typedApiService.invoke(session.sessionId(), params));
     }
 
+    private JsonObject handleApiBatch(String id, JsonObject params, WebSocketBridgeServer.ClientSession session) {
+        return handleTypedApiRequest(id, () -> typedApiService.batch(session.sessionId(), params));
+    }
+
+    private JsonObject handleApiPipeline(String id, JsonObject params, WebSocketBridgeServer.ClientSession session) {
+        return handleTypedApiRequest(id, () -> typedApiService.pipeline(session.sessionId(), params));
+    }
+
+    private JsonObject handleApiRelease(String id, JsonObject params, WebSocketBridgeServer.ClientSession session) {
+        // Releasing only touches the per-session table, so it skips the client thread and the pause gate.
+        try {
+            return ProtocolCodec.successResponse(id, typedApiService.release(session.sessionId(), params));
+        } catch (TypedApiException exception) {
+            return ProtocolCodec.errorResponse(id, exception.code(), exception.getMessage(), exception.details());
+        }
+    }
+
+    private JsonObject handleApiWatch(String id, JsonObject params, WebSocketBridgeServer.ClientSession session) {
+        return handleTypedApiRequest(id, () -> typedApiService.watch(session.sessionId(), params));
+    }
+
+    private JsonObject handleApiUnwatch(String id, JsonObject params, WebSocketBridgeServer.ClientSession session) {
+        try {
+            return ProtocolCodec.successResponse(id, typedApiService.unwatch(session.sessionId(), params));
+        } catch (TypedApiException exception) {
+            return ProtocolCodec.errorResponse(id, exception.code(), exception.getMessage(), exception.details());
+        }
+    }
+
     private JsonObject handleEntitiesList(String id, JsonObject params) {
         try {
             JsonObject result = runOnClientThread(() -> {
@@ -424,26 +566,43 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
         }
     }
 
-    private JsonObject buildStatusPayload(WebSocketBridgeServer.ClientSession session) {
+    private JsonObject buildStatusPayload(WebSocketBridgeServer.ClientSession session, StatusStreamOptions options) {
+        // Only requested fields are built, so unsubscribed-from fields (player lookup, watch list) cost nothing.
         JsonObject result = new JsonObject();
-        result.addProperty("protocol_version", BridgeConfig.PROTOCOL_VERSION);
-        result.addProperty("server_version", serverVersion);
-        result.addProperty("host", BridgeConfig.DEFAULT_HOST);
-        result.addProperty("port", server != null ? server.getBoundPort() : BridgeConfig.DEFAULT_PORT);
-        result.addProperty("authenticated", session != null && session.isAuthenticated());
-        result.addProperty("baritone_available", baritoneGateway.isAvailable());
-        result.addProperty("in_world", baritoneGateway.isInWorld());
-        result.add("active_task", taskRegistry.activeAsJson());
-        result.add("watch_patterns", watchPatternRegistry.toJsonArray());
-        JsonObject player = currentPlayerPayload(MinecraftClient.getInstance());
-        result.add("player", player != null ? player : JsonNull.INSTANCE);
+        if (options.includes("protocol_version")) {
+            result.addProperty("protocol_version", BridgeConfig.PROTOCOL_VERSION);
+        }
+        if (options.includes("server_version")) {
+            result.addProperty("server_version", serverVersion);
+        }
+        if (options.includes("host")) {
+            result.addProperty("host", BridgeConfig.DEFAULT_HOST);
+        }
+        if (options.includes("port")) {
+            result.addProperty("port", server != null ? server.getBoundPort() : BridgeConfig.DEFAULT_PORT);
+        }
+        if (options.includes("authenticated")) {
+            result.addProperty("authenticated", session != null && session.isAuthenticated());
+        }
+        if (options.includes("baritone_available")) {
+            result.addProperty("baritone_available", baritoneGateway.isAvailable());
+        }
+        if (options.includes("in_world")) {
+            result.addProperty("in_world", baritoneGateway.isInWorld());
+        }
+        if (options.includes("active_task")) {
+            result.add("active_task", taskRegistry.activeAsJson());
+        }
+        if (options.includes("watch_patterns")) {
+            result.add("watch_patterns", watchPatternRegistry.toJsonArray());
+        }
+        if (options.includes("player")) {
+            JsonObject player = currentPlayerPayload(MinecraftClient.getInstance());
+            result.add("player", player != null ? player : JsonNull.INSTANCE);
+        }
         return result;
     }
 
-    private static String statusDigest(JsonObject status) {
-        return ProtocolCodec.toLine(status);
-    }
-
     private JsonObject handleBaritoneExecute(String id, JsonObject params, WebSocketBridgeServer.ClientSession session) {
         String command = asString(params, "command");
         if (command == null || command.isBlank()) {
@@ -567,6 +726,30 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
         }
     }
 
+    private void registerInlineValueCodecs() {
+        // BetterBlockPos extends BlockPos, so Baritone positions share the block_pos encoding.
+        typedApiService.registerInlineValue("block_pos", BlockPos.class, pos -> {
+            JsonArray coords = new JsonArray();
+            coords.add(pos.getX());
+            coords.add(pos.getY());
+            coords.add(pos.getZ());
+            return coords;
+        });
+        typedApiService.registerInlineValue("vec3d", Vec3d.class, vec -> {
+            JsonArray coords = new JsonArray();
+            coords.add(vec.x);
+            coords.add(vec.y);
+            coords.add(vec.z);
+            return coords;
+        });
+        typedApiService.registerInlineValue("chunk_pos", ChunkPos.class, chunk -> {
+            JsonArray coords = new JsonArray();
+            coords.add(chunk.x);
+            coords.add(chunk.z);
+            return coords;
+        });
+    }
+
     private Object resolvePrimaryBaritone() throws ReflectiveOperationException {
         return baritoneGateway.resolvePrimaryBaritoneForTypedApi();
     }
@@ -751,7 +934,59 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
         lastKnownSelfPlayer = selfSnapshot;
     }
 
-    private void tickTaskLifecycle() {
+    private BaritoneGateway.ActivitySnapshot tickPathingActivity() {
+        WebSocketBridgeServer currentServer = this.server;
+        if (currentServer == null || !currentServer.isRunning() || !hasAuthenticatedSession(currentServer)) {
+            pathingActivityTracker.reset();
+            return null;
+        }
+
+        BaritoneGateway.ActivitySnapshot snapshot = baritoneGateway.activitySnapshot();
+        pathingActivityTracker.observe(snapshot)
+            .ifPresent(transition -> publishEvent("baritone.pathing_activity", pathingActivityToJson(transition)));
+        return snapshot;
+    }
+
+    private static boolean hasAuthenticatedSession(WebSocketBridgeServer currentServer) {
+        for (WebSocketBridgeServer.ClientSession session : currentServer.sessionSnapshot()) {
+            if (session.isAuthenticated()) {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    private void emitPathingActivityEventToSession(
+        WebSocketBridgeServer.ClientSession session,
+        PathingActivityTracker.Transition transition
+    ) {
+        WebSocketBridgeServer currentServer = this.server;
+        if (currentServer == null || !currentServer.isRunning() || session == null) {
+            return;
+        }
+        JsonObject envelope = ProtocolCodec.eventEnvelope("baritone.pathing_activity", pathingActivityToJson(transition));
+        currentServer.publishEvent(session, envelope);
+    }
+
+    private JsonObject pathingActivityToJson(PathingActivityTracker.Transition transition) {
+        BaritoneGateway.ActivitySnapshot snapshot = transition.snapshot();
+        JsonObject payload = new JsonObject();
+        payload.addProperty("seq", transition.sequence());
+        payload.addProperty("pathing", snapshot.isPathing());
+        payload.addProperty("calculating", snapshot.calcInProgress());
+        payload.addProperty("has_path", snapshot.hasPath());
+        payload.addProperty("busy", snapshot.isBusy());
+        payload.addProperty("paused", snapshot.isPaused());
+        payload.addProperty("process_active", snapshot.processInControlActive());
+        payload.addProperty("command_type", snapshot.commandType());
+        payload.addProperty("source_process", snapshot.sourceProcess());
+        payload.addProperty("builder_active", snapshot.builderActive());
+        payload.addProperty("builder_paused", snapshot.builderPaused());
+        taskRegistry.active().ifPresent(active -> payload.addProperty("task_id", active.taskId()));
+        return payload;
+    }
+
+    private void tickTaskLifecycle(BaritoneGateway.ActivitySnapshot activity) {
         Optional<TaskSnapshot> active = taskRegistry.active();
         if (active.isEmpty()) {
             taskLifecycleResolver.clear();
@@ -761,7 +996,7 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
         TaskSnapshot current = active.orElseThrow();
         Optional<TaskLifecycleResolver.LifecycleUpdate> lifecycleUpdate = taskLifecycleResolver.evaluate(
             current.taskId(),
-            baritoneGateway.activitySnapshot()
+            activity != null ? activity : baritoneGateway.activitySnapshot()
         );
 
         if (lifecycleUpdate.isEmpty()) {
@@ -808,12 +1043,22 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
                 continue;
             }
 
-            JsonObject status = buildStatusPayload(session);
+            if (!effectivePauseActive) {
+                for (JsonObject change : typedApiService.tickWatches(session.sessionId())) {
+                    currentServer.publishEvent(session, ProtocolCodec.eventEnvelope("api.watch.changed", change));
+                }
+            }
+
+            StatusStreamOptions options = statusSubscriptionRegistry.options(session.sessionId());
+            if (options == null) {
+                continue;
+            }
+
+            JsonObject status = buildStatusPayload(session, options);
             Optional<StatusSubscriptionRegistry.Emission> emission = statusSubscriptionRegistry.evaluate(
                 session.sessionId(),
-                statusDigest(status),
-                nowMs,
-                BridgeConfig.STATUS_HEARTBEAT_INTERVAL_MS
+                status,
+                nowMs
             );
             if (emission.isEmpty()) {
                 continue;
@@ -832,11 +1077,23 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
         JsonObject data = new JsonObject();
         data.addProperty("reason", emission.reason());
         data.addProperty("seq", emission.sequence());
-        data.add("status", status);
+        if (emission.isDelta()) {
+            data.addProperty("delta", true);
+            data.addProperty("base_seq", emission.baseSequence());
+            data.add("changed", emission.changed());
+            if (!emission.removed().isEmpty()) {
+                data.add("removed", emission.removed());
+            }
+        } else {
+            data.add("status", status);
+        }
         currentServer.publishEvent(session, ProtocolCodec.eventEnvelope("status.update", data));
     }
 
     private void onIncomingChatMessage(Text message, GameProfile sender) {
+        if (!hasEventSubscriber("minecraft.chat_message")) {
+            return;
+        }
         MinecraftClient client = MinecraftClient.getInstance();
         JsonObject authorPayload = null;
         if (sender != null) {
@@ -852,6 +1109,9 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
     }
 
     private void onIncomingSystemMessage(Text message, boolean overlay) {
+        if (!hasEventSubscriber("minecraft.system_message")) {
+            return;
+        }
         JsonObject data = new JsonObject();
         data.addProperty("message", message != null ? message.getString() : "");
         data.addProperty("overlay", overlay);
@@ -952,12 +1212,17 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
 
     private void publishEvent(String eventName, JsonObject data) {
         WebSocketBridgeServer currentServer = this.server;
-        if (currentServer == null || !currentServer.isRunning()) {
+        if (currentServer == null || !currentServer.isRunning() || !currentServer.hasEventSubscriber(eventName)) {
             return;
         }
         currentServer.publishEvent(ProtocolCodec.eventEnvelope(eventName, data));
     }
 
+    private boolean hasEventSubscriber(String eventName) {
+        WebSocketBridgeServer currentServer = this.server;
+        return currentServer != null && currentServer.isRunning() && currentServer.hasEventSubscriber(eventName);
+    }
+
     private boolean applyPyritoneChatControl(String message) {
         String subcommand = pyritoneSubcommand(message);
         if (subcommand == null) {
@@ -1167,6 +1432,14 @@ public final class PyritoneBridgeClientMod implements ClientModInitializer {
         return source.get(key).getAsString();
     }
 
+    private static boolean asBoolean(JsonObject source, String key) {
+        if (source == null || !source.has(key) || !source.get(key).isJsonPrimitive()) {
+            return false;
+        }
+        JsonPrimitive primitive = source.getAsJsonPrimitive(key);
+        return primitive.isBoolean() && primitive.getAsBoolean();
+    }
+
     private static JsonObject asObject(JsonObject source, String key) {
         if (source == null || !source.has(key) || !source.get(key).isJsonObject()) {
             return new JsonObject();
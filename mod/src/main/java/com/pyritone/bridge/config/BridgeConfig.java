@@ -9,10 +9,15 @@ public final class BridgeConfig {
     public static final String DEFAULT_HOST = "127.0.0.1";
     public static final int DEFAULT_PORT = 27841;
     public static final String DEFAULT_WS_PATH = "/ws";
+    public static final int DEFAULT_LINE_PORT = 27842;
+    public static final String LINE_TRANSPORT = "ndjson";
     public static final int PROTOCOL_VERSION = 2;
     public static final long STATUS_HEARTBEAT_INTERVAL_MS = 5_000L;
+    public static final int MAX_REMOTE_REFERENCES_PER_SESSION = 4_096;
+    public static final long REMOTE_REFERENCE_TTL_MS = 10L * 60L * 1_000L;
     public static final String TOKEN_FILE_NAME = "token.txt";
     public static final String BRIDGE_INFO_FILE_NAME = "bridge-info.json";
+    public static final String LINE_SOCKET_FILE_NAME = "bridge.sock";
 
     private BridgeConfig() {
     }
@@ -28,4 +33,8 @@ public final class BridgeConfig {
     public static Path bridgeInfoFile() {
         return configDirectory().resolve(BRIDGE_INFO_FILE_NAME);
     }
+
+    public static Path lineSocketFile() {
+        return configDirectory().resolve(LINE_SOCKET_FILE_NAME);
+    }
 }
@@ -16,13 +16,33 @@ public final class BridgeInfoWriter {
     private BridgeInfoWriter() {
     }
 
-    public static void write(Logger logger, String host, int port, String token, int protocolVersion, String serverVersion) {
+    /**
+     * Writes the discovery file. When {@code linePort} is positive the newline-delimited listener is advertised as
+     * the preferred {@code transport}, with {@code tcp_port} and, if bound, {@code unix_socket}; the WebSocket
+     * fields stay for clients that only speak WebSocket.
+     */
+    public static void write(
+        Logger logger,
+        String host,
+        int port,
+        String token,
+        int protocolVersion,
+        String serverVersion,
+        int linePort,
+        Path unixSocket
+    ) {
         Path infoFile = BridgeConfig.bridgeInfoFile();
 
         JsonObject payload = new JsonObject();
         payload.addProperty("host", host);
         payload.addProperty("port", port);
-        payload.addProperty("transport", "websocket");
+        payload.addProperty("transport", linePort > 0 ? BridgeConfig.LINE_TRANSPORT : "websocket");
+        if (linePort > 0) {
+            payload.addProperty("tcp_port", linePort);
+            if (unixSocket != null) {
+                payload.addProperty("unix_socket", unixSocket.toAbsolutePath().toString());
+            }
+        }
         payload.addProperty("ws_path", BridgeConfig.DEFAULT_WS_PATH);
         payload.addProperty("ws_url", "ws://" + host + ":" + port + BridgeConfig.DEFAULT_WS_PATH);
         payload.addProperty("token", token);
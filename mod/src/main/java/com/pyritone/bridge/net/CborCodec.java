@@ -0,0 +1,267 @@
+package com.pyritone.bridge.net;
+
+import com.google.gson.JsonArray;
+import com.google.gson.JsonElement;
+import com.google.gson.JsonNull;
+import com.google.gson.JsonObject;
+import com.google.gson.JsonPrimitive;
+import com.google.gson.JsonSyntaxException;
+
+import java.io.ByteArrayOutputStream;
+import java.math.BigDecimal;
+import java.math.BigInteger;
+import java.nio.BufferUnderflowException;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.nio.charset.StandardCharsets;
+import java.util.Map;
+
+/**
+ * CBOR (RFC 8949) encoding of Gson trees for sessions that negotiated binary frames.
+ *
+ * <p>Only the JSON data model is supported: maps with text keys, arrays, text, integers up to 64 bits,
+ * floats, booleans and null. Tags are skipped on decode and indefinite lengths are rejected.
+ */
+public final class CborCodec {
+    private static final int MAJOR_UNSIGNED = 0;
+    private static final int MAJOR_NEGATIVE = 1;
+    private static final int MAJOR_BYTES = 2;
+    private static final int MAJOR_TEXT = 3;
+    private static final int MAJOR_ARRAY = 4;
+    private static final int MAJOR_MAP = 5;
+    private static final int MAJOR_TAG = 6;
+
+    private static final int FALSE = 0xF4;
+    private static final int TRUE = 0xF5;
+    private static final int NULL = 0xF6;
+    private static final int UNDEFINED = 0xF7;
+    private static final int FLOAT16 = 0xF9;
+    private static final int FLOAT32 = 0xFA;
+    private static final int FLOAT64 = 0xFB;
+
+    private CborCodec() {
+    }
+
+    public static byte[] encode(JsonElement element) {
+        ByteArrayOutputStream out = new ByteArrayOutputStream(256);
+        writeElement(element, out);
+        return out.toByteArray();
+    }
+
+    public static JsonObject decodeObject(ByteBuffer buffer) {
+        ByteBuffer input = buffer.slice().order(ByteOrder.BIG_ENDIAN);
+        JsonElement element;
+        try {
+            element = readElement(input);
+        } catch (BufferUnderflowException exception) {
+            throw new JsonSyntaxException("Truncated CBOR payload", exception);
+        }
+        if (input.hasRemaining()) {
+            throw new JsonSyntaxException("Trailing bytes after CBOR payload");
+        }
+        if (!element.isJsonObject()) {
+            throw new JsonSyntaxException("Expected a CBOR map");
+        }
+        return element.getAsJsonObject();
+    }
+
+    public static JsonObject decodeObject(byte[] payload) {
+        return decodeObject(ByteBuffer.wrap(payload));
+    }
+
+    private static void writeElement(JsonElement element, ByteArrayOutputStream out) {
+        if (element == null || element.isJsonNull()) {
+            out.write(NULL);
+            return;
+        }
+        if (element.isJsonObject()) {
+            JsonObject object = element.getAsJsonObject();
+            writeHead(MAJOR_MAP, object.size(), out);
+            for (Map.Entry<String, JsonElement> entry : object.entrySet()) {
+                writeText(entry.getKey(), out);
+                writeElement(entry.getValue(), out);
+            }
+            return;
+        }
+        if (element.isJsonArray()) {
+            JsonArray array = element.getAsJsonArray();
+            writeHead(MAJOR_ARRAY, array.size(), out);
+            for (JsonElement item : array) {
+                writeElement(item, out);
+            }
+            return;
+        }
+
+        JsonPrimitive primitive = element.getAsJsonPrimitive();
+        if (primitive.isBoolean()) {
+            out.write(primitive.getAsBoolean() ? TRUE : FALSE);
+        } else if (primitive.isNumber()) {
+            writeNumber(primitive.getAsNumber(), out);
+        } else {
+            writeText(primitive.getAsString(), out);
+        }
+    }
+
+    private static void writeNumber(Number number, ByteArrayOutputStream out) {
+        if (number instanceof Double || number instanceof Float || number instanceof BigDecimal) {
+            writeDouble(number.doubleValue(), out);
+            return;
+        }
+        if (number instanceof BigInteger bigInteger) {
+            if (bigInteger.bitLength() < 64) {
+                writeLong(bigInteger.longValue(), out);
+            } else {
+                writeDouble(bigInteger.doubleValue(), out);
+            }
+            return;
+        }
+        if (number instanceof Integer || number instanceof Long || number instanceof Short || number instanceof Byte) {
+            writeLong(number.longValue(), out);
+            return;
+        }
+
+        // Gson's LazilyParsedNumber (numbers parsed from text) keeps the original literal.
+        String literal = number.toString();
+        if (literal.indexOf('.') < 0 && literal.indexOf('e') < 0 && literal.indexOf('E') < 0) {
+            try {
+                writeLong(Long.parseLong(literal), out);
+                return;
+            } catch (NumberFormatException ignored) {
+                // Out of long range; fall back to a double.
+            }
+        }
+        writeDouble(number.doubleValue(), out);
+    }
+
+    private static void writeLong(long value, ByteArrayOutputStream out) {
+        if (value >= 0) {
+            writeHead(MAJOR_UNSIGNED, value, out);
+        } else {
+            writeHead(MAJOR_NEGATIVE, -1L - value, out);
+        }
+    }
+
+    private static void writeDouble(double value, ByteArrayOutputStream out) {
+        out.write(FLOAT64);
+        long bits = Double.doubleToLongBits(value);
+        for (int shift = 56; shift >= 0; shift -= 8) {
+            out.write((int) (bits >>> shift) & 0xFF);
+        }
+    }
+
+    private static void writeText(String value, ByteArrayOutputStream out) {
+        byte[] bytes = value.getBytes(StandardCharsets.UTF_8);
+        writeHead(MAJOR_TEXT, bytes.length, out);
+        out.write(bytes, 0, bytes.length);
+    }
+
+    private static void writeHead(int major, long argument, ByteArrayOutputStream out) {
+        int prefix = major << 5;
+        if (argument < 24L) {
+            out.write(prefix | (int) argument);
+        } else if (argument < 0x100L) {
+            out.write(prefix | 24);
+            out.write((int) argument);
+        } else if (argument < 0x10000L) {
+            out.write(prefix | 25);
+            writeBigEndian(argument, 2, out);
+        } else if (argument < 0x100000000L) {
+            out.write(prefix | 26);
+            writeBigEndian(argument, 4, out);
+        } else {
+            out.write(prefix | 27);
+            writeBigEndian(argument, 8, out);
+        }
+    }
+
+    private static void writeBigEndian(long value, int width, ByteArrayOutputStream out) {
+        for (int shift = (width - 1) * 8; shift >= 0; shift -= 8) {
+            out.write((int) (value >>> shift) & 0xFF);
+        }
+    }
+
+    private static JsonElement readElement(ByteBuffer input) {
+        int initial = input.get() & 0xFF;
+        int major = initial >>> 5;
+        int info = initial & 0x1F;
+
+        if (major == 7) {
+            return switch (initial) {
+                case FALSE -> new JsonPrimitive(false);
+                case TRUE -> new JsonPrimitive(true);
+                case NULL, UNDEFINED -> JsonNull.INSTANCE;
+                case FLOAT16 -> new JsonPrimitive((double) Float.float16ToFloat(input.getShort()));
+                case FLOAT32 -> new JsonPrimitive((double) input.getFloat());
+                case FLOAT64 -> new JsonPrimitive(input.getDouble());
+                default -> throw new JsonSyntaxException("Unsupported CBOR simple value " + initial);
+            };
+        }
+
+        long argument = readArgument(input, info);
+        switch (major) {
+            case MAJOR_UNSIGNED:
+                return argument >= 0
+                    ? new JsonPrimitive(argument)
+                    : new JsonPrimitive(new BigInteger(Long.toUnsignedString(argument)));
+            case MAJOR_NEGATIVE:
+                return argument >= 0
+                    ? new JsonPrimitive(-1L - argument)
+                    : new JsonPrimitive(BigInteger.ONE.negate().subtract(new BigInteger(Long.toUnsignedString(argument))));
+            case MAJOR_TEXT:
+                return new JsonPrimitive(new String(readBytes(input, argument), StandardCharsets.UTF_8));
+            case MAJOR_BYTES:
+                throw new JsonSyntaxException("CBOR byte strings are not part of the bridge protocol");
+            case MAJOR_ARRAY: {
+                JsonArray array = new JsonArray();
+                long size = checkedLength(input, argument);
+                for (long index = 0; index < size; index++) {
+                    array.add(readElement(input));
+                }
+                return array;
+            }
+            case MAJOR_MAP: {
+                JsonObject object = new JsonObject();
+                long size = checkedLength(input, argument);
+                for (long index = 0; index < size; index++) {
+                    JsonElement key = readElement(input);
+                    if (!key.isJsonPrimitive() || !key.getAsJsonPrimitive().isString()) {
+                        throw new JsonSyntaxException("CBOR map keys must be text");
+                    }
+                    object.add(key.getAsString(), readElement(input));
+                }
+                return object;
+            }
+            case MAJOR_TAG:
+                return readElement(input);
+            default:
+                throw new JsonSyntaxException("Unsupported CBOR major type " + major);
+        }
+    }
+
+    private static long readArgument(ByteBuffer input, int info) {
+        if (info < 24) {
+            return info;
+        }
+        return switch (info) {
+            case 24 -> input.get() & 0xFFL;
+            case 25 -> input.getShort() & 0xFFFFL;
+            case 26 -> input.getInt() & 0xFFFFFFFFL;
+            case 27 -> input.getLong();
+            default -> throw new JsonSyntaxException("Unsupported CBOR additional info " + info);
+        };
+    }
+
+    private static long checkedLength(ByteBuffer input, long length) {
+        // Every item takes at least one byte, so a length beyond the remaining input is malformed.
+        if (length < 0 || length > input.remaining()) {
+            throw new JsonSyntaxException("CBOR length exceeds payload size");
+        }
+        return length;
+    }
+
+    private static byte[] readBytes(ByteBuffer input, long length) {
+        byte[] bytes = new byte[(int) checkedLength(input, length)];
+        input.get(bytes);
+        return bytes;
+    }
+}
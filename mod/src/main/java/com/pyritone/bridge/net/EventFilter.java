@@ -0,0 +1,142 @@
+package com.pyritone.bridge.net;
+
+import com.google.gson.JsonArray;
+import com.google.gson.JsonElement;
+import com.google.gson.JsonObject;
+
+import java.util.ArrayList;
+import java.util.List;
+import java.util.regex.Pattern;
+
+/**
+ * Per-session event name filter set by {@code events.subscribe}.
+ *
+ * <p>An event is delivered when its name matches at least one {@code include} glob and no {@code exclude} glob.
+ * Globs support {@code *} (any run of characters, including dots) and {@code ?} (one character).
+ */
+public final class EventFilter {
+    public static final EventFilter ALL = new EventFilter(List.of("*"), List.of());
+
+    private final List<String> include;
+    private final List<String> exclude;
+    private final List<Pattern> includePatterns;
+    private final List<Pattern> excludePatterns;
+    private final boolean acceptsAll;
+
+    private EventFilter(List<String> include, List<String> exclude) {
+        this.include = List.copyOf(include);
+        this.exclude = List.copyOf(exclude);
+        this.includePatterns = compile(this.include);
+        this.excludePatterns = compile(this.exclude);
+        this.acceptsAll = this.include.contains("*") && this.exclude.isEmpty();
+    }
+
+    public static EventFilter fromParams(JsonObject params) {
+        List<String> include = readPatterns(params, "include");
+        List<String> exclude = readPatterns(params, "exclude");
+        if (include == null) {
+            include = List.of("*");
+        }
+        return new EventFilter(include, exclude == null ? List.of() : exclude);
+    }
+
+    public boolean accepts(String eventName) {
+        if (acceptsAll) {
+            return true;
+        }
+        if (eventName == null) {
+            return false;
+        }
+        if (!anyMatches(includePatterns, eventName)) {
+            return false;
+        }
+        return !anyMatches(excludePatterns, eventName);
+    }
+
+    public List<String> include() {
+        return include;
+    }
+
+    public List<String> exclude() {
+        return exclude;
+    }
+
+    public JsonObject toJson() {
+        JsonObject object = new JsonObject();
+        object.add("include", toJsonArray(include));
+        object.add("exclude", toJsonArray(exclude));
+        return object;
+    }
+
+    static Pattern compileGlob(String glob) {
+        StringBuilder regex = new StringBuilder(glob.length() + 8);
+        StringBuilder literal = new StringBuilder();
+        for (int index = 0; index < glob.length(); index++) {
+            char character = glob.charAt(index);
+            if (character == '*' || character == '?') {
+                if (!literal.isEmpty()) {
+                    regex.append(Pattern.quote(literal.toString()));
+                    literal.setLength(0);
+                }
+                regex.append(character == '*' ? ".*" : ".");
+            } else {
+                literal.append(character);
+            }
+        }
+        if (!literal.isEmpty()) {
+            regex.append(Pattern.quote(literal.toString()));
+        }
+        return Pattern.compile(regex.toString());
+    }
+
+    private static List<String> readPatterns(JsonObject params, String key) {
+        if (params == null || !params.has(key) || params.get(key).isJsonNull()) {
+            return null;
+        }
+
+        JsonElement element = params.get(key);
+        if (!element.isJsonArray()) {
+            throw new IllegalArgumentException("events.subscribe params." + key + " must be an array of strings");
+        }
+
+        List<String> patterns = new ArrayList<>();
+        for (JsonElement entry : element.getAsJsonArray()) {
+            if (!entry.isJsonPrimitive() || !entry.getAsJsonPrimitive().isString()) {
+                throw new IllegalArgumentException("events.subscribe params." + key + " entries must be strings");
+            }
+            String value = entry.getAsString().trim();
+            if (value.isEmpty()) {
+                throw new IllegalArgumentException("events.subscribe params." + key + " entries must be non-empty strings");
+            }
+            if (!patterns.contains(value)) {
+                patterns.add(value);
+            }
+        }
+        return patterns;
+    }
+
+    private static List<Pattern> compile(List<String> globs) {
+        List<Pattern> patterns = new ArrayList<>(globs.size());
+        for (String glob : globs) {
+            patterns.add(compileGlob(glob));
+        }
+        return List.copyOf(patterns);
+    }
+
+    private static boolean anyMatches(List<Pattern> patterns, String eventName) {
+        for (Pattern pattern : patterns) {
+            if (pattern.matcher(eventName).matches()) {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    private static JsonArray toJsonArray(List<String> values) {
+        JsonArray array = new JsonArray();
+        for (String value : values) {
+            array.add(value);
+        }
+        return array;
+    }
+}
@@ -0,0 +1,284 @@
+package com.pyritone.bridge.net;
+
+import org.slf4j.Logger;
+
+import java.io.BufferedReader;
+import java.io.Closeable;
+import java.io.IOException;
+import java.io.InputStreamReader;
+import java.net.InetAddress;
+import java.net.InetSocketAddress;
+import java.net.StandardProtocolFamily;
+import java.net.StandardSocketOptions;
+import java.net.UnixDomainSocketAddress;
+import java.nio.ByteBuffer;
+import java.nio.channels.Channels;
+import java.nio.channels.ServerSocketChannel;
+import java.nio.channels.SocketChannel;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.List;
+import java.util.Set;
+import java.util.concurrent.ArrayBlockingQueue;
+import java.util.concurrent.BlockingQueue;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.atomic.AtomicBoolean;
+
+/**
+ * Second bridge listener speaking newline-delimited JSON (one envelope per line, UTF-8) over plain TCP and, where
+ * the platform supports it, a Unix domain socket.
+ *
+ * <p>Sessions are registered with the {@link WebSocketBridgeServer} they were created for, so requests, events,
+ * auth and session gating behave exactly as for WebSocket clients. Line sessions are text-only (no CBOR).
+ *
+ * <p>Outgoing lines are queued per session and written by a dedicated writer thread, so a client that stops
+ * reading never blocks the thread publishing to it (often the Minecraft client thread). A session whose queue
+ * overflows is closed.
+ */
+public final class LineBridgeServer implements Closeable {
+    static final int OUTBOUND_QUEUE_LIMIT = 4096;
+
+    private final WebSocketBridgeServer hub;
+    private final String host;
+    private final int port;
+    private final Path unixSocketPath;
+    private final Logger logger;
+
+    private final Set<SocketChannel> channels = ConcurrentHashMap.newKeySet();
+    private final AtomicBoolean running = new AtomicBoolean(false);
+    private volatile ServerSocketChannel tcpServer;
+    private volatile ServerSocketChannel unixServer;
+    private volatile int boundPort;
+    private volatile Path boundUnixSocket;
+
+    public LineBridgeServer(WebSocketBridgeServer hub, String host, int port, Path unixSocketPath, Logger logger) {
+        this.hub = hub;
+        this.host = host;
+        this.port = port;
+        this.unixSocketPath = unixSocketPath;
+        this.logger = logger;
+    }
+
+    public void start() throws IOException {
+        if (running.getAndSet(true)) {
+            return;
+        }
+
+        try {
+            ServerSocketChannel nextTcpServer = ServerSocketChannel.open();
+            nextTcpServer.setOption(StandardSocketOptions.SO_REUSEADDR, true);
+            nextTcpServer.bind(new InetSocketAddress(InetAddress.getByName(host), port));
+            this.tcpServer = nextTcpServer;
+            this.boundPort = ((InetSocketAddress) nextTcpServer.getLocalAddress()).getPort();
+            startAcceptor(nextTcpServer, true, "pyritone-line-tcp");
+        } catch (IOException exception) {
+            close();
+            throw exception;
+        }
+
+        if (unixSocketPath != null) {
+            startUnixListener();
+        }
+    }
+
+    public boolean isRunning() {
+        return running.get();
+    }
+
+    public int getBoundPort() {
+        return boundPort;
+    }
+
+    /**
+     * Path of the bound Unix domain socket, or {@code null} when the platform or path did not allow one.
+     */
+    public Path getUnixSocketPath() {
+        return boundUnixSocket;
+    }
+
+    @Override
+    public void close() {
+        running.set(false);
+        closeQuietly(tcpServer);
+        tcpServer = null;
+        closeQuietly(unixServer);
+        unixServer = null;
+
+        Path socketFile = boundUnixSocket;
+        boundUnixSocket = null;
+        if (socketFile != null) {
+            try {
+                Files.deleteIfExists(socketFile);
+            } catch (IOException ignored) {
+                // A stale socket file is replaced on the next start.
+            }
+        }
+
+        for (SocketChannel channel : List.copyOf(channels)) {
+            closeQuietly(channel);
+        }
+        channels.clear();
+    }
+
+    private void startUnixListener() {
+        try {
+            Files.createDirectories(unixSocketPath.toAbsolutePath().getParent());
+            Files.deleteIfExists(unixSocketPath);
+            ServerSocketChannel nextUnixServer = ServerSocketChannel.open(StandardProtocolFamily.UNIX);
+            nextUnixServer.bind(UnixDomainSocketAddress.of(unixSocketPath));
+            this.unixServer = nextUnixServer;
+            this.boundUnixSocket = unixSocketPath;
+            startAcceptor(nextUnixServer, false, "pyritone-line-unix");
+        } catch (UnsupportedOperationException | IOException exception) {
+            logger.debug("Unix domain socket listener unavailable at {}", unixSocketPath, exception);
+        }
+    }
+
+    private void startAcceptor(ServerSocketChannel serverChannel, boolean tcp, String threadName) {
+        Thread acceptor = new Thread(() -> acceptLoop(serverChannel, tcp), threadName);
+        acceptor.setDaemon(true);
+        acceptor.start();
+    }
+
+    private void acceptLoop(ServerSocketChannel serverChannel, boolean tcp) {
+        while (running.get() && serverChannel.isOpen()) {
+            SocketChannel channel;
+            try {
+                channel = serverChannel.accept();
+            } catch (IOException exception) {
+                if (running.get() && serverChannel.isOpen()) {
+                    logger.warn("Line bridge listener failed to accept a connection", exception);
+                }
+                return;
+            }
+
+            try {
+                if (tcp) {
+                    channel.setOption(StandardSocketOptions.TCP_NODELAY, true);
+                }
+            } catch (IOException exception) {
+                logger.debug("Unable to set TCP_NODELAY on line bridge connection", exception);
+            }
+
+            channels.add(channel);
+            Thread reader = new Thread(() -> readLoop(channel), "pyritone-line-session");
+            reader.setDaemon(true);
+            reader.start();
+        }
+    }
+
+    private void readLoop(SocketChannel channel) {
+        LineConnection connection = new LineConnection(channel, logger);
+        WebSocketBridgeServer.ClientSession session = new WebSocketBridgeServer.ClientSession(connection, logger);
+        connection.startWriter();
+        hub.registerSession(session);
+        try (BufferedReader reader = new BufferedReader(
+            new InputStreamReader(Channels.newInputStream(channel), StandardCharsets.UTF_8)
+        )) {
+            String line;
+            while ((line = reader.readLine()) != null) {
+                if (line.isBlank()) {
+                    continue;
+                }
+                String frame = line;
+                hub.dispatch(session, () -> ProtocolCodec.parseObject(frame));
+            }
+        } catch (IOException exception) {
+            if (running.get()) {
+                logger.debug("Line bridge session {} closed", session.sessionId(), exception);
+            }
+        } finally {
+            hub.unregisterSession(session);
+            channels.remove(channel);
+            connection.close();
+        }
+    }
+
+    private static void closeQuietly(Closeable closeable) {
+        if (closeable == null) {
+            return;
+        }
+        try {
+            closeable.close();
+        } catch (IOException ignored) {
+            // No-op on shutdown.
+        }
+    }
+
+    private static final class LineConnection implements WebSocketBridgeServer.Connection {
+        private static final ByteBuffer CLOSE_MARKER = ByteBuffer.allocate(0);
+
+        private final SocketChannel channel;
+        private final Logger logger;
+        private final BlockingQueue<ByteBuffer> outbound = new ArrayBlockingQueue<>(OUTBOUND_QUEUE_LIMIT);
+        private final AtomicBoolean closed = new AtomicBoolean(false);
+
+        private LineConnection(SocketChannel channel, Logger logger) {
+            this.channel = channel;
+            this.logger = logger;
+        }
+
+        private void startWriter() {
+            Thread writer = new Thread(this::writeLoop, "pyritone-line-writer");
+            writer.setDaemon(true);
+            writer.start();
+        }
+
+        private void writeLoop() {
+            try {
+                while (true) {
+                    ByteBuffer buffer = outbound.take();
+                    if (buffer == CLOSE_MARKER) {
+                        return;
+                    }
+                    while (buffer.hasRemaining()) {
+                        channel.write(buffer);
+                    }
+                }
+            } catch (IOException exception) {
+                logger.debug("Line bridge writer stopped", exception);
+            } catch (InterruptedException exception) {
+                Thread.currentThread().interrupt();
+            } finally {
+                close();
+            }
+        }
+
+        @Override
+        public boolean isOpen() {
+            return !closed.get() && channel.isOpen();
+        }
+
+        @Override
+        public boolean supportsBinaryFrames() {
+            return false;
+        }
+
+        @Override
+        public void sendText(String text) throws IOException {
+            byte[] encoded = text.getBytes(StandardCharsets.UTF_8);
+            ByteBuffer buffer = ByteBuffer.allocate(encoded.length + 1);
+            buffer.put(encoded).put((byte) '\n').flip();
+            if (!outbound.offer(buffer)) {
+                // ClientSession.send closes the session on failure instead of stalling the publisher.
+                throw new IOException("Line bridge session outbound queue overflowed (" + OUTBOUND_QUEUE_LIMIT + " lines)");
+            }
+        }
+
+        @Override
+        public void sendBinary(byte[] data) throws IOException {
+            throw new IOException("Line bridge sessions do not carry binary frames");
+        }
+
+        @Override
+        public void close() {
+            if (closed.getAndSet(true)) {
+                return;
+            }
+            outbound.clear();
+            outbound.offer(CLOSE_MARKER);
+            closeQuietly(channel);
+        }
+    }
+}
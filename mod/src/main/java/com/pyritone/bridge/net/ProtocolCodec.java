@@ -69,6 +69,13 @@ public final class ProtocolCodec {
         return event;
     }
 
+    public static String eventName(JsonObject event) {
+        if (event == null || !event.has("event") || !event.get("event").isJsonPrimitive()) {
+            return null;
+        }
+        return event.get("event").getAsString();
+    }
+
     public static String requestId(JsonObject payload) {
         if (!payload.has("id") || !payload.get("id").isJsonPrimitive()) {
             return null;
@@ -11,6 +11,7 @@ import java.io.Closeable;
 import java.io.IOException;
 import java.net.InetAddress;
 import java.net.InetSocketAddress;
+import java.nio.ByteBuffer;
 import java.util.HashSet;
 import java.util.Map;
 import java.util.Set;
@@ -98,14 +99,28 @@ public final class WebSocketBridgeServer implements Closeable {
     }
 
     public void publishEvent(JsonObject event) {
+        String eventName = ProtocolCodec.eventName(event);
         for (ClientSession session : sessions) {
-            if (!session.isAuthenticated()) {
+            if (!session.isAuthenticated() || !session.acceptsEvent(eventName)) {
                 continue;
             }
             session.send(event);
         }
     }
 
+    /**
+     * Returns whether any authenticated session's event filter lets {@code eventName} through, so callers can
+     * skip building payloads nobody receives.
+     */
+    public boolean hasEventSubscriber(String eventName) {
+        for (ClientSession session : sessions) {
+            if (session.isAuthenticated() && session.acceptsEvent(eventName)) {
+                return true;
+            }
+        }
+        return false;
+    }
+
     public void publishEvent(ClientSession session, JsonObject event) {
         if (session == null || event == null) {
             return;
@@ -116,6 +131,9 @@ public final class WebSocketBridgeServer implements Closeable {
         if (!sessions.contains(session)) {
             return;
         }
+        if (!session.acceptsEvent(ProtocolCodec.eventName(event))) {
+            return;
+        }
         session.send(event);
     }
 
@@ -123,6 +141,30 @@ public final class WebSocketBridgeServer implements Closeable {
         return new HashSet<>(sessions);
     }
 
+    void registerSession(ClientSession session) {
+        sessions.add(session);
+    }
+
+    void unregisterSession(ClientSession session) {
+        if (session != null) {
+            sessions.remove(session);
+            session.close();
+        }
+    }
+
+    void dispatch(ClientSession session, PayloadDecoder decoder) {
+        try {
+            JsonObject request = decoder.decode();
+            JsonObject response = requestHandler.handleRequest(session, request);
+            if (response != null) {
+                session.send(response);
+            }
+        } catch (Exception exception) {
+            logger.debug("Session {} received invalid payload", session.sessionId(), exception);
+            session.send(ProtocolCodec.errorResponse(null, "BAD_REQUEST", "Malformed request payload"));
+        }
+    }
+
     @Override
     public void close() {
         if (!running.getAndSet(false)) {
@@ -145,18 +187,44 @@ public final class WebSocketBridgeServer implements Closeable {
         JsonObject handleRequest(ClientSession session, JsonObject request);
     }
 
+    @FunctionalInterface
+    interface PayloadDecoder {
+        JsonObject decode();
+    }
+
+    /**
+     * Outgoing side of one client connection (a WebSocket or a newline-delimited socket stream).
+     */
+    interface Connection {
+        boolean isOpen();
+
+        boolean supportsBinaryFrames();
+
+        void sendText(String text) throws IOException;
+
+        void sendBinary(byte[] data) throws IOException;
+
+        void close();
+    }
+
     public static final class ClientSession implements Closeable {
         private final String sessionId = UUID.randomUUID().toString();
-        private final WebSocket socket;
+        private final Connection connection;
         private final Logger logger;
         private final AtomicBoolean authenticated = new AtomicBoolean(false);
         private final AtomicBoolean closed = new AtomicBoolean(false);
+        private volatile boolean binaryFrames;
+        private volatile EventFilter eventFilter = EventFilter.ALL;
 
-        private ClientSession(WebSocket socket, Logger logger) {
-            this.socket = socket;
+        ClientSession(Connection connection, Logger logger) {
+            this.connection = connection;
             this.logger = logger;
         }
 
+        private ClientSession(WebSocket socket, Logger logger) {
+            this(new WebSocketConnection(socket), logger);
+        }
+
         public String sessionId() {
             return sessionId;
         }
@@ -169,14 +237,48 @@ public final class WebSocketBridgeServer implements Closeable {
             this.authenticated.set(authenticated);
         }
 
+        public boolean usesBinaryFrames() {
+            return binaryFrames;
+        }
+
+        /**
+         * Whether this connection can carry binary CBOR frames; newline-delimited sessions are text-only.
+         */
+        public boolean supportsBinaryFrames() {
+            return connection.supportsBinaryFrames();
+        }
+
+        /**
+         * Switches outgoing payloads between text JSON and binary CBOR frames.
+         */
+        public void setBinaryFrames(boolean binaryFrames) {
+            this.binaryFrames = binaryFrames;
+        }
+
+        public EventFilter eventFilter() {
+            return eventFilter;
+        }
+
+        public void setEventFilter(EventFilter eventFilter) {
+            this.eventFilter = eventFilter == null ? EventFilter.ALL : eventFilter;
+        }
+
+        public boolean acceptsEvent(String eventName) {
+            return eventFilter.accepts(eventName);
+        }
+
         public void send(JsonObject payload) {
             if (closed.get() || payload == null) {
                 return;
             }
 
             try {
-                if (socket != null && socket.isOpen()) {
-                    socket.send(ProtocolCodec.toLine(payload));
+                if (connection.isOpen()) {
+                    if (binaryFrames) {
+                        connection.sendBinary(CborCodec.encode(payload));
+                    } else {
+                        connection.sendText(ProtocolCodec.toLine(payload));
+                    }
                 }
             } catch (Exception exception) {
                 logger.debug("Failed writing payload to session {}", sessionId, exception);
@@ -188,9 +290,7 @@ public final class WebSocketBridgeServer implements Closeable {
         public void close() {
             if (!closed.getAndSet(true)) {
                 try {
-                    if (socket != null) {
-                        socket.close();
-                    }
+                    connection.close();
                 } catch (Exception ignored) {
                     // Nothing useful to do on shutdown.
                 }
@@ -198,6 +298,35 @@ public final class WebSocketBridgeServer implements Closeable {
         }
     }
 
+    private record WebSocketConnection(WebSocket socket) implements Connection {
+        @Override
+        public boolean isOpen() {
+            return socket != null && socket.isOpen();
+        }
+
+        @Override
+        public boolean supportsBinaryFrames() {
+            return true;
+        }
+
+        @Override
+        public void sendText(String text) {
+            socket.send(text);
+        }
+
+        @Override
+        public void sendBinary(byte[] data) {
+            socket.send(data);
+        }
+
+        @Override
+        public void close() {
+            if (socket != null) {
+                socket.close();
+            }
+        }
+    }
+
     private final class BridgeWebSocketServer extends WebSocketServer {
         private final CountDownLatch startedLatch;
         private final AtomicReference<Exception> startupError;
@@ -244,6 +373,15 @@ public final class WebSocketBridgeServer implements Closeable {
 
         @Override
         public void onMessage(WebSocket conn, String message) {
+            handleMessage(conn, () -> ProtocolCodec.parseObject(message));
+        }
+
+        @Override
+        public void onMessage(WebSocket conn, ByteBuffer message) {
+            handleMessage(conn, () -> CborCodec.decodeObject(message));
+        }
+
+        private void handleMessage(WebSocket conn, PayloadDecoder decoder) {
             if (conn == null) {
                 return;
             }
@@ -254,16 +392,7 @@ public final class WebSocketBridgeServer implements Closeable {
                 return;
             }
 
-            try {
-                JsonObject request = ProtocolCodec.parseObject(message);
-                JsonObject response = requestHandler.handleRequest(session, request);
-                if (response != null) {
-                    session.send(response);
-                }
-            } catch (Exception exception) {
-                logger.debug("Session {} received invalid payload", session.sessionId(), exception);
-                session.send(ProtocolCodec.errorResponse(null, "BAD_REQUEST", "Malformed request payload"));
-            }
+            dispatch(session, decoder);
         }
 
         @Override
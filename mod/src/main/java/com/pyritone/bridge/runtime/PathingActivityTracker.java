@@ -0,0 +1,35 @@
+package com.pyritone.bridge.runtime;
+
+import java.util.Optional;
+
+/**
+ * Remembers the last published Baritone activity snapshot and reports when it changes.
+ *
+ * <p>The tracker starts from {@link BaritoneGateway.ActivitySnapshot#idle()}, so an idle client emits nothing.
+ */
+public final class PathingActivityTracker {
+    private BaritoneGateway.ActivitySnapshot current = BaritoneGateway.ActivitySnapshot.idle();
+    private long sequence;
+
+    public synchronized Optional<Transition> observe(BaritoneGateway.ActivitySnapshot snapshot) {
+        BaritoneGateway.ActivitySnapshot next = snapshot == null ? BaritoneGateway.ActivitySnapshot.idle() : snapshot;
+        if (next.equals(current)) {
+            return Optional.empty();
+        }
+        current = next;
+        sequence += 1;
+        return Optional.of(new Transition(next, sequence));
+    }
+
+    public synchronized Transition current() {
+        return new Transition(current, sequence);
+    }
+
+    public synchronized void reset() {
+        current = BaritoneGateway.ActivitySnapshot.idle();
+        sequence = 0L;
+    }
+
+    public record Transition(BaritoneGateway.ActivitySnapshot snapshot, long sequence) {
+    }
+}
@@ -0,0 +1,92 @@
+package com.pyritone.bridge.runtime;
+
+import com.google.gson.JsonElement;
+import com.google.gson.JsonObject;
+
+import java.math.BigDecimal;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Map;
+
+/**
+ * Raw Java results of the completed steps of one {@code api.pipeline} request.
+ *
+ * <p>{@code {"$step": k}} placeholders resolve to these objects rather than to their wire encoding, so
+ * packed arrays and materialized values chain into later steps unchanged. Outside a pipeline ({@link #NONE})
+ * no placeholders are recognized.
+ */
+final class PipelineSteps {
+    static final PipelineSteps NONE = new PipelineSteps(false);
+
+    private final boolean active;
+    private final List<Object> values = new ArrayList<>();
+
+    private PipelineSteps(boolean active) {
+        this.active = active;
+    }
+
+    static PipelineSteps create() {
+        return new PipelineSteps(true);
+    }
+
+    boolean isPlaceholder(JsonElement value) {
+        if (!active || value == null || !value.isJsonObject()) {
+            return false;
+        }
+        JsonObject object = value.getAsJsonObject();
+        if (object.size() != 1 || !object.has(TypedApiService.STEP_KEY) || !object.get(TypedApiService.STEP_KEY).isJsonPrimitive()) {
+            return false;
+        }
+        return object.get(TypedApiService.STEP_KEY).getAsJsonPrimitive().isNumber();
+    }
+
+    int indexOf(JsonElement placeholder) throws TypedApiException {
+        BigDecimal rawIndex = placeholder.getAsJsonObject().get(TypedApiService.STEP_KEY).getAsBigDecimal();
+        int stepIndex;
+        try {
+            stepIndex = rawIndex.intValueExact();
+        } catch (ArithmeticException exception) {
+            JsonObject details = new JsonObject();
+            details.addProperty("source_step", rawIndex.toPlainString());
+            throw new TypedApiException("BAD_REQUEST", "Pipeline placeholder step must be an integer", details);
+        }
+        if (stepIndex < 0 || stepIndex >= values.size()) {
+            JsonObject details = new JsonObject();
+            details.addProperty("source_step", stepIndex);
+            details.addProperty("available_steps", values.size());
+            throw new TypedApiException("BAD_REQUEST", "Pipeline placeholder must reference an earlier step", details);
+        }
+        return stepIndex;
+    }
+
+    Object get(int stepIndex) {
+        return values.get(stepIndex);
+    }
+
+    void add(Object value) {
+        values.add(value);
+    }
+
+    /**
+     * Checks every placeholder in {@code params} up front, so a bad index fails the step as BAD_REQUEST instead of
+     * being reported as an overload that could not be coerced.
+     */
+    void validate(JsonElement params) throws TypedApiException {
+        if (params == null || params.isJsonNull() || params.isJsonPrimitive()) {
+            return;
+        }
+        if (isPlaceholder(params)) {
+            indexOf(params);
+            return;
+        }
+        if (params.isJsonArray()) {
+            for (JsonElement item : params.getAsJsonArray()) {
+                validate(item);
+            }
+            return;
+        }
+        for (Map.Entry<String, JsonElement> entry : params.getAsJsonObject().entrySet()) {
+            validate(entry.getValue());
+        }
+    }
+}
@@ -1,14 +1,52 @@
 package com.pyritone.bridge.runtime;
 
-import java.util.HashMap;
+import com.pyritone.bridge.config.BridgeConfig;
+
+import java.util.Collection;
 import java.util.IdentityHashMap;
+import java.util.Iterator;
+import java.util.LinkedHashMap;
 import java.util.Map;
 import java.util.Optional;
 import java.util.Set;
 import java.util.concurrent.ConcurrentHashMap;
+import java.util.function.LongSupplier;
 
 public final class RemoteReferenceTable {
+    private static final String REFERENCE_PREFIX = "ref-";
+
     private final Map<String, SessionReferences> sessions = new ConcurrentHashMap<>();
+    private final int maxReferencesPerSession;
+    private final long referenceTtlMs;
+    private final LongSupplier clock;
+
+    public RemoteReferenceTable() {
+        this(BridgeConfig.MAX_REMOTE_REFERENCES_PER_SESSION, BridgeConfig.REMOTE_REFERENCE_TTL_MS);
+    }
+
+    public RemoteReferenceTable(int maxReferencesPerSession, long referenceTtlMs) {
+        this(maxReferencesPerSession, referenceTtlMs, System::currentTimeMillis);
+    }
+
+    RemoteReferenceTable(int maxReferencesPerSession, long referenceTtlMs, LongSupplier clock) {
+        if (maxReferencesPerSession <= 0) {
+            throw new IllegalArgumentException("maxReferencesPerSession must be > 0");
+        }
+        if (clock == null) {
+            throw new IllegalArgumentException("clock is required");
+        }
+        this.maxReferencesPerSession = maxReferencesPerSession;
+        this.referenceTtlMs = referenceTtlMs;
+        this.clock = clock;
+    }
+
+    public int maxReferencesPerSession() {
+        return maxReferencesPerSession;
+    }
+
+    public long referenceTtlMs() {
+        return referenceTtlMs;
+    }
 
     public void clear() {
         sessions.clear();
@@ -37,7 +75,7 @@ public final class RemoteReferenceTable {
             throw new IllegalArgumentException("value is required");
         }
         SessionReferences references = sessions.computeIfAbsent(sessionId, ignored -> new SessionReferences());
-        return references.store(value);
+        return references.store(value, clock.getAsLong());
     }
 
     public Optional<Object> resolve(String sessionId, String referenceId) {
@@ -48,28 +86,144 @@ public final class RemoteReferenceTable {
         if (references == null) {
             return Optional.empty();
         }
-        return references.resolve(referenceId);
+        return references.resolve(referenceId, clock.getAsLong());
+    }
+
+    /**
+     * Returns true when the id was issued to this session but has since been evicted or released.
+     */
+    public boolean isExpired(String sessionId, String referenceId) {
+        if (sessionId == null || sessionId.isBlank() || referenceId == null || referenceId.isBlank()) {
+            return false;
+        }
+        SessionReferences references = sessions.get(sessionId);
+        return references != null && references.isExpired(referenceId, clock.getAsLong());
+    }
+
+    public int release(String sessionId, Collection<String> referenceIds) {
+        if (sessionId == null || sessionId.isBlank() || referenceIds == null) {
+            return 0;
+        }
+        SessionReferences references = sessions.get(sessionId);
+        if (references == null) {
+            return 0;
+        }
+        return references.release(referenceIds);
+    }
+
+    public int size(String sessionId) {
+        SessionReferences references = sessionId == null ? null : sessions.get(sessionId);
+        return references == null ? 0 : references.size();
+    }
+
+    public long evictedCount(String sessionId) {
+        SessionReferences references = sessionId == null ? null : sessions.get(sessionId);
+        return references == null ? 0L : references.evictedCount();
+    }
+
+    private static long parseSequence(String referenceId) {
+        if (!referenceId.startsWith(REFERENCE_PREFIX)) {
+            return -1L;
+        }
+        try {
+            return Long.parseLong(referenceId.substring(REFERENCE_PREFIX.length()));
+        } catch (NumberFormatException exception) {
+            return -1L;
+        }
     }
 
-    private static final class SessionReferences {
-        private final Map<String, Object> byReferenceId = new HashMap<>();
+    private final class SessionReferences {
+        // Access-ordered, so iteration starts at the least recently used reference.
+        private final LinkedHashMap<String, Entry> byReferenceId = new LinkedHashMap<>(16, 0.75f, true);
         private final IdentityHashMap<Object, String> byIdentity = new IdentityHashMap<>();
         private long sequence = 1L;
+        private long evicted = 0L;
 
-        private synchronized String store(Object value) {
+        private synchronized String store(Object value, long now) {
+            expire(now);
             String existing = byIdentity.get(value);
             if (existing != null) {
+                byReferenceId.get(existing).lastAccessMs = now;
                 return existing;
             }
 
-            String referenceId = "ref-" + sequence++;
-            byReferenceId.put(referenceId, value);
+            String referenceId = REFERENCE_PREFIX + sequence++;
+            byReferenceId.put(referenceId, new Entry(value, now));
             byIdentity.put(value, referenceId);
+            trimToCapacity();
             return referenceId;
         }
 
-        private synchronized Optional<Object> resolve(String referenceId) {
-            return Optional.ofNullable(byReferenceId.get(referenceId));
+        private synchronized Optional<Object> resolve(String referenceId, long now) {
+            expire(now);
+            Entry entry = byReferenceId.get(referenceId);
+            if (entry == null) {
+                return Optional.empty();
+            }
+            entry.lastAccessMs = now;
+            return Optional.of(entry.value);
+        }
+
+        private synchronized boolean isExpired(String referenceId, long now) {
+            expire(now);
+            long referenceSequence = parseSequence(referenceId);
+            return referenceSequence > 0L && referenceSequence < sequence && !byReferenceId.containsKey(referenceId);
+        }
+
+        private synchronized int release(Collection<String> referenceIds) {
+            int released = 0;
+            for (String referenceId : referenceIds) {
+                Entry entry = referenceId == null ? null : byReferenceId.remove(referenceId);
+                if (entry != null) {
+                    byIdentity.remove(entry.value);
+                    released += 1;
+                }
+            }
+            return released;
+        }
+
+        private synchronized int size() {
+            return byReferenceId.size();
+        }
+
+        private synchronized long evictedCount() {
+            return evicted;
+        }
+
+        private void expire(long now) {
+            if (referenceTtlMs <= 0L) {
+                return;
+            }
+            Iterator<Map.Entry<String, Entry>> iterator = byReferenceId.entrySet().iterator();
+            while (iterator.hasNext()) {
+                Map.Entry<String, Entry> eldest = iterator.next();
+                if (now - eldest.getValue().lastAccessMs < referenceTtlMs) {
+                    return;
+                }
+                iterator.remove();
+                byIdentity.remove(eldest.getValue().value);
+                evicted += 1L;
+            }
+        }
+
+        private void trimToCapacity() {
+            Iterator<Map.Entry<String, Entry>> iterator = byReferenceId.entrySet().iterator();
+            while (byReferenceId.size() > maxReferencesPerSession && iterator.hasNext()) {
+                Map.Entry<String, Entry> eldest = iterator.next();
+                iterator.remove();
+                byIdentity.remove(eldest.getValue().value);
+                evicted += 1L;
+            }
+        }
+    }
+
+    private static final class Entry {
+        private final Object value;
+        private long lastAccessMs;
+
+        private Entry(Object value, long lastAccessMs) {
+            this.value = value;
+            this.lastAccessMs = lastAccessMs;
         }
     }
 }
@@ -0,0 +1,115 @@
+package com.pyritone.bridge.runtime;
+
+import com.google.gson.JsonArray;
+import com.google.gson.JsonElement;
+import com.google.gson.JsonNull;
+import com.google.gson.JsonObject;
+
+import java.util.LinkedHashSet;
+import java.util.List;
+import java.util.Set;
+
+/**
+ * Per-session status projection and rate parsed from {@code status.get}/{@code status.subscribe} params.
+ *
+ * <p>{@code fields} limits which top-level status fields are built, compared and sent ({@code null} means all).
+ * {@code heartbeatMs} is the interval for unchanged-status heartbeats and {@code minIntervalMs} the minimum gap
+ * between change updates; changes inside that gap are coalesced into the next update.
+ */
+public record StatusStreamOptions(Set<String> fields, long heartbeatMs, long minIntervalMs) {
+    public static final List<String> FIELDS = List.of(
+        "protocol_version",
+        "server_version",
+        "host",
+        "port",
+        "authenticated",
+        "baritone_available",
+        "in_world",
+        "active_task",
+        "watch_patterns",
+        "player"
+    );
+    public static final long MIN_HEARTBEAT_MS = 50L;
+    public static final long MAX_HEARTBEAT_MS = 10L * 60L * 1_000L;
+
+    public StatusStreamOptions {
+        fields = fields == null ? null : Set.copyOf(fields);
+    }
+
+    public static StatusStreamOptions defaults(long heartbeatMs) {
+        return new StatusStreamOptions(null, heartbeatMs, 0L);
+    }
+
+    public static StatusStreamOptions fromParams(JsonObject params, long defaultHeartbeatMs) {
+        Set<String> fields = readFields(params);
+        long heartbeatMs = readMillis(params, "heartbeat_ms", defaultHeartbeatMs);
+        if (heartbeatMs < MIN_HEARTBEAT_MS || heartbeatMs > MAX_HEARTBEAT_MS) {
+            throw new IllegalArgumentException(
+                "heartbeat_ms must be between " + MIN_HEARTBEAT_MS + " and " + MAX_HEARTBEAT_MS
+            );
+        }
+        long minIntervalMs = readMillis(params, "min_interval_ms", 0L);
+        if (minIntervalMs < 0L || minIntervalMs > heartbeatMs) {
+            throw new IllegalArgumentException("min_interval_ms must be between 0 and heartbeat_ms");
+        }
+        return new StatusStreamOptions(fields, heartbeatMs, minIntervalMs);
+    }
+
+    public boolean includes(String field) {
+        return fields == null || fields.contains(field);
+    }
+
+    public JsonObject toJson() {
+        JsonObject object = new JsonObject();
+        if (fields == null) {
+            object.add("fields", JsonNull.INSTANCE);
+        } else {
+            JsonArray array = new JsonArray();
+            for (String field : FIELDS) {
+                if (fields.contains(field)) {
+                    array.add(field);
+                }
+            }
+            object.add("fields", array);
+        }
+        object.addProperty("heartbeat_ms", heartbeatMs);
+        object.addProperty("min_interval_ms", minIntervalMs);
+        return object;
+    }
+
+    private static Set<String> readFields(JsonObject params) {
+        if (params == null || !params.has("fields") || params.get("fields").isJsonNull()) {
+            return null;
+        }
+
+        JsonElement element = params.get("fields");
+        if (!element.isJsonArray()) {
+            throw new IllegalArgumentException("fields must be an array of status field names");
+        }
+
+        Set<String> fields = new LinkedHashSet<>();
+        for (JsonElement entry : element.getAsJsonArray()) {
+            if (!entry.isJsonPrimitive() || !entry.getAsJsonPrimitive().isString()) {
+                throw new IllegalArgumentException("fields entries must be strings");
+            }
+            String field = entry.getAsString().trim();
+            if (!FIELDS.contains(field)) {
+                throw new IllegalArgumentException("Unknown status field: " + field + " (supported: " + String.join(", ", FIELDS) + ")");
+            }
+            fields.add(field);
+        }
+        return fields;
+    }
+
+    private static long readMillis(JsonObject params, String key, long fallback) {
+        if (params == null || !params.has(key) || params.get(key).isJsonNull()) {
+            return fallback;
+        }
+
+        JsonElement element = params.get(key);
+        if (!element.isJsonPrimitive() || !element.getAsJsonPrimitive().isNumber()) {
+            throw new IllegalArgumentException(key + " must be a number of milliseconds");
+        }
+        return element.getAsLong();
+    }
+}
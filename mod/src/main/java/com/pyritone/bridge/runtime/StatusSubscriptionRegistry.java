@@ -1,6 +1,11 @@
 package com.pyritone.bridge.runtime;
 
+import com.google.gson.JsonArray;
+import com.google.gson.JsonElement;
+import com.google.gson.JsonObject;
+
 import java.util.Map;
+import java.util.Objects;
 import java.util.Optional;
 import java.util.Set;
 import java.util.concurrent.ConcurrentHashMap;
@@ -12,16 +17,31 @@ public final class StatusSubscriptionRegistry {
         subscriptions.clear();
     }
 
-    public void subscribe(String sessionId, String statusDigest, long nowMs) {
+    /**
+     * Subscribes with the (projected) status object as baseline and per-session options, and returns the baseline
+     * sequence number. In delta mode each emission carries only the top-level fields that changed since the
+     * previous emission. Re-subscribing keeps the sequence increasing, so updates sent before the new baseline are
+     * recognizable as stale.
+     */
+    public long subscribe(
+        String sessionId,
+        JsonObject status,
+        long nowMs,
+        boolean delta,
+        StatusStreamOptions options
+    ) {
         if (sessionId == null || sessionId.isBlank()) {
-            return;
+            return 0L;
         }
+        Objects.requireNonNull(options, "options");
 
+        long[] sequence = new long[1];
         subscriptions.compute(sessionId, (ignored, existing) -> {
             SubscriptionState state = existing == null ? new SubscriptionState() : existing;
-            state.seed(statusDigest, nowMs);
+            sequence[0] = state.seed(status, nowMs, delta, options);
             return state;
         });
+        return sequence[0];
     }
 
     public boolean unsubscribe(String sessionId) {
@@ -31,6 +51,15 @@ public final class StatusSubscriptionRegistry {
         return subscriptions.remove(sessionId) != null;
     }
 
+    /** Options the session subscribed with, or {@code null} when it is not subscribed. */
+    public StatusStreamOptions options(String sessionId) {
+        if (sessionId == null) {
+            return null;
+        }
+        SubscriptionState state = subscriptions.get(sessionId);
+        return state == null ? null : state.options;
+    }
+
     public void retainSessions(Set<String> activeSessionIds) {
         if (activeSessionIds == null) {
             clear();
@@ -39,12 +68,13 @@ public final class StatusSubscriptionRegistry {
         subscriptions.keySet().retainAll(activeSessionIds);
     }
 
-    public Optional<Emission> evaluate(
-        String sessionId,
-        String statusDigest,
-        long nowMs,
-        long heartbeatIntervalMs
-    ) {
+    /**
+     * Compares {@code status} with the last emitted status structurally (no serialization) and returns the
+     * emission to send, if any, using the heartbeat and minimum change interval the session subscribed with.
+     * Changes seen before {@code min_interval_ms} has passed since the previous emission are held back and sent as
+     * one update once it has.
+     */
+    public Optional<Emission> evaluate(String sessionId, JsonObject status, long nowMs) {
         if (sessionId == null || sessionId.isBlank()) {
             return Optional.empty();
         }
@@ -53,40 +83,89 @@ public final class StatusSubscriptionRegistry {
         if (state == null) {
             return Optional.empty();
         }
-        return Optional.ofNullable(state.evaluate(statusDigest, nowMs, heartbeatIntervalMs));
+        return Optional.ofNullable(
+            state.evaluate(status, nowMs, state.options.heartbeatMs(), state.options.minIntervalMs())
+        );
+    }
+
+    static JsonObject diff(JsonObject previous, JsonObject current) {
+        JsonObject changed = new JsonObject();
+        for (Map.Entry<String, JsonElement> entry : current.entrySet()) {
+            JsonElement before = previous != null ? previous.get(entry.getKey()) : null;
+            if (!Objects.equals(before, entry.getValue())) {
+                changed.add(entry.getKey(), entry.getValue());
+            }
+        }
+        return changed;
+    }
+
+    static JsonArray removedFields(JsonObject previous, JsonObject current) {
+        JsonArray removed = new JsonArray();
+        if (previous == null) {
+            return removed;
+        }
+        for (String key : previous.keySet()) {
+            if (!current.has(key)) {
+                removed.add(key);
+            }
+        }
+        return removed;
     }
 
     private static final class SubscriptionState {
-        private String lastDigest;
+        private JsonObject lastStatus;
         private long lastEmittedAtMs;
         private long sequence;
+        private boolean delta;
+        private volatile StatusStreamOptions options;
 
-        private synchronized void seed(String statusDigest, long nowMs) {
-            this.lastDigest = statusDigest;
+        private synchronized long seed(JsonObject status, long nowMs, boolean delta, StatusStreamOptions options) {
+            this.lastStatus = status;
             this.lastEmittedAtMs = nowMs;
-            this.sequence = 0;
+            this.delta = delta;
+            this.options = options;
+            return sequence;
         }
 
-        private synchronized Emission evaluate(String statusDigest, long nowMs, long heartbeatIntervalMs) {
-            boolean changed = lastDigest == null || !lastDigest.equals(statusDigest);
+        private synchronized Emission evaluate(JsonObject status, long nowMs, long heartbeatIntervalMs, long minIntervalMs) {
+            boolean changed = lastStatus == null || !lastStatus.equals(status);
+            long baseSequence = sequence;
             if (changed) {
-                lastDigest = statusDigest;
+                if (nowMs - lastEmittedAtMs < minIntervalMs) {
+                    return null;
+                }
+                JsonObject previous = lastStatus;
+                lastStatus = status;
                 lastEmittedAtMs = nowMs;
                 sequence += 1;
-                return new Emission("change", sequence);
+                return emission("change", baseSequence, previous, status);
             }
 
             long interval = Math.max(heartbeatIntervalMs, 1L);
             if (nowMs - lastEmittedAtMs >= interval) {
                 lastEmittedAtMs = nowMs;
                 sequence += 1;
-                return new Emission("heartbeat", sequence);
+                return emission("heartbeat", baseSequence, status, status);
             }
 
             return null;
         }
+
+        private Emission emission(String reason, long baseSequence, JsonObject previous, JsonObject current) {
+            if (!delta) {
+                return new Emission(reason, sequence, baseSequence, null, null);
+            }
+            return new Emission(reason, sequence, baseSequence, diff(previous, current), removedFields(previous, current));
+        }
     }
 
-    public record Emission(String reason, long sequence) {
+    /**
+     * One {@code status.update} to send. {@code changed}/{@code removed} are set only for delta subscriptions and
+     * apply on top of the status at {@code baseSequence}.
+     */
+    public record Emission(String reason, long sequence, long baseSequence, JsonObject changed, JsonArray removed) {
+        public boolean isDelta() {
+            return changed != null;
+        }
     }
 }
@@ -20,13 +20,29 @@ import java.util.stream.Collectors;
 
 public final class TypedApiService {
     public static final String REF_KEY = "$pyritone_ref";
+    public static final String STEP_KEY = "$step";
+    public static final String VALUE_KEY = "$pyritone_value";
+    public static final String ARRAY_KEY = "$pyritone_array";
+    public static final int MAX_BATCH_CALLS = 256;
+    public static final String REF_EXPIRED = "REF_EXPIRED";
+    public static final int MAX_WATCH_EVERY_TICKS = 1_200;
     private static final int METADATA_VERSION = 1;
 
     private final Map<String, RootBinding> roots = new ConcurrentHashMap<>();
-    private final RemoteReferenceTable references = new RemoteReferenceTable();
+    private final RemoteReferenceTable references;
     private final TypedApiValueCodec codec;
+    private final TypedApiWatchRegistry watches = new TypedApiWatchRegistry();
+    private final Set<String> packedArraySessions = ConcurrentHashMap.newKeySet();
 
     public TypedApiService(ClassLoader classLoader) {
+        this(classLoader, new RemoteReferenceTable());
+    }
+
+    public TypedApiService(ClassLoader classLoader, RemoteReferenceTable references) {
+        if (references == null) {
+            throw new IllegalArgumentException("references is required");
+        }
+        this.references = references;
         this.codec = new TypedApiValueCodec(classLoader, references);
     }
 
@@ -43,15 +59,57 @@ public final class TypedApiService {
         roots.put(name, new RootBinding(name, javaType, resolver));
     }
 
+    /**
+     * Registers an inline encoding for {@code type} (and its subclasses), used when a call sets {@code materialize}.
+     */
+    public <T> void registerInlineValue(String kind, Class<T> type, InlineValueEncoder<? super T> encoder) {
+        if (kind == null || kind.isBlank()) {
+            throw new IllegalArgumentException("kind is required");
+        }
+        if (type == null) {
+            throw new IllegalArgumentException("type is required");
+        }
+        if (encoder == null) {
+            throw new IllegalArgumentException("encoder is required");
+        }
+        codec.registerInlineValue(kind, type, encoder);
+    }
+
+    /**
+     * Enables the packed `$pyritone_array` encoding for numeric arrays returned to this session.
+     */
+    public void setPackedArrays(String sessionId, boolean enabled) {
+        if (sessionId == null || sessionId.isBlank()) {
+            return;
+        }
+        if (enabled) {
+            packedArraySessions.add(sessionId);
+        } else {
+            packedArraySessions.remove(sessionId);
+        }
+    }
+
     public void clear() {
         references.clear();
+        watches.clear();
+        packedArraySessions.clear();
     }
 
     public void retainSessions(Set<String> activeSessionIds) {
         references.retainSessions(activeSessionIds);
+        watches.retainSessions(activeSessionIds);
+        if (activeSessionIds == null) {
+            packedArraySessions.clear();
+        } else {
+            packedArraySessions.retainAll(activeSessionIds);
+        }
     }
 
     public JsonObject metadata(String sessionId, JsonObject params) throws TypedApiException {
+        return metadata(sessionId, params, PipelineSteps.NONE);
+    }
+
+    private JsonObject metadata(String sessionId, JsonObject params, PipelineSteps steps) throws TypedApiException {
         JsonObject result = new JsonObject();
         result.addProperty("metadata_version", METADATA_VERSION);
 
@@ -69,19 +127,23 @@ public final class TypedApiService {
             return result;
         }
 
-        ResolvedTarget target = resolveTarget(sessionId, targetPayload, false);
+        ResolvedTarget target = resolveTarget(sessionId, targetPayload, false, steps);
         result.add("target", describeTarget(target));
         result.add("type", describeType(target.targetClass()));
         return result;
     }
 
     public JsonObject construct(String sessionId, JsonObject params) throws TypedApiException {
+        return construct(sessionId, params, PipelineSteps.NONE).result();
+    }
+
+    private CallResult construct(String sessionId, JsonObject params, PipelineSteps steps) throws TypedApiException {
         String typeName = requireString(params, "type", "Missing type");
         Class<?> targetType = codec.resolveTypeByName(typeName);
         JsonArray args = readArgs(params);
         String[] parameterTypeNames = readOptionalTypeNames(params);
 
-        ConstructSelection selection = selectConstructor(targetType, args, parameterTypeNames, sessionId);
+        ConstructSelection selection = selectConstructor(targetType, args, parameterTypeNames, sessionId, steps);
         Object instance;
         try {
             instance = selection.constructor().newInstance(selection.arguments());
@@ -93,19 +155,24 @@ public final class TypedApiService {
         }
 
         JsonObject result = new JsonObject();
-        result.add("value", codec.encodeValue(sessionId, instance));
+        result.add("value", codec.encodeValue(sessionId, instance, false, packedArraySessions.contains(sessionId)));
         result.addProperty("java_type", instance == null ? targetType.getName() : instance.getClass().getName());
-        return result;
+        return new CallResult(result, instance);
     }
 
     public JsonObject invoke(String sessionId, JsonObject params) throws TypedApiException {
+        return invoke(sessionId, params, PipelineSteps.NONE).result();
+    }
+
+    private CallResult invoke(String sessionId, JsonObject params, PipelineSteps steps) throws TypedApiException {
         JsonObject targetPayload = requireObject(params, "target", "Missing target");
         String methodName = requireString(params, "method", "Missing method");
         JsonArray args = readArgs(params);
         String[] parameterTypeNames = readOptionalTypeNames(params);
+        boolean materialize = readOptionalBoolean(params, "materialize");
 
-        ResolvedTarget target = resolveTarget(sessionId, targetPayload, true);
-        MethodSelection selection = selectMethod(target, methodName, args, parameterTypeNames, sessionId);
+        ResolvedTarget target = resolveTarget(sessionId, targetPayload, true, steps);
+        MethodSelection selection = selectMethod(target, methodName, args, parameterTypeNames, sessionId, steps);
 
         Object value;
         try {
@@ -118,12 +185,250 @@ public final class TypedApiService {
         }
 
         JsonObject result = new JsonObject();
-        result.add("value", codec.encodeValue(sessionId, value));
+        result.add("value", codec.encodeValue(sessionId, value, materialize, packedArraySessions.contains(sessionId)));
         result.addProperty("return_type", selection.method().getReturnType().getName());
+        return new CallResult(result, value);
+    }
+
+    public JsonObject batch(String sessionId, JsonObject params) throws TypedApiException {
+        JsonArray calls = requireArray(params, "calls", "Missing calls");
+        if (calls.size() > MAX_BATCH_CALLS) {
+            JsonObject details = new JsonObject();
+            details.addProperty("max_calls", MAX_BATCH_CALLS);
+            details.addProperty("actual_count", calls.size());
+            throw new TypedApiException("BAD_REQUEST", "Too many calls in batch", details);
+        }
+
+        JsonArray results = new JsonArray();
+        for (int index = 0; index < calls.size(); index += 1) {
+            JsonElement item = calls.get(index);
+            try {
+                if (!item.isJsonObject()) {
+                    throw new TypedApiException("BAD_REQUEST", "Expected batch call to be an object");
+                }
+                JsonObject call = item.getAsJsonObject();
+                String method = requireString(call, "method", "Missing batch call method");
+                JsonObject callParams = readOptionalObject(call, "params");
+                JsonObject payload = callParams == null ? new JsonObject() : callParams;
+                results.add(batchSuccess(dispatchCall(sessionId, method, payload, PipelineSteps.NONE).result()));
+            } catch (TypedApiException exception) {
+                results.add(batchFailure(exception.code(), exception.getMessage(), exception.details()));
+            } catch (RuntimeException exception) {
+                JsonObject details = new JsonObject();
+                details.addProperty("cause_type", exception.getClass().getName());
+                details.addProperty("cause_message", exception.getMessage());
+                results.add(batchFailure("INTERNAL_ERROR", "Typed API invocation failed", details));
+            }
+        }
+
+        JsonObject result = new JsonObject();
+        result.add("results", results);
+        return result;
+    }
+
+    public JsonObject pipeline(String sessionId, JsonObject params) throws TypedApiException {
+        JsonArray steps = requireArray(params, "steps", "Missing steps");
+        if (steps.size() > MAX_BATCH_CALLS) {
+            JsonObject details = new JsonObject();
+            details.addProperty("max_calls", MAX_BATCH_CALLS);
+            details.addProperty("actual_count", steps.size());
+            throw new TypedApiException("BAD_REQUEST", "Too many steps in pipeline", details);
+        }
+
+        JsonArray results = new JsonArray();
+        PipelineSteps values = PipelineSteps.create();
+        int failedStep = -1;
+        for (int index = 0; index < steps.size(); index += 1) {
+            if (failedStep >= 0) {
+                JsonObject details = new JsonObject();
+                details.addProperty("step", index);
+                details.addProperty("failed_step", failedStep);
+                results.add(batchFailure("API_PIPELINE_ABORTED", "Pipeline aborted after failed step " + failedStep, details));
+                continue;
+            }
+
+            JsonElement item = steps.get(index);
+            try {
+                if (!item.isJsonObject()) {
+                    throw new TypedApiException("BAD_REQUEST", "Expected pipeline step to be an object");
+                }
+                JsonObject step = item.getAsJsonObject();
+                String method = requireString(step, "method", "Missing pipeline step method");
+                JsonObject stepParams = readOptionalObject(step, "params");
+                JsonObject payload = stepParams == null ? new JsonObject() : stepParams;
+                values.validate(payload);
+                CallResult result = dispatchCall(sessionId, method, payload, values);
+                values.add(result.value());
+                results.add(batchSuccess(result.result()));
+            } catch (TypedApiException exception) {
+                failedStep = index;
+                results.add(batchFailure(exception.code(), exception.getMessage(), withStep(exception.details(), index)));
+            } catch (RuntimeException exception) {
+                failedStep = index;
+                JsonObject details = new JsonObject();
+                details.addProperty("step", index);
+                details.addProperty("cause_type", exception.getClass().getName());
+                details.addProperty("cause_message", exception.getMessage());
+                results.add(batchFailure("INTERNAL_ERROR", "Typed API invocation failed", details));
+            }
+        }
+
+        JsonObject result = new JsonObject();
+        result.add("results", results);
+        return result;
+    }
+
+    public JsonObject release(String sessionId, JsonObject params) throws TypedApiException {
+        JsonArray ids = requireArray(params, "ids", "Missing ids");
+        List<String> referenceIds = new ArrayList<>(ids.size());
+        for (JsonElement item : ids) {
+            if (!item.isJsonPrimitive() || !item.getAsJsonPrimitive().isString()) {
+                throw new TypedApiException("BAD_REQUEST", "Expected ids items to be strings");
+            }
+            referenceIds.add(item.getAsString());
+        }
+
+        JsonObject result = new JsonObject();
+        result.addProperty("released", references.release(sessionId, referenceIds));
+        result.addProperty("live", references.size(sessionId));
         return result;
     }
 
-    private ResolvedTarget resolveTarget(String sessionId, JsonObject targetPayload, boolean requireInstance) throws TypedApiException {
+    public JsonObject watch(String sessionId, JsonObject params) throws TypedApiException {
+        int everyTicks = 1;
+        if (params.has("every_ticks")) {
+            JsonElement raw = params.get("every_ticks");
+            if (!raw.isJsonPrimitive() || !raw.getAsJsonPrimitive().isNumber()) {
+                throw new TypedApiException("BAD_REQUEST", "Expected every_ticks to be an integer");
+            }
+            everyTicks = raw.getAsInt();
+        }
+        if (everyTicks < 1 || everyTicks > MAX_WATCH_EVERY_TICKS) {
+            JsonObject details = new JsonObject();
+            details.addProperty("every_ticks", everyTicks);
+            details.addProperty("max_every_ticks", MAX_WATCH_EVERY_TICKS);
+            throw new TypedApiException("BAD_REQUEST", "every_ticks must be between 1 and " + MAX_WATCH_EVERY_TICKS, details);
+        }
+
+        JsonObject call = new JsonObject();
+        call.add("target", requireObject(params, "target", "Missing target"));
+        call.addProperty("method", requireString(params, "method", "Missing method"));
+        call.add("args", readArgs(params));
+        if (params.has("parameter_types")) {
+            call.add("parameter_types", params.get("parameter_types"));
+        }
+        if (params.has("materialize")) {
+            call.add("materialize", params.get("materialize"));
+        }
+
+        // Evaluating once up front validates the call and seeds the change baseline.
+        JsonObject initial = invoke(sessionId, call);
+        JsonElement value = initial.get("value");
+        String watchId = watches.add(sessionId, call, everyTicks, value);
+
+        JsonObject result = new JsonObject();
+        result.addProperty("watch_id", watchId);
+        result.addProperty("every_ticks", everyTicks);
+        result.add("value", value);
+        result.add("return_type", initial.get("return_type"));
+        return result;
+    }
+
+    public JsonObject unwatch(String sessionId, JsonObject params) throws TypedApiException {
+        String watchId = requireString(params, "watch_id", "Missing watch_id");
+        JsonObject result = new JsonObject();
+        result.addProperty("watch_id", watchId);
+        result.addProperty("removed", watches.remove(sessionId, watchId));
+        return result;
+    }
+
+    /**
+     * Evaluates the session's due watches; must run on the client thread. Returns `api.watch.changed` payloads.
+     */
+    public List<JsonObject> tickWatches(String sessionId) {
+        List<TypedApiWatchRegistry.Change> changes = watches.tick(
+            sessionId,
+            call -> invoke(sessionId, call).get("value")
+        );
+        List<JsonObject> payloads = new ArrayList<>(changes.size());
+        for (TypedApiWatchRegistry.Change change : changes) {
+            JsonObject payload = new JsonObject();
+            payload.addProperty("watch_id", change.watchId());
+            payload.addProperty("seq", change.sequence());
+            if (change.failed()) {
+                TypedApiException error = change.error();
+                JsonObject errorPayload = new JsonObject();
+                errorPayload.addProperty("code", error.code());
+                errorPayload.addProperty("message", error.getMessage());
+                if (error.details() != null) {
+                    errorPayload.add("details", error.details());
+                }
+                payload.add("error", errorPayload);
+                payload.addProperty("active", false);
+            } else {
+                payload.add("value", change.value());
+                payload.addProperty("active", true);
+            }
+            payloads.add(payload);
+        }
+        return payloads;
+    }
+
+    private static JsonObject withStep(JsonObject details, int index) {
+        JsonObject merged = details == null ? new JsonObject() : details.deepCopy();
+        merged.addProperty("step", index);
+        return merged;
+    }
+
+    private CallResult dispatchCall(String sessionId, String method, JsonObject params, PipelineSteps steps) throws TypedApiException {
+        return switch (method) {
+            case "api.metadata.get" -> {
+                JsonObject result = metadata(sessionId, params, steps);
+                yield new CallResult(result, result);
+            }
+            case "api.construct" -> construct(sessionId, params, steps);
+            case "api.invoke" -> invoke(sessionId, params, steps);
+            default -> throw typedError("METHOD_NOT_FOUND", "Unsupported batch method: " + method, "method", method);
+        };
+    }
+
+    private static JsonObject batchSuccess(JsonObject result) {
+        JsonObject entry = new JsonObject();
+        entry.addProperty("ok", true);
+        entry.add("result", result);
+        return entry;
+    }
+
+    private static JsonObject batchFailure(String code, String message, JsonObject details) {
+        JsonObject error = new JsonObject();
+        error.addProperty("code", code);
+        error.addProperty("message", message);
+        if (details != null) {
+            error.add("data", details);
+        }
+
+        JsonObject entry = new JsonObject();
+        entry.addProperty("ok", false);
+        entry.add("error", error);
+        return entry;
+    }
+
+    private ResolvedTarget resolveTarget(
+        String sessionId,
+        JsonObject targetPayload,
+        boolean requireInstance,
+        PipelineSteps steps
+    ) throws TypedApiException {
+        if (steps.isPlaceholder(targetPayload)) {
+            int stepIndex = steps.indexOf(targetPayload);
+            Object instance = steps.get(stepIndex);
+            if (instance == null) {
+                JsonObject details = new JsonObject();
+                details.addProperty("source_step", stepIndex);
+                throw new TypedApiException("API_TARGET_UNAVAILABLE", "Pipeline step " + stepIndex + " returned null", details);
+            }
+            return new ResolvedTarget("step", null, null, instance.getClass(), instance);
+        }
         String kind = requireString(targetPayload, "kind", "Missing target kind");
         return switch (kind) {
             case "root" -> {
@@ -153,10 +458,7 @@ public final class TypedApiService {
             }
             case "ref" -> {
                 String referenceId = requireString(targetPayload, "id", "Missing reference id");
-                Object instance = references.resolve(sessionId, referenceId).orElse(null);
-                if (instance == null) {
-                    throw typedError("API_REFERENCE_NOT_FOUND", "Unknown remote reference: " + referenceId, "reference_id", referenceId);
-                }
+                Object instance = codec.resolveReference(sessionId, referenceId, new JsonObject());
                 yield new ResolvedTarget("ref", null, referenceId, instance.getClass(), instance);
             }
             case "type" -> {
@@ -172,7 +474,8 @@ public final class TypedApiService {
         Class<?> type,
         JsonArray args,
         String[] parameterTypeNames,
-        String sessionId
+        String sessionId,
+        PipelineSteps steps
     ) throws TypedApiException {
         if (parameterTypeNames != null) {
             Class<?>[] parameterTypes = resolveParameterTypes(parameterTypeNames);
@@ -186,7 +489,7 @@ public final class TypedApiService {
                 throw new TypedApiException("API_CONSTRUCTOR_NOT_FOUND", "No matching constructor for type: " + type.getName(), details);
             }
 
-            Object[] parameters = codec.coerceArguments(sessionId, args, constructor.getParameterTypes());
+            Object[] parameters = codec.coerceArguments(sessionId, args, constructor.getParameterTypes(), steps);
             return new ConstructSelection(constructor, parameters);
         }
 
@@ -197,9 +500,12 @@ public final class TypedApiService {
 
         for (Constructor<?> candidate : candidates) {
             try {
-                Object[] parameters = codec.coerceArguments(sessionId, args, candidate.getParameterTypes());
+                Object[] parameters = codec.coerceArguments(sessionId, args, candidate.getParameterTypes(), steps);
                 matches.add(new ConstructSelection(candidate, parameters));
-            } catch (TypedApiException ignored) {
+            } catch (TypedApiException exception) {
+                if (REF_EXPIRED.equals(exception.code())) {
+                    throw exception;
+                }
                 // Continue searching for a compatible constructor.
             }
         }
@@ -238,7 +544,8 @@ public final class TypedApiService {
         String methodName,
         JsonArray args,
         String[] parameterTypeNames,
-        String sessionId
+        String sessionId,
+        PipelineSteps steps
     ) throws TypedApiException {
         Class<?> type = target.targetClass();
         boolean staticOnly = "type".equals(target.kind());
@@ -263,7 +570,7 @@ public final class TypedApiService {
                 throw typedError("API_METHOD_NOT_FOUND", "Instance target does not allow static method invocation: " + methodName, "target_type", type.getName());
             }
 
-            Object[] parameters = codec.coerceArguments(sessionId, args, method.getParameterTypes());
+            Object[] parameters = codec.coerceArguments(sessionId, args, method.getParameterTypes(), steps);
             Object invokeTarget = Modifier.isStatic(method.getModifiers()) ? null : target.targetObject();
             return new MethodSelection(method, invokeTarget, parameters);
         }
@@ -277,10 +584,13 @@ public final class TypedApiService {
 
         for (Method candidate : candidates) {
             try {
-                Object[] parameters = codec.coerceArguments(sessionId, args, candidate.getParameterTypes());
+                Object[] parameters = codec.coerceArguments(sessionId, args, candidate.getParameterTypes(), steps);
                 Object invokeTarget = Modifier.isStatic(candidate.getModifiers()) ? null : target.targetObject();
                 matches.add(new MethodSelection(candidate, invokeTarget, parameters));
-            } catch (TypedApiException ignored) {
+            } catch (TypedApiException exception) {
+                if (REF_EXPIRED.equals(exception.code())) {
+                    throw exception;
+                }
                 // Continue searching for a compatible overload.
             }
         }
@@ -442,6 +752,17 @@ public final class TypedApiService {
         return value;
     }
 
+    private static boolean readOptionalBoolean(JsonObject source, String key) throws TypedApiException {
+        if (source == null || !source.has(key) || source.get(key).isJsonNull()) {
+            return false;
+        }
+        JsonElement value = source.get(key);
+        if (!value.isJsonPrimitive() || !value.getAsJsonPrimitive().isBoolean()) {
+            throw new TypedApiException("BAD_REQUEST", "Expected " + key + " to be a boolean");
+        }
+        return value.getAsBoolean();
+    }
+
     private static JsonObject readOptionalObject(JsonObject source, String key) {
         if (source == null || !source.has(key) || !source.get(key).isJsonObject()) {
             return null;
@@ -449,6 +770,13 @@ public final class TypedApiService {
         return source.getAsJsonObject(key);
     }
 
+    private static JsonArray requireArray(JsonObject source, String key, String message) throws TypedApiException {
+        if (source == null || !source.has(key) || !source.get(key).isJsonArray()) {
+            throw new TypedApiException("BAD_REQUEST", message);
+        }
+        return source.getAsJsonArray(key);
+    }
+
     private static JsonObject requireObject(JsonObject source, String key, String message) throws TypedApiException {
         JsonObject value = readOptionalObject(source, key);
         if (value == null) {
@@ -473,6 +801,11 @@ public final class TypedApiService {
         Object resolve() throws Exception;
     }
 
+    @FunctionalInterface
+    public interface InlineValueEncoder<T> {
+        JsonElement encode(T value);
+    }
+
     private record RootBinding(String name, String javaType, RootResolver resolver) {
     }
 
@@ -484,4 +817,10 @@ public final class TypedApiService {
 
     private record MethodSelection(Method method, Object invokeTarget, Object[] arguments) {
     }
+
+    /**
+     * Wire result of one call plus the raw Java value it encodes, which later pipeline steps consume.
+     */
+    private record CallResult(JsonObject result, Object value) {
+    }
 }
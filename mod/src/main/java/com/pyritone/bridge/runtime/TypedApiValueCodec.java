@@ -10,7 +10,10 @@ import com.google.gson.JsonPrimitive;
 
 import java.lang.reflect.Array;
 import java.lang.reflect.Modifier;
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
 import java.util.ArrayList;
+import java.util.Base64;
 import java.util.Collection;
 import java.util.LinkedHashMap;
 import java.util.LinkedHashSet;
@@ -18,18 +21,20 @@ import java.util.List;
 import java.util.Map;
 import java.util.Optional;
 import java.util.Set;
+import java.util.concurrent.ConcurrentHashMap;
 
 final class TypedApiValueCodec {
     private final Gson gson = new GsonBuilder().disableHtmlEscaping().create();
     private final ClassLoader classLoader;
     private final RemoteReferenceTable references;
+    private final Map<Class<?>, InlineCodec> inlineCodecs = new ConcurrentHashMap<>();
 
     TypedApiValueCodec(ClassLoader classLoader, RemoteReferenceTable references) {
         this.classLoader = classLoader;
         this.references = references;
     }
 
-    Object[] coerceArguments(String sessionId, JsonArray args, Class<?>[] parameterTypes) throws TypedApiException {
+    Object[] coerceArguments(String sessionId, JsonArray args, Class<?>[] parameterTypes, PipelineSteps steps) throws TypedApiException {
         if (args.size() != parameterTypes.length) {
             JsonObject details = new JsonObject();
             details.addProperty("expected_count", parameterTypes.length);
@@ -39,12 +44,33 @@ final class TypedApiValueCodec {
 
         Object[] values = new Object[parameterTypes.length];
         for (int index = 0; index < parameterTypes.length; index += 1) {
-            values[index] = coerceArgument(sessionId, args.get(index), parameterTypes[index], index);
+            values[index] = coerceArgument(sessionId, args.get(index), parameterTypes[index], index, steps);
         }
         return values;
     }
 
-    JsonElement encodeValue(String sessionId, Object value) {
+    Object resolveReference(String sessionId, String referenceId, JsonObject details) throws TypedApiException {
+        Object resolved = references.resolve(sessionId, referenceId).orElse(null);
+        if (resolved != null) {
+            return resolved;
+        }
+
+        details.addProperty("reference_id", referenceId);
+        if (references.isExpired(sessionId, referenceId)) {
+            throw new TypedApiException(TypedApiService.REF_EXPIRED, "Remote reference expired or was released: " + referenceId, details);
+        }
+        throw new TypedApiException("API_REFERENCE_NOT_FOUND", "Unknown remote reference: " + referenceId, details);
+    }
+
+    <T> void registerInlineValue(String kind, Class<T> type, TypedApiService.InlineValueEncoder<? super T> encoder) {
+        inlineCodecs.put(type, new InlineCodec(kind, value -> encoder.encode(type.cast(value))));
+    }
+
+    /**
+     * Encodes a typed value; with {@code materialize}, registered value types are inlined instead of becoming refs,
+     * and with {@code packArrays}, numeric arrays/collections travel as base64 little-endian envelopes.
+     */
+    JsonElement encodeValue(String sessionId, Object value, boolean materialize, boolean packArrays) {
         if (value == null) {
             return JsonNull.INSTANCE;
         }
@@ -70,32 +96,47 @@ final class TypedApiValueCodec {
             return new JsonPrimitive(type.getName());
         }
         if (value instanceof Optional<?> optional) {
-            return encodeValue(sessionId, optional.orElse(null));
+            return encodeValue(sessionId, optional.orElse(null), materialize, packArrays);
         }
 
         Class<?> valueType = value.getClass();
+        if (packArrays) {
+            JsonObject packed = packPrimitiveArray(value);
+            if (packed != null) {
+                return packed;
+            }
+        }
         if (valueType.isArray()) {
             JsonArray array = new JsonArray();
             int length = Array.getLength(value);
             for (int index = 0; index < length; index += 1) {
-                array.add(encodeValue(sessionId, Array.get(value, index)));
+                array.add(encodeValue(sessionId, Array.get(value, index), materialize, packArrays));
             }
             return array;
         }
         if (value instanceof Iterable<?> iterable) {
             JsonArray array = new JsonArray();
             for (Object item : iterable) {
-                array.add(encodeValue(sessionId, item));
+                array.add(encodeValue(sessionId, item, materialize, packArrays));
             }
             return array;
         }
         if (value instanceof Map<?, ?> map) {
             JsonObject object = new JsonObject();
             for (Map.Entry<?, ?> entry : map.entrySet()) {
-                object.add(String.valueOf(entry.getKey()), encodeValue(sessionId, entry.getValue()));
+                object.add(String.valueOf(entry.getKey()), encodeValue(sessionId, entry.getValue(), materialize, packArrays));
             }
             return object;
         }
+        if (materialize) {
+            InlineCodec inline = findInlineCodec(valueType);
+            if (inline != null) {
+                JsonObject envelope = new JsonObject();
+                envelope.addProperty(TypedApiService.VALUE_KEY, inline.kind());
+                envelope.add("v", inline.encoder().encode(value));
+                return envelope;
+            }
+        }
 
         String referenceId = references.store(sessionId, value);
         JsonObject reference = new JsonObject();
@@ -104,6 +145,87 @@ final class TypedApiValueCodec {
         return reference;
     }
 
+    /**
+     * Packs {@code int[]}/{@code long[]}/{@code double[]} and non-empty collections whose items are all
+     * {@code Integer}, {@code Long} or {@code Double}; returns null for anything else.
+     */
+    static JsonObject packPrimitiveArray(Object value) {
+        if (value instanceof int[] ints) {
+            ByteBuffer buffer = littleEndian(ints.length * Integer.BYTES);
+            buffer.asIntBuffer().put(ints);
+            return packedEnvelope("i32", buffer);
+        }
+        if (value instanceof long[] longs) {
+            ByteBuffer buffer = littleEndian(longs.length * Long.BYTES);
+            buffer.asLongBuffer().put(longs);
+            return packedEnvelope("i64", buffer);
+        }
+        if (value instanceof double[] doubles) {
+            ByteBuffer buffer = littleEndian(doubles.length * Double.BYTES);
+            buffer.asDoubleBuffer().put(doubles);
+            return packedEnvelope("f64", buffer);
+        }
+        if (!(value instanceof Collection<?> collection) || collection.isEmpty()) {
+            return null;
+        }
+
+        Class<?> itemType = null;
+        for (Object item : collection) {
+            Class<?> type = item == null ? null : item.getClass();
+            if (type != Integer.class && type != Long.class && type != Double.class) {
+                return null;
+            }
+            if (itemType == null) {
+                itemType = type;
+            } else if (itemType != type) {
+                return null;
+            }
+        }
+
+        int index = 0;
+        if (itemType == Integer.class) {
+            int[] ints = new int[collection.size()];
+            for (Object item : collection) {
+                ints[index++] = (Integer) item;
+            }
+            return packPrimitiveArray(ints);
+        }
+        if (itemType == Long.class) {
+            long[] longs = new long[collection.size()];
+            for (Object item : collection) {
+                longs[index++] = (Long) item;
+            }
+            return packPrimitiveArray(longs);
+        }
+        double[] doubles = new double[collection.size()];
+        for (Object item : collection) {
+            doubles[index++] = (Double) item;
+        }
+        return packPrimitiveArray(doubles);
+    }
+
+    private static ByteBuffer littleEndian(int size) {
+        return ByteBuffer.allocate(size).order(ByteOrder.LITTLE_ENDIAN);
+    }
+
+    private static JsonObject packedEnvelope(String kind, ByteBuffer buffer) {
+        JsonObject envelope = new JsonObject();
+        envelope.addProperty(TypedApiService.ARRAY_KEY, kind);
+        envelope.addProperty("b64", Base64.getEncoder().encodeToString(buffer.array()));
+        return envelope;
+    }
+
+    private InlineCodec findInlineCodec(Class<?> valueType) {
+        // Walk superclasses so subtypes (for example Baritone's BetterBlockPos) reuse their parent's codec.
+        for (Class<?> type = valueType; type != null && type != Object.class; type = type.getSuperclass()) {
+            InlineCodec codec = inlineCodecs.get(type);
+            if (codec != null) {
+                return codec;
+            }
+        }
+        return null;
+    }
+
     Class<?> resolveTypeByName(String typeName) throws TypedApiException {
         return switch (typeName) {
             case "boolean" -> boolean.class;
@@ -127,16 +249,22 @@ final class TypedApiValueCodec {
         };
     }
 
-    private Object coerceArgument(String sessionId, JsonElement element, Class<?> expectedType, int argIndex) throws TypedApiException {
+    private Object coerceArgument(
+        String sessionId,
+        JsonElement element,
+        Class<?> expectedType,
+        int argIndex,
+        PipelineSteps steps
+    ) throws TypedApiException {
+        if (steps.isPlaceholder(element)) {
+            return coerceStepValue(sessionId, steps.get(steps.indexOf(element)), expectedType, argIndex);
+        }
+
         String referenceId = extractReferenceId(element);
         if (referenceId != null) {
-            Object resolved = references.resolve(sessionId, referenceId).orElse(null);
-            if (resolved == null) {
-                JsonObject details = new JsonObject();
-                details.addProperty("reference_id", referenceId);
-                details.addProperty("arg_index", argIndex);
-                throw new TypedApiException("API_REFERENCE_NOT_FOUND", "Unknown remote reference: " + referenceId, details);
-            }
+            JsonObject lookupDetails = new JsonObject();
+            lookupDetails.addProperty("arg_index", argIndex);
+            Object resolved = resolveReference(sessionId, referenceId, lookupDetails);
             Class<?> boxedExpected = boxType(expectedType);
             if (boxedExpected != Object.class && !boxedExpected.isAssignableFrom(resolved.getClass())) {
                 JsonObject details = new JsonObject();
@@ -228,7 +356,7 @@ final class TypedApiValueCodec {
             JsonArray array = element.getAsJsonArray();
             Object targetArray = Array.newInstance(componentType, array.size());
             for (int index = 0; index < array.size(); index += 1) {
-                Object item = coerceArgument(sessionId, array.get(index), componentType, argIndex);
+                Object item = coerceArgument(sessionId, array.get(index), componentType, argIndex, steps);
                 Array.set(targetArray, index, item);
             }
             return targetArray;
@@ -240,7 +368,7 @@ final class TypedApiValueCodec {
             }
             Collection<Object> collection = instantiateCollection(expectedType);
             for (JsonElement item : element.getAsJsonArray()) {
-                collection.add(decodeUntyped(sessionId, item));
+                collection.add(decodeUntyped(sessionId, item, steps));
             }
             return collection;
         }
@@ -251,13 +379,13 @@ final class TypedApiValueCodec {
             }
             Map<String, Object> map = instantiateMap(expectedType);
             for (Map.Entry<String, JsonElement> entry : element.getAsJsonObject().entrySet()) {
-                map.put(entry.getKey(), decodeUntyped(sessionId, entry.getValue()));
+                map.put(entry.getKey(), decodeUntyped(sessionId, entry.getValue(), steps));
             }
             return map;
         }
 
         if (expectedType == Object.class) {
-            return decodeUntyped(sessionId, element);
+            return decodeUntyped(sessionId, element, steps);
         }
 
         try {
@@ -273,6 +401,20 @@ final class TypedApiValueCodec {
         }
     }
 
+    private Object coerceStepValue(String sessionId, Object value, Class<?> expectedType, int argIndex) throws TypedApiException {
+        if (value == null) {
+            if (expectedType.isPrimitive()) {
+                throw coercionError(argIndex, expectedType, JsonNull.INSTANCE, "Null is not allowed for primitive");
+            }
+            return null;
+        }
+        if (boxType(expectedType).isInstance(value)) {
+            return value;
+        }
+        // Fall back to the plain (unpacked, non-materialized) JSON form for numeric widening and list-to-array coercion.
+        return coerceArgument(sessionId, encodeValue(sessionId, value, false, false), expectedType, argIndex, PipelineSteps.NONE);
+    }
+
     private Number numberValue(Class<?> expectedType, int argIndex, JsonElement element) throws TypedApiException {
         if (!element.isJsonPrimitive()) {
             throw coercionError(argIndex, expectedType, element, "Expected numeric primitive");
@@ -292,16 +434,14 @@ final class TypedApiValueCodec {
         }
     }
 
-    private Object decodeUntyped(String sessionId, JsonElement element) throws TypedApiException {
+    private Object decodeUntyped(String sessionId, JsonElement element, PipelineSteps steps) throws TypedApiException {
+        if (steps.isPlaceholder(element)) {
+            return steps.get(steps.indexOf(element));
+        }
+
         String referenceId = extractReferenceId(element);
         if (referenceId != null) {
-            Object resolved = references.resolve(sessionId, referenceId).orElse(null);
-            if (resolved == null) {
-                JsonObject details = new JsonObject();
-                details.addProperty("reference_id", referenceId);
-                throw new TypedApiException("API_REFERENCE_NOT_FOUND", "Unknown remote reference: " + referenceId, details);
-            }
-            return resolved;
+            return resolveReference(sessionId, referenceId, new JsonObject());
         }
 
         if (element == null || element.isJsonNull()) {
@@ -333,14 +473,14 @@ final class TypedApiValueCodec {
         if (element.isJsonArray()) {
             List<Object> values = new ArrayList<>();
             for (JsonElement item : element.getAsJsonArray()) {
-                values.add(decodeUntyped(sessionId, item));
+                values.add(decodeUntyped(sessionId, item, steps));
             }
             return values;
         }
 
         Map<String, Object> values = new LinkedHashMap<>();
         for (Map.Entry<String, JsonElement> entry : element.getAsJsonObject().entrySet()) {
-            values.put(entry.getKey(), decodeUntyped(sessionId, entry.getValue()));
+            values.put(entry.getKey(), decodeUntyped(sessionId, entry.getValue(), steps));
         }
         return values;
     }
@@ -423,4 +563,7 @@ final class TypedApiValueCodec {
         details.add("value", value == null ? JsonNull.INSTANCE : value.deepCopy());
         return new TypedApiException("API_ARGUMENT_COERCION_FAILED", "Unable to coerce typed API argument", details);
     }
+
+    private record InlineCodec(String kind, TypedApiService.InlineValueEncoder<Object> encoder) {
+    }
 }
@@ -0,0 +1,168 @@
+package com.pyritone.bridge.runtime;
+
+import com.google.gson.JsonElement;
+import com.google.gson.JsonObject;
+
+import java.util.ArrayList;
+import java.util.Iterator;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.Set;
+import java.util.concurrent.ConcurrentHashMap;
+
+/**
+ * Per-session `api.watch` registrations, evaluated on a tick interval and reported only on change.
+ */
+public final class TypedApiWatchRegistry {
+    public static final int MAX_WATCHES_PER_SESSION = 64;
+    private static final String WATCH_PREFIX = "watch-";
+
+    private final Map<String, SessionWatches> sessions = new ConcurrentHashMap<>();
+
+    public void clear() {
+        sessions.clear();
+    }
+
+    public void clearSession(String sessionId) {
+        if (sessionId == null || sessionId.isBlank()) {
+            return;
+        }
+        sessions.remove(sessionId);
+    }
+
+    public void retainSessions(Set<String> activeSessionIds) {
+        if (activeSessionIds == null) {
+            clear();
+            return;
+        }
+        sessions.keySet().retainAll(activeSessionIds);
+    }
+
+    public String add(String sessionId, JsonObject call, int everyTicks, JsonElement initialValue) throws TypedApiException {
+        if (sessionId == null || sessionId.isBlank()) {
+            throw new IllegalArgumentException("sessionId is required");
+        }
+        SessionWatches watches = sessions.computeIfAbsent(sessionId, ignored -> new SessionWatches());
+        return watches.add(call, Math.max(1, everyTicks), initialValue);
+    }
+
+    public boolean remove(String sessionId, String watchId) {
+        if (sessionId == null || watchId == null) {
+            return false;
+        }
+        SessionWatches watches = sessions.get(sessionId);
+        return watches != null && watches.remove(watchId);
+    }
+
+    public int size(String sessionId) {
+        SessionWatches watches = sessionId == null ? null : sessions.get(sessionId);
+        return watches == null ? 0 : watches.size();
+    }
+
+    /**
+     * Advances every watch of the session by one tick and evaluates the due ones.
+     *
+     * <p>A watch whose evaluation fails is reported once with its error and then dropped.
+     */
+    public List<Change> tick(String sessionId, Evaluator evaluator) {
+        SessionWatches watches = sessionId == null ? null : sessions.get(sessionId);
+        if (watches == null) {
+            return List.of();
+        }
+        return watches.tick(evaluator);
+    }
+
+    @FunctionalInterface
+    public interface Evaluator {
+        JsonElement evaluate(JsonObject call) throws TypedApiException;
+    }
+
+    public record Change(String watchId, JsonElement value, long sequence, TypedApiException error) {
+        public boolean failed() {
+            return error != null;
+        }
+    }
+
+    private static final class SessionWatches {
+        private final LinkedHashMap<String, Watch> byId = new LinkedHashMap<>();
+        private long sequence = 1L;
+
+        private synchronized String add(JsonObject call, int everyTicks, JsonElement initialValue) throws TypedApiException {
+            if (byId.size() >= MAX_WATCHES_PER_SESSION) {
+                JsonObject details = new JsonObject();
+                details.addProperty("max_watches", MAX_WATCHES_PER_SESSION);
+                throw new TypedApiException("BAD_REQUEST", "Too many active watches for this session", details);
+            }
+            String watchId = WATCH_PREFIX + sequence++;
+            byId.put(watchId, new Watch(call.deepCopy(), everyTicks, initialValue));
+            return watchId;
+        }
+
+        private synchronized boolean remove(String watchId) {
+            return byId.remove(watchId) != null;
+        }
+
+        private synchronized int size() {
+            return byId.size();
+        }
+
+        private synchronized List<Change> tick(Evaluator evaluator) {
+            List<Change> changes = new ArrayList<>();
+            Iterator<Map.Entry<String, Watch>> iterator = byId.entrySet().iterator();
+            while (iterator.hasNext()) {
+                Map.Entry<String, Watch> entry = iterator.next();
+                Watch watch = entry.getValue();
+                watch.ticksUntilDue -= 1;
+                if (watch.ticksUntilDue > 0) {
+                    continue;
+                }
+                watch.ticksUntilDue = watch.everyTicks;
+
+                JsonElement value;
+                try {
+                    value = evaluator.evaluate(watch.call);
+                } catch (TypedApiException exception) {
+                    iterator.remove();
+                    changes.add(new Change(entry.getKey(), null, watch.sequence + 1L, exception));
+                    continue;
+                } catch (RuntimeException exception) {
+                    // Runs on the client tick; one broken watch must not escape it.
+                    JsonObject details = new JsonObject();
+                    details.addProperty("cause_type", exception.getClass().getName());
+                    details.addProperty("cause_message", exception.getMessage());
+                    iterator.remove();
+                    changes.add(new Change(
+                        entry.getKey(),
+                        null,
+                        watch.sequence + 1L,
+                        new TypedApiException("INTERNAL_ERROR", "Typed API invocation failed", details)
+                    ));
+                    continue;
+                }
+                if (value.equals(watch.lastValue)) {
+                    continue;
+                }
+                watch.lastValue = value;
+                watch.sequence += 1L;
+                changes.add(new Change(entry.getKey(), value, watch.sequence, null));
+            }
+            return changes;
+        }
+    }
+
+    private static final class Watch {
+        private final JsonObject call;
+        private final int everyTicks;
+        private int ticksUntilDue;
+        private JsonElement lastValue;
+        private long sequence;
+
+        private Watch(JsonObject call, int everyTicks, JsonElement initialValue) {
+            this.call = call;
+            this.everyTicks = everyTicks;
+            this.ticksUntilDue = everyTicks;
+            this.lastValue = initialValue;
+        }
+    }
+}
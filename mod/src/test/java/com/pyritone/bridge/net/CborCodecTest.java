@@ -0,0 +1,66 @@
+package com.pyritone.bridge.net;
+
+import com.google.gson.JsonArray;
+import com.google.gson.JsonNull;
+import com.google.gson.JsonObject;
+import com.google.gson.JsonSyntaxException;
+import org.junit.jupiter.api.Test;
+
+import static org.junit.jupiter.api.Assertions.assertArrayEquals;
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+class CborCodecTest {
+    @Test
+    void encodesSmallMapWithMinimalHeads() {
+        JsonObject payload = new JsonObject();
+        payload.addProperty("a", 1);
+
+        assertArrayEquals(new byte[] {(byte) 0xA1, 0x61, 0x61, 0x01}, CborCodec.encode(payload));
+    }
+
+    @Test
+    void roundTripsEventEnvelope() {
+        JsonObject data = new JsonObject();
+        data.addProperty("task_id", "task-1");
+        data.addProperty("percent", 42.5);
+        data.addProperty("ticks", 1_000_000_000_000L);
+        data.addProperty("delta", -300);
+        data.addProperty("done", false);
+        data.add("goal", JsonNull.INSTANCE);
+        JsonArray path = new JsonArray();
+        path.add(1);
+        path.add("ü");
+        data.add("path", path);
+
+        JsonObject event = ProtocolCodec.eventEnvelope("task.progress", data);
+        JsonObject decoded = CborCodec.decodeObject(CborCodec.encode(event));
+
+        assertEquals(event.get("event"), decoded.get("event"));
+        JsonObject decodedData = decoded.getAsJsonObject("data");
+        assertEquals(42.5, decodedData.get("percent").getAsDouble());
+        assertEquals(1_000_000_000_000L, decodedData.get("ticks").getAsLong());
+        assertEquals(-300, decodedData.get("delta").getAsInt());
+        assertTrue(decodedData.get("goal").isJsonNull());
+        assertEquals("ü", decodedData.getAsJsonArray("path").get(1).getAsString());
+    }
+
+    @Test
+    void keepsIntegerLiteralsParsedFromText() {
+        JsonObject parsed = ProtocolCodec.parseObject("{\"n\":7,\"x\":1.5}");
+
+        byte[] encoded = CborCodec.encode(parsed);
+
+        assertArrayEquals(
+            new byte[] {(byte) 0xA2, 0x61, 0x6E, 0x07, 0x61, 0x78, (byte) 0xFB, 0x3F, (byte) 0xF8, 0, 0, 0, 0, 0, 0},
+            encoded
+        );
+    }
+
+    @Test
+    void rejectsNonMapAndTruncatedPayloads() {
+        assertThrows(JsonSyntaxException.class, () -> CborCodec.decodeObject(new byte[] {(byte) 0x80}));
+        assertThrows(JsonSyntaxException.class, () -> CborCodec.decodeObject(new byte[] {(byte) 0xA1, 0x61}));
+    }
+}
@@ -0,0 +1,74 @@
+package com.pyritone.bridge.net;
+
+import com.google.gson.JsonArray;
+import com.google.gson.JsonObject;
+import org.junit.jupiter.api.Test;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertFalse;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+class EventFilterTest {
+    @Test
+    void missingParamsAcceptEverything() {
+        EventFilter filter = EventFilter.fromParams(new JsonObject());
+
+        assertTrue(filter.accepts("minecraft.chat_message"));
+        assertTrue(filter.accepts("task.completed"));
+        assertEquals(EventFilter.ALL.include(), filter.include());
+    }
+
+    @Test
+    void includeAndExcludeGlobs() {
+        JsonObject params = new JsonObject();
+        params.add("include", array("task.*", "bridge.pause_state", "minecraft.player_?oin"));
+        params.add("exclude", array("task.progress"));
+
+        EventFilter filter = EventFilter.fromParams(params);
+
+        assertTrue(filter.accepts("task.completed"));
+        assertTrue(filter.accepts("bridge.pause_state"));
+        assertTrue(filter.accepts("minecraft.player_join"));
+        assertFalse(filter.accepts("task.progress"));
+        assertFalse(filter.accepts("minecraft.chat_message"));
+        assertFalse(filter.accepts("bridge.pause_stateX"));
+        assertFalse(filter.accepts(null));
+    }
+
+    @Test
+    void excludeOnlyKeepsEverythingElse() {
+        JsonObject params = new JsonObject();
+        params.add("exclude", array("minecraft.*"));
+
+        EventFilter filter = EventFilter.fromParams(params);
+
+        assertFalse(filter.accepts("minecraft.system_message"));
+        assertTrue(filter.accepts("status.update"));
+    }
+
+    @Test
+    void globLiteralsAreQuoted() {
+        assertTrue(EventFilter.compileGlob("api.watch.*").matcher("api.watch.changed").matches());
+        assertFalse(EventFilter.compileGlob("api.watch.*").matcher("apiXwatch.changed").matches());
+    }
+
+    @Test
+    void rejectsMalformedPatterns() {
+        JsonObject notArray = new JsonObject();
+        notArray.addProperty("include", "task.*");
+        assertThrows(IllegalArgumentException.class, () -> EventFilter.fromParams(notArray));
+
+        JsonObject blank = new JsonObject();
+        blank.add("exclude", array(" "));
+        assertThrows(IllegalArgumentException.class, () -> EventFilter.fromParams(blank));
+    }
+
+    private static JsonArray array(String... values) {
+        JsonArray array = new JsonArray();
+        for (String value : values) {
+            array.add(value);
+        }
+        return array;
+    }
+}
@@ -0,0 +1,125 @@
+package com.pyritone.bridge.net;
+
+import com.google.gson.JsonObject;
+import org.junit.jupiter.api.Test;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+
+import java.io.BufferedReader;
+import java.io.InputStreamReader;
+import java.io.OutputStream;
+import java.net.Socket;
+import java.nio.charset.StandardCharsets;
+import java.time.Duration;
+import java.util.function.BooleanSupplier;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertFalse;
+import static org.junit.jupiter.api.Assertions.assertTimeoutPreemptively;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+class LineBridgeServerTest {
+    private static final Logger LOGGER = LoggerFactory.getLogger(LineBridgeServerTest.class);
+
+    @Test
+    void servesNewlineDelimitedRequestsAndEventsThroughTheSharedSessionSet() throws Exception {
+        WebSocketBridgeServer hub = new WebSocketBridgeServer("127.0.0.1", 0, "/ws", (session, request) -> {
+            String id = ProtocolCodec.requestId(request);
+            String method = request.get("method").getAsString();
+            if ("auth.login".equals(method)) {
+                session.setAuthenticated(true);
+                JsonObject result = new JsonObject();
+                result.addProperty("binary", session.supportsBinaryFrames());
+                return ProtocolCodec.successResponse(id, result);
+            }
+            if (!session.isAuthenticated()) {
+                return ProtocolCodec.errorResponse(id, "UNAUTHORIZED", "auth required");
+            }
+            JsonObject result = new JsonObject();
+            result.addProperty("pong", true);
+            return ProtocolCodec.successResponse(id, result);
+        }, LOGGER);
+        LineBridgeServer lineServer = new LineBridgeServer(hub, "127.0.0.1", 0, null, LOGGER);
+
+        try {
+            hub.start();
+            lineServer.start();
+            assertTrue(lineServer.getBoundPort() > 0);
+
+            try (Socket socket = new Socket("127.0.0.1", lineServer.getBoundPort())) {
+                OutputStream output = socket.getOutputStream();
+                BufferedReader input = new BufferedReader(
+                    new InputStreamReader(socket.getInputStream(), StandardCharsets.UTF_8)
+                );
+
+                output.write("{\"type\":\"request\",\"id\":\"1\",\"method\":\"ping\",\"params\":{}}\n".getBytes(StandardCharsets.UTF_8));
+                JsonObject unauthorized = ProtocolCodec.parseObject(input.readLine());
+                assertFalse(unauthorized.get("ok").getAsBoolean());
+                assertEquals("UNAUTHORIZED", unauthorized.getAsJsonObject("error").get("code").getAsString());
+
+                output.write("{\"type\":\"request\",\"id\":\"2\",\"method\":\"auth.login\",\"params\":{}}\n".getBytes(StandardCharsets.UTF_8));
+                JsonObject login = ProtocolCodec.parseObject(input.readLine());
+                assertTrue(login.get("ok").getAsBoolean());
+                assertFalse(login.getAsJsonObject("result").get("binary").getAsBoolean());
+
+                output.write("not json\n".getBytes(StandardCharsets.UTF_8));
+                JsonObject malformed = ProtocolCodec.parseObject(input.readLine());
+                assertEquals("BAD_REQUEST", malformed.getAsJsonObject("error").get("code").getAsString());
+
+                JsonObject data = new JsonObject();
+                data.addProperty("task_id", "task-1");
+                hub.publishEvent(ProtocolCodec.eventEnvelope("task.started", data));
+                JsonObject event = ProtocolCodec.parseObject(input.readLine());
+                assertEquals("task.started", event.get("event").getAsString());
+                assertEquals(1, hub.sessionSnapshot().size());
+            }
+        } finally {
+            lineServer.close();
+            hub.close();
+        }
+    }
+
+    @Test
+    void closesSessionThatStopsReadingInsteadOfBlockingThePublisher() throws Exception {
+        WebSocketBridgeServer hub = new WebSocketBridgeServer("127.0.0.1", 0, "/ws", (session, request) -> {
+            session.setAuthenticated(true);
+            return ProtocolCodec.successResponse(ProtocolCodec.requestId(request), new JsonObject());
+        }, LOGGER);
+        LineBridgeServer lineServer = new LineBridgeServer(hub, "127.0.0.1", 0, null, LOGGER);
+
+        try {
+            hub.start();
+            lineServer.start();
+
+            try (Socket socket = new Socket("127.0.0.1", lineServer.getBoundPort())) {
+                socket.setReceiveBufferSize(4096);
+                socket.getOutputStream().write(
+                    "{\"type\":\"request\",\"id\":\"1\",\"method\":\"auth.login\",\"params\":{}}\n"
+                        .getBytes(StandardCharsets.UTF_8)
+                );
+                waitFor(() -> hub.sessionSnapshot().size() == 1
+                    && hub.sessionSnapshot().iterator().next().isAuthenticated());
+
+                JsonObject data = new JsonObject();
+                data.addProperty("padding", "x".repeat(1024));
+                assertTimeoutPreemptively(Duration.ofSeconds(5), () -> {
+                    for (int i = 0; i < LineBridgeServer.OUTBOUND_QUEUE_LIMIT * 4; i++) {
+                        hub.publishEvent(ProtocolCodec.eventEnvelope("status.update", data));
+                    }
+                });
+                waitFor(() -> hub.sessionSnapshot().isEmpty());
+            }
+        } finally {
+            lineServer.close();
+            hub.close();
+        }
+    }
+
+    private static void waitFor(BooleanSupplier condition) throws InterruptedException {
+        long deadline = System.nanoTime() + Duration.ofSeconds(5).toNanos();
+        while (!condition.getAsBoolean()) {
+            assertTrue(System.nanoTime() < deadline, "condition not met in time");
+            Thread.sleep(10);
+        }
+    }
+}
@@ -0,0 +1,58 @@
+package com.pyritone.bridge.runtime;
+
+import org.junit.jupiter.api.Test;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertFalse;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+class PathingActivityTrackerTest {
+    @Test
+    void idleSnapshotDoesNotEmit() {
+        PathingActivityTracker tracker = new PathingActivityTracker();
+
+        assertTrue(tracker.observe(BaritoneGateway.ActivitySnapshot.idle()).isEmpty());
+        assertEquals(0L, tracker.current().sequence());
+    }
+
+    @Test
+    void emitsOnlyWhenSnapshotChanges() {
+        PathingActivityTracker tracker = new PathingActivityTracker();
+        BaritoneGateway.ActivitySnapshot pathing = snapshot(true, true, false);
+
+        PathingActivityTracker.Transition started = tracker.observe(pathing).orElseThrow();
+        assertTrue(started.snapshot().isPathing());
+        assertEquals(1L, started.sequence());
+
+        assertTrue(tracker.observe(snapshot(true, true, false)).isEmpty());
+
+        PathingActivityTracker.Transition finished = tracker.observe(snapshot(false, false, false)).orElseThrow();
+        assertFalse(finished.snapshot().isBusy());
+        assertEquals(2L, finished.sequence());
+        assertEquals(finished, tracker.current());
+    }
+
+    @Test
+    void resetReturnsToIdle() {
+        PathingActivityTracker tracker = new PathingActivityTracker();
+        tracker.observe(snapshot(false, false, true));
+
+        tracker.reset();
+
+        assertEquals(BaritoneGateway.ActivitySnapshot.idle(), tracker.current().snapshot());
+        assertEquals(0L, tracker.current().sequence());
+    }
+
+    private static BaritoneGateway.ActivitySnapshot snapshot(boolean pathing, boolean hasPath, boolean calculating) {
+        return new BaritoneGateway.ActivitySnapshot(
+            pathing,
+            hasPath,
+            calculating,
+            false,
+            null,
+            null,
+            false,
+            false
+        );
+    }
+}
@@ -2,8 +2,12 @@ package com.pyritone.bridge.runtime;
 
 import org.junit.jupiter.api.Test;
 
+import java.util.List;
 import java.util.Set;
+import java.util.concurrent.atomic.AtomicLong;
 
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertFalse;
 import static org.junit.jupiter.api.Assertions.assertSame;
 import static org.junit.jupiter.api.Assertions.assertTrue;
 
@@ -36,4 +40,54 @@ class RemoteReferenceTableTest {
         assertTrue(table.resolve("session-a", refA).isPresent());
         assertTrue(table.resolve("session-b", refB).isEmpty());
     }
+
+    @Test
+    void evictsLeastRecentlyUsedReferenceWhenOverCapacity() {
+        RemoteReferenceTable table = new RemoteReferenceTable(2, 0L);
+        Object first = new Object();
+        Object second = new Object();
+        Object third = new Object();
+
+        String refFirst = table.store("session-a", first);
+        String refSecond = table.store("session-a", second);
+        table.resolve("session-a", refFirst);
+        String refThird = table.store("session-a", third);
+
+        assertTrue(table.resolve("session-a", refFirst).isPresent());
+        assertTrue(table.resolve("session-a", refSecond).isEmpty());
+        assertTrue(table.resolve("session-a", refThird).isPresent());
+        assertTrue(table.isExpired("session-a", refSecond));
+        assertEquals(1L, table.evictedCount("session-a"));
+
+        String refSecondAgain = table.store("session-a", second);
+        assertFalse(refSecond.equals(refSecondAgain));
+    }
+
+    @Test
+    void expiresReferencesIdleLongerThanTtl() {
+        AtomicLong now = new AtomicLong(1_000L);
+        RemoteReferenceTable table = new RemoteReferenceTable(16, 100L, now::get);
+        String idle = table.store("session-a", new Object());
+        String active = table.store("session-a", new Object());
+
+        now.set(1_060L);
+        assertTrue(table.resolve("session-a", active).isPresent());
+        now.set(1_120L);
+
+        assertTrue(table.resolve("session-a", idle).isEmpty());
+        assertTrue(table.isExpired("session-a", idle));
+        assertTrue(table.resolve("session-a", active).isPresent());
+    }
+
+    @Test
+    void releaseDropsReferencesAndKeepsUnknownIdsDistinct() {
+        RemoteReferenceTable table = new RemoteReferenceTable();
+        String ref = table.store("session-a", new Object());
+
+        assertEquals(1, table.release("session-a", List.of(ref, "ref-999")));
+        assertEquals(0, table.size("session-a"));
+        assertTrue(table.isExpired("session-a", ref));
+        assertFalse(table.isExpired("session-a", "ref-999"));
+        assertFalse(table.isExpired("session-a", "bogus"));
+    }
 }
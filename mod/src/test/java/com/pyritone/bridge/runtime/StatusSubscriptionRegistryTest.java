@@ -1,27 +1,35 @@
 package com.pyritone.bridge.runtime;
 
+import com.google.gson.JsonArray;
+import com.google.gson.JsonObject;
 import org.junit.jupiter.api.Test;
 
 import java.util.Set;
 
 import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertFalse;
+import static org.junit.jupiter.api.Assertions.assertNull;
+import static org.junit.jupiter.api.Assertions.assertThrows;
 import static org.junit.jupiter.api.Assertions.assertTrue;
 
 class StatusSubscriptionRegistryTest {
+    private static final StatusStreamOptions DEFAULTS = StatusStreamOptions.defaults(2000L);
+
     @Test
     void doesNotEmitWithoutSubscription() {
         StatusSubscriptionRegistry registry = new StatusSubscriptionRegistry();
 
-        assertTrue(registry.evaluate("session-a", "digest-1", 1000L, 2000L).isEmpty());
+        assertTrue(registry.evaluate("session-a", status("RUNNING", "Steve"), 1000L).isEmpty());
+        assertNull(registry.options("session-a"));
     }
 
     @Test
-    void emitsChangeWhenDigestChanges() {
+    void emitsChangeWhenStatusChanges() {
         StatusSubscriptionRegistry registry = new StatusSubscriptionRegistry();
-        registry.subscribe("session-a", "digest-1", 1000L);
+        registry.subscribe("session-a", status("RUNNING", "Steve"), 1000L, false, DEFAULTS);
 
         StatusSubscriptionRegistry.Emission change = registry
-            .evaluate("session-a", "digest-2", 1200L, 2000L)
+            .evaluate("session-a", status("PAUSED", "Steve"), 1200L)
             .orElseThrow();
 
         assertEquals("change", change.reason());
@@ -29,14 +37,14 @@ class StatusSubscriptionRegistryTest {
     }
 
     @Test
-    void emitsHeartbeatWhenDigestUnchangedAndIntervalElapsed() {
+    void emitsHeartbeatWhenStatusUnchangedAndIntervalElapsed() {
         StatusSubscriptionRegistry registry = new StatusSubscriptionRegistry();
-        registry.subscribe("session-a", "digest-1", 1000L);
+        registry.subscribe("session-a", status("RUNNING", "Steve"), 1000L, false, DEFAULTS);
 
-        assertTrue(registry.evaluate("session-a", "digest-1", 2500L, 2000L).isEmpty());
+        assertTrue(registry.evaluate("session-a", status("RUNNING", "Steve"), 2500L).isEmpty());
 
         StatusSubscriptionRegistry.Emission heartbeat = registry
-            .evaluate("session-a", "digest-1", 3000L, 2000L)
+            .evaluate("session-a", status("RUNNING", "Steve"), 3000L)
             .orElseThrow();
         assertEquals("heartbeat", heartbeat.reason());
         assertEquals(1L, heartbeat.sequence());
@@ -45,13 +53,13 @@ class StatusSubscriptionRegistryTest {
     @Test
     void sequenceIncrementsAcrossEmissions() {
         StatusSubscriptionRegistry registry = new StatusSubscriptionRegistry();
-        registry.subscribe("session-a", "digest-1", 1000L);
+        registry.subscribe("session-a", status("RUNNING", "Steve"), 1000L, false, DEFAULTS);
 
         StatusSubscriptionRegistry.Emission first = registry
-            .evaluate("session-a", "digest-2", 1100L, 2000L)
+            .evaluate("session-a", status("PAUSED", "Steve"), 1100L)
             .orElseThrow();
         StatusSubscriptionRegistry.Emission second = registry
-            .evaluate("session-a", "digest-2", 3200L, 2000L)
+            .evaluate("session-a", status("PAUSED", "Steve"), 3200L)
             .orElseThrow();
 
         assertEquals(1L, first.sequence());
@@ -61,13 +69,124 @@ class StatusSubscriptionRegistryTest {
     @Test
     void unsubscribeAndRetainSessionsStopFurtherEmissions() {
         StatusSubscriptionRegistry registry = new StatusSubscriptionRegistry();
-        registry.subscribe("session-a", "digest-1", 1000L);
-        registry.subscribe("session-b", "digest-1", 1000L);
+        registry.subscribe("session-a", status("RUNNING", "Steve"), 1000L, false, DEFAULTS);
+        registry.subscribe("session-b", status("RUNNING", "Steve"), 1000L, false, DEFAULTS);
 
         assertTrue(registry.unsubscribe("session-a"));
-        assertTrue(registry.evaluate("session-a", "digest-2", 1500L, 2000L).isEmpty());
+        assertNull(registry.options("session-a"));
+        assertTrue(registry.evaluate("session-a", status("PAUSED", "Steve"), 1500L).isEmpty());
 
         registry.retainSessions(Set.of("session-a"));
-        assertTrue(registry.evaluate("session-b", "digest-2", 1500L, 2000L).isEmpty());
+        assertNull(registry.options("session-b"));
+        assertTrue(registry.evaluate("session-b", status("PAUSED", "Steve"), 1500L).isEmpty());
+    }
+
+    @Test
+    void structuralComparisonSkipsUnchangedStatus() {
+        StatusSubscriptionRegistry registry = new StatusSubscriptionRegistry();
+        registry.subscribe("session-a", status("RUNNING", "Steve"), 1000L, false, DEFAULTS);
+
+        assertTrue(registry.evaluate("session-a", status("RUNNING", "Steve"), 1100L).isEmpty());
+
+        StatusSubscriptionRegistry.Emission change = registry
+            .evaluate("session-a", status("PAUSED", "Steve"), 1200L)
+            .orElseThrow();
+        assertFalse(change.isDelta());
+        assertNull(change.changed());
+    }
+
+    @Test
+    void deltaModeCarriesOnlyChangedTopLevelFields() {
+        StatusSubscriptionRegistry registry = new StatusSubscriptionRegistry();
+        registry.subscribe("session-a", status("RUNNING", "Steve"), 1000L, true, DEFAULTS);
+
+        JsonObject next = status("PAUSED", "Steve");
+        next.remove("watch_patterns");
+        StatusSubscriptionRegistry.Emission change = registry
+            .evaluate("session-a", next, 1100L)
+            .orElseThrow();
+
+        assertTrue(change.isDelta());
+        assertEquals(0L, change.baseSequence());
+        assertEquals(1L, change.sequence());
+        assertEquals(Set.of("active_task"), change.changed().keySet());
+        assertEquals("watch_patterns", change.removed().get(0).getAsString());
+
+        StatusSubscriptionRegistry.Emission heartbeat = registry
+            .evaluate("session-a", next, 3200L)
+            .orElseThrow();
+        assertEquals("heartbeat", heartbeat.reason());
+        assertEquals(1L, heartbeat.baseSequence());
+        assertEquals(0, heartbeat.changed().size());
+        assertEquals(0, heartbeat.removed().size());
+    }
+
+    @Test
+    void perSessionOptionsRateLimitChangesAndSetHeartbeat() {
+        JsonObject params = new JsonObject();
+        JsonArray fields = new JsonArray();
+        fields.add("active_task");
+        params.add("fields", fields);
+        params.addProperty("heartbeat_ms", 1000L);
+        params.addProperty("min_interval_ms", 500L);
+        StatusStreamOptions options = StatusStreamOptions.fromParams(params, 5000L);
+
+        assertTrue(options.includes("active_task"));
+        assertFalse(options.includes("player"));
+
+        StatusSubscriptionRegistry registry = new StatusSubscriptionRegistry();
+        registry.subscribe("session-a", status("RUNNING", "Steve"), 1000L, false, options);
+        assertEquals(options, registry.options("session-a"));
+        assertNull(registry.options("session-b"));
+
+        assertTrue(registry.evaluate("session-a", status("PAUSED", "Steve"), 1200L).isEmpty());
+        assertTrue(registry.evaluate("session-a", status("CANCELED", "Steve"), 1400L).isEmpty());
+        StatusSubscriptionRegistry.Emission change = registry
+            .evaluate("session-a", status("CANCELED", "Steve"), 1500L)
+            .orElseThrow();
+        assertEquals("change", change.reason());
+        assertEquals(1L, change.sequence());
+
+        assertTrue(registry.evaluate("session-a", status("CANCELED", "Steve"), 2400L).isEmpty());
+        assertEquals("heartbeat", registry.evaluate("session-a", status("CANCELED", "Steve"), 2500L).orElseThrow().reason());
+    }
+
+    @Test
+    void rejectsUnknownFieldsAndOutOfRangeIntervals() {
+        JsonObject unknownField = new JsonObject();
+        JsonArray fields = new JsonArray();
+        fields.add("weather");
+        unknownField.add("fields", fields);
+        assertThrows(IllegalArgumentException.class, () -> StatusStreamOptions.fromParams(unknownField, 5000L));
+
+        JsonObject tooFast = new JsonObject();
+        tooFast.addProperty("heartbeat_ms", 1L);
+        assertThrows(IllegalArgumentException.class, () -> StatusStreamOptions.fromParams(tooFast, 5000L));
+
+        JsonObject intervalAboveHeartbeat = new JsonObject();
+        intervalAboveHeartbeat.addProperty("heartbeat_ms", 1000L);
+        intervalAboveHeartbeat.addProperty("min_interval_ms", 2000L);
+        assertThrows(IllegalArgumentException.class, () -> StatusStreamOptions.fromParams(intervalAboveHeartbeat, 5000L));
+
+        StatusStreamOptions defaults = StatusStreamOptions.fromParams(null, 5000L);
+        assertEquals(StatusStreamOptions.defaults(5000L), defaults);
+        assertTrue(defaults.includes("player"));
+    }
+
+    private static JsonObject status(String taskState, String playerName) {
+        JsonObject task = new JsonObject();
+        task.addProperty("task_id", "task-1");
+        task.addProperty("state", taskState);
+        JsonObject player = new JsonObject();
+        player.addProperty("name", playerName);
+        JsonArray patterns = new JsonArray();
+        patterns.add("diamond");
+
+        JsonObject status = new JsonObject();
+        status.addProperty("in_world", true);
+        status.add("active_task", task);
+        status.add("player", player);
+        status.add("watch_patterns", patterns);
+        return status;
     }
 }
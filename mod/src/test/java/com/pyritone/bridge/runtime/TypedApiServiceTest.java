@@ -4,8 +4,15 @@ import com.google.gson.JsonArray;
 import com.google.gson.JsonObject;
 import org.junit.jupiter.api.Test;
 
+import java.nio.ByteBuffer;
+import java.nio.ByteOrder;
+import java.util.ArrayList;
+import java.util.Base64;
+import java.util.List;
+
 import static org.junit.jupiter.api.Assertions.assertEquals;
 import static org.junit.jupiter.api.Assertions.assertNotNull;
+import static org.junit.jupiter.api.Assertions.assertNull;
 import static org.junit.jupiter.api.Assertions.assertThrows;
 import static org.junit.jupiter.api.Assertions.assertTrue;
 
@@ -142,6 +149,379 @@ class TypedApiServiceTest {
         assertTrue(error.details().has("target_type"));
     }
 
+    @Test
+    void batchRunsCallsInOrderAndReportsPerCallErrors() throws Exception {
+        TypedApiService service = new TypedApiService(getClass().getClassLoader());
+        service.registerRoot("sample", SampleRoot.class.getName(), SampleRoot::new);
+
+        JsonObject plusParams = new JsonObject();
+        plusParams.add("target", rootTarget("sample"));
+        plusParams.addProperty("method", "plus");
+        JsonArray plusArgs = new JsonArray();
+        plusArgs.add(2);
+        plusArgs.add(3);
+        plusParams.add("args", plusArgs);
+
+        JsonObject constructParams = new JsonObject();
+        constructParams.addProperty("type", SampleBox.class.getName());
+        JsonArray constructArgs = new JsonArray();
+        constructArgs.add(4);
+        constructParams.add("args", constructArgs);
+
+        JsonObject missingParams = new JsonObject();
+        missingParams.add("target", rootTarget("sample"));
+        missingParams.addProperty("method", "missing");
+
+        JsonArray calls = new JsonArray();
+        calls.add(batchCall("api.invoke", plusParams));
+        calls.add(batchCall("api.invoke", missingParams));
+        calls.add(batchCall("api.construct", constructParams));
+        calls.add(batchCall("api.unknown", new JsonObject()));
+        JsonObject request = new JsonObject();
+        request.add("calls", calls);
+
+        JsonArray results = service.batch("session-a", request).getAsJsonArray("results");
+        assertEquals(4, results.size());
+
+        JsonObject first = results.get(0).getAsJsonObject();
+        assertTrue(first.get("ok").getAsBoolean());
+        assertEquals(5, first.getAsJsonObject("result").get("value").getAsInt());
+
+        JsonObject second = results.get(1).getAsJsonObject();
+        assertEquals(false, second.get("ok").getAsBoolean());
+        assertEquals("API_METHOD_NOT_FOUND", second.getAsJsonObject("error").get("code").getAsString());
+
+        JsonObject third = results.get(2).getAsJsonObject();
+        assertTrue(third.get("ok").getAsBoolean());
+        assertTrue(third.getAsJsonObject("result").getAsJsonObject("value").has(TypedApiService.REF_KEY));
+
+        JsonObject fourth = results.get(3).getAsJsonObject();
+        assertEquals("METHOD_NOT_FOUND", fourth.getAsJsonObject("error").get("code").getAsString());
+    }
+
+    @Test
+    void pipelineSubstitutesEarlierStepResultsAndAbortsAfterFailure() throws Exception {
+        TypedApiService service = new TypedApiService(getClass().getClassLoader());
+
+        JsonObject constructParams = new JsonObject();
+        constructParams.addProperty("type", SampleBox.class.getName());
+        JsonArray constructArgs = new JsonArray();
+        constructArgs.add(4);
+        constructParams.add("args", constructArgs);
+
+        JsonObject childParams = new JsonObject();
+        childParams.add("target", stepRef(0));
+        childParams.addProperty("method", "child");
+        JsonArray childArgs = new JsonArray();
+        childArgs.add(2);
+        childParams.add("args", childArgs);
+
+        JsonObject addParams = new JsonObject();
+        addParams.add("target", stepRef(1));
+        addParams.addProperty("method", "add");
+        JsonArray addArgs = new JsonArray();
+        addArgs.add(1);
+        addParams.add("args", addArgs);
+
+        JsonObject missingParams = new JsonObject();
+        missingParams.add("target", stepRef(1));
+        missingParams.addProperty("method", "missing");
+
+        JsonArray steps = new JsonArray();
+        steps.add(batchCall("api.construct", constructParams));
+        steps.add(batchCall("api.invoke", childParams));
+        steps.add(batchCall("api.invoke", addParams));
+        steps.add(batchCall("api.invoke", missingParams));
+        steps.add(batchCall("api.invoke", addParams));
+        JsonObject request = new JsonObject();
+        request.add("steps", steps);
+
+        JsonArray results = service.pipeline("session-a", request).getAsJsonArray("results");
+        assertEquals(5, results.size());
+        assertTrue(results.get(1).getAsJsonObject().getAsJsonObject("result").getAsJsonObject("value").has(TypedApiService.REF_KEY));
+        assertEquals(7, results.get(2).getAsJsonObject().getAsJsonObject("result").get("value").getAsInt());
+
+        JsonObject failed = results.get(3).getAsJsonObject().getAsJsonObject("error");
+        assertEquals("API_METHOD_NOT_FOUND", failed.get("code").getAsString());
+        assertEquals(3, failed.getAsJsonObject("data").get("step").getAsInt());
+
+        JsonObject aborted = results.get(4).getAsJsonObject().getAsJsonObject("error");
+        assertEquals("API_PIPELINE_ABORTED", aborted.get("code").getAsString());
+        assertEquals(3, aborted.getAsJsonObject("data").get("failed_step").getAsInt());
+    }
+
+    @Test
+    void pipelineChainsPackedAndMaterializedResultsAsJavaValues() throws Exception {
+        TypedApiService service = new TypedApiService(getClass().getClassLoader());
+        service.registerRoot("sample", SampleRoot.class.getName(), SampleRoot::new);
+        service.registerInlineValue("box", SampleBox.class, box -> {
+            JsonArray encoded = new JsonArray();
+            encoded.add(box.add(0));
+            return encoded;
+        });
+        service.setPackedArrays("session-packed", true);
+
+        JsonObject countsParams = new JsonObject();
+        countsParams.add("target", rootTarget("sample"));
+        countsParams.addProperty("method", "counts");
+
+        JsonObject sumParams = new JsonObject();
+        sumParams.add("target", rootTarget("sample"));
+        sumParams.addProperty("method", "sum");
+        JsonArray sumArgs = new JsonArray();
+        sumArgs.add(stepRef(0));
+        sumParams.add("args", sumArgs);
+
+        JsonObject boxParams = new JsonObject();
+        boxParams.add("target", rootTarget("sample"));
+        boxParams.addProperty("method", "box");
+        JsonArray boxArgs = new JsonArray();
+        boxArgs.add(5);
+        boxParams.add("args", boxArgs);
+        boxParams.addProperty("materialize", true);
+
+        JsonObject addParams = new JsonObject();
+        addParams.add("target", stepRef(2));
+        addParams.addProperty("method", "add");
+        JsonArray addArgs = new JsonArray();
+        addArgs.add(1);
+        addParams.add("args", addArgs);
+
+        JsonArray steps = new JsonArray();
+        steps.add(batchCall("api.invoke", countsParams));
+        steps.add(batchCall("api.invoke", sumParams));
+        steps.add(batchCall("api.invoke", boxParams));
+        steps.add(batchCall("api.invoke", addParams));
+        JsonObject request = new JsonObject();
+        request.add("steps", steps);
+
+        JsonArray results = service.pipeline("session-packed", request).getAsJsonArray("results");
+        JsonObject packed = results.get(0).getAsJsonObject().getAsJsonObject("result").getAsJsonObject("value");
+        assertEquals("i32", packed.get(TypedApiService.ARRAY_KEY).getAsString());
+        assertTrue(results.get(1).getAsJsonObject().get("ok").getAsBoolean());
+        assertEquals(299, results.get(1).getAsJsonObject().getAsJsonObject("result").get("value").getAsInt());
+
+        JsonObject inline = results.get(2).getAsJsonObject().getAsJsonObject("result").getAsJsonObject("value");
+        assertEquals("box", inline.get(TypedApiService.VALUE_KEY).getAsString());
+        assertTrue(results.get(3).getAsJsonObject().get("ok").getAsBoolean());
+        assertEquals(6, results.get(3).getAsJsonObject().getAsJsonObject("result").get("value").getAsInt());
+    }
+
+    @Test
+    void pipelineRejectsForwardStepReferences() throws Exception {
+        TypedApiService service = new TypedApiService(getClass().getClassLoader());
+
+        JsonObject params = new JsonObject();
+        params.add("target", stepRef(0));
+        params.addProperty("method", "add");
+
+        JsonArray steps = new JsonArray();
+        steps.add(batchCall("api.invoke", params));
+        JsonObject request = new JsonObject();
+        request.add("steps", steps);
+
+        JsonObject error = service.pipeline("session-a", request)
+            .getAsJsonArray("results")
+            .get(0)
+            .getAsJsonObject()
+            .getAsJsonObject("error");
+        assertEquals("BAD_REQUEST", error.get("code").getAsString());
+    }
+
+    @Test
+    void pipelineRejectsStepIndexesThatAreNotIntegers() throws Exception {
+        TypedApiService service = new TypedApiService(getClass().getClassLoader());
+
+        JsonObject constructParams = new JsonObject();
+        constructParams.addProperty("type", SampleBox.class.getName());
+        JsonArray constructArgs = new JsonArray();
+        constructArgs.add(4);
+        constructParams.add("args", constructArgs);
+
+        JsonObject fractional = new JsonObject();
+        fractional.addProperty(TypedApiService.STEP_KEY, 0.5d);
+        JsonObject fractionalParams = new JsonObject();
+        fractionalParams.add("target", fractional);
+        fractionalParams.addProperty("method", "child");
+
+        JsonObject huge = new JsonObject();
+        huge.addProperty(TypedApiService.STEP_KEY, 4_294_967_296L);
+        JsonObject hugeParams = new JsonObject();
+        hugeParams.add("target", huge);
+        hugeParams.addProperty("method", "child");
+
+        for (JsonObject params : List.of(fractionalParams, hugeParams)) {
+            JsonArray steps = new JsonArray();
+            steps.add(batchCall("api.construct", constructParams));
+            steps.add(batchCall("api.invoke", params));
+            JsonObject request = new JsonObject();
+            request.add("steps", steps);
+
+            JsonObject error = service.pipeline("session-a", request)
+                .getAsJsonArray("results")
+                .get(1)
+                .getAsJsonObject()
+                .getAsJsonObject("error");
+            assertEquals("BAD_REQUEST", error.get("code").getAsString());
+        }
+    }
+
+    @Test
+    void releasedReferenceFailsWithRefExpired() throws Exception {
+        TypedApiService service = new TypedApiService(getClass().getClassLoader());
+
+        JsonObject constructParams = new JsonObject();
+        constructParams.addProperty("type", SampleBox.class.getName());
+        JsonArray constructArgs = new JsonArray();
+        constructArgs.add(1);
+        constructParams.add("args", constructArgs);
+        String referenceId = service.construct("session-a", constructParams)
+            .getAsJsonObject("value")
+            .get(TypedApiService.REF_KEY)
+            .getAsString();
+
+        JsonObject releaseParams = new JsonObject();
+        JsonArray ids = new JsonArray();
+        ids.add(referenceId);
+        releaseParams.add("ids", ids);
+        assertEquals(1, service.release("session-a", releaseParams).get("released").getAsInt());
+
+        JsonObject invokeParams = new JsonObject();
+        invokeParams.add("target", refTarget(referenceId));
+        invokeParams.addProperty("method", "add");
+        JsonArray invokeArgs = new JsonArray();
+        invokeArgs.add(1);
+        invokeParams.add("args", invokeArgs);
+
+        TypedApiException expired = assertThrows(TypedApiException.class, () -> service.invoke("session-a", invokeParams));
+        assertEquals(TypedApiService.REF_EXPIRED, expired.code());
+
+        invokeParams.add("target", refTarget("ref-404"));
+        TypedApiException missing = assertThrows(TypedApiException.class, () -> service.invoke("session-a", invokeParams));
+        assertEquals("API_REFERENCE_NOT_FOUND", missing.code());
+    }
+
+    @Test
+    void watchEmitsOnlyWhenValueChangesAtTickInterval() throws Exception {
+        TypedApiService service = new TypedApiService(getClass().getClassLoader());
+        int[] base = {1};
+        service.registerRoot("box", SampleBox.class.getName(), () -> new SampleBox(base[0]));
+
+        JsonObject watchParams = new JsonObject();
+        watchParams.add("target", rootTarget("box"));
+        watchParams.addProperty("method", "add");
+        JsonArray args = new JsonArray();
+        args.add(10);
+        watchParams.add("args", args);
+        watchParams.addProperty("every_ticks", 2);
+
+        JsonObject watch = service.watch("session-a", watchParams);
+        String watchId = watch.get("watch_id").getAsString();
+        assertEquals(11, watch.get("value").getAsInt());
+
+        assertTrue(service.tickWatches("session-a").isEmpty());
+        assertTrue(service.tickWatches("session-a").isEmpty());
+
+        base[0] = 5;
+        assertTrue(service.tickWatches("session-a").isEmpty());
+        List<JsonObject> changes = service.tickWatches("session-a");
+        assertEquals(1, changes.size());
+        assertEquals(watchId, changes.get(0).get("watch_id").getAsString());
+        assertEquals(15, changes.get(0).get("value").getAsInt());
+        assertEquals(1L, changes.get(0).get("seq").getAsLong());
+
+        JsonObject unwatchParams = new JsonObject();
+        unwatchParams.addProperty("watch_id", watchId);
+        assertTrue(service.unwatch("session-a", unwatchParams).get("removed").getAsBoolean());
+        base[0] = 7;
+        service.tickWatches("session-a");
+        assertTrue(service.tickWatches("session-a").isEmpty());
+    }
+
+    @Test
+    void watchRejectsOutOfRangeTickInterval() {
+        TypedApiService service = new TypedApiService(getClass().getClassLoader());
+        service.registerRoot("sample", SampleRoot.class.getName(), SampleRoot::new);
+
+        JsonObject watchParams = new JsonObject();
+        watchParams.add("target", rootTarget("sample"));
+        watchParams.addProperty("method", "plus");
+        watchParams.addProperty("every_ticks", 0);
+
+        TypedApiException error = assertThrows(TypedApiException.class, () -> service.watch("session-a", watchParams));
+        assertEquals("BAD_REQUEST", error.code());
+    }
+
+    @Test
+    void materializeInlinesRegisteredValueTypesInsteadOfRefs() throws Exception {
+        TypedApiService service = new TypedApiService(getClass().getClassLoader());
+        service.registerRoot("sample", SampleRoot.class.getName(), SampleRoot::new);
+        service.registerInlineValue("box", SampleBox.class, box -> {
+            JsonArray encoded = new JsonArray();
+            encoded.add(box.add(0));
+            return encoded;
+        });
+
+        JsonObject invokeParams = new JsonObject();
+        invokeParams.add("target", rootTarget("sample"));
+        invokeParams.addProperty("method", "boxes");
+        JsonArray args = new JsonArray();
+        args.add(2);
+        invokeParams.add("args", args);
+
+        JsonArray refs = service.invoke("session-a", invokeParams).getAsJsonArray("value");
+        assertTrue(refs.get(0).getAsJsonObject().has(TypedApiService.REF_KEY));
+
+        invokeParams.addProperty("materialize", true);
+        JsonArray inline = service.invoke("session-a", invokeParams).getAsJsonArray("value");
+        assertEquals(2, inline.size());
+        JsonObject first = inline.get(0).getAsJsonObject();
+        assertEquals("box", first.get(TypedApiService.VALUE_KEY).getAsString());
+        assertEquals(0, first.getAsJsonArray("v").get(0).getAsInt());
+        assertEquals(1, inline.get(1).getAsJsonObject().getAsJsonArray("v").get(0).getAsInt());
+    }
+
+    @Test
+    void packedArraysAreEncodedLittleEndianOnlyForOptedInSessions() throws Exception {
+        TypedApiService service = new TypedApiService(getClass().getClassLoader());
+        service.registerRoot("sample", SampleRoot.class.getName(), SampleRoot::new);
+        service.setPackedArrays("session-packed", true);
+
+        JsonObject invokeParams = new JsonObject();
+        invokeParams.add("target", rootTarget("sample"));
+        invokeParams.addProperty("method", "counts");
+
+        JsonArray plain = service.invoke("session-a", invokeParams).getAsJsonArray("value");
+        assertEquals(3, plain.size());
+
+        JsonObject packed = service.invoke("session-packed", invokeParams).getAsJsonObject("value");
+        assertEquals("i32", packed.get(TypedApiService.ARRAY_KEY).getAsString());
+        byte[] bytes = Base64.getDecoder().decode(packed.get("b64").getAsString());
+        ByteBuffer buffer = ByteBuffer.wrap(bytes).order(ByteOrder.LITTLE_ENDIAN);
+        assertEquals(12, bytes.length);
+        assertEquals(1, buffer.getInt(0));
+        assertEquals(-2, buffer.getInt(4));
+        assertEquals(300, buffer.getInt(8));
+
+        JsonObject boxed = TypedApiValueCodec.packPrimitiveArray(List.of(1.5d, -2.0d));
+        assertNotNull(boxed);
+        assertEquals("f64", boxed.get(TypedApiService.ARRAY_KEY).getAsString());
+        assertNull(TypedApiValueCodec.packPrimitiveArray(List.of(1, 2L)));
+    }
+
+    private static JsonObject stepRef(int step) {
+        JsonObject placeholder = new JsonObject();
+        placeholder.addProperty(TypedApiService.STEP_KEY, step);
+        return placeholder;
+    }
+
+    private static JsonObject batchCall(String method, JsonObject params) {
+        JsonObject call = new JsonObject();
+        call.addProperty("method", method);
+        call.add("params", params);
+        return call;
+    }
+
     private static JsonObject rootTarget(String rootName) {
         JsonObject target = new JsonObject();
         target.addProperty("kind", "root");
@@ -168,6 +548,30 @@ class TypedApiServiceTest {
         public String pick(Integer value) {
             return "int:" + value;
         }
+
+        public int[] counts() {
+            return new int[]{1, -2, 300};
+        }
+
+        public int sum(int[] values) {
+            int total = 0;
+            for (int value : values) {
+                total += value;
+            }
+            return total;
+        }
+
+        public SampleBox box(int base) {
+            return new SampleBox(base);
+        }
+
+        public List<SampleBox> boxes(int count) {
+            List<SampleBox> boxes = new ArrayList<>();
+            for (int index = 0; index < count; index += 1) {
+                boxes.add(new SampleBox(index));
+            }
+            return boxes;
+        }
     }
 
     public static final class SampleBox {
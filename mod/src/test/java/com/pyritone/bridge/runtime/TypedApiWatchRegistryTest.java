@@ -0,0 +1,42 @@
+package com.pyritone.bridge.runtime;
+
+import com.google.gson.JsonObject;
+import com.google.gson.JsonPrimitive;
+import org.junit.jupiter.api.Test;
+
+import java.util.List;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+class TypedApiWatchRegistryTest {
+    @Test
+    void dropsWatchWhoseEvaluationThrowsUncheckedException() throws Exception {
+        TypedApiWatchRegistry registry = new TypedApiWatchRegistry();
+        JsonObject broken = new JsonObject();
+        broken.addProperty("method", "broken");
+        JsonObject healthy = new JsonObject();
+        healthy.addProperty("method", "healthy");
+        String brokenId = registry.add("session-a", broken, 1, new JsonPrimitive(0));
+        String healthyId = registry.add("session-a", healthy, 1, new JsonPrimitive(0));
+
+        List<TypedApiWatchRegistry.Change> changes = registry.tick("session-a", call -> {
+            if ("broken".equals(call.get("method").getAsString())) {
+                throw new IllegalArgumentException("cannot encode value");
+            }
+            return new JsonPrimitive(1);
+        });
+
+        assertEquals(2, changes.size());
+        TypedApiWatchRegistry.Change failure = changes.get(0);
+        assertEquals(brokenId, failure.watchId());
+        assertTrue(failure.failed());
+        assertEquals("INTERNAL_ERROR", failure.error().code());
+        assertEquals(
+            IllegalArgumentException.class.getName(),
+            failure.error().details().get("cause_type").getAsString()
+        );
+        assertEquals(healthyId, changes.get(1).watchId());
+        assertEquals(1, registry.size("session-a"));
+    }
+}
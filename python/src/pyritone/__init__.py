@@ -1,12 +1,27 @@
 import logging
 
 from .baritone import BaritoneNamespace, GoalRef, TypedTaskHandle, TypedTaskResult
-from .client_async import AsyncPyritoneClient, Client as AsyncClient
+from .client_async import AsyncPyritoneClient, Client as AsyncClient, EventSubscription
 from .client_event import Client, EventClient
 from .client_sync import PyritoneClient
 from .commands import ALIAS_TO_CANONICAL, BARITONE_VERSION, COMMAND_SPECS, CommandArg, CommandDispatchResult
 from . import minecraft
-from .models import BridgeError, BridgeInfo, DiscoveryError, RemoteRef, TypedCallError, VisibleEntity
+from .models import (
+    BlockPos,
+    BridgeError,
+    BridgeInfo,
+    ChunkPos,
+    DiscoveryError,
+    EventOverflowError,
+    ReconnectPolicy,
+    RemoteRef,
+    RemoteRefExpiredError,
+    RequestInterruptedError,
+    TypedCallError,
+    Vec3d,
+    VisibleEntity,
+)
+from .transport import LoopbackBridge, Transport, TransportClosed
 
 __all__ = [
     "ALIAS_TO_CANONICAL",
@@ -14,20 +29,31 @@ __all__ = [
     "AsyncPyritoneClient",
     "BARITONE_VERSION",
     "BaritoneNamespace",
+    "BlockPos",
     "BridgeError",
     "BridgeInfo",
     "Client",
     "COMMAND_SPECS",
+    "ChunkPos",
     "CommandArg",
     "CommandDispatchResult",
     "DiscoveryError",
     "EventClient",
+    "EventOverflowError",
+    "EventSubscription",
     "GoalRef",
+    "LoopbackBridge",
     "PyritoneClient",
+    "ReconnectPolicy",
     "RemoteRef",
+    "RemoteRefExpiredError",
+    "RequestInterruptedError",
+    "Transport",
+    "TransportClosed",
     "TypedTaskHandle",
     "TypedTaskResult",
     "TypedCallError",
+    "Vec3d",
     "VisibleEntity",
     "minecraft",
     "client",
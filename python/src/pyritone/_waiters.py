@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Callable
+
+WaiterCheck = Callable[..., Any]
+
+
+@dataclass(eq=False, slots=True)
+class Waiter:
+    event_name: str
+    key: str | None
+    check: WaiterCheck | None
+    future: asyncio.Future[Any]
+    timer: asyncio.TimerHandle | None = None
+
+
+class WaiterRegistry:
+    """One-shot event waiters indexed by event name and an optional secondary key (such as `task_id`).
+
+    Dispatch only visits waiters registered for the event's name (plus the wildcard name), and a
+    waiter registered with a key is only visited for events carrying that key. Timeouts are
+    scheduled with `loop.call_at`, and every completed waiter is removed from the index, so timed
+    out or canceled waits leave nothing behind.
+    """
+
+    def __init__(self, any_event: str | None = None) -> None:
+        self._any_event = any_event
+        self._buckets: dict[tuple[str, str | None], dict[Waiter, None]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def event_names(self) -> set[str]:
+        return {event_name for event_name, _ in self._buckets}
+
+    def add(
+        self,
+        event_name: str,
+        *,
+        check: WaiterCheck | None = None,
+        key: str | None = None,
+        timeout: float | None = None,
+    ) -> Waiter:
+        loop = asyncio.get_running_loop()
+        waiter = Waiter(event_name=event_name, key=key, check=check, future=loop.create_future())
+        self._buckets.setdefault((event_name, key), {})[waiter] = None
+        if timeout is not None:
+            waiter.timer = loop.call_at(loop.time() + timeout, self._expire, waiter)
+        return waiter
+
+    async def wait(self, waiter: Waiter) -> Any:
+        try:
+            return await waiter.future
+        finally:
+            self.remove(waiter)
+
+    def remove(self, waiter: Waiter) -> None:
+        if waiter.timer is not None:
+            waiter.timer.cancel()
+            waiter.timer = None
+        bucket_key = (waiter.event_name, waiter.key)
+        bucket = self._buckets.get(bucket_key)
+        if bucket is None:
+            return
+        bucket.pop(waiter, None)
+        if not bucket:
+            self._buckets.pop(bucket_key, None)
+
+    def resolve(self, event_name: str, key: str | None, check_args: tuple[Any, ...], result: Any) -> None:
+        """Complete every matching waiter whose check accepts `check_args` with `result`."""
+        for waiter in self._matching(event_name, key):
+            if waiter.future.done():
+                self.remove(waiter)
+                continue
+
+            if waiter.check is not None:
+                try:
+                    matches = bool(waiter.check(*check_args))
+                except Exception as error:
+                    waiter.future.set_exception(error)
+                    self.remove(waiter)
+                    continue
+                if not matches:
+                    continue
+
+            waiter.future.set_result(result)
+            self.remove(waiter)
+
+    def fail_all(self, error: BaseException) -> None:
+        buckets = list(self._buckets.values())
+        self._buckets.clear()
+        for bucket in buckets:
+            for waiter in bucket:
+                if waiter.timer is not None:
+                    waiter.timer.cancel()
+                    waiter.timer = None
+                if not waiter.future.done():
+                    waiter.future.set_exception(error)
+
+    def _matching(self, event_name: str, key: str | None) -> list[Waiter]:
+        names = [event_name]
+        if self._any_event is not None and event_name != self._any_event:
+            names.append(self._any_event)
+        waiters: list[Waiter] = []
+        for name in names:
+            bucket = self._buckets.get((name, None))
+            if bucket:
+                waiters.extend(bucket)
+            if key is not None:
+                bucket = self._buckets.get((name, key))
+                if bucket:
+                    waiters.extend(bucket)
+        return waiters
+
+    def _expire(self, waiter: Waiter) -> None:
+        waiter.timer = None
+        if not waiter.future.done():
+            waiter.future.set_exception(asyncio.TimeoutError())
+        self.remove(waiter)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import base64
+import sys
+from array import array
+from typing import Any
+
+# Wire kind -> array typecode. The bridge always packs little-endian.
+_PACKED_TYPECODES: dict[str, str] = {
+    "i32": "i",
+    "i64": "q",
+    "f64": "d",
+}
+
+ARRAY_KEY = "$pyritone_array"
+
+
+def decode_packed_array(kind: str, b64: str) -> array:
+    """Decode a `$pyritone_array` envelope into an `array.array` without per-element Python objects."""
+    typecode = _PACKED_TYPECODES.get(kind)
+    if typecode is None:
+        raise ValueError(f"Unsupported packed array kind: {kind!r}")
+    values = array(typecode)
+    values.frombytes(base64.b64decode(b64))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def to_numpy(values: array | Any) -> Any:
+    """Return a zero-copy NumPy view of a decoded packed array.
+
+    NumPy is optional (`pip install pyritone[numpy]`); an ImportError is raised when it is missing.
+    """
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError("pyritone.arrays.to_numpy requires NumPy; install pyritone[numpy]") from error
+
+    if not isinstance(values, array):
+        return numpy.asarray(values)
+    # Decoded arrays are already in native byte order.
+    return numpy.frombuffer(values, dtype=numpy.dtype(values.typecode))
+
+
+def decode_array_envelope(value: dict[str, Any]) -> array | None:
+    kind = value.get(ARRAY_KEY)
+    b64 = value.get("b64")
+    if not isinstance(kind, str) or not isinstance(b64, str):
+        return None
+    return decode_packed_array(kind, b64)
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import functools
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Awaitable, Callable
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable
 from uuid import uuid4
 
 from .minecraft._identifiers import BlockLike, coerce_block_id
-from .models import BridgeError, RemoteRef
+from .models import BlockPos, BridgeError, PipelineStepRef, RemoteRef, RemoteRefExpiredError
 
 if TYPE_CHECKING:
-    from .client_async import Client
+    from .client_async import Client, TypedPipeline, TypedPipelineStep
 
 
 BARITONE_PROVIDER_TYPE = "baritone.api.IBaritoneProvider"
@@ -53,6 +55,8 @@ DIRECTION_TYPE = "net.minecraft.class_2350"
 AXIS_TYPE = "net.minecraft.class_2350$class_2351"
 JAVA_FILE_TYPE = "java.io.File"
 
+EnumConstant = RemoteRef | str
+
 
 def _require_remote_ref(value: Any, *, context: str, expected_type: str | None = None) -> RemoteRef:
     if isinstance(value, RemoteRef):
@@ -88,12 +92,25 @@ def _unwrap_ref_or_value(value: Any) -> Any:
     return value
 
 
+def _require_enum_constant(value: Any, name: str, *, context: str, expected_type: str) -> EnumConstant:
+    # The bridge codec encodes enum return values by constant name and coerces names back for enum parameters.
+    if isinstance(value, str) and value.upper() == name:
+        return value
+    return _require_remote_ref(value, context=context, expected_type=expected_type)
+
+
 def _require_remote_ref_list(value: Any, *, context: str, expected_type: str | None = None) -> list[RemoteRef]:
     if not isinstance(value, list):
         raise BridgeError("BAD_RESPONSE", f"Expected list from {context}", {"value": value})
     return [_require_remote_ref(item, context=context, expected_type=expected_type) for item in value]
 
 
+def _require_block_pos_list(value: Any, *, context: str) -> list[BlockPos]:
+    if not isinstance(value, list) or not all(isinstance(item, BlockPos) for item in value):
+        raise BridgeError("BAD_RESPONSE", f"Expected list[BlockPos] from {context}", {"value": value})
+    return value
+
+
 def _require_string_list(value: Any, *, context: str) -> list[str]:
     if not isinstance(value, list):
         raise BridgeError("BAD_RESPONSE", f"Expected list from {context}", {"value": value})
@@ -158,6 +175,8 @@ class _RemoteWrapper:
     def __init__(self, client: "Client", ref: RemoteRef) -> None:
         self._client = client
         self._ref = ref
+        # Set for cached root accessors so an expired ref can be fetched again.
+        self._reload: Callable[[RemoteRef], Awaitable[RemoteRef]] | None = None
 
     @property
     def ref(self) -> RemoteRef:
@@ -168,12 +187,27 @@ class _RemoteWrapper:
         method: str,
         *args: Any,
         parameter_types: list[str] | tuple[str, ...],
+        materialize: bool = False,
     ) -> Any:
+        try:
+            return await self._client.api_invoke(
+                self._ref,
+                method,
+                *args,
+                parameter_types=list(parameter_types),
+                materialize=materialize,
+            )
+        except RemoteRefExpiredError as error:
+            if self._reload is None or error.details.get("reference_id") != self._ref.ref_id:
+                raise
+            # The bridge evicted the cached accessor ref (idle TTL or LRU cap); fetch it again and retry once.
+            self._ref = await self._reload(self._ref)
         return await self._client.api_invoke(
             self._ref,
             method,
             *args,
             parameter_types=list(parameter_types),
+            materialize=materialize,
         )
 
 
@@ -316,8 +350,17 @@ class _ProcessRef(_BaritoneWrapper):
             raise BridgeError("BAD_RESPONSE", "Expected string from IBaritoneProcess.displayName", {"value": value})
         return value
 
-    def _new_task_handle(self, action: str) -> TypedTaskHandle:
-        return self._baritone._new_task_handle(action)
+    async def _dispatch(
+        self,
+        action: str,
+        method: str,
+        *args: Any,
+        parameter_types: list[str] | tuple[str, ...],
+    ) -> TypedTaskHandle:
+        # Mark before dispatching so activity pushed ahead of the response still counts as "started".
+        busy_mark = self._client._pathing_busy_count
+        await self._invoke(method, *args, parameter_types=parameter_types)
+        return self._baritone._new_task_handle(action, busy_mark=busy_mark)
 
 
 class CustomGoalProcessRef(_ProcessRef):
@@ -325,8 +368,7 @@ class CustomGoalProcessRef(_ProcessRef):
         await self._invoke("setGoal", _unwrap_goal(goal), parameter_types=[GOAL_TYPE])
 
     async def path_dispatch(self) -> TypedTaskHandle:
-        await self._invoke("path", parameter_types=[])
-        return self._new_task_handle("ICustomGoalProcess.path")
+        return await self._dispatch("ICustomGoalProcess.path", "path", parameter_types=[])
 
     async def path(
         self,
@@ -339,8 +381,12 @@ class CustomGoalProcessRef(_ProcessRef):
         return await handle.wait(timeout, poll_interval=poll_interval, startup_timeout=startup_timeout)
 
     async def set_goal_and_path_dispatch(self, goal: GoalRef | RemoteRef) -> TypedTaskHandle:
-        await self._invoke("setGoalAndPath", _unwrap_goal(goal), parameter_types=[GOAL_TYPE])
-        return self._new_task_handle("ICustomGoalProcess.setGoalAndPath")
+        return await self._dispatch(
+            "ICustomGoalProcess.setGoalAndPath",
+            "setGoalAndPath",
+            _unwrap_goal(goal),
+            parameter_types=[GOAL_TYPE],
+        )
 
     async def set_goal_and_path(
         self,
@@ -363,8 +409,12 @@ class CustomGoalProcessRef(_ProcessRef):
 class GetToBlockProcessRef(_ProcessRef):
     async def get_to_block_dispatch(self, block: RemoteRef | _RemoteWrapper | BlockLike) -> TypedTaskHandle:
         block_arg = await self._baritone.block_optional_meta(coerce_block_id(block)) if isinstance(block, str) else _unwrap_ref(block)
-        await self._invoke("getToBlock", block_arg, parameter_types=["baritone.api.utils.BlockOptionalMeta"])
-        return self._new_task_handle("IGetToBlockProcess.getToBlock")
+        return await self._dispatch(
+            "IGetToBlockProcess.getToBlock",
+            "getToBlock",
+            block_arg,
+            parameter_types=["baritone.api.utils.BlockOptionalMeta"],
+        )
 
     async def get_to_block(
         self,
@@ -383,13 +433,13 @@ class MineProcessRef(_ProcessRef):
         if not block_names:
             raise ValueError("mine_by_name_dispatch requires at least one block name")
         resolved_names = [coerce_block_id(name) for name in block_names]
-        await self._invoke(
+        return await self._dispatch(
+            "IMineProcess.mineByName",
             "mineByName",
             int(quantity),
             resolved_names,
             parameter_types=["int", "java.lang.String[]"],
         )
-        return self._new_task_handle("IMineProcess.mineByName")
 
     async def mine_by_name(
         self,
@@ -408,8 +458,7 @@ class MineProcessRef(_ProcessRef):
 
 class ExploreProcessRef(_ProcessRef):
     async def explore_dispatch(self, x: int, z: int) -> TypedTaskHandle:
-        await self._invoke("explore", int(x), int(z), parameter_types=["int", "int"])
-        return self._new_task_handle("IExploreProcess.explore")
+        return await self._dispatch("IExploreProcess.explore", "explore", int(x), int(z), parameter_types=["int", "int"])
 
     async def explore(
         self,
@@ -430,8 +479,7 @@ class ExploreProcessRef(_ProcessRef):
 
 class BuilderProcessRef(_ProcessRef):
     async def build_open_schematic_dispatch(self) -> TypedTaskHandle:
-        await self._invoke("buildOpenSchematic", parameter_types=[])
-        return self._new_task_handle("IBuilderProcess.buildOpenSchematic")
+        return await self._dispatch("IBuilderProcess.buildOpenSchematic", "buildOpenSchematic", parameter_types=[])
 
     async def build_open_schematic(
         self,
@@ -444,8 +492,12 @@ class BuilderProcessRef(_ProcessRef):
         return await handle.wait(timeout, poll_interval=poll_interval, startup_timeout=startup_timeout)
 
     async def build_open_litematic_dispatch(self, index: int) -> TypedTaskHandle:
-        await self._invoke("buildOpenLitematic", int(index), parameter_types=["int"])
-        return self._new_task_handle("IBuilderProcess.buildOpenLitematic")
+        return await self._dispatch(
+            "IBuilderProcess.buildOpenLitematic",
+            "buildOpenLitematic",
+            int(index),
+            parameter_types=["int"],
+        )
 
     async def build_open_litematic(
         self,
@@ -470,8 +522,12 @@ class BuilderProcessRef(_ProcessRef):
 
 class FollowProcessRef(_ProcessRef):
     async def follow_dispatch(self, entity_filter: RemoteRef | _RemoteWrapper) -> TypedTaskHandle:
-        await self._invoke("follow", _unwrap_ref(entity_filter), parameter_types=["java.util.function.Predicate"])
-        return self._new_task_handle("IFollowProcess.follow")
+        return await self._dispatch(
+            "IFollowProcess.follow",
+            "follow",
+            _unwrap_ref(entity_filter),
+            parameter_types=["java.util.function.Predicate"],
+        )
 
     async def follow(
         self,
@@ -485,8 +541,12 @@ class FollowProcessRef(_ProcessRef):
         return await handle.wait(timeout, poll_interval=poll_interval, startup_timeout=startup_timeout)
 
     async def pickup_dispatch(self, item_filter: RemoteRef | _RemoteWrapper) -> TypedTaskHandle:
-        await self._invoke("pickup", _unwrap_ref(item_filter), parameter_types=["java.util.function.Predicate"])
-        return self._new_task_handle("IFollowProcess.pickup")
+        return await self._dispatch(
+            "IFollowProcess.pickup",
+            "pickup",
+            _unwrap_ref(item_filter),
+            parameter_types=["java.util.function.Predicate"],
+        )
 
     async def pickup(
         self,
@@ -576,7 +636,10 @@ class CachedWorldRef(_BaritoneWrapper):
         center_x: int,
         center_z: int,
         max_region_distance_sq: int,
-    ) -> list[RemoteRef]:
+        *,
+        materialize: bool = False,
+    ) -> list[RemoteRef] | list[BlockPos]:
+        """Return matching block positions; `materialize=True` inlines them as `BlockPos` tuples instead of refs."""
         value = await self._invoke(
             "getLocationsOf",
             coerce_block_id(block),
@@ -585,7 +648,10 @@ class CachedWorldRef(_BaritoneWrapper):
             int(center_z),
             int(max_region_distance_sq),
             parameter_types=["java.lang.String", "int", "int", "int", "int"],
+            materialize=materialize,
         )
+        if materialize:
+            return _require_block_pos_list(value, context="ICachedWorld.getLocationsOf")
         return _require_remote_ref_list(value, context="ICachedWorld.getLocationsOf", expected_type="net.minecraft.class_2338")
 
     async def reload_all_from_disk(self) -> None:
@@ -910,7 +976,10 @@ class WorldScannerRef(_BaritoneWrapper):
         max_chunk_radius: int,
         y_level_threshold: int,
         max_results: int,
-    ) -> list[RemoteRef]:
+        *,
+        materialize: bool = False,
+    ) -> list[RemoteRef] | list[BlockPos]:
+        """Scan loaded chunks for blocks; `materialize=True` inlines results as `BlockPos` tuples instead of refs."""
         value = await self._invoke(
             "scanChunkRadius",
             _unwrap_ref(player_context),
@@ -919,7 +988,10 @@ class WorldScannerRef(_BaritoneWrapper):
             int(y_level_threshold),
             int(max_results),
             parameter_types=[PLAYER_CONTEXT_TYPE, BLOCK_OPTIONAL_META_LOOKUP_TYPE, "int", "int", "int"],
+            materialize=materialize,
         )
+        if materialize:
+            return _require_block_pos_list(value, context="IWorldScanner.scanChunkRadius")
         return _require_remote_ref_list(value, context="IWorldScanner.scanChunkRadius", expected_type="net.minecraft.class_2338")
 
 
@@ -1243,13 +1315,246 @@ class GoalFactory:
         return GoalRef(self._baritone._client, ref)
 
 
+class BaritonePipelineValue:
+    """Deferred result of one step recorded in a `BaritonePipeline`.
+
+    Pass the value (or its `ref`) as a target or argument of a later step, chain
+    a further call with `call()`, and read the real value with `result()` once
+    the pipeline has been sent.
+    """
+
+    def __init__(
+        self,
+        pipeline: "BaritonePipeline",
+        step: "TypedPipelineStep",
+        wrap: type[_RemoteWrapper] | None,
+        expected_type: str | None,
+    ) -> None:
+        self._pipeline = pipeline
+        self._step = step
+        self._wrap = wrap
+        self._expected_type = expected_type
+
+    @property
+    def ref(self) -> PipelineStepRef:
+        return self._step.ref
+
+    @property
+    def done(self) -> bool:
+        return self._step.done
+
+    def call(
+        self,
+        method: str,
+        *args: Any,
+        parameter_types: list[str] | tuple[str, ...] | None = None,
+        wrap: type[_RemoteWrapper] | None = None,
+        expected_type: str | None = None,
+        materialize: bool = False,
+    ) -> BaritonePipelineValue:
+        """Record `method` invoked on this step's value."""
+        return self._pipeline.invoke(
+            self,
+            method,
+            *args,
+            parameter_types=parameter_types,
+            wrap=wrap,
+            expected_type=expected_type,
+            materialize=materialize,
+        )
+
+    def result(self) -> Any:
+        value = self._step.result()
+        if self._wrap is None:
+            return value
+        context = self._step.params.get("method") or self._step.params.get("type") or "pipeline step"
+        ref = _require_remote_ref(value, context=str(context), expected_type=self._expected_type)
+        return self._pipeline._baritone._wrap_ref(self._wrap, ref)
+
+
+class BaritonePipeline:
+    """Records an explicit chain of typed calls and sends them as one `api.pipeline` request.
+
+    Root accessors such as `world_provider()` are available by name; further
+    steps are recorded with `call()` and take earlier values as targets or
+    arguments, so `p.world_provider().call("getCurrentWorld").call("getCachedWorld")`
+    costs one round trip. Recording never consults the accessor or enum caches.
+    """
+
+    _ROOT_ACCESSORS: dict[str, tuple[str, str, type[_RemoteWrapper]]] = {
+        "pathing_behavior": ("getPathingBehavior", "baritone.api.behavior.IPathingBehavior", PathingBehaviorRef),
+        "custom_goal_process": ("getCustomGoalProcess", "baritone.api.process.ICustomGoalProcess", CustomGoalProcessRef),
+        "get_to_block_process": ("getGetToBlockProcess", "baritone.api.process.IGetToBlockProcess", GetToBlockProcessRef),
+        "mine_process": ("getMineProcess", "baritone.api.process.IMineProcess", MineProcessRef),
+        "explore_process": ("getExploreProcess", "baritone.api.process.IExploreProcess", ExploreProcessRef),
+        "builder_process": ("getBuilderProcess", "baritone.api.process.IBuilderProcess", BuilderProcessRef),
+        "follow_process": ("getFollowProcess", "baritone.api.process.IFollowProcess", FollowProcessRef),
+        "world_provider": ("getWorldProvider", WORLD_PROVIDER_TYPE, WorldProviderRef),
+        "selection_manager": ("getSelectionManager", SELECTION_MANAGER_TYPE, SelectionManagerRef),
+        "command_manager": ("getCommandManager", COMMAND_MANAGER_TYPE, CommandManagerRef),
+        "player_context": ("getPlayerContext", PLAYER_CONTEXT_TYPE, PlayerContextRef),
+        "input_override_handler": ("getInputOverrideHandler", INPUT_OVERRIDE_HANDLER_TYPE, InputOverrideHandlerRef),
+        "game_event_handler": ("getGameEventHandler", EVENT_BUS_TYPE, EventBusRef),
+    }
+
+    def __init__(self, baritone: "BaritoneNamespace", pipeline: "TypedPipeline") -> None:
+        self._baritone = baritone
+        self._pipeline = pipeline
+
+    def __len__(self) -> int:
+        return len(self._pipeline)
+
+    def __getattr__(self, name: str) -> Callable[[], BaritonePipelineValue]:
+        accessor = self._ROOT_ACCESSORS.get(name)
+        if accessor is None:
+            raise AttributeError(name)
+        method, expected_type, wrap = accessor
+
+        def _record_accessor() -> BaritonePipelineValue:
+            return self.invoke(BaritoneNamespace.ROOT, method, parameter_types=[], wrap=wrap, expected_type=expected_type)
+
+        return _record_accessor
+
+    def invoke(
+        self,
+        target: BaritonePipelineValue | RemoteRef | _RemoteWrapper | str | dict[str, Any],
+        method: str,
+        *args: Any,
+        parameter_types: list[str] | tuple[str, ...] | None = None,
+        wrap: type[_RemoteWrapper] | None = None,
+        expected_type: str | None = None,
+        materialize: bool = False,
+    ) -> BaritonePipelineValue:
+        step = self._pipeline.invoke(
+            _unwrap_pipeline_value(target),
+            method,
+            *(_unwrap_pipeline_value(arg) for arg in args),
+            parameter_types=parameter_types,
+            materialize=materialize,
+        )
+        return BaritonePipelineValue(self, step, wrap, expected_type)
+
+    def invoke_type(
+        self,
+        type_name: str,
+        method: str,
+        *args: Any,
+        parameter_types: list[str] | tuple[str, ...] | None = None,
+        wrap: type[_RemoteWrapper] | None = None,
+        expected_type: str | None = None,
+    ) -> BaritonePipelineValue:
+        return self.invoke(
+            {"kind": "type", "name": type_name},
+            method,
+            *args,
+            parameter_types=parameter_types,
+            wrap=wrap,
+            expected_type=expected_type,
+        )
+
+    def construct(
+        self,
+        type_name: str,
+        *args: Any,
+        parameter_types: list[str] | tuple[str, ...] | None = None,
+        wrap: type[_RemoteWrapper] | None = None,
+    ) -> BaritonePipelineValue:
+        step = self._pipeline.construct(
+            type_name,
+            *(_unwrap_pipeline_value(arg) for arg in args),
+            parameter_types=parameter_types,
+        )
+        return BaritonePipelineValue(self, step, wrap, type_name if wrap is not None else None)
+
+
+def _unwrap_pipeline_value(value: Any) -> Any:
+    if isinstance(value, BaritonePipelineValue):
+        return value.ref
+    if isinstance(value, _RemoteWrapper):
+        return value.ref
+    if isinstance(value, list):
+        return [_unwrap_pipeline_value(item) for item in value]
+    return value
+
+
 class BaritoneNamespace:
     ROOT = "baritone"
+    _PATHING_FALLBACK_PROBE_SECONDS = 2.0
 
     def __init__(self, client: "Client") -> None:
         self._client = client
         self._logger = logging.getLogger("pyritone")
         self.goals = GoalFactory(self)
+        self._accessor_cache: dict[str, _RemoteWrapper] = {}
+        self._accessor_generation = 0
+        self._accessor_hits = 0
+        self._accessor_misses = 0
+        self._accessor_invalidations = 0
+        self._last_in_world: bool | None = None
+        self._enum_cache: dict[tuple[str, str], EnumConstant] = {}
+
+    @property
+    def accessor_cache_stats(self) -> dict[str, int]:
+        """Hit/miss counters for memoized root accessors such as `pathing_behavior()`."""
+        return {
+            "hits": self._accessor_hits,
+            "misses": self._accessor_misses,
+            "invalidations": self._accessor_invalidations,
+            "size": len(self._accessor_cache),
+        }
+
+    def _reset_session_caches(self) -> None:
+        # Enum constants are stable for a bridge session; refs do not survive a new one.
+        self._enum_cache.clear()
+        self._last_in_world = None
+        self._invalidate_accessors("reconnect")
+
+    def _invalidate_accessors(self, reason: str) -> None:
+        self._accessor_generation += 1
+        if not self._accessor_cache:
+            return
+        self._accessor_cache.clear()
+        self._accessor_invalidations += 1
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug("[Py-Ritone] Baritone accessor cache cleared ( reason=%s )", reason)
+
+    def _observe_in_world(self, in_world: bool) -> None:
+        previous = self._last_in_world
+        self._last_in_world = in_world
+        if previous is not None and previous != in_world:
+            self._invalidate_accessors("in_world")
+
+    def _forget_ref(self, ref_id: Any) -> None:
+        if not isinstance(ref_id, str):
+            return
+        for key, wrapper in list(self._accessor_cache.items()):
+            if wrapper.ref.ref_id == ref_id:
+                del self._accessor_cache[key]
+        for enum_key, constant in list(self._enum_cache.items()):
+            if isinstance(constant, RemoteRef) and constant.ref_id == ref_id:
+                del self._enum_cache[enum_key]
+
+    async def _cached_accessor(self, key: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        cached = self._accessor_cache.get(key)
+        if cached is not None:
+            self._accessor_hits += 1
+            return cached
+
+        self._accessor_misses += 1
+        generation = self._accessor_generation
+        wrapper = await load()
+        # Drop results that raced with an invalidation; they may belong to the old world.
+        if generation == self._accessor_generation:
+            self._accessor_cache[key] = wrapper
+            self._client._retain_remote_ref(wrapper.ref)
+            wrapper._reload = functools.partial(self._reload_accessor, key, load)
+        return wrapper
+
+    async def _reload_accessor(self, key: str, load: Callable[[], Awaitable[Any]], expired: RemoteRef) -> RemoteRef:
+        cached = self._accessor_cache.get(key)
+        if cached is not None and cached.ref.ref_id == expired.ref_id:
+            del self._accessor_cache[key]
+        return (await self._cached_accessor(key, load)).ref
 
     async def _invoke_root(
         self,
@@ -1289,12 +1594,50 @@ class BaritoneNamespace:
         target = {"kind": "type", "name": type_name}
         return await self._client.api_invoke(target, method, *args, parameter_types=list(parameter_types))
 
-    async def _enum_ref(self, enum_type: str, value: str, *, context: str) -> RemoteRef:
+    async def _enum_ref(self, enum_type: str, value: str, *, context: str) -> EnumConstant:
         normalized = value.strip().upper()
         if not normalized:
             raise ValueError(f"{context} requires a non-empty enum name")
+
+        key = (enum_type, normalized)
+        cached = self._enum_cache.get(key)
+        if cached is not None:
+            return cached
+
         enum_value = await self._invoke_type(enum_type, "valueOf", normalized, parameter_types=["java.lang.String"])
-        return _require_remote_ref(enum_value, context=context, expected_type=enum_type)
+        constant = _require_enum_constant(enum_value, normalized, context=context, expected_type=enum_type)
+        self._intern_enum(key, constant)
+        return constant
+
+    async def prefetch_enum(self, enum_type: str) -> dict[str, EnumConstant]:
+        """Intern every constant of `enum_type` with one `values()` call (plus one batch if the bridge returns refs)."""
+        values = await self._invoke_type(enum_type, "values", parameter_types=[])
+        if not isinstance(values, list):
+            raise BridgeError("BAD_RESPONSE", f"Expected list from {enum_type}.values", {"value": values})
+
+        refs = [value for value in values if isinstance(value, RemoteRef)]
+        names: dict[str, str] = {}
+        if refs:
+            async with self._client.batch() as batch:
+                name_calls = [batch.invoke(ref, "name", parameter_types=[]) for ref in refs]
+            names = {ref.ref_id: str(call.result()) for ref, call in zip(refs, name_calls)}
+
+        interned: dict[str, EnumConstant] = {}
+        for value in values:
+            if isinstance(value, RemoteRef):
+                name = names[value.ref_id]
+            elif isinstance(value, str) and value:
+                name = value
+            else:
+                raise BridgeError("BAD_RESPONSE", f"Expected enum constant from {enum_type}.values", {"value": value})
+            self._intern_enum((enum_type, name.upper()), value)
+            interned[name.upper()] = value
+        return interned
+
+    def _intern_enum(self, key: tuple[str, str], constant: EnumConstant) -> None:
+        self._enum_cache[key] = constant
+        if isinstance(constant, RemoteRef):
+            self._client._retain_remote_ref(constant)
 
     async def _coerce_better_block_pos(self, value: tuple[int, int, int] | RemoteRef | _RemoteWrapper) -> RemoteRef:
         if isinstance(value, tuple):
@@ -1307,71 +1650,129 @@ class BaritoneNamespace:
     async def metadata(self) -> dict[str, Any]:
         return await self._client.api_metadata_get(self.ROOT)
 
+    @contextlib.asynccontextmanager
+    async def pipeline(self) -> AsyncIterator[BaritonePipeline]:
+        """Record a chain of typed calls and send them in one `api.pipeline` round trip on exit.
+
+        Example: `async with client.baritone.pipeline() as p: cached =
+        p.world_provider().call("getCurrentWorld").call("getCachedWorld").call("isCached", 0, 0,
+        parameter_types=["int", "int"])`, then `cached.result()` after the block.
+        """
+        async with self._client.pipeline() as typed_pipeline:
+            yield BaritonePipeline(self, typed_pipeline)
+
+    def _wrap_ref(self, wrap: type[_RemoteWrapper], ref: RemoteRef) -> _RemoteWrapper:
+        if issubclass(wrap, _BaritoneWrapper):
+            return wrap(self._client, self, ref)
+        return wrap(self._client, ref)
+
     async def pathing_behavior(self) -> PathingBehaviorRef:
-        ref = await self._invoke_root_ref(
-            "getPathingBehavior",
-            expected_type="baritone.api.behavior.IPathingBehavior",
-        )
-        return PathingBehaviorRef(self._client, ref)
+        async def _load() -> PathingBehaviorRef:
+            ref = await self._invoke_root_ref(
+                "getPathingBehavior",
+                expected_type="baritone.api.behavior.IPathingBehavior",
+            )
+            return PathingBehaviorRef(self._client, ref)
+
+        return await self._cached_accessor("pathing_behavior", _load)
 
     async def custom_goal_process(self) -> CustomGoalProcessRef:
-        ref = await self._invoke_root_ref(
-            "getCustomGoalProcess",
-            expected_type="baritone.api.process.ICustomGoalProcess",
-        )
-        return CustomGoalProcessRef(self._client, self, ref)
+        async def _load() -> CustomGoalProcessRef:
+            ref = await self._invoke_root_ref(
+                "getCustomGoalProcess",
+                expected_type="baritone.api.process.ICustomGoalProcess",
+            )
+            return CustomGoalProcessRef(self._client, self, ref)
+
+        return await self._cached_accessor("custom_goal_process", _load)
 
     async def get_to_block_process(self) -> GetToBlockProcessRef:
-        ref = await self._invoke_root_ref(
-            "getGetToBlockProcess",
-            expected_type="baritone.api.process.IGetToBlockProcess",
-        )
-        return GetToBlockProcessRef(self._client, self, ref)
+        async def _load() -> GetToBlockProcessRef:
+            ref = await self._invoke_root_ref(
+                "getGetToBlockProcess",
+                expected_type="baritone.api.process.IGetToBlockProcess",
+            )
+            return GetToBlockProcessRef(self._client, self, ref)
+
+        return await self._cached_accessor("get_to_block_process", _load)
 
     async def mine_process(self) -> MineProcessRef:
-        ref = await self._invoke_root_ref("getMineProcess", expected_type="baritone.api.process.IMineProcess")
-        return MineProcessRef(self._client, self, ref)
+        async def _load() -> MineProcessRef:
+            ref = await self._invoke_root_ref("getMineProcess", expected_type="baritone.api.process.IMineProcess")
+            return MineProcessRef(self._client, self, ref)
+
+        return await self._cached_accessor("mine_process", _load)
 
     async def explore_process(self) -> ExploreProcessRef:
-        ref = await self._invoke_root_ref("getExploreProcess", expected_type="baritone.api.process.IExploreProcess")
-        return ExploreProcessRef(self._client, self, ref)
+        async def _load() -> ExploreProcessRef:
+            ref = await self._invoke_root_ref("getExploreProcess", expected_type="baritone.api.process.IExploreProcess")
+            return ExploreProcessRef(self._client, self, ref)
+
+        return await self._cached_accessor("explore_process", _load)
 
     async def builder_process(self) -> BuilderProcessRef:
-        ref = await self._invoke_root_ref("getBuilderProcess", expected_type="baritone.api.process.IBuilderProcess")
-        return BuilderProcessRef(self._client, self, ref)
+        async def _load() -> BuilderProcessRef:
+            ref = await self._invoke_root_ref("getBuilderProcess", expected_type="baritone.api.process.IBuilderProcess")
+            return BuilderProcessRef(self._client, self, ref)
+
+        return await self._cached_accessor("builder_process", _load)
 
     async def follow_process(self) -> FollowProcessRef:
-        ref = await self._invoke_root_ref("getFollowProcess", expected_type="baritone.api.process.IFollowProcess")
-        return FollowProcessRef(self._client, self, ref)
+        async def _load() -> FollowProcessRef:
+            ref = await self._invoke_root_ref("getFollowProcess", expected_type="baritone.api.process.IFollowProcess")
+            return FollowProcessRef(self._client, self, ref)
+
+        return await self._cached_accessor("follow_process", _load)
 
     async def world_provider(self) -> WorldProviderRef:
-        ref = await self._invoke_root_ref("getWorldProvider", expected_type=WORLD_PROVIDER_TYPE)
-        return WorldProviderRef(self._client, self, ref)
+        async def _load() -> WorldProviderRef:
+            ref = await self._invoke_root_ref("getWorldProvider", expected_type=WORLD_PROVIDER_TYPE)
+            return WorldProviderRef(self._client, self, ref)
+
+        return await self._cached_accessor("world_provider", _load)
 
     async def selection_manager(self) -> SelectionManagerRef:
-        ref = await self._invoke_root_ref("getSelectionManager", expected_type=SELECTION_MANAGER_TYPE)
-        return SelectionManagerRef(self._client, self, ref)
+        async def _load() -> SelectionManagerRef:
+            ref = await self._invoke_root_ref("getSelectionManager", expected_type=SELECTION_MANAGER_TYPE)
+            return SelectionManagerRef(self._client, self, ref)
+
+        return await self._cached_accessor("selection_manager", _load)
 
     async def command_manager(self) -> CommandManagerRef:
-        ref = await self._invoke_root_ref("getCommandManager", expected_type=COMMAND_MANAGER_TYPE)
-        return CommandManagerRef(self._client, self, ref)
+        async def _load() -> CommandManagerRef:
+            ref = await self._invoke_root_ref("getCommandManager", expected_type=COMMAND_MANAGER_TYPE)
+            return CommandManagerRef(self._client, self, ref)
+
+        return await self._cached_accessor("command_manager", _load)
 
     async def player_context(self) -> PlayerContextRef:
-        ref = await self._invoke_root_ref("getPlayerContext", expected_type=PLAYER_CONTEXT_TYPE)
-        return PlayerContextRef(self._client, self, ref)
+        async def _load() -> PlayerContextRef:
+            ref = await self._invoke_root_ref("getPlayerContext", expected_type=PLAYER_CONTEXT_TYPE)
+            return PlayerContextRef(self._client, self, ref)
+
+        return await self._cached_accessor("player_context", _load)
 
     async def input_override_handler(self) -> InputOverrideHandlerRef:
-        ref = await self._invoke_root_ref("getInputOverrideHandler", expected_type=INPUT_OVERRIDE_HANDLER_TYPE)
-        return InputOverrideHandlerRef(self._client, self, ref)
+        async def _load() -> InputOverrideHandlerRef:
+            ref = await self._invoke_root_ref("getInputOverrideHandler", expected_type=INPUT_OVERRIDE_HANDLER_TYPE)
+            return InputOverrideHandlerRef(self._client, self, ref)
+
+        return await self._cached_accessor("input_override_handler", _load)
 
     async def game_event_handler(self) -> EventBusRef:
-        ref = await self._invoke_root_ref("getGameEventHandler", expected_type=EVENT_BUS_TYPE)
-        return EventBusRef(self._client, ref)
+        async def _load() -> EventBusRef:
+            ref = await self._invoke_root_ref("getGameEventHandler", expected_type=EVENT_BUS_TYPE)
+            return EventBusRef(self._client, ref)
+
+        return await self._cached_accessor("game_event_handler", _load)
 
     async def provider(self) -> BaritoneProviderRef:
-        value = await self._invoke_type("baritone.api.BaritoneAPI", "getProvider", parameter_types=[])
-        ref = _require_remote_ref(value, context="BaritoneAPI.getProvider", expected_type=BARITONE_PROVIDER_TYPE)
-        return BaritoneProviderRef(self._client, self, ref)
+        async def _load() -> BaritoneProviderRef:
+            value = await self._invoke_type("baritone.api.BaritoneAPI", "getProvider", parameter_types=[])
+            ref = _require_remote_ref(value, context="BaritoneAPI.getProvider", expected_type=BARITONE_PROVIDER_TYPE)
+            return BaritoneProviderRef(self._client, self, ref)
+
+        return await self._cached_accessor("provider", _load)
 
     async def command_system(self) -> CommandSystemRef:
         provider = await self.provider()
@@ -1424,16 +1825,16 @@ class BaritoneNamespace:
             context=BLOCK_OPTIONAL_META_LOOKUP_TYPE,
         )
 
-    async def direction(self, value: str) -> RemoteRef:
+    async def direction(self, value: str) -> EnumConstant:
         return await self._enum_ref(DIRECTION_TYPE, value, context="Direction")
 
-    async def axis_direction(self, value: str) -> RemoteRef:
+    async def axis_direction(self, value: str) -> EnumConstant:
         return await self._enum_ref(AXIS_TYPE, value, context="Direction.Axis")
 
-    async def waypoint_tag(self, value: str) -> RemoteRef:
+    async def waypoint_tag(self, value: str) -> EnumConstant:
         return await self._enum_ref(WAYPOINT_TAG_TYPE, value, context="IWaypoint.Tag")
 
-    async def input_key(self, value: str) -> RemoteRef:
+    async def input_key(self, value: str) -> EnumConstant:
         return await self._enum_ref(INPUT_TYPE, value, context="Input")
 
     async def java_path(self, value: str | Path) -> RemoteRef:
@@ -1560,7 +1961,7 @@ class BaritoneNamespace:
     async def open_click(self) -> None:
         await self._invoke_root("openClick", parameter_types=[])
 
-    def _new_task_handle(self, action: str) -> TypedTaskHandle:
+    def _new_task_handle(self, action: str, *, busy_mark: int) -> TypedTaskHandle:
         handle_id = f"typed-{uuid4().hex}"
 
         async def _waiter(timeout: float | None, poll_interval: float, startup_timeout: float) -> TypedTaskResult:
@@ -1570,6 +1971,7 @@ class BaritoneNamespace:
                 timeout=timeout,
                 poll_interval=poll_interval,
                 startup_timeout=startup_timeout,
+                busy_mark=busy_mark,
             )
 
         return TypedTaskHandle(handle_id=handle_id, action=action, waiter=_waiter)
@@ -1582,22 +1984,43 @@ class BaritoneNamespace:
         timeout: float | None,
         poll_interval: float,
         startup_timeout: float,
+        busy_mark: int = 0,
     ) -> TypedTaskResult:
         loop = asyncio.get_running_loop()
         deadline = None if timeout is None else loop.time() + timeout
         startup_deadline = loop.time() + startup_timeout
 
+        # Bridges that push `baritone.pathing_activity` let us wait on events; older
+        # bridges never send it, so fall back to polling the pathing behavior.
+        event_driven = self._pathing_activity() is not None
+        behavior: PathingBehaviorRef | None = None
+        next_probe = loop.time() + (self._PATHING_FALLBACK_PROBE_SECONDS if event_driven else 0.0)
+
         started = False
-        behavior = await self.pathing_behavior()
         last_transition: tuple[bool, bool] | None = None
 
         while True:
-            if deadline is not None and loop.time() >= deadline:
+            now = loop.time()
+            if deadline is not None and now >= deadline:
                 raise TimeoutError(f"Timed out waiting for typed Baritone task: {action}")
 
-            pathing = await behavior.is_pathing()
-            calculating = (await behavior.in_progress()) is not None
+            signal = self._client._pathing_signal if event_driven else None
+            activity = self._pathing_activity() if event_driven else None
+            if activity is not None and now < next_probe:
+                pathing = activity.get("pathing") is True
+                calculating = activity.get("calculating") is True
+            else:
+                activity = None
+                if behavior is None:
+                    behavior = await self.pathing_behavior()
+                pathing = await behavior.is_pathing()
+                calculating = (await behavior.in_progress()) is not None
+                interval = self._PATHING_FALLBACK_PROBE_SECONDS if event_driven else poll_interval
+                next_probe = loop.time() + interval
+
             busy = pathing or calculating
+            if event_driven and self._client._pathing_busy_count != busy_mark:
+                started = True
             transition = (pathing, calculating)
             if transition != last_transition:
                 last_transition = transition
@@ -1611,7 +2034,12 @@ class BaritoneNamespace:
             if busy:
                 started = True
             elif started or loop.time() >= startup_deadline:
-                has_path = await behavior.has_path()
+                if activity is not None:
+                    has_path = activity.get("has_path") is True
+                else:
+                    if behavior is None:
+                        behavior = await self.pathing_behavior()
+                    has_path = await behavior.has_path()
                 self._emit_typed_wait_best_path(
                     handle_id=handle_id,
                     action=action,
@@ -1623,6 +2051,8 @@ class BaritoneNamespace:
                     started=started,
                     has_path=has_path,
                 )
+                if behavior is None:
+                    behavior = await self.pathing_behavior()
                 return TypedTaskResult(
                     handle_id=handle_id,
                     action=action,
@@ -1633,7 +2063,21 @@ class BaritoneNamespace:
                     goal=await behavior.goal(),
                 )
 
-            await asyncio.sleep(poll_interval)
+            if signal is None:
+                await asyncio.sleep(poll_interval)
+                continue
+
+            wake_at = next_probe
+            if not started:
+                wake_at = min(wake_at, startup_deadline)
+            if deadline is not None:
+                wake_at = min(wake_at, deadline)
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(signal.wait(), timeout=max(wake_at - loop.time(), 0.0))
+
+    def _pathing_activity(self) -> dict[str, Any] | None:
+        activity = getattr(self._client, "_pathing_activity", None)
+        return activity if isinstance(activity, dict) else None
 
     def _emit_typed_wait_transition(
         self,
@@ -1713,6 +2157,8 @@ class BaritoneNamespace:
 __all__ = [
     "ArgParserManagerRef",
     "BaritoneNamespace",
+    "BaritonePipeline",
+    "BaritonePipelineValue",
     "BaritoneProviderRef",
     "BuilderProcessRef",
     "CachedWorldRef",
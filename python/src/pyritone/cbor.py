@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import struct
+from typing import Any
+
+# Pure-Python CBOR (RFC 8949) for the JSON data model used by bridge envelopes:
+# maps, arrays, text, byte strings, integers up to 64 bits, floats, booleans and null.
+
+_MAJOR_UNSIGNED = 0
+_MAJOR_NEGATIVE = 1
+_MAJOR_BYTES = 2
+_MAJOR_TEXT = 3
+_MAJOR_ARRAY = 4
+_MAJOR_MAP = 5
+_MAJOR_TAG = 6
+_MAJOR_SIMPLE = 7
+
+_FALSE = 0xF4
+_TRUE = 0xF5
+_NULL = 0xF6
+_UNDEFINED = 0xF7
+_FLOAT64 = 0xFB
+
+_UINT64_MAX = (1 << 64) - 1
+
+_pack_float64 = struct.Struct(">d").pack
+_unpack_half = struct.Struct(">e").unpack_from
+_unpack_single = struct.Struct(">f").unpack_from
+_unpack_double = struct.Struct(">d").unpack_from
+
+
+def dumps(value: Any) -> bytes:
+    out = bytearray()
+    _encode(value, out)
+    return bytes(out)
+
+
+def loads(data: bytes | bytearray | memoryview) -> Any:
+    view = memoryview(data)
+    value, offset = _decode(view, 0)
+    if offset != len(view):
+        raise ValueError(f"Trailing bytes after CBOR item at offset {offset}")
+    return value
+
+
+def _write_head(major: int, argument: int, out: bytearray) -> None:
+    prefix = major << 5
+    if argument < 24:
+        out.append(prefix | argument)
+    elif argument < 0x100:
+        out.append(prefix | 24)
+        out.append(argument)
+    elif argument < 0x10000:
+        out.append(prefix | 25)
+        out += argument.to_bytes(2, "big")
+    elif argument < 0x100000000:
+        out.append(prefix | 26)
+        out += argument.to_bytes(4, "big")
+    else:
+        out.append(prefix | 27)
+        out += argument.to_bytes(8, "big")
+
+
+def _encode(value: Any, out: bytearray) -> None:
+    if value is None:
+        out.append(_NULL)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8")
+        _write_head(_MAJOR_TEXT, len(encoded), out)
+        out += encoded
+    elif isinstance(value, int):
+        if value >= 0:
+            if value > _UINT64_MAX:
+                raise ValueError(f"Integer out of CBOR range: {value}")
+            _write_head(_MAJOR_UNSIGNED, value, out)
+        else:
+            argument = -1 - value
+            if argument > _UINT64_MAX:
+                raise ValueError(f"Integer out of CBOR range: {value}")
+            _write_head(_MAJOR_NEGATIVE, argument, out)
+    elif isinstance(value, float):
+        out.append(_FLOAT64)
+        out += _pack_float64(value)
+    elif isinstance(value, dict):
+        _write_head(_MAJOR_MAP, len(value), out)
+        for key, item in value.items():
+            _encode(key, out)
+            _encode(item, out)
+    elif isinstance(value, (list, tuple)):
+        _write_head(_MAJOR_ARRAY, len(value), out)
+        for item in value:
+            _encode(item, out)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        raw = bytes(value)
+        _write_head(_MAJOR_BYTES, len(raw), out)
+        out += raw
+    else:
+        raise TypeError(f"Object of type {type(value).__name__} is not CBOR serializable")
+
+
+def _read_argument(view: memoryview, offset: int, info: int) -> tuple[int, int]:
+    if info < 24:
+        return info, offset
+    if info == 24:
+        return view[offset], offset + 1
+    if info == 25:
+        return int.from_bytes(view[offset : offset + 2], "big"), offset + 2
+    if info == 26:
+        return int.from_bytes(view[offset : offset + 4], "big"), offset + 4
+    if info == 27:
+        return int.from_bytes(view[offset : offset + 8], "big"), offset + 8
+    raise ValueError(f"Unsupported CBOR additional info {info} (indefinite lengths are not supported)")
+
+
+def _decode(view: memoryview, offset: int) -> tuple[Any, int]:
+    if offset >= len(view):
+        raise ValueError("Truncated CBOR payload")
+    initial = view[offset]
+    offset += 1
+    major = initial >> 5
+    info = initial & 0x1F
+
+    if major == _MAJOR_SIMPLE:
+        if initial == _FALSE:
+            return False, offset
+        if initial == _TRUE:
+            return True, offset
+        if initial in (_NULL, _UNDEFINED):
+            return None, offset
+        if info == 25:
+            return _unpack_half(view, offset)[0], offset + 2
+        if info == 26:
+            return _unpack_single(view, offset)[0], offset + 4
+        if info == 27:
+            return _unpack_double(view, offset)[0], offset + 8
+        raise ValueError(f"Unsupported CBOR simple value 0x{initial:02x}")
+
+    argument, offset = _read_argument(view, offset, info)
+    if major == _MAJOR_UNSIGNED:
+        return argument, offset
+    if major == _MAJOR_NEGATIVE:
+        return -1 - argument, offset
+    if major == _MAJOR_TEXT:
+        end = offset + argument
+        if end > len(view):
+            raise ValueError("Truncated CBOR payload")
+        return str(view[offset:end], "utf-8"), end
+    if major == _MAJOR_BYTES:
+        end = offset + argument
+        if end > len(view):
+            raise ValueError("Truncated CBOR payload")
+        return bytes(view[offset:end]), end
+    if major == _MAJOR_ARRAY:
+        items = []
+        for _ in range(argument):
+            item, offset = _decode(view, offset)
+            items.append(item)
+        return items, offset
+    if major == _MAJOR_MAP:
+        mapping: dict[Any, Any] = {}
+        for _ in range(argument):
+            key, offset = _decode(view, offset)
+            value, offset = _decode(view, offset)
+            mapping[key] = value
+        return mapping, offset
+    # Tags carry no meaning for bridge payloads; decode the tagged item as-is.
+    return _decode(view, offset)
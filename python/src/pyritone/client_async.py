@@ -1,21 +1,27 @@
 from __future__ import annotations
 
 import asyncio
-import copy
 import contextlib
 import contextvars
+import fnmatch
 import inspect
 import json
 import logging
+import re
 import shlex
-from collections import defaultdict
+import time
+import weakref
+from array import array
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Awaitable, Callable
-
-from websockets.asyncio.client import ClientConnection, connect
-from websockets.exceptions import ConnectionClosed
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable
 
+from ._waiters import Waiter, WaiterRegistry
+from .arrays import ARRAY_KEY, decode_array_envelope
 from .baritone import BaritoneNamespace
 from .commands.async_build import AsyncBuildCommands
 from .commands.async_control import AsyncControlCommands
@@ -25,10 +31,33 @@ from .commands.async_waypoints import AsyncWaypointsCommands
 from .commands.async_world import AsyncWorldCommands
 from .commands._types import CommandArg, CommandDispatchResult
 from .discovery import resolve_bridge_info
-from .models import BridgeError, BridgeInfo, RemoteRef, TypedCallError, VisibleEntity
-from .protocol import decode_message, encode_message, new_request
+from .models import (
+    BlockPos,
+    BridgeError,
+    BridgeInfo,
+    ChunkPos,
+    EventOverflowError,
+    PipelineStepRef,
+    ReconnectPolicy,
+    RemoteRef,
+    RemoteRefExpiredError,
+    RequestInterruptedError,
+    TypedCallError,
+    Vec3d,
+    VisibleEntity,
+)
+from .protocol import (
+    BINARY_CODEC_CAPABILITY,
+    JsonCodec,
+    decode_binary_message,
+    decode_message,
+    encode_binary_message,
+    get_codec,
+    new_request,
+)
 from .schematic_paths import normalize_build_coords, normalize_schematic_path
 from .settings import AsyncSettingsNamespace
+from .transport import Transport, TransportClosed, TransportFactory, resolve_transport_factory
 
 EventPayload = dict[str, Any]
 EventCheck = Callable[[EventPayload], bool]
@@ -37,40 +66,85 @@ _execute_notice_label: contextvars.ContextVar[str | None] = contextvars.ContextV
     "pyritone_execute_notice_label",
     default=None,
 )
+_active_ref_scope: contextvars.ContextVar["RemoteRefScope | None"] = contextvars.ContextVar(
+    "pyritone_active_ref_scope",
+    default=None,
+)
 _HUMAN_LOG_PREFIX = "[Py-Ritone]"
+_WIRE_FORMATS = ("json", "cbor")
 
 
 @dataclass(slots=True)
-class _EventWaiter:
-    event_name: str
-    check: EventCheck | None
-    future: asyncio.Future[EventPayload]
+class _TaskChannelItem:
+    event: EventPayload
+    # Bridge pause state when the event was dispatched, so replayed events are judged as they arrived.
+    bridge_paused: bool
+
+
+_TASK_CHANNEL_CLOSED = object()
+# The connection came back but the task is no longer active; its terminal event may have been missed.
+_TASK_CHANNEL_LOST = object()
+
+# Requests that are safe to send again after a reconnect; anything else in flight fails with
+# RequestInterruptedError because the bridge may already have run it.
+_IDEMPOTENT_METHODS = frozenset(
+    {
+        "ping",
+        "status.get",
+        "status.subscribe",
+        "status.unsubscribe",
+        "events.subscribe",
+        "entities.list",
+        "api.metadata.get",
+        "api.watch",
+        "api.unwatch",
+        "api.release",
+    }
+)
+
+
+class _ConnectionLost(ConnectionError):
+    """Fails in-flight requests when a reconnecting client loses its transport."""
 
 
 class ClientStateCache:
+    """Latest bridge status as an immutable, structurally shared snapshot.
+
+    `snapshot` and `active_task` return read-only mappings (lists become tuples) without copying;
+    each update builds a new snapshot that reuses every unchanged branch of the previous one.
+    `version` increases only when the content changes, so callers can memoize derived views on it.
+    Use `to_dict()` for a mutable deep copy.
+    """
+
     def __init__(self) -> None:
-        self._status: dict[str, Any] = {}
+        self._status: Mapping[str, Any] = _EMPTY_MAPPING
         self._updated_at: str | None = None
+        self._version = 0
+        self._stream_seq: int | None = None
 
     @property
     def updated_at(self) -> str | None:
         return self._updated_at
 
     @property
-    def snapshot(self) -> dict[str, Any]:
-        return copy.deepcopy(self._status)
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def snapshot(self) -> Mapping[str, Any]:
+        return self._status
 
     @property
-    def active_task(self) -> dict[str, Any] | None:
+    def active_task(self) -> Mapping[str, Any] | None:
         value = self._status.get("active_task")
-        if isinstance(value, dict):
-            return copy.deepcopy(value)
+        if isinstance(value, Mapping):
+            return value
         return None
 
     @property
     def task_id(self) -> str | None:
-        task = self._status.get("active_task")
-        if not isinstance(task, dict):
+        task = self.active_task
+        if task is None:
             return None
 
         task_id = task.get("task_id")
@@ -80,8 +154,8 @@ class ClientStateCache:
 
     @property
     def task_state(self) -> str | None:
-        task = self._status.get("active_task")
-        if not isinstance(task, dict):
+        task = self.active_task
+        if task is None:
             return None
 
         state = task.get("state")
@@ -91,8 +165,8 @@ class ClientStateCache:
 
     @property
     def task_detail(self) -> str | None:
-        task = self._status.get("active_task")
-        if not isinstance(task, dict):
+        task = self.active_task
+        if task is None:
             return None
 
         detail = task.get("detail")
@@ -100,32 +174,133 @@ class ClientStateCache:
             return detail
         return None
 
+    def to_dict(self) -> dict[str, Any]:
+        return _thaw(self._status)
+
     def _clear(self) -> None:
-        self._status = {}
+        self._set(_EMPTY_MAPPING)
         self._updated_at = None
+        self._stream_seq = None
+
+    def _start_delta_stream(self, seq: int | None) -> None:
+        self._stream_seq = seq
+
+    def _apply_delta(
+        self,
+        changed: dict[str, Any],
+        removed: list[str],
+        *,
+        seq: int,
+        base_seq: int,
+        ts: str | None = None,
+    ) -> bool:
+        """Apply a delta `status.update`; returns False (leaving the snapshot as is) on a sequence gap.
+
+        Deltas older than the current base (sent before a resync) are ignored.
+        """
+        if self._stream_seq is None or base_seq > self._stream_seq:
+            return False
+        if base_seq < self._stream_seq:
+            return True
+
+        if changed or removed:
+            updated = dict(self._status)
+            for key, value in changed.items():
+                updated[key] = _freeze(value, self._status.get(key))
+            for key in removed:
+                updated.pop(key, None)
+            if any(updated.get(key, _MISSING) is not self._status.get(key, _MISSING) for key in changed) or any(
+                key in self._status for key in removed
+            ):
+                self._set(MappingProxyType(updated))
+        self._stream_seq = seq
+        self._updated_at = ts
+        return True
 
     def _replace(self, status: dict[str, Any], *, ts: str | None = None) -> None:
-        self._status = copy.deepcopy(status)
+        self._set(_freeze(status, self._status))
+        self._updated_at = ts
+
+    def _merge(self, status: dict[str, Any], *, ts: str | None = None) -> None:
+        """Update only the fields in a projected `status`, keeping the others from the current snapshot."""
+        updated = dict(self._status)
+        for key, value in status.items():
+            updated[key] = _freeze(value, self._status.get(key))
+        if any(updated[key] is not self._status.get(key, _MISSING) for key in status):
+            self._set(MappingProxyType(updated))
         self._updated_at = ts
 
     def _merge_active_task(self, task_payload: dict[str, Any], *, ts: str | None = None) -> None:
-        next_status = dict(self._status)
-        next_status["active_task"] = copy.deepcopy(task_payload)
-        self._status = next_status
+        self._set(_with_key(self._status, "active_task", _freeze(task_payload, self._status.get("active_task"))))
         self._updated_at = ts
 
     def _clear_active_task(self, task_id: str | None, *, ts: str | None = None) -> None:
-        current = self._status.get("active_task")
-        if not isinstance(current, dict):
+        current = self.active_task
+        if current is None:
             return
         if task_id is not None and current.get("task_id") != task_id:
             return
 
-        next_status = dict(self._status)
-        next_status["active_task"] = None
-        self._status = next_status
+        self._set(_with_key(self._status, "active_task", None))
         self._updated_at = ts
 
+    def _set(self, status: Mapping[str, Any]) -> None:
+        if status is not self._status:
+            self._status = status
+            self._version += 1
+
+
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+_MISSING = object()
+
+
+def _freeze(value: Any, previous: Any = None) -> Any:
+    """Return an immutable copy of `value`, reusing `previous` (or its branches) where equal."""
+    if isinstance(value, dict):
+        previous_mapping = previous if isinstance(previous, MappingProxyType) else None
+        frozen: dict[str, Any] = {}
+        shared = previous_mapping is not None and len(previous_mapping) == len(value)
+        for key, item in value.items():
+            previous_item = previous_mapping.get(key, _MISSING) if previous_mapping is not None else _MISSING
+            frozen_item = _freeze(item, None if previous_item is _MISSING else previous_item)
+            frozen[key] = frozen_item
+            if frozen_item is not previous_item:
+                shared = False
+        if shared:
+            return previous_mapping
+        return MappingProxyType(frozen)
+
+    if isinstance(value, (list, tuple)):
+        previous_items = previous if isinstance(previous, tuple) else None
+        frozen_items = tuple(
+            _freeze(item, previous_items[index] if previous_items is not None and index < len(previous_items) else None)
+            for index, item in enumerate(value)
+        )
+        if previous_items is not None and len(previous_items) == len(frozen_items):
+            if all(item is previous_item for item, previous_item in zip(frozen_items, previous_items)):
+                return previous_items
+        return frozen_items
+
+    if previous is not None and type(previous) is type(value) and previous == value:
+        return previous
+    return value
+
+
+def _with_key(mapping: Mapping[str, Any], key: str, value: Any) -> Mapping[str, Any]:
+    if key in mapping and mapping[key] is value:
+        return mapping
+    updated = dict(mapping)
+    updated[key] = value
+    return MappingProxyType(updated)
+
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
 
 class _TaskNamespace:
     def __init__(self, client: "Client") -> None:
@@ -167,7 +342,7 @@ class _TaskNamespace:
             raise BridgeError(
                 "NO_ACTIVE_TASK",
                 "No active task available in client state cache",
-                {"state": self._client.state.snapshot},
+                {"state": self._client.state.to_dict()},
             )
 
         return await self._client.wait_for_task(
@@ -199,6 +374,525 @@ class PlayerView:
         return await self._client.entities_list(types=types)
 
 
+class TypedBatchCall:
+    """Handle for one typed call collected into a batch; resolved when the batch is sent."""
+
+    __slots__ = ("index", "method", "params", "_done", "_value", "_error")
+
+    def __init__(self, index: int, method: str, params: dict[str, Any]) -> None:
+        self.index = index
+        self.method = method
+        self.params = params
+        self._done = False
+        self._value: Any = None
+        self._error: TypedCallError | None = None
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    @property
+    def ok(self) -> bool:
+        return self._done and self._error is None
+
+    @property
+    def error(self) -> TypedCallError | None:
+        return self._error
+
+    def result(self) -> Any:
+        if not self._done:
+            raise RuntimeError("Typed batch has not been sent yet")
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def _resolve(self, entry: Any, decode: Callable[[Any], Any]) -> None:
+        self._done = True
+        if not isinstance(entry, dict):
+            self._error = TypedCallError("BAD_RESPONSE", "Expected object batch result entry", {"entry": entry})
+            return
+
+        if entry.get("ok", False):
+            result = entry.get("result")
+            if not isinstance(result, dict):
+                self._error = TypedCallError("BAD_RESPONSE", "Expected object result in batch entry", entry)
+                return
+            if self.method == "api.metadata.get":
+                self._value = result
+                return
+            if "value" not in result:
+                self._error = TypedCallError("BAD_RESPONSE", f"Expected value in {self.method} result", entry)
+                return
+            self._value = decode(result["value"])
+            return
+
+        error = entry.get("error") or {}
+        details = error.get("data")
+        self._error = _typed_call_error(
+            str(error.get("code", "UNKNOWN")),
+            str(error.get("message", "Unknown error")),
+            entry,
+            details if isinstance(details, dict) else {},
+        )
+
+
+class TypedBatch:
+    """Collects typed API calls and sends them as one `api.batch` request."""
+
+    _METHOD = "api.batch"
+    _CALL_TYPE = TypedBatchCall
+
+    def __init__(self, client: "Client") -> None:
+        self._client = client
+        self._calls: list[TypedBatchCall] = []
+        self._sent = False
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    @property
+    def sent(self) -> bool:
+        return self._sent
+
+    @property
+    def calls(self) -> tuple[TypedBatchCall, ...]:
+        return tuple(self._calls)
+
+    def metadata(self, target: str | RemoteRef | dict[str, Any] | None = None) -> TypedBatchCall:
+        return self._add("api.metadata.get", _typed_metadata_params(target))
+
+    def construct(
+        self,
+        type_name: str,
+        *args: Any,
+        parameter_types: list[str] | tuple[str, ...] | None = None,
+    ) -> TypedBatchCall:
+        return self._add("api.construct", _typed_construct_params(type_name, args, parameter_types))
+
+    def invoke(
+        self,
+        target: str | RemoteRef | dict[str, Any],
+        method: str,
+        *args: Any,
+        parameter_types: list[str] | tuple[str, ...] | None = None,
+        materialize: bool = False,
+    ) -> TypedBatchCall:
+        return self._add("api.invoke", _typed_invoke_params(target, method, args, parameter_types, materialize=materialize))
+
+    async def send(self) -> list[TypedBatchCall]:
+        if self._sent:
+            raise RuntimeError(f"{type(self).__name__} was already sent")
+        self._sent = True
+        if not self._calls:
+            return []
+
+        entries = await self._send_calls([{"method": call.method, "params": call.params} for call in self._calls])
+        if len(entries) != len(self._calls):
+            raise BridgeError(
+                "BAD_RESPONSE",
+                f"{self._METHOD} result count does not match call count",
+                {"expected": len(self._calls), "actual": len(entries)},
+            )
+        for call, entry in zip(self._calls, entries):
+            call._resolve(entry, self._client._decode_result_value)
+        return list(self._calls)
+
+    async def _send_calls(self, calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return await self._client.api_batch(calls)
+
+    def _add(self, method: str, params: dict[str, Any]) -> TypedBatchCall:
+        if self._sent:
+            raise RuntimeError(f"{type(self).__name__} was already sent")
+        call = self._CALL_TYPE(len(self._calls), method, params)
+        self._calls.append(call)
+        return call
+
+
+class TypedPipelineStep(TypedBatchCall):
+    """Handle for one pipeline step; `ref` lets later steps use this step's value."""
+
+    __slots__ = ()
+
+    @property
+    def ref(self) -> PipelineStepRef:
+        return PipelineStepRef(f"$step:{self.index}", step=self.index)
+
+
+class TypedPipeline(TypedBatch):
+    """Collects dependent typed calls and sends them as one `api.pipeline` request.
+
+    Pass `step.ref` as a target or argument to use an earlier step's value; the
+    bridge substitutes it before running the step. Steps after the first failure
+    resolve with `API_PIPELINE_ABORTED`.
+    """
+
+    _METHOD = "api.pipeline"
+    _CALL_TYPE = TypedPipelineStep
+
+    @property
+    def steps(self) -> tuple[TypedPipelineStep, ...]:
+        return tuple(self._calls)  # type: ignore[arg-type]
+
+    async def _send_calls(self, calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return await self._client.api_pipeline(calls)
+
+
+class RemoteRefScope:
+    """Remote refs decoded inside `client.ref_scope()`; released together when the scope exits."""
+
+    def __init__(self, client: "Client", parent: "RemoteRefScope | None") -> None:
+        self._client = client
+        self._parent = parent
+        self._refs: dict[str, RemoteRef] = {}
+        self._kept: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    @property
+    def refs(self) -> tuple[RemoteRef, ...]:
+        return tuple(self._refs.values())
+
+    def keep(self, *values: Any) -> None:
+        """Exclude refs (or typed wrappers) from this scope's release; they move to the enclosing scope if any."""
+        for value in values:
+            ref = value if isinstance(value, RemoteRef) else getattr(value, "ref", None)
+            if not isinstance(ref, RemoteRef):
+                raise TypeError(f"Expected RemoteRef or wrapper, got {type(value)!r}")
+            self._kept.add(ref.ref_id)
+            self._refs.pop(ref.ref_id, None)
+            if self._parent is not None:
+                self._parent._add(ref)
+
+    def _add(self, ref: RemoteRef) -> None:
+        if ref.ref_id not in self._kept:
+            self._refs.setdefault(ref.ref_id, ref)
+
+
+class _EventListener:
+    """One `on()` registration with its execution mode, ordered backlog and latency counters."""
+
+    MODES = ("inline", "thread", "task")
+
+    def __init__(self, client: "Client", event: str, callback: EventCallback, mode: str, max_queue: int) -> None:
+        self._client = client
+        self.event = event
+        self.callback = callback
+        self.mode = mode
+        self.max_queue = max_queue
+        self._queue: deque[EventPayload] = deque()
+        self._worker: asyncio.Task[None] | None = None
+        self.calls = 0
+        self.errors = 0
+        self.dropped = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        average = self.total_seconds / self.calls if self.calls else 0.0
+        return {
+            "event": self.event,
+            "callback": getattr(self.callback, "__qualname__", repr(self.callback)),
+            "mode": self.mode,
+            "calls": self.calls,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "queued": len(self._queue),
+            "avg_ms": average * 1000.0,
+            "max_ms": self.max_seconds * 1000.0,
+        }
+
+    def deliver(self, payload: EventPayload) -> None:
+        if self.mode == "inline":
+            started = time.perf_counter()
+            try:
+                self._client._invoke_event_callback(self.callback, payload, listener=self)
+            finally:
+                self._record(time.perf_counter() - started)
+            return
+
+        if len(self._queue) >= self.max_queue:
+            self._queue.popleft()
+            self.dropped += 1
+        self._queue.append(payload)
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain(), name="pyritone-event-listener")
+            self._client._listener_tasks.add(self._worker)
+            self._worker.add_done_callback(self._client._listener_tasks.discard)
+
+    def discard_backlog(self) -> None:
+        self._queue.clear()
+
+    async def _drain(self) -> None:
+        # One worker per listener keeps callbacks in event order.
+        loop = asyncio.get_running_loop()
+        while self._queue:
+            payload = self._queue.popleft()
+            started = time.perf_counter()
+            try:
+                if self.mode == "thread":
+                    await loop.run_in_executor(self._client._listener_executor(), self.callback, payload)
+                else:
+                    callback_result = self.callback(payload)
+                    if inspect.isawaitable(callback_result):
+                        await callback_result
+            except Exception:
+                self.errors += 1
+                self._client._logger.exception("Event callback raised")
+            finally:
+                self._record(time.perf_counter() - started)
+
+    def _record(self, elapsed: float) -> None:
+        self.calls += 1
+        self.total_seconds += elapsed
+        if elapsed > self.max_seconds:
+            self.max_seconds = elapsed
+
+
+class EventSubscription:
+    """Async iterator over raw event envelopes matching `pattern`, backed by its own ring buffer.
+
+    Each subscription sees every matching event regardless of other subscriptions and of
+    `events()`/`next_event()`. Payloads are shared with other consumers, not copied, so treat
+    them as read-only. When the buffer holds `maxsize` events the `overflow` policy applies:
+    `drop_oldest` discards the oldest buffered event, `block` pauses the receive loop until the
+    consumer catches up, and `error` ends the subscription with `EventOverflowError` once the
+    buffered events are consumed.
+    """
+
+    OVERFLOW_POLICIES = ("drop_oldest", "block", "error")
+
+    def __init__(self, client: "Client", pattern: str, *, maxsize: int, overflow: str) -> None:
+        self._client = client
+        self.pattern = pattern
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self._buffer: deque[EventPayload] = deque()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self._error: BaseException | None = None
+        self._closed = False
+        self.delivered = 0
+        self.dropped = 0
+        self.max_lag = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def lag(self) -> int:
+        """Events buffered but not yet consumed."""
+        return len(self._buffer)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "lag": len(self._buffer),
+            "max_lag": self.max_lag,
+            "maxsize": self.maxsize,
+        }
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._client._unregister_subscription(self)
+        self._readable.set()
+        self._writable.set()
+
+    async def __aenter__(self) -> "EventSubscription":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __aiter__(self) -> "EventSubscription":
+        return self
+
+    async def __anext__(self) -> EventPayload:
+        while True:
+            if self._buffer:
+                payload = self._buffer.popleft()
+                self.delivered += 1
+                self._writable.set()
+                return payload
+            if self._error is not None:
+                error = self._error
+                self._error = None
+                raise error
+            if self._closed:
+                raise StopAsyncIteration
+            self._readable.clear()
+            await self._readable.wait()
+
+    def _offer(self, payload: EventPayload) -> bool:
+        """Buffer one event in O(1); returns False only when a `block` subscription is full."""
+        if self._closed:
+            return True
+        if len(self._buffer) >= self.maxsize:
+            if self.overflow == "block":
+                return False
+            self.dropped += 1
+            if self.overflow == "error":
+                self._error = EventOverflowError(self.pattern, self.maxsize)
+                self.close()
+                return True
+            self._buffer.popleft()
+        self._buffer.append(payload)
+        if len(self._buffer) > self.max_lag:
+            self.max_lag = len(self._buffer)
+        self._readable.set()
+        return True
+
+    async def _put(self, payload: EventPayload) -> None:
+        while not self._offer(payload):
+            self._writable.clear()
+            await self._writable.wait()
+
+
+class TypedWatch:
+    """Async iterator over the values of an `api.watch` registration.
+
+    The first item is the value at registration time; later items arrive only
+    when the bridge sees the encoded value change. Use `async with` (or call
+    `close()`) to send `api.unwatch` when done.
+    """
+
+    _CLOSED = object()
+
+    def __init__(self, client: "Client", payload: dict[str, Any], *, initial: bool) -> None:
+        self._client = client
+        self._payload = payload
+        self._initial = initial
+        self._queue: asyncio.Queue[Any] = asyncio.Queue()
+        self.watch_id: str | None = None
+        self.every_ticks: int | None = None
+        self.return_type: str | None = None
+        self.value: Any = None
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def start(self) -> "TypedWatch":
+        if self.watch_id is not None or self._closed:
+            return self
+        result = await self._client._request("api.watch", self._payload)
+        self._apply_registration(result)
+        if self._initial:
+            self._queue.put_nowait(self.value)
+        self._client._register_watch(self)
+        return self
+
+    async def _resume(self) -> None:
+        # Re-registers on a new bridge session; the value is yielded only if it changed meanwhile.
+        previous = self.value
+        result = await self._client._request("api.watch", self._payload)
+        self._apply_registration(result)
+        if self.value != previous:
+            self._queue.put_nowait(self.value)
+        self._client._register_watch(self)
+
+    def _apply_registration(self, result: dict[str, Any]) -> None:
+        watch_id = result.get("watch_id")
+        if not isinstance(watch_id, str) or not watch_id:
+            raise BridgeError("BAD_RESPONSE", "Expected watch_id in api.watch result", result)
+        self.watch_id = watch_id
+        self.every_ticks = _as_int(result.get("every_ticks"))
+        return_type = result.get("return_type")
+        self.return_type = return_type if isinstance(return_type, str) else None
+        self.value = self._client._decode_result_value(result.get("value"))
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put_nowait(self._CLOSED)
+        watch_id = self.watch_id
+        if watch_id is None:
+            return
+        self._client._unregister_watch(watch_id)
+        if not self._client._closed:
+            with contextlib.suppress(BridgeError, ConnectionError):
+                await self._client._request("api.unwatch", {"watch_id": watch_id})
+
+    async def __aenter__(self) -> "TypedWatch":
+        return await self.start()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def __aiter__(self) -> "TypedWatch":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self.watch_id is None and not self._closed:
+            await self.start()
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        item = await self._queue.get()
+        if item is self._CLOSED:
+            raise StopAsyncIteration
+        if isinstance(item, BaseException):
+            raise item
+        return item
+
+    def _deliver(self, data: dict[str, Any]) -> None:
+        if self._closed:
+            return
+        error = data.get("error")
+        if isinstance(error, dict):
+            code = error.get("code")
+            message = error.get("message")
+            details = error.get("details")
+            self._closed = True
+            self._queue.put_nowait(
+                _typed_call_error(
+                    code if isinstance(code, str) else "INTERNAL_ERROR",
+                    message if isinstance(message, str) else "api.watch evaluation failed",
+                    data,
+                    details if isinstance(details, dict) else None,
+                )
+            )
+            self._queue.put_nowait(self._CLOSED)
+            return
+        self.value = self._client._decode_result_value(data.get("value"))
+        self._queue.put_nowait(self.value)
+
+    def _fail(self, error: BaseException) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put_nowait(error)
+        self._queue.put_nowait(self._CLOSED)
+
+
+class _TrackedRemoteRef(RemoteRef):
+    """RemoteRef that accepts weak references so collected refs can be released; compares equal to RemoteRef."""
+
+    __hash__ = RemoteRef.__hash__
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RemoteRef) and not isinstance(other, PipelineStepRef):
+            return self.ref_id == other.ref_id and self.java_type == other.java_type
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"RemoteRef(ref_id={self.ref_id!r}, java_type={self.java_type!r})"
+
+
+def _release_collected_ref(client_ref: "weakref.ref[Client]", ref_id: str) -> None:
+    client = client_ref()
+    if client is not None:
+        client._on_remote_ref_collected(ref_id)
+
+
 class Client(
     AsyncNavigationCommands,
     AsyncWorldCommands,
@@ -209,8 +903,22 @@ class Client(
 ):
     TERMINAL_TASK_EVENTS = {"task.completed", "task.failed", "task.canceled"}
     ANY_EVENT = "*"
-    WAIT_FOR_TASK_POLL_SECONDS = 0.25
+    TASK_HISTORY_MAX_TASKS = 32
+    TASK_HISTORY_MAX_EVENTS = 64
     PAUSE_EVENT_NAME = "bridge.pause_state"
+    PATHING_ACTIVITY_EVENT_NAME = "baritone.pathing_activity"
+    WATCH_CHANGED_EVENT_NAME = "api.watch.changed"
+    # Events the client consumes itself (pause gating, status cache, task tracking, watches, accessor
+    # cache); events_subscribe() always keeps them in the bridge-side filter.
+    EVENT_FILTER_BASELINE = (
+        "bridge.pause_state",
+        "status.update",
+        "task.*",
+        "baritone.path_event",
+        "baritone.pathing_activity",
+        "api.watch.changed",
+        "minecraft.player_respawn",
+    )
 
     def __init__(
         self,
@@ -221,22 +929,52 @@ class Client(
         ws_url: str | None = None,
         bridge_info_path: str | None = None,
         timeout: float = 5.0,
+        release_collected_refs: bool = False,
+        packed_arrays: bool = False,
+        wire_format: str = "json",
+        codec: str | JsonCodec | None = "json",
+        event_buffer_size: int | None = 1024,
+        listener_threads: int = 4,
+        transport: str | TransportFactory | None = "auto",
+        reconnect: bool | ReconnectPolicy = False,
     ) -> None:
+        if wire_format not in _WIRE_FORMATS:
+            raise ValueError(f"wire_format must be one of {', '.join(_WIRE_FORMATS)}")
+        if event_buffer_size is not None and event_buffer_size < 0:
+            raise ValueError("event_buffer_size must be >= 0 or None")
+        if listener_threads < 1:
+            raise ValueError("listener_threads must be >= 1")
+        self._codec = get_codec(codec)
         self._explicit_host = host
         self._explicit_port = port
         self._explicit_token = token
         self._explicit_ws_url = ws_url
         self._bridge_info_path = bridge_info_path
         self._timeout = timeout
+        self._transport_factory: TransportFactory = resolve_transport_factory(transport)
+        if reconnect is True:
+            reconnect = ReconnectPolicy()
+        self._reconnect_policy: ReconnectPolicy | None = reconnect or None
 
         self._bridge_info: BridgeInfo | None = None
-        self._websocket: ClientConnection | None = None
+        self._transport: Transport | None = None
         self._receive_task: asyncio.Task[None] | None = None
+        self._reconnect_task: asyncio.Task[None] | None = None
+        self._session_ready = asyncio.Event()
+        self._closed_event = asyncio.Event()
+        self._closed_event.set()
         self._pending: dict[str, asyncio.Future[dict[str, Any]]] = {}
         self._events: asyncio.Queue[EventPayload] = asyncio.Queue()
-        self._event_waiters: list[_EventWaiter] = []
-        self._event_listeners: dict[str, set[EventCallback]] = defaultdict(set)
+        # None keeps every event; 0 only hands events to next_event() callers already waiting.
+        self._event_buffer_size = event_buffer_size
+        self._event_buffer_dropped = 0
+        self._event_pull_waiters = 0
+        self._event_waiters = WaiterRegistry(any_event=self.ANY_EVENT)
+        self._buffered_event_counts: dict[Any, int] = {}
+        self._event_listeners: dict[str, dict[EventCallback, _EventListener]] = defaultdict(dict)
         self._listener_tasks: set[asyncio.Task[None]] = set()
+        self._listener_threads = listener_threads
+        self._listener_thread_pool: ThreadPoolExecutor | None = None
         self._closed = True
 
         self._logger = logging.getLogger("pyritone")
@@ -245,6 +983,37 @@ class Client(
         self._unexpected_close_logged = False
         self._pause_state = _default_pause_state()
         self._pause_state_seq = -1
+        self._pathing_activity: dict[str, Any] | None = None
+        self._pathing_busy_count = 0
+        self._pathing_signal = asyncio.Event()
+        self._watches: dict[str, TypedWatch] = {}
+        # Watches registered on a lost session, re-issued once the client reconnects.
+        self._suspended_watches: list[TypedWatch] = []
+        self._unrouted_watch_changes: deque[dict[str, Any]] = deque(maxlen=64)
+        self._task_channels: dict[str, set[asyncio.Queue[Any]]] = {}
+        self._subscriptions_by_event: dict[str, set[EventSubscription]] = {}
+        self._pattern_subscriptions: dict[EventSubscription, Callable[[str], Any]] = {}
+        self._event_include: list[str] | None = None
+        self._event_exclude: list[str] = []
+        self._event_interest: set[str] = set()
+        self._event_filter_task: asyncio.Task[None] | None = None
+        self._event_filter_dirty = False
+        self._status_options: dict[str, Any] = {}
+        self._status_fields: tuple[str, ...] | None = None
+        self._status_resync_task: asyncio.Task[None] | None = None
+        self._pending_status_deltas: deque[tuple[dict[str, Any], str | None]] = deque(maxlen=64)
+        self._awaiting_status_baseline = 0
+        self._awaiting_status_projection = 0
+        self._task_history: OrderedDict[str, deque[_TaskChannelItem]] = OrderedDict()
+        self._release_collected_refs = release_collected_refs
+        self._packed_arrays = packed_arrays
+        self._wire_format = wire_format
+        self._capabilities: frozenset[str] = frozenset()
+        self._binary_frames = False
+        self._live_ref_counts: dict[str, int] = {}
+        self._collected_ref_ids: set[str] = set()
+        self._ref_release_task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
         self.settings = AsyncSettingsNamespace(self)
         self.state = ClientStateCache()
         self.task = _TaskNamespace(self)
@@ -261,37 +1030,44 @@ class Client(
     def bridge_info(self) -> BridgeInfo | None:
         return self._bridge_info
 
+    @property
+    def capabilities(self) -> frozenset[str]:
+        """Optional wire features the bridge accepted at `auth.login` (for example `packed_arrays`)."""
+        return self._capabilities
+
+    @property
+    def codec(self) -> JsonCodec:
+        """JSON codec used for text frames (`orjson`, `msgspec` or stdlib `json`)."""
+        return self._codec
+
+    @property
+    def wire_format(self) -> str:
+        """`cbor` when this session exchanges binary CBOR frames, otherwise `json`."""
+        return "cbor" if self._binary_frames else "json"
+
     async def connect(self) -> None:
         if not self._closed:
             return
         self.state._clear()
+        self.baritone._reset_session_caches()
+        self._capabilities = frozenset()
+        self._binary_frames = False
+        self._task_history.clear()
         self._state_log_signatures.clear()
         self._last_status_task_signature = None
         self._unexpected_close_logged = False
         self._reset_pause_state()
 
-        self._bridge_info = resolve_bridge_info(
-            host=self._explicit_host,
-            port=self._explicit_port,
-            token=self._explicit_token,
-            ws_url=self._explicit_ws_url,
-            bridge_info_path=self._bridge_info_path,
-        )
-
-        self._log_state("connecting", ws_url=self._bridge_info.ws_url)
-        self._websocket = await connect(
-            self._bridge_info.ws_url,
-            open_timeout=self._timeout,
-            close_timeout=self._timeout,
-            ping_interval=20.0,
-            ping_timeout=20.0,
-            logger=self._logger,
-        )
+        self._bridge_info = self._resolve_bridge_info()
+        self._log_state("connecting", ws_url=self._bridge_info.ws_url, transport=self._bridge_info.transport)
+        self._transport = await self._transport_factory(self._bridge_info, timeout=self._timeout, logger=self._logger)
         self._closed = False
-        self._receive_task = asyncio.create_task(self._receive_loop(), name="pyritone-receive")
+        self._closed_event.clear()
+        self._session_ready.set()
+        self._loop = asyncio.get_running_loop()
 
         try:
-            await self._request("auth.login", {"token": self._bridge_info.token})
+            await self._open_session()
         except Exception:
             await self.close()
             raise
@@ -302,13 +1078,53 @@ class Client(
             server=self._bridge_info.server_version,
         )
 
+    async def _open_session(self) -> None:
+        # Starts the receive loop on a freshly opened transport and logs in.
+        assert self._bridge_info is not None
+        self._receive_task = asyncio.create_task(self._receive_loop(), name="pyritone-receive")
+        login_params: dict[str, Any] = {"token": self._bridge_info.token}
+        requested_capabilities = []
+        if self._packed_arrays:
+            requested_capabilities.append("packed_arrays")
+        if self._wire_format == "cbor":
+            requested_capabilities.append(BINARY_CODEC_CAPABILITY)
+        if requested_capabilities:
+            login_params["capabilities"] = requested_capabilities
+        login = await self._request("auth.login", login_params)
+        capabilities = login.get("capabilities")
+        if isinstance(capabilities, list):
+            self._capabilities = frozenset(item for item in capabilities if isinstance(item, str))
+        # The bridge answers in binary from the login response onwards; requests follow suit.
+        self._binary_frames = BINARY_CODEC_CAPABILITY in self._capabilities
+
+    def _resolve_bridge_info(self) -> BridgeInfo:
+        # In-process bridges (LoopbackBridge) describe themselves; everything else goes through discovery.
+        bridge_info = getattr(self._transport_factory, "bridge_info", None)
+        if isinstance(bridge_info, BridgeInfo):
+            return bridge_info
+        return resolve_bridge_info(
+            host=self._explicit_host,
+            port=self._explicit_port,
+            token=self._explicit_token,
+            ws_url=self._explicit_ws_url,
+            bridge_info_path=self._bridge_info_path,
+        )
+
     async def close(self) -> None:
-        if self._closed and self._websocket is None and self._receive_task is None:
+        if self._closed and self._transport is None and self._receive_task is None and self._reconnect_task is None:
             return
 
         self._log_state_once("connection_close", "disconnecting")
         self._closed = True
 
+        reconnect_task = self._reconnect_task
+        self._reconnect_task = None
+        if reconnect_task is not None and reconnect_task is not asyncio.current_task():
+            reconnect_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await reconnect_task
+        self._session_ready.set()
+
         receive_task = self._receive_task
         self._receive_task = None
         if receive_task is not None:
@@ -316,24 +1132,67 @@ class Client(
             with contextlib.suppress(asyncio.CancelledError):
                 await receive_task
 
-        websocket = self._websocket
-        self._websocket = None
-        if websocket is not None:
+        transport = self._transport
+        self._transport = None
+        if transport is not None:
             with contextlib.suppress(Exception):
-                await websocket.close()
+                await transport.close()
 
         self._fail_pending(ConnectionError("Client closed"))
         self._fail_waiters(ConnectionError("Client closed"))
+        self._fail_watches(ConnectionError("Client closed"))
+        self._fail_task_channels()
+        self._close_subscriptions()
         await self._cancel_listener_tasks()
+        await self._reset_event_filter()
+        resync_task = self._status_resync_task
+        self._status_resync_task = None
+        self._pending_status_deltas.clear()
+        if resync_task is not None and not resync_task.done():
+            resync_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await resync_task
+        self._status_options = {}
+        self._status_fields = None
+        await self._reset_ref_tracking()
         self.state._clear()
         self._last_status_task_signature = None
         self._state_log_signatures.clear()
         self._reset_pause_state()
+        self._closed_event.set()
         self._log_state_once("connection_close_complete", "disconnected", reason="client_closed")
 
-    def on(self, event: str, callback: EventCallback) -> Callable[[], None]:
+    async def wait_closed(self) -> None:
+        """Wait until the client is closed for good, riding out reconnects when `reconnect` is enabled."""
+        await self._closed_event.wait()
+
+    def on(
+        self,
+        event: str,
+        callback: EventCallback,
+        *,
+        mode: str = "inline",
+        max_queue: int = 1024,
+    ) -> Callable[[], None]:
+        """Register `callback` for `event` (or `*`).
+
+        `mode` picks where the callback runs: `inline` calls it inside the receive loop,
+        `task` runs it from a per-listener asyncio task, and `thread` runs a sync callback on
+        the client's bounded thread pool. Queued modes keep event order per listener and drop
+        the oldest queued event beyond `max_queue`.
+        """
+        if mode not in _EventListener.MODES:
+            raise ValueError(f"mode must be one of {', '.join(_EventListener.MODES)}")
+        if max_queue < 1:
+            raise ValueError("max_queue must be >= 1")
+        if mode == "thread" and inspect.iscoroutinefunction(callback):
+            raise TypeError("mode='thread' requires a synchronous callback")
+
         normalized = event or self.ANY_EVENT
-        self._event_listeners[normalized].add(callback)
+        listeners = self._event_listeners[normalized]
+        if callback not in listeners:
+            listeners[callback] = _EventListener(self, normalized, callback, mode, max_queue)
+        self._note_event_interest(normalized)
 
         def _unsubscribe() -> None:
             self.off(normalized, callback)
@@ -342,32 +1201,295 @@ class Client(
 
     def off(self, event: str, callback: EventCallback) -> None:
         normalized = event or self.ANY_EVENT
-        callbacks = self._event_listeners.get(normalized)
-        if callbacks is None:
+        listeners = self._event_listeners.get(normalized)
+        if listeners is None:
             return
 
-        callbacks.discard(callback)
-        if not callbacks:
+        listener = listeners.pop(callback, None)
+        if listener is not None:
+            listener.discard_backlog()
+        if not listeners:
             self._event_listeners.pop(normalized, None)
 
+    @property
+    def listener_stats(self) -> list[dict[str, Any]]:
+        """Per-listener call counts, drops, backlog and callback latency (ms), slowest first."""
+        stats = [listener.stats for listeners in self._event_listeners.values() for listener in listeners.values()]
+        stats.sort(key=lambda item: item["max_ms"], reverse=True)
+        return stats
+
+    def subscribe(
+        self,
+        pattern: str = "*",
+        *,
+        maxsize: int = 1024,
+        overflow: str = "drop_oldest",
+    ) -> EventSubscription:
+        """Open an independent, bounded stream of raw events whose name matches `pattern`.
+
+        `pattern` is an event name (`task.completed`), a glob (`task.*`) or `*` for every event.
+        """
+        normalized = (pattern or self.ANY_EVENT).strip()
+        if not normalized:
+            raise ValueError("pattern is required")
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        if overflow not in EventSubscription.OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {', '.join(EventSubscription.OVERFLOW_POLICIES)}")
+
+        subscription = EventSubscription(self, normalized, maxsize=maxsize, overflow=overflow)
+        if normalized == self.ANY_EVENT:
+            self._pattern_subscriptions[subscription] = _match_any_event
+        elif any(char in normalized for char in "*?["):
+            self._pattern_subscriptions[subscription] = re.compile(fnmatch.translate(normalized)).match
+        else:
+            self._subscriptions_by_event.setdefault(normalized, set()).add(subscription)
+        self._note_event_interest(normalized)
+        return subscription
+
+    def _unregister_subscription(self, subscription: EventSubscription) -> None:
+        self._pattern_subscriptions.pop(subscription, None)
+        subscriptions = self._subscriptions_by_event.get(subscription.pattern)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            self._subscriptions_by_event.pop(subscription.pattern, None)
+
+    async def _fan_out_to_subscriptions(self, payload: EventPayload) -> None:
+        event_name = payload.get("event")
+        if not isinstance(event_name, str):
+            return
+        targets = list(self._subscriptions_by_event.get(event_name, ()))
+        for subscription, matches in list(self._pattern_subscriptions.items()):
+            if matches(event_name):
+                targets.append(subscription)
+        for subscription in targets:
+            if not subscription._offer(payload):
+                await subscription._put(payload)
+
+    def _close_subscriptions(self) -> None:
+        subscriptions = list(self._pattern_subscriptions)
+        for exact in self._subscriptions_by_event.values():
+            subscriptions.extend(exact)
+        for subscription in subscriptions:
+            subscription.close()
+
+    async def events_subscribe(
+        self,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> dict[str, Any]:
+        """Ask the bridge to only send events matching an `include` glob and no `exclude` glob.
+
+        `EVENT_FILTER_BASELINE` and every event name with a registered `on()`/`wait_for()`/`subscribe()`
+        interest are added to `include` (dropping any `exclude` glob that would block them), and later
+        registrations widen the filter the same way. `*` listeners only see what the filter lets through.
+        """
+        self._event_include = _normalize_event_patterns(include, default=[self.ANY_EVENT])
+        self._event_exclude = _normalize_event_patterns(exclude, default=[])
+        for pattern in (*self.EVENT_FILTER_BASELINE, *sorted(self._registered_event_interest())):
+            self._widen_event_filter(pattern)
+        return await self._push_event_filter()
+
+    @property
+    def event_filter(self) -> dict[str, list[str]] | None:
+        """The bridge-side event filter for this session, or `None` when every event is sent."""
+        if self._event_include is None:
+            return None
+        return {"include": list(self._event_include), "exclude": list(self._event_exclude)}
+
+    def _registered_event_interest(self) -> set[str]:
+        names = set(self._event_listeners)
+        names.update(self._subscriptions_by_event)
+        names.update(subscription.pattern for subscription in self._pattern_subscriptions)
+        names.update(self._event_waiters.event_names())
+        names.update(self._event_interest)
+        names.discard(self.ANY_EVENT)
+        return names
+
+    def _note_event_interest(self, *patterns: str) -> None:
+        """Record a lasting interest in `patterns`, widening the active filter in the background."""
+        changed = False
+        for pattern in patterns:
+            if pattern == self.ANY_EVENT:
+                continue
+            self._event_interest.add(pattern)
+            changed = self._widen_event_filter(pattern) or changed
+        if changed:
+            self._schedule_event_filter_push()
+
+    async def _require_events(self, *patterns: str) -> None:
+        """Widen the active filter for `patterns` and wait until the bridge applied it."""
+        changed = False
+        for pattern in patterns:
+            changed = self._widen_event_filter(pattern) or changed
+        if changed:
+            await self._push_event_filter()
+
+    async def _require_events_for(self, waiter: Waiter, *patterns: str) -> None:
+        """`_require_events`, abandoned once `waiter` completes (matched or timed out) first.
+
+        An abandoned push is re-sent in the background, so the widened filter still reaches the bridge.
+        """
+        changed = False
+        for pattern in patterns:
+            changed = self._widen_event_filter(pattern) or changed
+        if not changed:
+            return
+
+        push = asyncio.ensure_future(self._push_event_filter())
+        try:
+            await asyncio.wait((push, waiter.future), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            abandoned = not push.done()
+            if abandoned:
+                push.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await push
+                self._schedule_event_filter_push()
+        if abandoned:
+            return
+        error = push.exception()
+        # A push failing after the waiter already matched does not take the match away.
+        if error is not None and not waiter.future.done():
+            raise error
+
+    def _widen_event_filter(self, pattern: str) -> bool:
+        if self._event_include is None or not pattern or pattern == self.ANY_EVENT:
+            return False
+
+        # Only excludes covering the whole pattern are dropped; a narrower exclude (`task.progress`
+        # under `task.*`) stays, since the caller asked for it explicitly.
+        blocking = [excluded for excluded in self._event_exclude if fnmatch.fnmatchcase(pattern, excluded)]
+        covered = any(fnmatch.fnmatchcase(pattern, included) for included in self._event_include)
+        if covered and not blocking:
+            return False
+        if blocking:
+            self._event_exclude = [excluded for excluded in self._event_exclude if excluded not in blocking]
+        if not covered:
+            self._event_include.append(pattern)
+        return True
+
+    async def _push_event_filter(self) -> dict[str, Any]:
+        return await self._request(
+            "events.subscribe",
+            {"include": list(self._event_include or [self.ANY_EVENT]), "exclude": list(self._event_exclude)},
+        )
+
+    def _schedule_event_filter_push(self) -> None:
+        if self._transport is None:
+            return
+        task = self._event_filter_task
+        if task is not None and not task.done():
+            self._event_filter_dirty = True
+            return
+        self._event_filter_task = asyncio.create_task(self._sync_event_filter(), name="pyritone-event-filter")
+
+    async def _sync_event_filter(self) -> None:
+        while True:
+            self._event_filter_dirty = False
+            try:
+                await self._push_event_filter()
+            except Exception:
+                self._logger.debug("events.subscribe update failed", exc_info=True)
+                return
+            if not self._event_filter_dirty:
+                return
+
+    async def _reset_event_filter(self) -> None:
+        self._event_include = None
+        self._event_exclude = []
+        task = self._event_filter_task
+        self._event_filter_task = None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+
     async def ping(self) -> dict[str, Any]:
         return await self._request("ping", {})
 
-    async def status_get(self) -> dict[str, Any]:
-        status = await self._request("status.get", {})
-        self.state._replace(status)
+    async def status_get(self, *, fields: Iterable[str] | None = None) -> dict[str, Any]:
+        """Fetch the bridge status; `fields` limits the reply to those top-level fields."""
+        field_names = _normalize_status_fields(fields)
+        params: dict[str, Any] = {} if field_names is None else {"fields": list(field_names)}
+        status = await self._request("status.get", params)
+        self._apply_status(status, partial=field_names is not None)
         return status
 
-    async def status_subscribe(self) -> dict[str, Any]:
+    async def status_subscribe(
+        self,
+        *,
+        delta: bool = False,
+        fields: Iterable[str] | None = None,
+        heartbeat_ms: int | None = None,
+        min_interval_ms: int | None = None,
+    ) -> dict[str, Any]:
+        """Subscribe to `status.update` pushes.
+
+        With `delta=True` updates carry only the changed top-level fields on top of a base `seq`;
+        `client.state` applies them and re-subscribes for a full status whenever a `seq` is skipped.
+        `fields` limits which top-level fields the bridge builds, compares and sends (the rest of
+        `client.state` keeps its last known values). `heartbeat_ms` sets the unchanged-status
+        heartbeat and `min_interval_ms` the minimum gap between change updates for this session.
+        """
+        field_names = _normalize_status_fields(fields)
+        params: dict[str, Any] = {}
+        if delta:
+            params["delta"] = True
+        if field_names is not None:
+            params["fields"] = list(field_names)
+        if heartbeat_ms is not None:
+            params["heartbeat_ms"] = heartbeat_ms
+        if min_interval_ms is not None:
+            params["min_interval_ms"] = min_interval_ms
+
         state_before = self.state.updated_at
-        result = await self._request("status.subscribe", {})
+        if delta:
+            # Deltas can be dispatched before this coroutine resumes; hold them until the baseline is set.
+            self.state._start_delta_stream(None)
+            self._awaiting_status_baseline += 1
+        if field_names is not None:
+            # Projected updates can also arrive before this coroutine resumes; merge rather than replace them.
+            self._awaiting_status_projection += 1
+        try:
+            result = await self._request("status.subscribe", params)
+        except Exception:
+            if delta and self._status_options.get("delta"):
+                # The previous delta stream lost its baseline above; fetch a new one under the old options.
+                self._resync_status()
+            raise
+        finally:
+            if delta:
+                self._awaiting_status_baseline -= 1
+            if field_names is not None:
+                self._awaiting_status_projection -= 1
+        self._status_options = {
+            "delta": delta,
+            "fields": field_names,
+            "heartbeat_ms": heartbeat_ms,
+            "min_interval_ms": min_interval_ms,
+        }
+        self._status_fields = field_names
         status = result.get("status")
-        if isinstance(status, dict) and self.state.updated_at == state_before:
-            self.state._replace(status)
+        delta_stream = delta and result.get("delta") is True
+        if isinstance(status, dict) and (delta_stream or self.state.updated_at == state_before):
+            self._apply_status(status, partial=field_names is not None)
+        seq = result.get("seq")
+        self.state._start_delta_stream(seq if delta_stream and isinstance(seq, int) else None)
+        pending = list(self._pending_status_deltas)
+        self._pending_status_deltas.clear()
+        if delta_stream:
+            for pending_data, pending_ts in pending:
+                self._apply_status_delta(pending_data, ts=pending_ts)
         return result
 
     async def status_unsubscribe(self) -> dict[str, Any]:
-        return await self._request("status.unsubscribe", {})
+        result = await self._request("status.unsubscribe", {})
+        self._status_options = {}
+        self._status_fields = None
+        return result
 
     async def get_world(self) -> WorldView:
         self._log_sent_debug("get_world")
@@ -486,10 +1608,7 @@ class Client(
         return None
 
     async def api_metadata_get(self, target: str | RemoteRef | dict[str, Any] | None = None) -> dict[str, Any]:
-        payload: dict[str, Any] = {}
-        if target is not None:
-            payload["target"] = _encode_typed_target(target)
-        return await self._request("api.metadata.get", payload)
+        return await self._request("api.metadata.get", _typed_metadata_params(target))
 
     async def api_construct(
         self,
@@ -497,17 +1616,11 @@ class Client(
         *args: Any,
         parameter_types: list[str] | tuple[str, ...] | None = None,
     ) -> Any:
-        payload: dict[str, Any] = {
-            "type": type_name,
-            "args": [_encode_typed_value(value) for value in args],
-        }
-        if parameter_types is not None:
-            payload["parameter_types"] = list(parameter_types)
-
+        payload = _typed_construct_params(type_name, args, parameter_types)
         result = await self._request("api.construct", payload)
         if "value" not in result:
             raise BridgeError("BAD_RESPONSE", "Expected value in api.construct result", result)
-        return _decode_typed_value(result["value"])
+        return self._decode_result_value(result["value"])
 
     async def api_invoke(
         self,
@@ -515,19 +1628,124 @@ class Client(
         method: str,
         *args: Any,
         parameter_types: list[str] | tuple[str, ...] | None = None,
+        materialize: bool = False,
     ) -> Any:
-        payload: dict[str, Any] = {
-            "target": _encode_typed_target(target),
-            "method": method,
-            "args": [_encode_typed_value(value) for value in args],
-        }
-        if parameter_types is not None:
-            payload["parameter_types"] = list(parameter_types)
+        """Invoke `method` on a typed target and decode the return value.
 
+        With `materialize=True` the bridge inlines position-like values
+        (`BlockPos`/`BetterBlockPos`, `Vec3d`, `ChunkPos`) as named tuples
+        instead of returning remote refs.
+        """
+        payload = _typed_invoke_params(target, method, args, parameter_types, materialize=materialize)
         result = await self._request("api.invoke", payload)
         if "value" not in result:
             raise BridgeError("BAD_RESPONSE", "Expected value in api.invoke result", result)
-        return _decode_typed_value(result["value"])
+        return self._decode_result_value(result["value"])
+
+    async def api_batch(self, calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Send raw `api.batch` calls and return the per-call result entries in order.
+
+        Prefer `async with client.batch() as batch:` which encodes calls and
+        decodes each entry into a `TypedBatchCall`.
+        """
+        result = await self._request("api.batch", {"calls": list(calls)})
+        entries = result.get("results")
+        if not isinstance(entries, list):
+            raise BridgeError("BAD_RESPONSE", "Expected list in api.batch result.results", result)
+        return entries
+
+    async def api_release(self, *refs: RemoteRef | str) -> int:
+        """Release remote references held by the bridge for this session; returns how many were dropped.
+
+        Released or evicted refs fail later calls with `RemoteRefExpiredError` (`REF_EXPIRED`).
+        """
+        ids = [ref.ref_id if isinstance(ref, RemoteRef) else str(ref) for ref in refs]
+        if not ids:
+            return 0
+        result = await self._request("api.release", {"ids": ids})
+        return int(result.get("released", 0))
+
+    @contextlib.asynccontextmanager
+    async def ref_scope(self) -> AsyncIterator[RemoteRefScope]:
+        """Record every RemoteRef decoded in this block and release them with one `api.release` on exit.
+
+        Refs that must outlive the block can be excluded with `scope.keep(ref)`.
+        The same bridge object always maps to the same ref id, so releasing a
+        ref here also invalidates copies of that id held elsewhere.
+        """
+        scope = RemoteRefScope(self, _active_ref_scope.get())
+        token = _active_ref_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            _active_ref_scope.reset(token)
+            await self._release_refs_quietly(list(scope._refs))
+
+    @contextlib.asynccontextmanager
+    async def batch(self) -> AsyncIterator[TypedBatch]:
+        """Collect typed calls and send them in one `api.batch` round trip on exit.
+
+        The bridge runs the whole batch in a single client-thread submission.
+        Read values from the returned `TypedBatchCall` handles after the block.
+        Nothing is sent when the block raises.
+        """
+        typed_batch = TypedBatch(self)
+        yield typed_batch
+        if not typed_batch.sent:
+            await typed_batch.send()
+
+    async def api_pipeline(self, steps: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Send raw `api.pipeline` steps and return the per-step result entries in order."""
+        result = await self._request("api.pipeline", {"steps": list(steps)})
+        entries = result.get("results")
+        if not isinstance(entries, list):
+            raise BridgeError("BAD_RESPONSE", "Expected list in api.pipeline result.results", result)
+        return entries
+
+    @contextlib.asynccontextmanager
+    async def pipeline(self) -> AsyncIterator[TypedPipeline]:
+        """Collect dependent typed calls and send them in one `api.pipeline` round trip on exit.
+
+        Use `step.ref` to target or pass an earlier step's value. For typed
+        Baritone wrappers use `client.baritone.pipeline()` instead.
+        """
+        typed_pipeline = TypedPipeline(self)
+        yield typed_pipeline
+        if not typed_pipeline.sent:
+            await typed_pipeline.send()
+
+    def watch(
+        self,
+        target: str | RemoteRef | dict[str, Any],
+        method: str,
+        *args: Any,
+        parameter_types: list[str] | tuple[str, ...] | None = None,
+        every_ticks: int = 1,
+        initial: bool = True,
+        materialize: bool = False,
+    ) -> TypedWatch:
+        """Watch a typed call on the bridge and iterate its value each time it changes.
+
+        The bridge evaluates `target.method(*args)` on the client thread every
+        `every_ticks` ticks and only pushes `api.watch.changed` when the encoded
+        value differs, so an unchanged value costs no traffic. Ref values compare
+        by identity. The iterator raises `TypedCallError` and ends if an
+        evaluation fails.
+
+            async with client.watch(behavior.ref, "isPathing") as watch:
+                async for pathing in watch:
+                    ...
+        """
+        if every_ticks < 1:
+            raise ValueError("every_ticks must be >= 1")
+        payload = _typed_invoke_params(target, method, args, parameter_types, materialize=materialize)
+        payload["every_ticks"] = int(every_ticks)
+        return TypedWatch(self, payload, initial=initial)
+
+    async def api_unwatch(self, watch_id: str) -> bool:
+        self._unregister_watch(watch_id)
+        result = await self._request("api.unwatch", {"watch_id": watch_id})
+        return bool(result.get("removed"))
 
     async def execute(self, command: str, *, label: str | None = None) -> dict[str, Any]:
         """Execute raw Baritone command text.
@@ -548,9 +1766,25 @@ class Client(
         return await self._request("task.cancel", payload)
 
     async def next_event(self, timeout: float | None = None) -> EventPayload:
-        if timeout is None:
-            return await self._events.get()
-        return await asyncio.wait_for(self._events.get(), timeout=timeout)
+        self._event_pull_waiters += 1
+        try:
+            if timeout is None:
+                payload = await self._events.get()
+            else:
+                payload = await asyncio.wait_for(self._events.get(), timeout=timeout)
+        finally:
+            self._event_pull_waiters -= 1
+        self._forget_buffered_event(payload)
+        return payload
+
+    @property
+    def event_buffer_stats(self) -> dict[str, int | None]:
+        """Size and overflow counters for the `next_event()`/`events()` buffer."""
+        return {
+            "buffered": self._events.qsize(),
+            "dropped": self._event_buffer_dropped,
+            "maxsize": self._event_buffer_size,
+        }
 
     async def events(self):
         while not self._closed:
@@ -561,28 +1795,30 @@ class Client(
         event: str,
         check: EventCheck | None = None,
         timeout: float | None = None,
+        *,
+        task_id: str | None = None,
     ) -> EventPayload:
+        """Wait for the next `event` (or `*`) accepted by `check`.
+
+        Passing `task_id` only considers events whose `data.task_id` matches, without running
+        `check` for other tasks' events.
+        """
         self._ensure_connected()
 
-        buffered_match = self._pop_buffered_event(event or self.ANY_EVENT, check)
+        pattern = event or self.ANY_EVENT
+        buffered_match = self._pop_buffered_event(pattern, check, task_id=task_id)
         if buffered_match is not None:
             return buffered_match
 
-        loop = asyncio.get_running_loop()
-        waiter = _EventWaiter(
-            event_name=event or self.ANY_EVENT,
-            check=check,
-            future=loop.create_future(),
-        )
-        self._event_waiters.append(waiter)
-
+        # Register before widening the filter so an event arriving during the `events.subscribe`
+        # round trip still matches, and let the waiter's timeout bound that round trip too.
+        waiter = self._event_waiters.add(pattern, check=check, key=task_id, timeout=timeout)
         try:
-            if timeout is None:
-                return await waiter.future
-            return await asyncio.wait_for(waiter.future, timeout=timeout)
-        finally:
-            with contextlib.suppress(ValueError):
-                self._event_waiters.remove(waiter)
+            await self._require_events_for(waiter, pattern)
+        except BaseException:
+            self._event_waiters.remove(waiter)
+            raise
+        return await self._event_waiters.wait(waiter)
 
     async def wait_for_task(
         self,
@@ -601,83 +1837,130 @@ class Client(
         loop = asyncio.get_running_loop()
         deadline: float | None = None
         task_paused = self._is_wait_task_paused(task_id)
-        bridge_paused = self._is_effectively_paused()
         if timeout is not None:
             deadline = loop.time() + timeout
 
-        while True:
-            if self._closed and self._events.empty():
-                self._log_state_once_debug(f"wait_for_task:{task_id}:closed", "disconnected", task_id=task_id)
-                raise ConnectionError("Connection closed by bridge")
+        channel = self._open_task_channel(task_id)
+        try:
+            while True:
+                if self._closed and channel.empty():
+                    self._log_state_once_debug(f"wait_for_task:{task_id}:closed", "disconnected", task_id=task_id)
+                    raise ConnectionError("Connection closed by bridge")
+
+                remaining: float | None = None
+                if deadline is not None:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        self._log_state_once_debug(f"wait_for_task:{task_id}:timeout", "wait_timeout", task_id=task_id)
+                        raise TimeoutError()
 
-            remaining: float | None = None
-            if deadline is not None:
-                remaining = deadline - loop.time()
-                if remaining <= 0:
-                    self._log_state_once_debug(f"wait_for_task:{task_id}:timeout", "wait_timeout", task_id=task_id)
-                    raise TimeoutError()
+                try:
+                    item = await asyncio.wait_for(channel.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    continue
+                if item is _TASK_CHANNEL_CLOSED:
+                    self._log_state_once_debug(f"wait_for_task:{task_id}:closed", "disconnected", task_id=task_id)
+                    raise ConnectionError("Connection closed by bridge")
+                if item is _TASK_CHANNEL_LOST:
+                    raise ConnectionError(
+                        f"Task {task_id} is no longer active after reconnecting; its outcome was not observed"
+                    )
 
-            poll_timeout = remaining
-            if poll_timeout is None or poll_timeout > self.WAIT_FOR_TASK_POLL_SECONDS:
-                poll_timeout = self.WAIT_FOR_TASK_POLL_SECONDS
+                event = item.event
+                bridge_paused = item.bridge_paused
+                data = event["data"]
+                event_name = event.get("event")
+                if event_name == "task.paused":
+                    task_paused = True
+                elif event_name == "task.resumed":
+                    task_paused = False
+                elif event_name in {"task.started", "task.progress"}:
+                    state = data.get("state")
+                    if isinstance(state, str) and state.upper() == "PAUSED":
+                        task_paused = True
+                    elif isinstance(state, str):
+                        task_paused = False
+                if (
+                    prefer_path_hints
+                    and event_name == "baritone.path_event"
+                ):
+                    path_event = data.get("path_event")
+                    if path_event == "AT_GOAL":
+                        terminal_event = _synthetic_task_completed_event(task_id, event)
+                        self._log_wait_terminal(task_id, terminal_event, source="path_hint")
+                        return terminal_event
+                    if path_event == "CANCELED":
+                        if task_paused or bridge_paused or self._is_wait_task_paused(task_id):
+                            continue
+                        terminal_event = _synthetic_task_canceled_event(task_id, event)
+                        self._log_wait_terminal(task_id, terminal_event, source="path_hint")
+                        return terminal_event
+
+                if isinstance(event_name, str) and event_name in self.TERMINAL_TASK_EVENTS:
+                    self._log_wait_terminal(task_id, event, source="event")
+                    return event
+
+                if on_update is not None:
+                    callback_result = on_update(event)
+                    if inspect.isawaitable(callback_result):
+                        await callback_result
+        finally:
+            self._close_task_channel(task_id, channel)
+
+    def _open_task_channel(self, task_id: str) -> asyncio.Queue[Any]:
+        channel: asyncio.Queue[Any] = asyncio.Queue()
+        # Events for this task may have been dispatched before the waiter started; replay them first.
+        for item in self._task_history.get(task_id, ()):
+            channel.put_nowait(item)
+        self._task_channels.setdefault(task_id, set()).add(channel)
+        return channel
+
+    def _close_task_channel(self, task_id: str, channel: asyncio.Queue[Any]) -> None:
+        channels = self._task_channels.get(task_id)
+        if channels is None:
+            return
+        channels.discard(channel)
+        if not channels:
+            self._task_channels.pop(task_id, None)
 
-            try:
-                event = await self.next_event(timeout=poll_timeout)
-            except asyncio.TimeoutError:
-                continue
+    def _route_task_event(self, payload: EventPayload) -> None:
+        event_name = payload.get("event")
+        if not isinstance(event_name, str):
+            return
+        if not event_name.startswith("task.") and event_name != "baritone.path_event":
+            return
+        data = payload.get("data")
+        if not isinstance(data, dict):
+            return
+        task_id = data.get("task_id")
+        if not isinstance(task_id, str) or not task_id:
+            return
 
-            data = event.get("data")
-            if not isinstance(data, dict):
-                continue
-            event_name = event.get("event")
-            if event_name == self.PAUSE_EVENT_NAME:
-                paused_flag = data.get("paused")
-                if isinstance(paused_flag, bool):
-                    bridge_paused = paused_flag
-            if data.get("task_id") != task_id:
-                continue
+        item = _TaskChannelItem(event=payload, bridge_paused=self._is_effectively_paused())
+        history = self._task_history.get(task_id)
+        if history is None:
+            history = deque(maxlen=self.TASK_HISTORY_MAX_EVENTS)
+            self._task_history[task_id] = history
+            while len(self._task_history) > self.TASK_HISTORY_MAX_TASKS:
+                self._task_history.popitem(last=False)
+        else:
+            self._task_history.move_to_end(task_id)
+        history.append(item)
 
-            if event_name == "task.paused":
-                task_paused = True
-            elif event_name == "task.resumed":
-                task_paused = False
-            elif event_name in {"task.started", "task.progress"}:
-                state = data.get("state")
-                if isinstance(state, str) and state.upper() == "PAUSED":
-                    task_paused = True
-                elif isinstance(state, str):
-                    task_paused = False
-            if (
-                prefer_path_hints
-                and event_name == "baritone.path_event"
-            ):
-                path_event = data.get("path_event")
-                if path_event == "AT_GOAL":
-                    terminal_event = _synthetic_task_completed_event(task_id, event)
-                    self._log_wait_terminal(task_id, terminal_event, source="path_hint")
-                    return terminal_event
-                if path_event == "CANCELED":
-                    if task_paused or bridge_paused or self._is_wait_task_paused(task_id):
-                        continue
-                    terminal_event = _synthetic_task_canceled_event(task_id, event)
-                    self._log_wait_terminal(task_id, terminal_event, source="path_hint")
-                    return terminal_event
-
-            if isinstance(event_name, str) and event_name in self.TERMINAL_TASK_EVENTS:
-                self._log_wait_terminal(task_id, event, source="event")
-                return event
-
-            if on_update is not None:
-                callback_result = on_update(event)
-                if inspect.isawaitable(callback_result):
-                    await callback_result
+        for channel in self._task_channels.get(task_id, ()):
+            channel.put_nowait(item)
+
+    def _fail_task_channels(self) -> None:
+        for channels in self._task_channels.values():
+            for channel in channels:
+                channel.put_nowait(_TASK_CHANNEL_CLOSED)
 
     def _is_wait_task_paused(self, task_id: str) -> bool:
         if self._is_effectively_paused():
             return True
 
         active_task = self.state.active_task
-        if not isinstance(active_task, dict):
+        if active_task is None:
             return False
         if active_task.get("task_id") != task_id:
             return False
@@ -739,7 +2022,7 @@ class Client(
         return await self.wait_for_task(task_id)
 
     async def _request(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
-        websocket = self._ensure_connected()
+        transport = await self._connected_transport()
         action, action_args = self._describe_request_for_log(method, params)
         first_attempt = True
 
@@ -759,11 +2042,29 @@ class Client(
             future: asyncio.Future[dict[str, Any]] = loop.create_future()
             self._pending[request_id] = future
 
-            await websocket.send(encode_message(request))
-            self._log_payload("send", request, sensitive=(method == "auth.login"))
-
             try:
+                await self._send_frame(transport, request)
+                self._log_payload("send", request, sensitive=(method == "auth.login"))
                 response = await asyncio.wait_for(future, timeout=self._timeout)
+            except (_ConnectionLost, TransportClosed) as error:
+                if (
+                    isinstance(error, TransportClosed)
+                    and self._reconnect_policy is not None
+                    and not self._closed
+                    and transport is self._transport
+                ):
+                    # The send noticed the drop before the receive loop did.
+                    self._pending.pop(request_id, None)
+                    self._on_connection_lost()
+                if not self._reconnecting_elsewhere():
+                    raise
+                # A frame that failed to send never reached the bridge, so any method can go again.
+                if isinstance(error, _ConnectionLost) and method not in _IDEMPOTENT_METHODS:
+                    raise RequestInterruptedError(method) from None
+                self._log_state_debug("retry_after_reconnect", method=method, action=action)
+                transport = await self._connected_transport()
+                first_attempt = False
+                continue
             finally:
                 self._pending.pop(request_id, None)
 
@@ -797,17 +2098,156 @@ class Client(
                 continue
 
             self._log_received(action, {"error_code": code, "message": message})
+            if code == "REF_EXPIRED":
+                self.baritone._forget_ref(parsed_details.get("reference_id"))
             if method.startswith("api."):
-                raise TypedCallError(code, message, response, parsed_details)
+                raise _typed_call_error(code, message, response, parsed_details)
             raise BridgeError(code, message, response, parsed_details)
 
+    def _apply_status(self, status: dict[str, Any], *, ts: str | None = None, partial: bool = False) -> None:
+        if partial:
+            self.state._merge(status, ts=ts)
+        else:
+            self.state._replace(status, ts=ts)
+        in_world = status.get("in_world")
+        if isinstance(in_world, bool):
+            self.baritone._observe_in_world(in_world)
+
+    def _apply_status_delta(self, data: dict[str, Any], *, ts: str | None = None) -> None:
+        if self.state._stream_seq is None:
+            if self._awaiting_status_baseline:
+                # Replayed on top of the baseline once the status.subscribe response is applied.
+                self._pending_status_deltas.append((data, ts))
+            return
+
+        changed = data.get("changed")
+        removed = data.get("removed", [])
+        seq = data.get("seq")
+        base_seq = data.get("base_seq")
+        if (
+            not isinstance(changed, dict)
+            or not isinstance(removed, list)
+            or not isinstance(seq, int)
+            or not isinstance(base_seq, int)
+            or not self.state._apply_delta(changed, removed, seq=seq, base_seq=base_seq, ts=ts)
+        ):
+            self._resync_status()
+            return
+
+        in_world = changed.get("in_world")
+        if isinstance(in_world, bool):
+            self.baritone._observe_in_world(in_world)
+        if "active_task" in changed:
+            reason = data.get("reason")
+            self._log_status_snapshot(changed, reason=reason if isinstance(reason, str) else None)
+
+    def _resync_status(self) -> None:
+        if self._transport is None:
+            return
+        if self._status_resync_task is not None and not self._status_resync_task.done():
+            return
+        self._log_state_debug("status resync", last_seq=self.state._stream_seq)
+        # Until the new baseline arrives, deltas from the old stream have nothing to apply to.
+        self.state._start_delta_stream(None)
+        self._status_resync_task = asyncio.create_task(self._run_status_resync(), name="pyritone-status-resync")
+
+    async def _run_status_resync(self) -> None:
+        try:
+            await self.status_subscribe(**self._status_options)
+        except Exception:
+            self._logger.debug("status.subscribe resync failed", exc_info=True)
+
+    def _retain_remote_ref(self, ref: RemoteRef) -> None:
+        scope = _active_ref_scope.get()
+        while scope is not None:
+            if scope._client is self:
+                scope._kept.add(ref.ref_id)
+                scope._refs.pop(ref.ref_id, None)
+            scope = scope._parent
+
+    def _decode_result_value(self, value: Any) -> Any:
+        return _decode_typed_value(value, self._track_remote_ref)
+
+    def _track_remote_ref(self, ref: RemoteRef) -> RemoteRef:
+        if self._release_collected_refs:
+            ref = _TrackedRemoteRef(ref.ref_id, ref.java_type)
+            self._live_ref_counts[ref.ref_id] = self._live_ref_counts.get(ref.ref_id, 0) + 1
+            self._collected_ref_ids.discard(ref.ref_id)
+            weakref.finalize(ref, _release_collected_ref, weakref.ref(self), ref.ref_id)
+
+        scope = _active_ref_scope.get()
+        while scope is not None and scope._client is not self:
+            scope = scope._parent
+        if scope is not None:
+            scope._add(ref)
+        return ref
+
+    def _on_remote_ref_collected(self, ref_id: str) -> None:
+        # Finalizers may run on any thread; hand off to the event loop.
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(self._queue_collected_ref, ref_id)
+
+    def _queue_collected_ref(self, ref_id: str) -> None:
+        remaining = self._live_ref_counts.get(ref_id, 0) - 1
+        if remaining > 0:
+            self._live_ref_counts[ref_id] = remaining
+            return
+        self._live_ref_counts.pop(ref_id, None)
+        if self._closed:
+            return
+        self._collected_ref_ids.add(ref_id)
+        if self._ref_release_task is None or self._ref_release_task.done():
+            self._ref_release_task = asyncio.create_task(self._flush_collected_refs(), name="pyritone-ref-release")
+
+    async def _flush_collected_refs(self) -> None:
+        # Yield once so refs collected together go out in one api.release.
+        await asyncio.sleep(0)
+        while self._collected_ref_ids and not self._closed:
+            ref_ids = [ref_id for ref_id in self._collected_ref_ids if ref_id not in self._live_ref_counts]
+            self._collected_ref_ids.clear()
+            await self._release_refs_quietly(ref_ids)
+
+    async def _release_refs_quietly(self, ref_ids: list[str]) -> None:
+        if not ref_ids or self._closed:
+            return
+        try:
+            await self.api_release(*ref_ids)
+        except (BridgeError, ConnectionError, asyncio.TimeoutError) as error:
+            self._logger.debug("[Py-Ritone] Remote ref release failed ( count=%s, error=%s )", len(ref_ids), error)
+
+    async def _reset_ref_tracking(self) -> None:
+        release_task = self._ref_release_task
+        self._ref_release_task = None
+        if release_task is not None and not release_task.done():
+            release_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await release_task
+        self._live_ref_counts.clear()
+        self._collected_ref_ids.clear()
+
+    async def _send_frame(self, transport: Transport, payload: dict[str, Any]) -> None:
+        if self._binary_frames:
+            await transport.send(encode_binary_message(payload), binary=True)
+        else:
+            await transport.send(self._codec.dumps(payload))
+
+    def _decode_frame(self, message: bytes) -> dict[str, Any]:
+        # JSON text is ASCII up to the opening brace; a CBOR map head byte is >= 0xA0.
+        if self._wire_format == "cbor" and message and message[0] >= 0x80:
+            return decode_binary_message(message)
+        return decode_message(message, self._codec)
+
     async def _receive_loop(self) -> None:
-        websocket = self._websocket
-        assert websocket is not None
+        transport = self._transport
+        assert transport is not None
 
         try:
-            async for message in websocket:
-                payload = decode_message(message)
+            while True:
+                message = await transport.recv()
+                payload = self._decode_frame(message)
                 self._log_payload("recv", payload, sensitive=False)
 
                 payload_type = payload.get("type")
@@ -823,8 +2263,8 @@ class Client(
                     self._logger.debug("Ignoring unknown payload type: %r", payload_type)
         except asyncio.CancelledError:
             raise
-        except ConnectionClosed as error:
-            if not self._closed:
+        except TransportClosed as error:
+            if not self._closed and not error.clean:
                 if not self._unexpected_close_logged:
                     self._unexpected_close_logged = True
                     self._log_state(
@@ -833,57 +2273,216 @@ class Client(
                         reason=error.reason,
                     )
                 self._logger.warning(
-                    "Bridge websocket closed unexpectedly (code=%s, reason=%s)",
+                    "Bridge connection closed unexpectedly (code=%s, reason=%s)",
                     error.code,
                     error.reason,
                 )
         except Exception:
             if not self._closed:
-                self._logger.exception("Bridge websocket receive loop failed")
+                self._logger.exception("Bridge receive loop failed")
         finally:
             if not self._closed:
-                self._closed = True
-                self._fail_pending(ConnectionError("Connection closed by bridge"))
-                self._fail_waiters(ConnectionError("Connection closed by bridge"))
-
-    async def _dispatch_event(self, payload: EventPayload) -> None:
-        self._update_state_from_event(payload)
-        await self._events.put(payload)
+                if self._reconnect_policy is None:
+                    self._mark_connection_closed(ConnectionError("Connection closed by bridge"))
+                elif self._receive_task is asyncio.current_task():
+                    self._on_connection_lost()
 
-        event_name = payload.get("event")
-        if isinstance(event_name, str):
-            callbacks = list(self._event_listeners.get(event_name, set()))
-        else:
-            callbacks = []
-        callbacks.extend(self._event_listeners.get(self.ANY_EVENT, set()))
+    def _mark_connection_closed(self, error: ConnectionError) -> None:
+        self._closed = True
+        self._fail_pending(error)
+        self._fail_waiters(error)
+        self._fail_watches(error)
+        self._fail_task_channels()
+        self._close_subscriptions()
+        self._session_ready.set()
+        self._closed_event.set()
+
+    def _on_connection_lost(self) -> None:
+        # Waiters, task waits and subscriptions stay registered; only requests in flight fail.
+        self._receive_task = None
+        self._fail_pending(_ConnectionLost("Connection to the bridge was lost"))
+        self._suspended_watches.extend(self._watches.values())
+        self._watches.clear()
+        self._unrouted_watch_changes.clear()
+        if self._reconnect_task is not None:
+            # A reconnect attempt lost its new transport; that attempt fails and drops the session itself.
+            return
+        transport = self._transport
+        self._transport = None
+        self._session_ready.clear()
+        self._reconnect_task = asyncio.create_task(self._reconnect(transport), name="pyritone-reconnect")
+
+    def _reconnecting_elsewhere(self) -> bool:
+        task = self._reconnect_task
+        return task is not None and task is not asyncio.current_task()
+
+    async def _connected_transport(self) -> Transport:
+        # Callers other than the reconnect itself wait until the session is replayed. The per-request
+        # timeout does not apply: backoff alone can exceed it, so the policy bounds the wait instead.
+        if not self._closed and self._reconnecting_elsewhere():
+            policy = self._reconnect_policy
+            assert policy is not None
+            try:
+                await asyncio.wait_for(self._session_ready.wait(), timeout=policy.reconnect_wait)
+            except asyncio.TimeoutError:
+                raise ConnectionError(
+                    f"Reconnect to the bridge still in progress after waiting {policy.reconnect_wait:g}s"
+                ) from None
+            if self._closed:
+                raise ConnectionError("Connection to the bridge was lost and the client closed before it reconnected")
+        return self._ensure_connected()
 
-        for callback in callbacks:
-            self._invoke_event_callback(callback, payload)
+    async def _reconnect(self, stale_transport: Transport | None) -> None:
+        try:
+            await self._run_reconnect(stale_transport)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            # Never leave requests parked on a session that will not come back.
+            self._logger.exception("Bridge reconnect supervisor failed")
+            await self._abandon_reconnect(ConnectionError(f"Reconnect to the bridge failed: {error}"))
+
+    async def _run_reconnect(self, stale_transport: Transport | None) -> None:
+        policy = self._reconnect_policy
+        assert policy is not None
+        if stale_transport is not None:
+            with contextlib.suppress(Exception):
+                await stale_transport.close()
 
-        for waiter in list(self._event_waiters):
-            if waiter.future.done():
-                with contextlib.suppress(ValueError):
-                    self._event_waiters.remove(waiter)
+        attempt = 0
+        while policy.max_attempts is None or attempt < policy.max_attempts:
+            await asyncio.sleep(policy.delay(attempt))
+            attempt += 1
+            self._log_state("reconnecting", attempt=attempt)
+            try:
+                # Discovery runs again: a restarted bridge may listen elsewhere and rotates its token.
+                self._bridge_info = self._resolve_bridge_info()
+                self._transport = await self._transport_factory(
+                    self._bridge_info,
+                    timeout=self._timeout,
+                    logger=self._logger,
+                )
+                await self._replay_session()
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                self._logger.debug("Reconnect attempt %s failed: %s", attempt, error)
+                await self._drop_session()
                 continue
 
-            if waiter.event_name != self.ANY_EVENT and waiter.event_name != event_name:
+            self._reconnect_task = None
+            self._unexpected_close_logged = False
+            self._session_ready.set()
+            self._log_state("reconnected", attempt=attempt, server=self._bridge_info.server_version)
+            return
+
+        self._log_state("reconnect_failed", attempts=attempt)
+        await self._abandon_reconnect(ConnectionError(f"Could not reconnect to the bridge after {attempt} attempts"))
+
+    async def _abandon_reconnect(self, error: ConnectionError) -> None:
+        self._reconnect_task = None
+        self._fail_waiters(error)
+        self._fail_watches(error)
+        await self.close()
+
+    async def _drop_session(self) -> None:
+        receive_task = self._receive_task
+        self._receive_task = None
+        if receive_task is not None and not receive_task.done():
+            receive_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await receive_task
+        transport = self._transport
+        self._transport = None
+        if transport is not None:
+            with contextlib.suppress(Exception):
+                await transport.close()
+
+    async def _replay_session(self) -> None:
+        # Session-scoped bridge state (refs, accessors, pause seq, capabilities) starts over.
+        self.baritone._reset_session_caches()
+        await self._reset_ref_tracking()
+        self._capabilities = frozenset()
+        self._binary_frames = False
+        self._reset_pause_state()
+        self._pending_status_deltas.clear()
+        self.state._start_delta_stream(None)
+
+        await self._open_session()
+        if self._event_include is not None:
+            await self._push_event_filter()
+        status = await self.status_get()
+        if self._status_options:
+            await self.status_subscribe(**self._status_options)
+        await self._resume_watches()
+
+        active_task = status.get("active_task")
+        active_task_id = active_task.get("task_id") if isinstance(active_task, dict) else None
+        for task_id, channels in self._task_channels.items():
+            if task_id != active_task_id:
+                for channel in channels:
+                    channel.put_nowait(_TASK_CHANNEL_LOST)
+
+    async def _resume_watches(self) -> None:
+        while self._suspended_watches:
+            watch = self._suspended_watches[0]
+            if watch.closed:
+                self._suspended_watches.pop(0)
                 continue
+            if _references_remote_ref(watch._payload):
+                self._suspended_watches.pop(0)
+                watch._fail(
+                    RemoteRefExpiredError(
+                        "REF_EXPIRED",
+                        "Watch target referenced a remote object from the previous bridge session",
+                        None,
+                    )
+                )
+                continue
+            try:
+                await watch._resume()
+            except (BridgeError, asyncio.TimeoutError) as error:
+                watch._fail(error)
+            # Connection errors propagate and keep the watch suspended for the next attempt.
+            self._suspended_watches.pop(0)
+
+    def _buffer_event(self, payload: EventPayload) -> None:
+        maxsize = self._event_buffer_size
+        if maxsize == 0 and self._event_pull_waiters <= self._events.qsize():
+            # Buffering disabled: only a next_event() caller that is already waiting receives it.
+            return
+        if maxsize:
+            while self._events.qsize() >= maxsize:
+                self._forget_buffered_event(self._events.get_nowait())
+                self._event_buffer_dropped += 1
+        self._events.put_nowait(payload)
+        event_name = payload.get("event")
+        self._buffered_event_counts[event_name] = self._buffered_event_counts.get(event_name, 0) + 1
 
-            if waiter.check is not None:
-                try:
-                    matches = bool(waiter.check(payload))
-                except Exception as error:
-                    waiter.future.set_exception(error)
-                    with contextlib.suppress(ValueError):
-                        self._event_waiters.remove(waiter)
-                    continue
+    async def _dispatch_event(self, payload: EventPayload) -> None:
+        self._update_state_from_event(payload)
+        self._route_task_event(payload)
+        self._buffer_event(payload)
+        await self._fan_out_to_subscriptions(payload)
 
-                if not matches:
-                    continue
+        event_name = payload.get("event")
+        if isinstance(event_name, str):
+            listeners = list(self._event_listeners.get(event_name, {}).values())
+        else:
+            listeners = []
+        listeners.extend(self._event_listeners.get(self.ANY_EVENT, {}).values())
 
-            waiter.future.set_result(payload)
-            with contextlib.suppress(ValueError):
-                self._event_waiters.remove(waiter)
+        for listener in listeners:
+            listener.deliver(payload)
+
+        data = payload.get("data")
+        task_id = data.get("task_id") if isinstance(data, dict) else None
+        self._event_waiters.resolve(
+            event_name if isinstance(event_name, str) else self.ANY_EVENT,
+            task_id if isinstance(task_id, str) else None,
+            (payload,),
+            payload,
+        )
 
     def _update_state_from_event(self, payload: EventPayload) -> None:
         event_name = payload.get("event")
@@ -903,9 +2502,13 @@ class Client(
             return
 
         if event_name == "status.update":
+            if data.get("delta") is True:
+                self._apply_status_delta(data, ts=ts)
+                return
             status = data.get("status")
             if isinstance(status, dict):
-                self.state._replace(status, ts=ts)
+                partial = self._status_fields is not None or self._awaiting_status_projection > 0
+                self._apply_status(status, ts=ts, partial=partial)
                 reason = data.get("reason")
                 self._log_status_snapshot(
                     status,
@@ -913,8 +2516,21 @@ class Client(
                 )
             return
 
+        if event_name == self.PATHING_ACTIVITY_EVENT_NAME:
+            self._update_pathing_activity(data)
+            return
+
         if event_name == "baritone.path_event":
             self._log_path_event_state(data)
+            self._signal_pathing_change()
+            return
+
+        if event_name == self.WATCH_CHANGED_EVENT_NAME:
+            self._route_watch_change(data)
+            return
+
+        if event_name == "minecraft.player_respawn":
+            self.baritone._invalidate_accessors("player_respawn")
             return
 
         if event_name in {"task.started", "task.progress", "task.paused", "task.resumed"}:
@@ -928,9 +2544,66 @@ class Client(
                 self.state._clear_active_task(task_id, ts=ts)
             self._log_task_event_state(event_name, data)
 
+    def _register_watch(self, watch: TypedWatch) -> None:
+        watch_id = watch.watch_id
+        if watch_id is None:
+            return
+        self._watches[watch_id] = watch
+        # Changes can be dispatched before the `api.watch` caller resumes; replay them now.
+        pending = [data for data in self._unrouted_watch_changes if data.get("watch_id") == watch_id]
+        for data in pending:
+            self._unrouted_watch_changes.remove(data)
+            watch._deliver(data)
+            if data.get("active") is False:
+                self._watches.pop(watch_id, None)
+
+    def _unregister_watch(self, watch_id: str) -> None:
+        self._watches.pop(watch_id, None)
+
+    def _route_watch_change(self, data: dict[str, Any]) -> None:
+        watch_id = data.get("watch_id")
+        if not isinstance(watch_id, str):
+            return
+        watch = self._watches.get(watch_id)
+        if watch is None:
+            self._unrouted_watch_changes.append(dict(data))
+            return
+        watch._deliver(data)
+        if data.get("active") is False:
+            self._watches.pop(watch_id, None)
+
+    def _fail_watches(self, error: BaseException) -> None:
+        watches = [*self._watches.values(), *self._suspended_watches]
+        self._watches.clear()
+        self._suspended_watches.clear()
+        self._unrouted_watch_changes.clear()
+        for watch in watches:
+            watch._fail(error)
+
     def _reset_pause_state(self) -> None:
         self._pause_state = _default_pause_state()
         self._pause_state_seq = -1
+        self._pathing_activity = None
+        self._signal_pathing_change()
+
+    def _update_pathing_activity(self, payload: dict[str, Any]) -> None:
+        seq_value = _as_int(payload.get("seq"))
+        current = self._pathing_activity
+        if current is not None and seq_value is not None:
+            current_seq = _as_int(current.get("seq"))
+            if current_seq is not None and 0 < seq_value < current_seq:
+                return
+        self._pathing_activity = dict(payload)
+        if payload.get("pathing") is True or payload.get("calculating") is True:
+            # Lets waiters notice a task that started and finished between two wake-ups.
+            self._pathing_busy_count += 1
+        self._signal_pathing_change()
+
+    def _signal_pathing_change(self) -> None:
+        # Wake every waiter parked on the current event, then arm a fresh one.
+        signal = self._pathing_signal
+        self._pathing_signal = asyncio.Event()
+        signal.set()
 
     def _is_effectively_paused(self) -> bool:
         paused = self._pause_state.get("paused")
@@ -1013,10 +2686,18 @@ class Client(
             game_paused=game_paused,
         )
 
-    def _invoke_event_callback(self, callback: EventCallback, payload: EventPayload) -> None:
+    def _invoke_event_callback(
+        self,
+        callback: EventCallback,
+        payload: EventPayload,
+        *,
+        listener: _EventListener | None = None,
+    ) -> None:
         try:
             callback_result = callback(payload)
         except Exception:
+            if listener is not None:
+                listener.errors += 1
             self._logger.exception("Event callback raised")
             return
 
@@ -1034,7 +2715,22 @@ class Client(
         except Exception:
             self._logger.exception("Async event callback raised")
 
+    def _listener_executor(self) -> ThreadPoolExecutor:
+        if self._listener_thread_pool is None:
+            self._listener_thread_pool = ThreadPoolExecutor(
+                max_workers=self._listener_threads,
+                thread_name_prefix="pyritone-listener",
+            )
+        return self._listener_thread_pool
+
     async def _cancel_listener_tasks(self) -> None:
+        for listeners in self._event_listeners.values():
+            for listener in listeners.values():
+                listener.discard_backlog()
+        thread_pool = self._listener_thread_pool
+        self._listener_thread_pool = None
+        if thread_pool is not None:
+            thread_pool.shutdown(wait=False, cancel_futures=True)
         if not self._listener_tasks:
             return
 
@@ -1053,15 +2749,12 @@ class Client(
         self._pending.clear()
 
     def _fail_waiters(self, error: BaseException) -> None:
-        for waiter in self._event_waiters:
-            if not waiter.future.done():
-                waiter.future.set_exception(error)
-        self._event_waiters.clear()
+        self._event_waiters.fail_all(error)
 
-    def _ensure_connected(self) -> ClientConnection:
-        if self._closed or self._websocket is None:
+    def _ensure_connected(self) -> Transport:
+        if self._closed or self._transport is None:
             raise RuntimeError("Client is not connected")
-        return self._websocket
+        return self._transport
 
     def _log_sent(self, action: str, *args: Any) -> None:
         if not self._logger.isEnabledFor(logging.INFO):
@@ -1199,6 +2892,28 @@ class Client(
             arg_count = len(args) if isinstance(args, list) else 0
             return ("api_invoke", (invoke_method, target, f"args={arg_count}"))
 
+        if method == "api.batch":
+            calls = params.get("calls")
+            call_count = len(calls) if isinstance(calls, list) else 0
+            return ("api_batch", (f"calls={call_count}",))
+
+        if method == "api.release":
+            ids = params.get("ids")
+            id_count = len(ids) if isinstance(ids, list) else 0
+            return ("api_release", (f"ids={id_count}",))
+
+        if method == "api.pipeline":
+            steps = params.get("steps")
+            step_count = len(steps) if isinstance(steps, list) else 0
+            return ("api_pipeline", (f"steps={step_count}",))
+
+        if method == "api.watch":
+            target = _summarize_typed_target(params.get("target"))
+            return ("watch", (params.get("method"), target, f"every_ticks={params.get('every_ticks')}"))
+
+        if method == "api.unwatch":
+            return ("api_unwatch", (params.get("watch_id"),))
+
         action = _rpc_action_name(method)
         return (action, ())
 
@@ -1267,6 +2982,13 @@ class Client(
                 summary["value_type"] = _summarize_value_type(result.get("value"))
             return summary or None
 
+        if method in {"api.batch", "api.pipeline"}:
+            entries = result.get("results")
+            if not isinstance(entries, list):
+                return None
+            failed = sum(1 for entry in entries if not (isinstance(entry, dict) and entry.get("ok", False)))
+            return {"count": len(entries), "failed": failed}
+
         if method == "api.metadata.get":
             summary = {}
             roots = result.get("roots")
@@ -1465,9 +3187,22 @@ class Client(
         else:
             safe_payload = payload
 
-        self._logger.debug("%s %s", direction, json.dumps(safe_payload, sort_keys=True))
+        self._logger.debug("%s %s", direction, self._codec.dumps_sorted(safe_payload))
+
+    def _pop_buffered_event(
+        self,
+        event_name: str,
+        check: EventCheck | None,
+        *,
+        task_id: str | None = None,
+    ) -> EventPayload | None:
+        if event_name == self.ANY_EVENT:
+            if self._events.empty():
+                return None
+        elif not self._buffered_event_counts.get(event_name):
+            # Most waits start before their event arrives; skip the buffer scan entirely then.
+            return None
 
-    def _pop_buffered_event(self, event_name: str, check: EventCheck | None) -> EventPayload | None:
         buffered = getattr(self._events, "_queue", None)
         if buffered is None:
             return None
@@ -1476,6 +3211,10 @@ class Client(
             payload_event_name = payload.get("event")
             if event_name != self.ANY_EVENT and event_name != payload_event_name:
                 continue
+            if task_id is not None:
+                data = payload.get("data")
+                if not isinstance(data, dict) or data.get("task_id") != task_id:
+                    continue
 
             if check is not None:
                 if not check(payload):
@@ -1483,10 +3222,19 @@ class Client(
 
             with contextlib.suppress(ValueError):
                 buffered.remove(payload)
+                self._forget_buffered_event(payload)
             return payload
 
         return None
 
+    def _forget_buffered_event(self, payload: EventPayload) -> None:
+        event_name = payload.get("event")
+        remaining = self._buffered_event_counts.get(event_name, 0) - 1
+        if remaining > 0:
+            self._buffered_event_counts[event_name] = remaining
+        else:
+            self._buffered_event_counts.pop(event_name, None)
+
 
 _RPC_ACTION_NAMES: dict[str, str] = {
     "auth.login": "auth_login",
@@ -1498,6 +3246,11 @@ _RPC_ACTION_NAMES: dict[str, str] = {
     "api.metadata.get": "api_metadata_get",
     "api.construct": "api_construct",
     "api.invoke": "api_invoke",
+    "api.batch": "api_batch",
+    "api.pipeline": "api_pipeline",
+    "api.release": "api_release",
+    "api.watch": "watch",
+    "api.unwatch": "api_unwatch",
     "baritone.execute": "execute",
     "task.cancel": "cancel",
 }
@@ -1751,6 +3504,40 @@ def _as_int(value: Any) -> int | None:
     return None
 
 
+def _match_any_event(event_name: str) -> bool:
+    return True
+
+
+def _normalize_event_patterns(patterns: Iterable[str] | None, *, default: list[str]) -> list[str]:
+    if patterns is None:
+        return list(default)
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    normalized: list[str] = []
+    for pattern in patterns:
+        if not isinstance(pattern, str) or not pattern.strip():
+            raise ValueError("event patterns must be non-empty strings")
+        value = pattern.strip()
+        if value not in normalized:
+            normalized.append(value)
+    return normalized
+
+
+def _normalize_status_fields(fields: Iterable[str] | None) -> tuple[str, ...] | None:
+    if fields is None:
+        return None
+    if isinstance(fields, str):
+        fields = [fields]
+    normalized: list[str] = []
+    for field in fields:
+        if not isinstance(field, str) or not field.strip():
+            raise ValueError("status fields must be non-empty strings")
+        value = field.strip()
+        if value not in normalized:
+            normalized.append(value)
+    return tuple(normalized)
+
+
 def _synthetic_task_completed_event(task_id: str, source_event: EventPayload) -> EventPayload:
     data: dict[str, Any] = {
         "task_id": task_id,
@@ -1786,6 +3573,8 @@ def _synthetic_task_canceled_event(task_id: str, source_event: EventPayload) ->
 
 
 def _encode_typed_target(target: str | RemoteRef | dict[str, Any]) -> dict[str, Any]:
+    if isinstance(target, PipelineStepRef):
+        return {"$step": target.step}
     if isinstance(target, RemoteRef):
         return {"kind": "ref", "id": target.ref_id}
     if isinstance(target, str):
@@ -1795,7 +3584,71 @@ def _encode_typed_target(target: str | RemoteRef | dict[str, Any]) -> dict[str,
     raise TypeError(f"Unsupported typed target: {type(target)!r}")
 
 
+def _typed_call_error(
+    code: str,
+    message: str,
+    payload: dict[str, Any] | None,
+    details: dict[str, Any] | None,
+) -> TypedCallError:
+    if code == "REF_EXPIRED":
+        return RemoteRefExpiredError(code, message, payload, details)
+    return TypedCallError(code, message, payload, details)
+
+
+def _typed_metadata_params(target: str | RemoteRef | dict[str, Any] | None) -> dict[str, Any]:
+    payload: dict[str, Any] = {}
+    if target is not None:
+        payload["target"] = _encode_typed_target(target)
+    return payload
+
+
+def _typed_construct_params(
+    type_name: str,
+    args: tuple[Any, ...],
+    parameter_types: list[str] | tuple[str, ...] | None,
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "type": type_name,
+        "args": [_encode_typed_value(value) for value in args],
+    }
+    if parameter_types is not None:
+        payload["parameter_types"] = list(parameter_types)
+    return payload
+
+
+def _typed_invoke_params(
+    target: str | RemoteRef | dict[str, Any],
+    method: str,
+    args: tuple[Any, ...],
+    parameter_types: list[str] | tuple[str, ...] | None,
+    *,
+    materialize: bool = False,
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "target": _encode_typed_target(target),
+        "method": method,
+        "args": [_encode_typed_value(value) for value in args],
+    }
+    if parameter_types is not None:
+        payload["parameter_types"] = list(parameter_types)
+    if materialize:
+        payload["materialize"] = True
+    return payload
+
+
+def _references_remote_ref(value: Any) -> bool:
+    if isinstance(value, dict):
+        if value.get("kind") == "ref" or "$pyritone_ref" in value:
+            return True
+        return any(_references_remote_ref(item) for item in value.values())
+    if isinstance(value, list):
+        return any(_references_remote_ref(item) for item in value)
+    return False
+
+
 def _encode_typed_value(value: Any) -> Any:
+    if isinstance(value, PipelineStepRef):
+        return {"$step": value.step}
     if isinstance(value, RemoteRef):
         payload: dict[str, Any] = {"$pyritone_ref": value.ref_id}
         if value.java_type:
@@ -1807,18 +3660,39 @@ def _encode_typed_value(value: Any) -> Any:
         return [_encode_typed_value(item) for item in value]
     if isinstance(value, dict):
         return {str(key): _encode_typed_value(item) for key, item in value.items()}
+    if isinstance(value, (array, memoryview)):
+        # Packed array results go back to the bridge as plain JSON number lists.
+        return value.tolist()
     return value
 
 
-def _decode_typed_value(value: Any) -> Any:
+_INLINE_VALUE_TYPES: dict[str, Callable[..., Any]] = {
+    "block_pos": BlockPos,
+    "vec3d": Vec3d,
+    "chunk_pos": ChunkPos,
+}
+
+
+def _decode_typed_value(value: Any, track: Callable[[RemoteRef], RemoteRef] | None = None) -> Any:
     if isinstance(value, list):
-        return [_decode_typed_value(item) for item in value]
+        return [_decode_typed_value(item, track) for item in value]
     if isinstance(value, dict):
         reference_id = value.get("$pyritone_ref")
         if isinstance(reference_id, str) and reference_id:
             java_type = value.get("java_type")
-            return RemoteRef(reference_id, java_type if isinstance(java_type, str) else None)
-        return {key: _decode_typed_value(item) for key, item in value.items()}
+            ref = RemoteRef(reference_id, java_type if isinstance(java_type, str) else None)
+            return track(ref) if track is not None else ref
+        if ARRAY_KEY in value:
+            packed = decode_array_envelope(value)
+            if packed is not None:
+                return packed
+        inline_kind = value.get("$pyritone_value")
+        if isinstance(inline_kind, str):
+            inline_type = _INLINE_VALUE_TYPES.get(inline_kind)
+            components = value.get("v")
+            if inline_type is not None and isinstance(components, list):
+                return inline_type(*components)
+        return {key: _decode_typed_value(item, track) for key, item in value.items()}
     return value
 
 
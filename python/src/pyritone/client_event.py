@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import asyncio
-import contextlib
 import inspect
 import logging
-from dataclasses import dataclass
+import time
+from collections import deque
+from collections.abc import Mapping
 from typing import Any, Awaitable, Callable
 
-from .client_async import AsyncPyritoneClient
+from ._waiters import WaiterRegistry
+from .client_async import AsyncPyritoneClient, EventSubscription
+from .models import ReconnectPolicy
 from .minecraft import chat as minecraft_chat
 from .minecraft import player as minecraft_player
+from .protocol import JsonCodec
+from .transport import TransportFactory
 
 RawEventPayload = dict[str, Any]
 RawEventCheck = Callable[[RawEventPayload], bool]
@@ -18,11 +23,115 @@ EventCallback = Callable[..., Awaitable[Any]]
 EventCheck = Callable[..., bool]
 
 
-@dataclass(slots=True)
-class _EventWaiter:
-    event_name: str
-    check: EventCheck | None
-    future: asyncio.Future[Any]
+class _HandlerQueue:
+    """Ordered dispatch queue for one `@client.event` handler, with its overflow policy and timing counters."""
+
+    OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "coalesce")
+
+    def __init__(
+        self,
+        client: "Client",
+        name: str,
+        callback: EventCallback,
+        *,
+        concurrency: int,
+        max_queue: int,
+        overflow: str,
+    ) -> None:
+        self._client = client
+        self.name = name
+        self.callback = callback
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.overflow = overflow
+        self._queue: deque[tuple[Any, ...]] = deque()
+        self._workers: set[asyncio.Task[None]] = set()
+        self.running = 0
+        self.calls = 0
+        self.errors = 0
+        self.dropped = 0
+        self.max_queued = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        average = self.total_seconds / self.calls if self.calls else 0.0
+        return {
+            "handler": self.name,
+            "concurrency": self.concurrency,
+            "overflow": self.overflow,
+            "max_queue": self.max_queue,
+            "queued": len(self._queue),
+            "max_queued": self.max_queued,
+            "running": self.running,
+            "calls": self.calls,
+            "errors": self.errors,
+            "dropped": self.dropped,
+            "avg_ms": average * 1000.0,
+            "max_ms": self.max_seconds * 1000.0,
+        }
+
+    def put(self, args: tuple[Any, ...]) -> None:
+        if self.overflow == "coalesce":
+            # Only the newest pending event matters (status snapshots, progress ticks).
+            self.dropped += len(self._queue)
+            self._queue.clear()
+        elif len(self._queue) >= self.max_queue:
+            if self.overflow == "drop_newest":
+                self.dropped += 1
+                return
+            self._queue.popleft()
+            self.dropped += 1
+
+        self._queue.append(args)
+        if len(self._queue) > self.max_queued:
+            self.max_queued = len(self._queue)
+
+        idle_workers = len(self._workers) - self.running
+        if idle_workers < len(self._queue) and len(self._workers) < self.concurrency:
+            worker = asyncio.create_task(self._drain(), name=f"pyritone-{self.name}")
+            self._workers.add(worker)
+            worker.add_done_callback(self._workers.discard)
+
+    async def cancel(self) -> None:
+        # On disconnect the backlog is dropped and running handler calls are cancelled, not drained.
+        self.dropped += len(self._queue)
+        self._queue.clear()
+        current = asyncio.current_task()
+        workers = [worker for worker in self._workers if worker is not current]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _drain(self) -> None:
+        # Workers take events in arrival order; with concurrency 1 handlers also finish in order.
+        while self._queue:
+            args = self._queue.popleft()
+            self.running += 1
+            started = time.perf_counter()
+            try:
+                await self.callback(*args)
+            except Exception as error:
+                self.errors += 1
+                await self._client._dispatch_error(self.name, error, *args)
+            finally:
+                self.running -= 1
+                self._record(time.perf_counter() - started)
+
+    def _record(self, elapsed: float) -> None:
+        self.calls += 1
+        self.total_seconds += elapsed
+        if elapsed > self.max_seconds:
+            self.max_seconds = elapsed
+
+
+def _raw_events_by_handler(mapping: dict[str, tuple[str, ...]]) -> dict[str, tuple[str, ...]]:
+    inverted: dict[str, tuple[str, ...]] = {}
+    for raw_event, handler_names in mapping.items():
+        for handler_name in handler_names:
+            inverted[handler_name] = (*inverted.get(handler_name, ()), raw_event)
+    return inverted
 
 
 class Client:
@@ -63,6 +172,9 @@ class Client:
         "task_failed": "on_task_failed",
         "task_canceled": "on_task_canceled",
     }
+    _HANDLER_TO_RAW_EVENTS = _raw_events_by_handler(_RAW_EVENT_TO_HANDLERS)
+    # Lifecycle handlers run directly instead of through a dispatch queue.
+    _DIRECT_HANDLERS = frozenset({"on_ready", "on_disconnect", "on_error"})
 
     def __init__(
         self,
@@ -73,6 +185,14 @@ class Client:
         ws_url: str | None = None,
         bridge_info_path: str | None = None,
         timeout: float = 5.0,
+        release_collected_refs: bool = False,
+        packed_arrays: bool = False,
+        wire_format: str = "json",
+        codec: str | JsonCodec | None = "json",
+        event_buffer_size: int | None = 1024,
+        listener_threads: int = 4,
+        transport: str | TransportFactory | None = "auto",
+        reconnect: bool | ReconnectPolicy = False,
     ) -> None:
         self._raw = AsyncPyritoneClient(
             host=host,
@@ -81,10 +201,20 @@ class Client:
             ws_url=ws_url,
             bridge_info_path=bridge_info_path,
             timeout=timeout,
+            release_collected_refs=release_collected_refs,
+            packed_arrays=packed_arrays,
+            wire_format=wire_format,
+            codec=codec,
+            event_buffer_size=event_buffer_size,
+            listener_threads=listener_threads,
+            transport=transport,
+            reconnect=reconnect,
         )
         self._logger = logging.getLogger("pyritone")
         self._event_handlers: dict[str, EventCallback] = {}
-        self._event_waiters: list[_EventWaiter] = []
+        self._handler_queues: dict[str, _HandlerQueue] = {}
+        self._player_cache: tuple[int, minecraft_player.player | None] = (-1, None)
+        self._event_waiters = WaiterRegistry()
         self._raw_unsubscribe: Callable[[], None] | None = None
         self._started = False
 
@@ -94,20 +224,79 @@ class Client:
 
     @property
     def player(self) -> minecraft_player.player | None:
-        snapshot = self._raw.state.snapshot
-        raw_player = snapshot.get("player")
-        if not isinstance(raw_player, dict):
-            return None
-        return minecraft_player.player.from_payload(raw_player)
+        state = self._raw.state
+        cached_version, cached_player = self._player_cache
+        if cached_version == state.version:
+            return cached_player
 
-    def event(self, callback: EventCallback) -> EventCallback:
-        if not inspect.iscoroutinefunction(callback):
-            raise TypeError("@client.event requires an async function")
-        self._event_handlers[callback.__name__] = callback
-        return callback
+        raw_player = state.snapshot.get("player")
+        value = minecraft_player.player.from_payload(raw_player) if isinstance(raw_player, Mapping) else None
+        self._player_cache = (state.version, value)
+        return value
 
-    def on(self, event: str, callback: RawEventCallback) -> Callable[[], None]:
-        return self._raw.on(event, callback)
+    @property
+    def handler_stats(self) -> list[dict[str, Any]]:
+        """Queue depth and timing per `@client.event` handler, slowest first."""
+        stats = [queue.stats for queue in self._handler_queues.values()]
+        stats.sort(key=lambda item: item["max_ms"], reverse=True)
+        return stats
+
+    def event(
+        self,
+        callback: EventCallback | None = None,
+        *,
+        concurrency: int = 1,
+        max_queue: int = 1024,
+        overflow: str = "drop_oldest",
+    ) -> Any:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if max_queue < 1:
+            raise ValueError("max_queue must be >= 1")
+        if overflow not in _HandlerQueue.OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {', '.join(_HandlerQueue.OVERFLOW_POLICIES)}")
+
+        def register(handler: EventCallback) -> EventCallback:
+            if not inspect.iscoroutinefunction(handler):
+                raise TypeError("@client.event requires an async function")
+            name = handler.__name__
+            self._event_handlers[name] = handler
+            # Keep the raw events behind this handler in the bridge-side filter (`events_subscribe`).
+            self._raw._note_event_interest(*self._HANDLER_TO_RAW_EVENTS.get(name, ()))
+            if name in self._DIRECT_HANDLERS:
+                return handler
+
+            queue = self._handler_queues.get(name)
+            if queue is None:
+                self._handler_queues[name] = _HandlerQueue(
+                    self,
+                    name,
+                    handler,
+                    concurrency=concurrency,
+                    max_queue=max_queue,
+                    overflow=overflow,
+                )
+            else:
+                # Re-registering keeps the pending backlog and counters.
+                queue.callback = handler
+                queue.concurrency = concurrency
+                queue.max_queue = max_queue
+                queue.overflow = overflow
+            return handler
+
+        if callback is None:
+            return register
+        return register(callback)
+
+    def on(
+        self,
+        event: str,
+        callback: RawEventCallback,
+        *,
+        mode: str = "inline",
+        max_queue: int = 1024,
+    ) -> Callable[[], None]:
+        return self._raw.on(event, callback, mode=mode, max_queue=max_queue)
 
     def off(self, event: str, callback: RawEventCallback) -> None:
         self._raw.off(event, callback)
@@ -115,6 +304,15 @@ class Client:
     async def next_event(self, timeout: float | None = None) -> RawEventPayload:
         return await self._raw.next_event(timeout=timeout)
 
+    def subscribe(
+        self,
+        pattern: str = "*",
+        *,
+        maxsize: int = 1024,
+        overflow: str = "drop_oldest",
+    ) -> EventSubscription:
+        return self._raw.subscribe(pattern, maxsize=maxsize, overflow=overflow)
+
     async def events(self):
         async for payload in self._raw.events():
             yield payload
@@ -133,20 +331,20 @@ class Client:
             raw_check = check if check is None or callable(check) else None
             return await self._raw.wait_for(normalized, check=raw_check, timeout=timeout)
 
-        loop = asyncio.get_running_loop()
-        waiter = _EventWaiter(
-            event_name=self._normalize_high_level_event_name(normalized),
+        handler_name = self._normalize_high_level_event_name(normalized)
+        # Register before widening the filter, as the raw client does, so an event routed during the
+        # `events.subscribe` round trip still matches and `timeout` bounds that round trip too.
+        waiter = self._event_waiters.add(
+            handler_name,
             check=check if check is None or callable(check) else None,
-            future=loop.create_future(),
+            timeout=timeout,
         )
-        self._event_waiters.append(waiter)
         try:
-            if timeout is None:
-                return await waiter.future
-            return await asyncio.wait_for(waiter.future, timeout=timeout)
-        finally:
-            with contextlib.suppress(ValueError):
-                self._event_waiters.remove(waiter)
+            await self._raw._require_events_for(waiter, *self._HANDLER_TO_RAW_EVENTS.get(handler_name, ()))
+        except BaseException:
+            self._event_waiters.remove(waiter)
+            raise
+        return await self._event_waiters.wait(waiter)
 
     async def start(self) -> None:
         if self._started:
@@ -164,10 +362,8 @@ class Client:
                 self._logger.debug("Initial status_get failed during start()", exc_info=True)
             await self._dispatch_high_level("on_ready")
 
-            receive_task = getattr(self._raw, "_receive_task", None)
-            if receive_task is not None:
-                with contextlib.suppress(asyncio.CancelledError):
-                    await receive_task
+            # Returns once the bridge connection is gone for good (reconnects are ridden out).
+            await self._raw.wait_closed()
         finally:
             unsubscribe = self._raw_unsubscribe
             self._raw_unsubscribe = None
@@ -175,6 +371,8 @@ class Client:
                 unsubscribe()
 
             self._fail_high_level_waiters(ConnectionError("Client disconnected"))
+            for queue in list(self._handler_queues.values()):
+                await queue.cancel()
             if connected:
                 await self._dispatch_high_level("on_disconnect")
             self._started = False
@@ -191,7 +389,12 @@ class Client:
     def __getattr__(self, name: str) -> Any:
         return getattr(self._raw, name)
 
-    async def _on_raw_event(self, payload: RawEventPayload) -> None:
+    def _on_raw_event(self, payload: RawEventPayload) -> None:
+        # Route on the next loop iteration, as the old per-event task did, so code woken by the same
+        # frame can still register a waiter for it. call_soon keeps events in order without a task each.
+        asyncio.get_running_loop().call_soon(self._route_raw_event, payload)
+
+    def _route_raw_event(self, payload: RawEventPayload) -> None:
         event_name = payload.get("event")
         if not isinstance(event_name, str):
             return
@@ -201,40 +404,46 @@ class Client:
 
         if event_name == "minecraft.chat_message":
             context = minecraft_chat.message.from_payload(parsed_data)
-            await self._dispatch_high_level("on_chat_message", context)
-            await self._dispatch_high_level("on_message", context)
+            self._enqueue_high_level("on_chat_message", context)
+            self._enqueue_high_level("on_message", context)
             return
 
         if event_name == "minecraft.system_message":
             context = minecraft_chat.system_message.from_payload(parsed_data)
-            await self._dispatch_high_level("on_system_message", context)
+            self._enqueue_high_level("on_system_message", context)
             return
 
         if event_name == "minecraft.player_join":
             context = minecraft_player.join.from_payload(parsed_data)
-            await self._dispatch_high_level("on_player_join", context)
+            self._enqueue_high_level("on_player_join", context)
             return
 
         if event_name == "minecraft.player_leave":
             context = minecraft_player.leave.from_payload(parsed_data)
-            await self._dispatch_high_level("on_player_leave", context)
+            self._enqueue_high_level("on_player_leave", context)
             return
 
         if event_name == "minecraft.player_death":
             context = minecraft_player.death.from_payload(parsed_data)
-            await self._dispatch_high_level("on_player_death", context)
+            self._enqueue_high_level("on_player_death", context)
             return
 
         if event_name == "minecraft.player_respawn":
             context = minecraft_player.respawn.from_payload(parsed_data)
-            await self._dispatch_high_level("on_player_respawn", context)
+            self._enqueue_high_level("on_player_respawn", context)
             return
 
         handlers = self._RAW_EVENT_TO_HANDLERS.get(event_name)
         if handlers is None:
             return
         for handler_name in handlers:
-            await self._dispatch_high_level(handler_name, payload)
+            self._enqueue_high_level(handler_name, payload)
+
+    def _enqueue_high_level(self, event_name: str, *args: Any) -> None:
+        self._resolve_high_level_waiters(event_name, args)
+        queue = self._handler_queues.get(event_name)
+        if queue is not None:
+            queue.put(args)
 
     async def _dispatch_high_level(self, event_name: str, *args: Any) -> None:
         self._resolve_high_level_waiters(event_name, args)
@@ -263,41 +472,16 @@ class Client:
             self._logger.exception("Unhandled exception in on_error")
 
     def _resolve_high_level_waiters(self, event_name: str, args: tuple[Any, ...]) -> None:
-        for waiter in list(self._event_waiters):
-            if waiter.future.done():
-                with contextlib.suppress(ValueError):
-                    self._event_waiters.remove(waiter)
-                continue
-
-            if waiter.event_name != event_name:
-                continue
-
-            if waiter.check is not None:
-                try:
-                    matches = bool(waiter.check(*args))
-                except Exception as error:
-                    waiter.future.set_exception(error)
-                    with contextlib.suppress(ValueError):
-                        self._event_waiters.remove(waiter)
-                    continue
-                if not matches:
-                    continue
-
-            if len(args) == 0:
-                result: Any = None
-            elif len(args) == 1:
-                result = args[0]
-            else:
-                result = args
-            waiter.future.set_result(result)
-            with contextlib.suppress(ValueError):
-                self._event_waiters.remove(waiter)
+        if len(args) == 0:
+            result: Any = None
+        elif len(args) == 1:
+            result = args[0]
+        else:
+            result = args
+        self._event_waiters.resolve(event_name, None, args, result)
 
     def _fail_high_level_waiters(self, error: BaseException) -> None:
-        for waiter in self._event_waiters:
-            if not waiter.future.done():
-                waiter.future.set_exception(error)
-        self._event_waiters.clear()
+        self._event_waiters.fail_all(error)
 
     def _normalize_high_level_event_name(self, event: str) -> str:
         normalized = event.strip().lower()
@@ -13,6 +13,7 @@ DEFAULT_HOST = "127.0.0.1"
 DEFAULT_PORT = 27841
 DEFAULT_WS_PATH = "/ws"
 DEFAULT_TRANSPORT = "websocket"
+LINE_TRANSPORT = "ndjson"
 DEFAULT_BRIDGE_INFO_RELATIVE = Path("config") / "pyritone_bridge" / "bridge-info.json"
 
 
@@ -133,8 +134,20 @@ def resolve_bridge_info(
     server_version = file_values.get("server_version")
     resolved_transport = str(file_values.get("transport") or DEFAULT_TRANSPORT)
     resolved_ws_path = _normalize_ws_path(file_values.get("ws_path"))
+    tcp_port = file_values.get("tcp_port")
+    unix_socket = file_values.get("unix_socket")
 
     explicit_ws_url = ws_url or env_ws_url
+    explicit_endpoint = bool(explicit_ws_url) or any(
+        value is not None for value in (host, port, env_host, env_port)
+    )
+    # The newline-delimited listener is preferred when advertised, unless a WebSocket endpoint was given explicitly.
+    if resolved_transport == LINE_TRANSPORT and (explicit_endpoint or tcp_port is None):
+        resolved_transport = DEFAULT_TRANSPORT
+    if resolved_transport != LINE_TRANSPORT:
+        tcp_port = None
+        unix_socket = None
+
     if explicit_ws_url:
         resolved_ws_url = str(explicit_ws_url)
     elif host is not None or port is not None or env_host is not None or env_port is not None:
@@ -160,6 +173,8 @@ def resolve_bridge_info(
         transport=resolved_transport,
         protocol_version=int(protocol_version) if protocol_version is not None else None,
         server_version=str(server_version) if server_version is not None else None,
+        tcp_port=int(tcp_port) if tcp_port is not None else None,
+        unix_socket=str(unix_socket) if isinstance(unix_socket, str) and unix_socket else None,
     )
 
 
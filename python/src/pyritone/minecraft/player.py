@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -17,11 +18,11 @@ class player:
     self: bool = False
 
     @classmethod
-    def from_payload(cls, payload: dict[str, Any] | None) -> "player | None":
+    def from_payload(cls, payload: Mapping[str, Any] | None) -> "player | None":
         if payload is None:
             return None
-        if not isinstance(payload, dict):
-            raise TypeError("player payload must be a dict or None")
+        if not isinstance(payload, Mapping):
+            raise TypeError("player payload must be a mapping or None")
 
         uuid_value = payload.get("uuid")
         uuid = uuid_value if isinstance(uuid_value, str) and uuid_value.strip() else None
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import random
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, NamedTuple
 
 
 @dataclass(slots=True)
@@ -14,6 +15,8 @@ class BridgeInfo:
     transport: str = "websocket"
     protocol_version: int | None = None
     server_version: str | None = None
+    tcp_port: int | None = None
+    unix_socket: str | None = None
 
 
 class DiscoveryError(ValueError):
@@ -39,12 +42,102 @@ class TypedCallError(BridgeError):
     pass
 
 
+class RemoteRefExpiredError(TypedCallError):
+    """Raised with code `REF_EXPIRED` when the bridge evicted or released a remote reference."""
+
+
+class EventOverflowError(RuntimeError):
+    """Raised by an `overflow="error"` event subscription whose buffer filled up."""
+
+    def __init__(self, pattern: str, maxsize: int) -> None:
+        self.pattern = pattern
+        self.maxsize = maxsize
+        super().__init__(f"Event subscription {pattern!r} overflowed its buffer of {maxsize} events")
+
+
+class RequestInterruptedError(ConnectionError):
+    """Raised when the connection dropped while a non-idempotent request was in flight.
+
+    The bridge may or may not have run the request, so the reconnecting client does not retry it.
+    """
+
+    def __init__(self, method: str) -> None:
+        self.method = method
+        super().__init__(
+            f"Connection to the bridge was lost while {method!r} was in flight; it may or may not have run "
+            "and was not retried because it is not idempotent"
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class ReconnectPolicy:
+    """Backoff for `Client(reconnect=...)`: `initial_delay * multiplier**attempt`, capped at `max_delay`.
+
+    Each delay is scaled by a random factor in `[1 - jitter, 1]`. `max_attempts=None` retries forever.
+    Requests issued while reconnecting wait for the session to come back; `reconnect_wait` caps that
+    wait in seconds (`None` waits as long as the reconnect keeps trying).
+    """
+
+    initial_delay: float = 0.5
+    max_delay: float = 30.0
+    multiplier: float = 2.0
+    jitter: float = 0.5
+    max_attempts: int | None = None
+    reconnect_wait: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.initial_delay < 0 or self.max_delay < 0:
+            raise ValueError("reconnect delays must be >= 0")
+        if self.multiplier < 1:
+            raise ValueError("multiplier must be >= 1")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+        if self.max_attempts is not None and self.max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1 or None")
+        if self.reconnect_wait is not None and self.reconnect_wait <= 0:
+            raise ValueError("reconnect_wait must be > 0 or None")
+
+    def delay(self, attempt: int) -> float:
+        # The exponent is capped so long outages never overflow; max_delay is reached well before it.
+        try:
+            base = self.initial_delay * self.multiplier ** min(attempt, 64)
+        except OverflowError:
+            base = self.max_delay
+        return min(self.max_delay, base) * random.uniform(1 - self.jitter, 1)
+
+
 @dataclass(slots=True, frozen=True)
 class RemoteRef:
     ref_id: str
     java_type: str | None = None
 
 
+@dataclass(slots=True, frozen=True)
+class PipelineStepRef(RemoteRef):
+    """Placeholder for the value of an earlier `api.pipeline` step."""
+
+    step: int = 0
+
+
+class BlockPos(NamedTuple):
+    """Block coordinates inlined by the bridge for `BlockPos`/`BetterBlockPos` when a call sets `materialize`."""
+
+    x: int
+    y: int
+    z: int
+
+
+class Vec3d(NamedTuple):
+    x: float
+    y: float
+    z: float
+
+
+class ChunkPos(NamedTuple):
+    x: int
+    z: int
+
+
 @dataclass(slots=True, frozen=True)
 class VisibleEntity:
     id: str
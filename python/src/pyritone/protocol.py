@@ -4,6 +4,15 @@ import json
 import uuid
 from typing import Any
 
+from . import cbor as _pure_cbor
+
+try:  # Optional accelerated CBOR codec (`pip install pyritone[cbor]`).
+    import cbor2 as _cbor2
+except ImportError:  # pragma: no cover - depends on the environment
+    _cbor2 = None
+
+BINARY_CODEC_CAPABILITY = "cbor"
+
 
 def new_request(method: str, params: dict[str, Any] | None = None, request_id: str | None = None) -> dict[str, Any]:
     return {
@@ -14,21 +23,163 @@ def new_request(method: str, params: dict[str, Any] | None = None, request_id: s
     }
 
 
-def encode_message(payload: dict[str, Any]) -> str:
-    return json.dumps(payload, separators=(",", ":"))
+class JsonCodec:
+    """Text JSON codec used for protocol frames.
 
+    `dumps` may return `str` or UTF-8 `bytes`; `loads` accepts either, so raw frame bytes never need
+    a separate `.decode("utf-8")` copy. This base class wraps the stdlib `json` module.
+    """
 
-def decode_message(message: bytes | str) -> dict[str, Any]:
-    if isinstance(message, bytes):
-        text = message.decode("utf-8")
-    else:
-        text = message
-    parsed = json.loads(text)
+    name = "json"
+
+    def dumps(self, payload: Any) -> str | bytes:
+        return json.dumps(payload, separators=(",", ":"))
+
+    def dumps_sorted(self, payload: Any) -> str:
+        """Key-sorted text for debug logging."""
+        return json.dumps(payload, separators=(",", ":"), sort_keys=True, default=str)
+
+    def loads(self, data: bytes | bytearray | memoryview | str) -> Any:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson-backed codec. Encoding matches stdlib `json` (non-str keys, big ints); decoding turns
+    integers beyond 64 bits into floats."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+        self._sorted_options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, payload: Any) -> str | bytes:
+        try:
+            return self._orjson.dumps(payload, option=self._options)
+        except TypeError:
+            # orjson rejects integers beyond 64 bits; stdlib json writes them exactly.
+            return super().dumps(payload)
+
+    def dumps_sorted(self, payload: Any) -> str:
+        return self._orjson.dumps(payload, option=self._sorted_options, default=str).decode("utf-8")
+
+    def loads(self, data: bytes | bytearray | memoryview | str) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """msgspec-backed codec; payloads it cannot encode (for example integers beyond 64 bits) go through stdlib `json`."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._decode_error = msgspec.DecodeError
+        self._encode_errors = (msgspec.EncodeError, OverflowError, TypeError)
+        self._encoder = msgspec.json.Encoder()
+        self._sorted_encoder = msgspec.json.Encoder(order="sorted", enc_hook=str)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, payload: Any) -> str | bytes:
+        try:
+            return self._encoder.encode(payload)
+        except self._encode_errors:
+            return super().dumps(payload)
+
+    def dumps_sorted(self, payload: Any) -> str:
+        return self._sorted_encoder.encode(payload).decode("utf-8")
+
+    def loads(self, data: bytes | bytearray | memoryview | str) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as error:
+            raise ValueError(str(error)) from error
+
+
+_CODEC_TYPES: dict[str, type[JsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JsonCodec,
+}
+# `auto` tries these in order and falls back to stdlib `json`.
+_AUTO_CODEC_ORDER = ("orjson", "msgspec")
+
+
+def get_codec(codec: str | JsonCodec | None = "json") -> JsonCodec:
+    """Resolve a codec instance from a name (`json`, `auto`, `orjson`, `msgspec`) or pass one through.
+
+    `None` means stdlib `json`; `auto` opts in to the fastest installed backend. Naming an optional backend
+    that is not installed raises ImportError.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None:
+        return JsonCodec()
+    if codec == "auto":
+        for name in _AUTO_CODEC_ORDER:
+            try:
+                return _CODEC_TYPES[name]()
+            except ImportError:
+                continue
+        return JsonCodec()
+
+    codec_type = _CODEC_TYPES.get(codec)
+    if codec_type is None:
+        raise ValueError(f"Unknown JSON codec {codec!r}; expected auto, {', '.join(_CODEC_TYPES)}")
+    try:
+        return codec_type()
+    except ImportError as error:
+        raise ImportError(f"JSON codec {codec!r} requires the {codec} package; install pyritone[{codec}]") from error
+
+
+DEFAULT_CODEC = JsonCodec()
+
+
+def encode_message(payload: dict[str, Any], codec: JsonCodec | None = None) -> str:
+    encoded = (codec or DEFAULT_CODEC).dumps(payload)
+    if isinstance(encoded, bytes):
+        return encoded.decode("utf-8")
+    return encoded
+
+
+def decode_message(message: bytes | str, codec: JsonCodec | None = None) -> dict[str, Any]:
+    parsed = (codec or DEFAULT_CODEC).loads(message)
     if not isinstance(parsed, dict):
         raise ValueError("Protocol payload must be a JSON object")
     return parsed
 
 
+def encode_binary_message(payload: dict[str, Any]) -> bytes:
+    """Encode one envelope as CBOR for a WebSocket binary frame."""
+    if _cbor2 is not None:
+        return _cbor2.dumps(payload)
+    return _pure_cbor.dumps(payload)
+
+
+def decode_binary_message(message: bytes | bytearray | memoryview) -> dict[str, Any]:
+    if _cbor2 is not None:
+        parsed = _cbor2.loads(bytes(message))
+    else:
+        parsed = _pure_cbor.loads(message)
+    if not isinstance(parsed, dict):
+        raise ValueError("Protocol payload must be a CBOR map")
+    return parsed
+
+
+def binary_codec_backend() -> str:
+    """Name of the CBOR implementation in use: `cbor2` when installed, otherwise `pure`."""
+    return "cbor2" if _cbor2 is not None else "pure"
+
+
 def encode_line(payload: dict[str, Any]) -> bytes:
     return (encode_message(payload) + "\n").encode("utf-8")
 
@@ -0,0 +1,430 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Protocol, runtime_checkable
+
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosed, ConnectionClosedOK
+
+from .discovery import LINE_TRANSPORT
+from .models import BridgeError, BridgeInfo
+from .protocol import JsonCodec, decode_binary_message, decode_message, get_codec
+
+
+class TransportClosed(ConnectionError):
+    """Raised by `Transport.recv()`/`send()` once the connection is gone.
+
+    `clean` is True for an orderly close (either side), False when the connection dropped.
+    """
+
+    def __init__(self, code: int | None = None, reason: str = "", *, clean: bool = False) -> None:
+        self.code = code
+        self.reason = reason
+        self.clean = clean
+        super().__init__(f"Transport closed (code={code}, reason={reason})")
+
+
+@runtime_checkable
+class Transport(Protocol):
+    """One bidirectional frame stream between the client and the bridge.
+
+    `send` takes one encoded envelope (`binary=True` for CBOR frames) and `recv` returns the next
+    frame as raw bytes; both raise `TransportClosed` once the connection is gone.
+    """
+
+    async def send(self, data: bytes | str, *, binary: bool = False) -> None: ...
+
+    async def recv(self) -> bytes: ...
+
+    async def close(self) -> None: ...
+
+
+class TransportFactory(Protocol):
+    """Opens a `Transport` to the bridge described by `info`.
+
+    Factories that are the bridge themselves (such as `LoopbackBridge`) may also expose a
+    `bridge_info` attribute; `Client.connect()` then uses it instead of running discovery.
+    """
+
+    def __call__(
+        self,
+        info: BridgeInfo,
+        *,
+        timeout: float,
+        logger: logging.Logger | None = None,
+    ) -> Awaitable[Transport]: ...
+
+
+class WebSocketTransport:
+    """`Transport` over a `websockets` client connection (the default)."""
+
+    def __init__(self, connection: ClientConnection) -> None:
+        self._connection = connection
+
+    async def send(self, data: bytes | str, *, binary: bool = False) -> None:
+        try:
+            # Codecs may produce UTF-8 bytes; text=True sends them as a text frame without re-decoding.
+            await self._connection.send(data, text=not binary)
+        except ConnectionClosed as error:
+            raise _closed_from(error) from error
+
+    async def recv(self) -> bytes:
+        try:
+            # decode=False hands text frames over as raw UTF-8 bytes for the codec.
+            message = await self._connection.recv(decode=False)
+        except ConnectionClosed as error:
+            raise _closed_from(error) from error
+        return message if isinstance(message, bytes) else message.encode("utf-8")
+
+    async def close(self) -> None:
+        await self._connection.close()
+
+
+async def connect_websocket(
+    info: BridgeInfo,
+    *,
+    timeout: float,
+    logger: logging.Logger | None = None,
+) -> WebSocketTransport:
+    connection = await connect(
+        info.ws_url,
+        open_timeout=timeout,
+        close_timeout=timeout,
+        ping_interval=20.0,
+        ping_timeout=20.0,
+        logger=logger,
+    )
+    return WebSocketTransport(connection)
+
+
+# Largest single line accepted from the bridge (typed API results can be large).
+LINE_LIMIT_BYTES = 16 * 1024 * 1024
+
+
+class LineTransport:
+    """`Transport` over newline-delimited JSON on a TCP or Unix domain socket stream (text frames only)."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+
+    async def send(self, data: bytes | str, *, binary: bool = False) -> None:
+        if binary:
+            raise ValueError("Line transport does not carry binary frames")
+        if self._writer.is_closing():
+            raise TransportClosed(reason="line transport closed", clean=True)
+        frame = data.encode("utf-8") if isinstance(data, str) else data
+        try:
+            self._writer.write(frame + b"\n")
+            await self._writer.drain()
+        except (ConnectionError, OSError) as error:
+            raise TransportClosed(reason=str(error)) from error
+
+    async def recv(self) -> bytes:
+        try:
+            line = await self._reader.readline()
+        except (ConnectionError, OSError, asyncio.LimitOverrunError, ValueError) as error:
+            raise TransportClosed(reason=str(error)) from error
+        if not line.endswith(b"\n"):
+            # EOF: the bridge closed the stream (a partial trailing line is discarded).
+            raise TransportClosed(reason="line transport closed by bridge", clean=self._writer.is_closing())
+        return line[:-1]
+
+    async def close(self) -> None:
+        if self._writer.is_closing():
+            return
+        self._writer.close()
+        with contextlib.suppress(Exception):
+            await self._writer.wait_closed()
+
+
+async def connect_line(
+    info: BridgeInfo,
+    *,
+    timeout: float,
+    logger: logging.Logger | None = None,
+) -> LineTransport:
+    """Open the bridge's newline-delimited listener, preferring its Unix domain socket when available."""
+    if info.unix_socket and hasattr(asyncio, "open_unix_connection") and os.path.exists(info.unix_socket):
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(info.unix_socket, limit=LINE_LIMIT_BYTES),
+                timeout=timeout,
+            )
+            return LineTransport(reader, writer)
+        except OSError:
+            if logger is not None:
+                logger.debug("Unix socket %s unavailable; using TCP", info.unix_socket, exc_info=True)
+    if info.tcp_port is None:
+        raise ConnectionError("Bridge does not advertise a line transport port")
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(info.host, info.tcp_port, limit=LINE_LIMIT_BYTES),
+        timeout=timeout,
+    )
+    return LineTransport(reader, writer)
+
+
+async def connect_bridge(
+    info: BridgeInfo,
+    *,
+    timeout: float,
+    logger: logging.Logger | None = None,
+) -> Transport:
+    """Default factory: the transport discovery selected, falling back to WebSocket if the line listener fails."""
+    if info.transport == LINE_TRANSPORT:
+        try:
+            return await connect_line(info, timeout=timeout, logger=logger)
+        except (OSError, asyncio.TimeoutError) as error:
+            if logger is not None:
+                logger.debug("Line transport unavailable (%s); falling back to WebSocket", error)
+    return await connect_websocket(info, timeout=timeout, logger=logger)
+
+
+_NAMED_FACTORIES: dict[str, TransportFactory] = {
+    "auto": connect_bridge,
+    "websocket": connect_websocket,
+    LINE_TRANSPORT: connect_line,
+}
+
+
+def resolve_transport_factory(transport: str | TransportFactory | None) -> TransportFactory:
+    """Map `Client(transport=...)` to a factory: `auto` (default), `websocket`, `ndjson`, or a factory callable."""
+    if transport is None:
+        return connect_bridge
+    if isinstance(transport, str):
+        factory = _NAMED_FACTORIES.get(transport)
+        if factory is None:
+            raise ValueError(f"transport must be one of {', '.join(_NAMED_FACTORIES)} or a transport factory")
+        return factory
+    return transport
+
+
+def _closed_from(error: ConnectionClosed) -> TransportClosed:
+    received = error.rcvd
+    code = received.code if received is not None else None
+    reason = received.reason if received is not None else ""
+    return TransportClosed(code, reason, clean=isinstance(error, ConnectionClosedOK))
+
+
+_CLOSE = object()
+
+
+class LoopbackTransport:
+    """One end of an in-memory frame pipe; see `loopback_pair()`."""
+
+    def __init__(self) -> None:
+        self._inbox: asyncio.Queue[Any] = asyncio.Queue()
+        self._peer: LoopbackTransport | None = None
+        self._closed = False
+
+    async def send(self, data: bytes | str, *, binary: bool = False) -> None:
+        peer = self._peer
+        if self._closed or peer is None or peer._closed:
+            raise TransportClosed(1000, "loopback closed", clean=True)
+        peer._inbox.put_nowait(data.encode("utf-8") if isinstance(data, str) else data)
+
+    async def recv(self) -> bytes:
+        if self._closed:
+            raise TransportClosed(1000, "loopback closed", clean=True)
+        message = await self._inbox.get()
+        if message is _CLOSE:
+            self._closed = True
+            raise TransportClosed(1000, "loopback closed", clean=True)
+        return message
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._inbox.put_nowait(_CLOSE)
+        if self._peer is not None and not self._peer._closed:
+            self._peer._inbox.put_nowait(_CLOSE)
+
+
+def loopback_pair() -> tuple[LoopbackTransport, LoopbackTransport]:
+    """Two connected in-memory transports; frames sent on one are received on the other."""
+    left = LoopbackTransport()
+    right = LoopbackTransport()
+    left._peer = right
+    right._peer = left
+    return left, right
+
+
+LoopbackHandler = Callable[[dict[str, Any], "LoopbackSession"], Any]
+
+
+class LoopbackSession:
+    """Bridge side of one loopback connection."""
+
+    def __init__(self, bridge: LoopbackBridge, transport: LoopbackTransport) -> None:
+        self.bridge = bridge
+        self.transport = transport
+        self.authenticated = False
+        self.requests: list[str] = []
+
+    async def send_event(self, event: str, data: dict[str, Any]) -> None:
+        await self._send({"type": "event", "event": event, "data": data, "ts": _now()})
+
+    async def close(self) -> None:
+        await self.transport.close()
+
+    async def _serve(self) -> None:
+        try:
+            while True:
+                message = await self.transport.recv()
+                request = self._decode(message)
+                await self._handle(request)
+        except TransportClosed:
+            pass
+        finally:
+            self.bridge._sessions.discard(self)
+
+    async def _handle(self, request: dict[str, Any]) -> None:
+        request_id = request.get("id")
+        method = str(request.get("method", ""))
+        params = request.get("params")
+        self.requests.append(method)
+        handler = self.bridge._handlers.get(method)
+        if handler is None:
+            await self._send_error(request_id, "METHOD_NOT_FOUND", f"Unknown method: {method}")
+            return
+        if not self.authenticated and method != "auth.login":
+            await self._send_error(request_id, "UNAUTHORIZED", "Authenticate with auth.login first")
+            return
+
+        try:
+            result = handler(params if isinstance(params, dict) else {}, self)
+            if inspect.isawaitable(result):
+                result = await result
+        except BridgeError as error:
+            await self._send_error(request_id, error.code, error.message, error.details)
+            return
+        except Exception as error:
+            # Like the real bridge, a handler bug fails this request instead of the whole session.
+            await self._send_error(
+                request_id,
+                "INTERNAL_ERROR",
+                "Internal request handling error",
+                {"cause_type": type(error).__name__, "cause_message": str(error)},
+            )
+            return
+        await self._send({"type": "response", "id": request_id, "ok": True, "result": result or {}})
+
+    async def _send_error(
+        self,
+        request_id: Any,
+        code: str,
+        message: str,
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        error: dict[str, Any] = {"code": code, "message": message}
+        if details:
+            error["data"] = details
+        await self._send({"type": "response", "id": request_id, "ok": False, "error": error})
+
+    async def _send(self, payload: dict[str, Any]) -> None:
+        with contextlib.suppress(TransportClosed):
+            await self.transport.send(self.bridge.codec.dumps(payload))
+
+    def _decode(self, message: bytes) -> dict[str, Any]:
+        # A CBOR map head byte is >= 0xA0; JSON text starts with an ASCII brace.
+        if message and message[0] >= 0x80:
+            return decode_binary_message(message)
+        return decode_message(message, self.bridge.codec)
+
+
+class LoopbackBridge:
+    """In-process bridge stub that a `Client` connects to without sockets or a handshake.
+
+    Pass it as `Client(transport=bridge)`. Handlers registered with `method()` receive the
+    request params and the `LoopbackSession`, and return the result object (or raise
+    `BridgeError` for an error response; any other exception becomes INTERNAL_ERROR).
+    `auth.login` and `ping` are built in. Frames use stdlib JSON unless `codec` picks another backend.
+    """
+
+    def __init__(
+        self,
+        *,
+        token: str = "loopback",
+        server_version: str = "loopback",
+        codec: str | JsonCodec | None = "json",
+    ) -> None:
+        self.token = token
+        self.server_version = server_version
+        self.codec = get_codec(codec)
+        self._handlers: dict[str, LoopbackHandler] = {
+            "auth.login": self._login,
+            "ping": lambda params, session: {"pong": True, "ts": _now()},
+        }
+        self._sessions: set[LoopbackSession] = set()
+        self._session_tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def bridge_info(self) -> BridgeInfo:
+        return BridgeInfo(
+            host="loopback",
+            port=0,
+            token=self.token,
+            ws_url="ws://loopback/ws",
+            transport="loopback",
+            protocol_version=2,
+            server_version=self.server_version,
+        )
+
+    @property
+    def sessions(self) -> frozenset[LoopbackSession]:
+        return frozenset(self._sessions)
+
+    def method(self, name: str, handler: LoopbackHandler | None = None) -> Any:
+        """Register `handler` for `name`; usable as `@bridge.method("status.get")`."""
+
+        def register(callback: LoopbackHandler) -> LoopbackHandler:
+            self._handlers[name] = callback
+            return callback
+
+        if handler is not None:
+            return register(handler)
+        return register
+
+    async def publish(self, event: str, data: dict[str, Any]) -> None:
+        """Send an event to every authenticated session."""
+        for session in list(self._sessions):
+            if session.authenticated:
+                await session.send_event(event, data)
+
+    async def close(self) -> None:
+        for session in list(self._sessions):
+            await session.close()
+        tasks = list(self._session_tasks)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __call__(
+        self,
+        info: BridgeInfo,
+        *,
+        timeout: float,
+        logger: logging.Logger | None = None,
+    ) -> LoopbackTransport:
+        client_end, bridge_end = loopback_pair()
+        session = LoopbackSession(self, bridge_end)
+        self._sessions.add(session)
+        task = asyncio.create_task(session._serve(), name="pyritone-loopback-session")
+        self._session_tasks.add(task)
+        task.add_done_callback(self._session_tasks.discard)
+        return client_end
+
+    def _login(self, params: dict[str, Any], session: LoopbackSession) -> dict[str, Any]:
+        if params.get("token") != self.token:
+            raise BridgeError("UNAUTHORIZED", "Invalid token")
+        session.authenticated = True
+        return {"protocol_version": 2, "server_version": self.server_version, "capabilities": []}
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import gc
+import struct
+import threading
+from array import array
 from typing import Any
 
 import pytest
 from websockets.asyncio.server import ServerConnection, serve
 
-from pyritone.client_async import AsyncPyritoneClient
-from pyritone.baritone import TypedTaskHandle
-from pyritone.models import BridgeError, RemoteRef, TypedCallError, VisibleEntity
-from pyritone.protocol import decode_message, encode_message
+from pyritone.client_async import AsyncPyritoneClient, ClientStateCache
+from pyritone.baritone import CachedWorldRef, CustomGoalProcessRef, GoalRef, TypedTaskHandle
+from pyritone.models import BridgeError, EventOverflowError, RemoteRef, RemoteRefExpiredError, TypedCallError, VisibleEntity
+from pyritone.protocol import (
+    JsonCodec,
+    decode_binary_message,
+    decode_message,
+    encode_binary_message,
+    encode_message,
+)
+from pyritone.transport import LoopbackBridge
 
 
 async def _start_server(handler):
@@ -146,6 +158,298 @@ async def test_wait_for_task_returns_terminal_event_for_matching_task_id():
         await server.wait_closed()
 
 
+@pytest.mark.asyncio
+async def test_concurrent_task_waiters_do_not_steal_each_others_events():
+    release_events = asyncio.Event()
+
+    async def handler(websocket: ServerConnection):
+        async for message in websocket:
+            request = decode_message(message)
+            if request.get("method") == "auth.login":
+                response = {
+                    "type": "response",
+                    "id": request["id"],
+                    "ok": True,
+                    "result": {"protocol_version": 2, "server_version": "test"},
+                }
+                await websocket.send(encode_message(response))
+                await release_events.wait()
+                for task_id, event_name in (("a", "task.progress"), ("b", "task.completed"), ("a", "task.completed")):
+                    await websocket.send(
+                        encode_message(
+                            {
+                                "type": "event",
+                                "event": event_name,
+                                "data": {"task_id": task_id},
+                                "ts": "2026-01-01T00:00:00Z",
+                            }
+                        )
+                    )
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        updates: list[str] = []
+        wait_a = asyncio.create_task(client.wait_for_task("a", on_update=lambda event: updates.append(event["event"])))
+        wait_a_again = asyncio.create_task(client.wait_for_task("a"))
+        wait_b = asyncio.create_task(client.wait_for_task("b"))
+        await asyncio.sleep(0)
+        release_events.set()
+
+        done_a, done_a_again, done_b = await asyncio.wait_for(asyncio.gather(wait_a, wait_a_again, wait_b), timeout=2.0)
+        assert done_a["event"] == done_a_again["event"] == "task.completed"
+        assert done_a["data"]["task_id"] == "a"
+        assert done_b["data"]["task_id"] == "b"
+        assert updates == ["task.progress"]
+
+        # The shared queue still holds every event for events()/next_event() consumers.
+        seen = [(await client.next_event(timeout=1.0))["event"] for _ in range(3)]
+        assert seen == ["task.progress", "task.completed", "task.completed"]
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_subscriptions_each_receive_the_full_matching_stream():
+    release_events = asyncio.Event()
+
+    async def handler(websocket: ServerConnection):
+        async for message in websocket:
+            request = decode_message(message)
+            if request.get("method") == "auth.login":
+                response = {
+                    "type": "response",
+                    "id": request["id"],
+                    "ok": True,
+                    "result": {"protocol_version": 2, "server_version": "test"},
+                }
+                await websocket.send(encode_message(response))
+                await release_events.wait()
+                for event_name in ("task.started", "status.update", "task.completed"):
+                    await websocket.send(
+                        encode_message(
+                            {"type": "event", "event": event_name, "data": {}, "ts": "2026-01-01T00:00:00Z"}
+                        )
+                    )
+                await websocket.close()
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        everything = client.subscribe()
+        tasks = client.subscribe("task.*")
+        status = client.subscribe("status.update")
+        release_events.set()
+
+        async def drain(subscription):
+            return [payload["event"] async for payload in subscription]
+
+        all_names, task_names, status_names = await asyncio.wait_for(
+            asyncio.gather(drain(everything), drain(tasks), drain(status)),
+            timeout=2.0,
+        )
+        assert all_names == ["task.started", "status.update", "task.completed"]
+        assert task_names == ["task.started", "task.completed"]
+        assert status_names == ["status.update"]
+        assert everything.stats == {"delivered": 3, "dropped": 0, "lag": 0, "max_lag": everything.max_lag, "maxsize": 1024}
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_subscription_overflow_policies():
+    client = AsyncPyritoneClient(ws_url="ws://127.0.0.1:1/ws", token="token")
+    events = [{"type": "event", "event": "task.progress", "data": {"n": n}} for n in range(3)]
+
+    drop_oldest = client.subscribe("task.progress", maxsize=2)
+    failing = client.subscribe("task.*", maxsize=2, overflow="error")
+    blocking = client.subscribe("*", maxsize=2, overflow="block")
+
+    for payload in events[:2]:
+        await client._dispatch_event(payload)  # noqa: SLF001
+    blocked_dispatch = asyncio.create_task(client._dispatch_event(events[2]))  # noqa: SLF001
+    await asyncio.sleep(0)
+    assert not blocked_dispatch.done()
+    assert blocking.lag == 2
+
+    assert (await blocking.__anext__())["data"] == {"n": 0}
+    await asyncio.wait_for(blocked_dispatch, timeout=1.0)
+    assert [(await blocking.__anext__())["data"]["n"] for _ in range(2)] == [1, 2]
+
+    assert [(await drop_oldest.__anext__())["data"]["n"] for _ in range(2)] == [1, 2]
+    assert drop_oldest.stats["dropped"] == 1
+
+    assert [(await failing.__anext__())["data"]["n"] for _ in range(2)] == [0, 1]
+    with pytest.raises(EventOverflowError):
+        await failing.__anext__()
+    assert failing.closed
+
+    with pytest.raises(ValueError, match="overflow"):
+        client.subscribe("*", overflow="wait")
+
+
+@pytest.mark.asyncio
+async def test_event_buffer_drops_oldest_beyond_cap():
+    client = AsyncPyritoneClient(ws_url="ws://127.0.0.1:1/ws", token="token", event_buffer_size=2)
+
+    for n in range(5):
+        await client._dispatch_event({"type": "event", "event": "status.update", "data": {"n": n}})  # noqa: SLF001
+
+    assert client.event_buffer_stats == {"buffered": 2, "dropped": 3, "maxsize": 2}
+    assert [(await client.next_event(timeout=1.0))["data"]["n"] for _ in range(2)] == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_event_buffer_disabled_only_feeds_waiting_consumers():
+    client = AsyncPyritoneClient(ws_url="ws://127.0.0.1:1/ws", token="token", event_buffer_size=0)
+    first = {"type": "event", "event": "status.update", "data": {"n": 1}}
+    second = {"type": "event", "event": "status.update", "data": {"n": 2}}
+
+    await client._dispatch_event(first)  # noqa: SLF001
+    assert client.event_buffer_stats["buffered"] == 0
+
+    pending = asyncio.create_task(client.next_event(timeout=1.0))
+    await asyncio.sleep(0)
+    await client._dispatch_event(second)  # noqa: SLF001
+    assert await pending is second
+    assert client.event_buffer_stats == {"buffered": 0, "dropped": 0, "maxsize": 0}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_indexes_waiters_by_task_id_and_cleans_up_timeouts():
+    client = AsyncPyritoneClient(ws_url="ws://127.0.0.1:1/ws", token="token")
+    client._closed = False  # noqa: SLF001
+    client._transport = object()  # noqa: SLF001
+    checked: list[str] = []
+
+    def check(payload):
+        checked.append(payload["data"]["task_id"])
+        return True
+
+    target = asyncio.create_task(client.wait_for("task.completed", check=check, task_id="b"))
+    expiring = [asyncio.create_task(client.wait_for("task.failed", timeout=0.01)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert len(client._event_waiters) == 4  # noqa: SLF001
+
+    await client._dispatch_event({"type": "event", "event": "task.completed", "data": {"task_id": "a"}})  # noqa: SLF001
+    await client._dispatch_event({"type": "event", "event": "task.completed", "data": {"task_id": "b"}})  # noqa: SLF001
+    assert (await target)["data"]["task_id"] == "b"
+    assert checked == ["b"]
+
+    for waiter in expiring:
+        with pytest.raises(asyncio.TimeoutError):
+            await waiter
+    assert len(client._event_waiters) == 0  # noqa: SLF001
+    client._closed = True  # noqa: SLF001
+    client._transport = None  # noqa: SLF001
+
+
+def test_state_cache_snapshots_are_immutable_and_structurally_shared():
+    state = ClientStateCache()
+    assert state.version == 0
+    status = {
+        "in_world": True,
+        "player": {"uuid": "u1", "name": "Steve", "self": True},
+        "watch_patterns": ["diamond"],
+        "active_task": None,
+    }
+
+    state._replace(status, ts="t1")  # noqa: SLF001
+    first = state.snapshot
+    assert state.version == 1
+    assert first["watch_patterns"] == ("diamond",)
+    with pytest.raises(TypeError):
+        first["in_world"] = False  # type: ignore[index]
+    status["player"]["name"] = "mutated"
+    assert first["player"]["name"] == "Steve"
+
+    # An identical heartbeat keeps the same snapshot object and version.
+    heartbeat = {
+        "in_world": True,
+        "player": {"uuid": "u1", "name": "Steve", "self": True},
+        "watch_patterns": ["diamond"],
+        "active_task": None,
+    }
+    state._replace(heartbeat, ts="t2")  # noqa: SLF001
+    assert state.snapshot is first
+    assert state.version == 1
+    assert state.updated_at == "t2"
+
+    state._merge_active_task({"task_id": "task-1", "state": "RUNNING"})  # noqa: SLF001
+    second = state.snapshot
+    assert state.version == 2
+    assert second["player"] is first["player"]
+    assert state.task_id == "task-1"
+    assert first["active_task"] is None
+
+    state._clear_active_task("other-task")  # noqa: SLF001
+    assert state.version == 2
+    state._clear_active_task("task-1")  # noqa: SLF001
+    assert state.version == 3
+    assert state.active_task is None
+
+    thawed = state.to_dict()
+    thawed["player"]["name"] = "Alex"
+    assert thawed["watch_patterns"] == ["diamond"]
+    assert state.snapshot["player"]["name"] == "Steve"
+
+
+@pytest.mark.asyncio
+async def test_listener_modes_keep_order_off_the_receive_loop():
+    client = AsyncPyritoneClient(ws_url="ws://127.0.0.1:1/ws", token="token")
+    threaded: list[int] = []
+    tasked: list[int] = []
+    gate = threading.Event()
+
+    def slow_sync(payload):
+        gate.wait(timeout=2.0)
+        threaded.append(payload["data"]["n"])
+
+    async def async_callback(payload):
+        await asyncio.sleep(0)
+        tasked.append(payload["data"]["n"])
+
+    client.on("task.progress", slow_sync, mode="thread", max_queue=2)
+    client.on("task.progress", async_callback, mode="task")
+    try:
+        for n in range(4):
+            await client._dispatch_event({"type": "event", "event": "task.progress", "data": {"n": n}})  # noqa: SLF001
+            if n == 0:
+                # Let the thread worker pick up event 0 so it is in flight rather than queued.
+                await asyncio.sleep(0.05)
+        # Dispatch returned while the threaded callback is still blocked on the gate.
+        assert threaded == []
+        gate.set()
+
+        for _ in range(200):
+            if len(threaded) == 3 and len(tasked) == 4:
+                break
+            await asyncio.sleep(0.01)
+        # Event 0 was in flight; 1 was dropped when 3 arrived with a backlog of two.
+        assert threaded == [0, 2, 3]
+        assert tasked == [0, 1, 2, 3]
+
+        stats = {item["callback"]: item for item in client.listener_stats}
+        slow_stats = stats[slow_sync.__qualname__]
+        assert slow_stats["mode"] == "thread"
+        assert slow_stats["calls"] == 3
+        assert slow_stats["dropped"] == 1
+        assert slow_stats["max_ms"] >= slow_stats["avg_ms"] > 0
+        assert stats[async_callback.__qualname__]["calls"] == 4
+    finally:
+        gate.set()
+        await client.close()
+
+    with pytest.raises(TypeError):
+        client.on("task.progress", async_callback, mode="thread")
+
+
 @pytest.mark.asyncio
 async def test_wait_for_task_on_update_receives_non_terminal_matching_events():
     async def handler(websocket: ServerConnection):
@@ -1692,6 +1996,109 @@ async def test_status_subscribe_and_unsubscribe_updates_state_cache():
         await server.wait_closed()
 
 
+@pytest.mark.asyncio
+async def test_status_field_projection_merges_into_state_cache():
+    observed_params: list[dict[str, Any]] = []
+
+    async def handler(websocket: ServerConnection):
+        async for message in websocket:
+            request = decode_message(message)
+            method = request.get("method")
+            if method == "auth.login":
+                result: dict[str, Any] = {"protocol_version": 2, "server_version": "test"}
+            elif method == "status.get":
+                result = {"in_world": True, "baritone_available": True, "active_task": None}
+            elif method == "status.subscribe":
+                observed_params.append(request.get("params"))
+                result = {
+                    "subscribed": True,
+                    "heartbeat_interval_ms": 1000,
+                    "min_interval_ms": 250,
+                    "fields": ["active_task"],
+                    "delta": False,
+                    "seq": 0,
+                    "status": {"active_task": {"task_id": "task-1", "state": "RUNNING"}},
+                }
+            else:
+                result = {}
+            await websocket.send(encode_message({"type": "response", "id": request["id"], "ok": True, "result": result}))
+            if method == "ping":
+                await websocket.send(
+                    encode_message(
+                        {
+                            "type": "event",
+                            "event": "status.update",
+                            "data": {"reason": "change", "seq": 1, "status": {"active_task": None}},
+                            "ts": "2026-01-01T00:00:03Z",
+                        }
+                    )
+                )
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        await client.status_get()
+
+        subscribed = await client.status_subscribe(fields=["active_task"], heartbeat_ms=1000, min_interval_ms=250)
+        assert subscribed["fields"] == ["active_task"]
+        assert observed_params == [{"fields": ["active_task"], "heartbeat_ms": 1000, "min_interval_ms": 250}]
+        assert client.state.snapshot["in_world"] is True
+        assert client.task.id == "task-1"
+
+        update = asyncio.create_task(client.wait_for("status.update", timeout=1.0))
+        await client.ping()
+        await update
+        assert client.state.snapshot["active_task"] is None
+        assert client.state.snapshot["baritone_available"] is True
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_rejected_projection_and_unsubscribe_leave_full_status_updates():
+    bridge = LoopbackBridge()
+
+    @bridge.method("status.get")
+    def status_get(params, session):
+        return {"in_world": True, "baritone_available": True, "active_task": None}
+
+    @bridge.method("status.subscribe")
+    def status_subscribe(params, session):
+        if "bogus" in params.get("fields", []):
+            raise BridgeError("BAD_REQUEST", "Unknown status field: bogus")
+        return {"subscribed": True, "status": {"active_task": None}}
+
+    @bridge.method("status.unsubscribe")
+    def status_unsubscribe(params, session):
+        return {"subscribed": False}
+
+    client = AsyncPyritoneClient(transport=bridge)
+    try:
+        await client.connect()
+        await client.status_get()
+
+        with pytest.raises(BridgeError):
+            await client.status_subscribe(fields=["bogus"])
+        assert client._status_fields is None  # noqa: SLF001
+        assert client._status_options == {}  # noqa: SLF001
+
+        await client.status_subscribe(fields=["active_task"])
+        assert client._status_fields == ("active_task",)  # noqa: SLF001
+        await client.status_unsubscribe()
+
+        update = asyncio.create_task(client.wait_for("status.update", timeout=1.0))
+        await asyncio.sleep(0)
+        await bridge.publish("status.update", {"reason": "change", "seq": 1, "status": {"in_world": False}})
+        await update
+        assert client.state.snapshot == {"in_world": False}
+    finally:
+        await client.close()
+        await bridge.close()
+
+
 @pytest.mark.asyncio
 async def test_task_wait_uses_cached_state_task_id_and_clears_on_terminal():
     async def handler(websocket: ServerConnection):
@@ -2006,63 +2413,65 @@ async def test_api_invoke_uses_root_target_and_parameter_types():
 
 
 @pytest.mark.asyncio
-async def test_api_error_raises_typed_call_error_with_details():
+async def test_packed_arrays_are_negotiated_at_login_and_decoded():
+    observed_logins: list[dict[str, Any]] = []
+    observed_invokes: list[dict[str, Any]] = []
+    packed = base64.b64encode(struct.pack("<3i", 1, -2, 300)).decode("ascii")
+
     async def handler(websocket: ServerConnection):
         async for message in websocket:
             request = decode_message(message)
             method = request.get("method")
 
             if method == "auth.login":
+                observed_logins.append(request["params"])
                 await websocket.send(
                     encode_message(
                         {
                             "type": "response",
                             "id": request["id"],
                             "ok": True,
-                            "result": {"protocol_version": 2, "server_version": "test"},
+                            "result": {
+                                "protocol_version": 2,
+                                "server_version": "test",
+                                "capabilities": ["packed_arrays"],
+                            },
                         }
                     )
                 )
                 continue
 
             if method == "api.invoke":
+                observed_invokes.append(request["params"])
                 await websocket.send(
                     encode_message(
                         {
                             "type": "response",
                             "id": request["id"],
-                            "ok": False,
-                            "error": {
-                                "code": "API_ARGUMENT_COERCION_FAILED",
-                                "message": "Bad arg",
-                                "data": {"arg_index": 0, "expected_type": "int"},
+                            "ok": True,
+                            "result": {
+                                "value": {"$pyritone_array": "i32", "b64": packed},
+                                "return_type": "int[]",
                             },
                         }
                     )
                 )
                 continue
 
-            await websocket.send(
-                encode_message(
-                    {
-                        "type": "response",
-                        "id": request["id"],
-                        "ok": False,
-                        "error": {"code": "METHOD_NOT_FOUND", "message": "Unknown"},
-                    }
-                )
-            )
-
     server, ws_url = await _start_server(handler)
-    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token", packed_arrays=True)
     try:
         await client.connect()
-        with pytest.raises(TypedCallError) as error:
-            await client.api_invoke("baritone", "plus", "oops")
+        assert observed_logins[0]["capabilities"] == ["packed_arrays"]
+        assert client.capabilities == frozenset({"packed_arrays"})
 
-        assert error.value.code == "API_ARGUMENT_COERCION_FAILED"
-        assert error.value.details["arg_index"] == 0
-        assert error.value.details["expected_type"] == "int"
+        counts = await client.api_invoke("baritone", "counts")
+        assert isinstance(counts, array)
+        assert counts.typecode == "i"
+        assert list(counts) == [1, -2, 300]
+
+        await client.api_invoke("baritone", "store", counts, memoryview(counts))
+        assert observed_invokes[-1]["args"] == [[1, -2, 300], [1, -2, 300]]
     finally:
         await client.close()
         server.close()
@@ -2070,11 +2479,14 @@ async def test_api_error_raises_typed_call_error_with_details():
 
 
 @pytest.mark.asyncio
-async def test_wait_for_timeout():
+async def test_packed_arrays_are_off_by_default():
+    observed_logins: list[dict[str, Any]] = []
+
     async def handler(websocket: ServerConnection):
         async for message in websocket:
             request = decode_message(message)
             if request.get("method") == "auth.login":
+                observed_logins.append(request["params"])
                 await websocket.send(
                     encode_message(
                         {
@@ -2090,21 +2502,850 @@ async def test_wait_for_timeout():
     client = AsyncPyritoneClient(ws_url=ws_url, token="token")
     try:
         await client.connect()
+        assert "capabilities" not in observed_logins[0]
+        assert client.capabilities == frozenset()
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_events_subscribe_keeps_client_interest_and_widens_on_registration():
+    observed_filters: list[dict[str, Any]] = []
+
+    async def handler(websocket: ServerConnection):
+        async for message in websocket:
+            request = decode_message(message)
+            method = request.get("method")
+            if method == "auth.login":
+                result: dict[str, Any] = {"protocol_version": 2, "server_version": "test"}
+            elif method == "events.subscribe":
+                observed_filters.append(request["params"])
+                result = request["params"]
+            else:
+                continue
+            await websocket.send(encode_message({"type": "response", "id": request["id"], "ok": True, "result": result}))
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        client.on("minecraft.chat_message", lambda payload: None)
+        assert client.event_filter is None
+        assert observed_filters == []
+
+        await client.events_subscribe(include=["task.*"], exclude=["minecraft.*", "task.progress"])
+        first = observed_filters[-1]
+        assert first["include"][0] == "task.*"
+        assert "bridge.pause_state" in first["include"]
+        assert "minecraft.chat_message" in first["include"]
+        # `minecraft.*` would block the registered chat listener; `task.progress` only narrows `task.*`.
+        assert first["exclude"] == ["task.progress"]
+
+        client.on("minecraft.player_join", lambda payload: None)
+        client.on("task.completed", lambda payload: None)
+        for _ in range(100):
+            if len(observed_filters) == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert observed_filters[-1]["include"][-1] == "minecraft.player_join"
+
         with pytest.raises(TimeoutError):
-            await client.wait_for("task.completed", timeout=0.05)
+            await client.wait_for("task.progress", timeout=0.05)
+        assert observed_filters[-1]["exclude"] == []
+        assert client.event_filter == observed_filters[-1]
     finally:
         await client.close()
         server.close()
         await server.wait_closed()
 
+    assert client.event_filter is None
+
 
 @pytest.mark.asyncio
-async def test_baritone_custom_goal_set_goal_and_path_waits_by_default():
-    observed_invokes: list[dict[str, Any]] = []
-    is_pathing_calls = 0
+async def test_wait_for_matches_events_during_filter_push_and_bounds_it_by_timeout():
+    bridge = LoopbackBridge()
+    release_subscribe = asyncio.Event()
+    subscribe_calls = 0
+
+    @bridge.method("events.subscribe")
+    async def events_subscribe(params, session):
+        nonlocal subscribe_calls
+        subscribe_calls += 1
+        if subscribe_calls > 1:
+            await release_subscribe.wait()
+        return {"include": params.get("include"), "exclude": params.get("exclude")}
+
+    client = AsyncPyritoneClient(transport=bridge)
+    try:
+        await client.connect()
+        await client.events_subscribe(include=["task.*"])
+
+        chat = asyncio.create_task(client.wait_for("minecraft.chat_message", timeout=1.0))
+        for _ in range(100):
+            if subscribe_calls == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert subscribe_calls == 2
+        await bridge.publish("minecraft.chat_message", {"message": "hi"})
+        event = await asyncio.wait_for(chat, timeout=0.5)
+        assert event["data"]["message"] == "hi"
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with pytest.raises(TimeoutError):
+            await client.wait_for("bridge.pause_state", timeout=0.05)
+        assert loop.time() - started < 0.5
+        assert "bridge.pause_state" in client.event_filter["include"]
+    finally:
+        release_subscribe.set()
+        await client.close()
+        await bridge.close()
+
+
+@pytest.mark.asyncio
+async def test_delta_status_updates_apply_and_resync_on_gap():
+    subscribe_params: list[dict[str, Any]] = []
+    base_status = {
+        "in_world": True,
+        "player": {"uuid": "u1", "name": "Steve", "self": True},
+        "watch_patterns": ["diamond"],
+        "active_task": None,
+    }
+
+    def _delta(seq: int, base_seq: int, changed: dict[str, Any], **extra: Any) -> str:
+        data = {"reason": "change", "seq": seq, "base_seq": base_seq, "delta": True, "changed": changed, **extra}
+        return encode_message({"type": "event", "event": "status.update", "data": data, "ts": f"t{seq}"})
 
     async def handler(websocket: ServerConnection):
-        nonlocal is_pathing_calls
+        async for message in websocket:
+            request = decode_message(message)
+            method = request.get("method")
+            if method == "auth.login":
+                result: dict[str, Any] = {"protocol_version": 2, "server_version": "test"}
+            elif method == "status.subscribe":
+                subscribe_params.append(request["params"])
+                seq = 3 if len(subscribe_params) == 1 else 10
+                status = dict(base_status, in_world=len(subscribe_params) == 1)
+                result = {"subscribed": True, "delta": True, "seq": seq, "status": status}
+            else:
+                continue
+            await websocket.send(encode_message({"type": "response", "id": request["id"], "ok": True, "result": result}))
+            if method == "status.subscribe" and len(subscribe_params) == 1:
+                await websocket.send(_delta(4, 3, {"active_task": {"task_id": "task-1", "state": "RUNNING"}}))
+                await websocket.send(_delta(5, 4, {}, removed=["watch_patterns"]))
+                # seq 6..7 never arrive.
+                await websocket.send(_delta(8, 7, {"in_world": False}))
+            elif method == "status.subscribe":
+                # Sent before the resync baseline; must be ignored rather than trigger another resync.
+                await websocket.send(_delta(9, 8, {"in_world": True}))
+                await websocket.send(_delta(11, 10, {"active_task": None}))
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        await client.status_subscribe(delta=True)
+        assert subscribe_params[0] == {"delta": True}
+
+        for _ in range(100):
+            if client.state.updated_at == "t11":
+                break
+            await asyncio.sleep(0.01)
+
+        assert len(subscribe_params) == 2
+        snapshot = client.state.snapshot
+        assert snapshot["in_world"] is False
+        assert snapshot["active_task"] is None
+        assert snapshot["watch_patterns"] == ("diamond",)
+        assert snapshot["player"]["name"] == "Steve"
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_cbor_wire_format_switches_to_binary_frames_after_login():
+    observed_frames: list[tuple[str, dict[str, Any]]] = []
+
+    async def handler(websocket: ServerConnection):
+        binary = False
+        async for message in websocket:
+            if isinstance(message, bytes):
+                request = decode_binary_message(message)
+                observed_frames.append(("binary", request))
+            else:
+                request = decode_message(message)
+                observed_frames.append(("text", request))
+
+            if request.get("method") == "auth.login":
+                binary = "cbor" in request["params"].get("capabilities", [])
+                result = {"protocol_version": 2, "server_version": "test", "capabilities": ["cbor"]}
+            else:
+                result = {"pong": True}
+            response = {"type": "response", "id": request["id"], "ok": True, "result": result}
+            await websocket.send(encode_binary_message(response) if binary else encode_message(response))
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token", packed_arrays=False, wire_format="cbor")
+    try:
+        await client.connect()
+        assert client.wire_format == "cbor"
+        assert await client.ping() == {"pong": True}
+
+        assert [kind for kind, _ in observed_frames] == ["text", "binary"]
+        assert observed_frames[0][1]["params"]["capabilities"] == ["cbor"]
+        assert observed_frames[1][1]["method"] == "ping"
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+def test_client_accepts_codec_name_or_instance():
+    assert AsyncPyritoneClient(ws_url="ws://127.0.0.1:1/ws", token="token", codec="json").codec.name == "json"
+
+    codec = JsonCodec()
+    assert AsyncPyritoneClient(ws_url="ws://127.0.0.1:1/ws", token="token", codec=codec).codec is codec
+
+
+def test_unknown_wire_format_is_rejected():
+    with pytest.raises(ValueError, match="wire_format"):
+        AsyncPyritoneClient(ws_url="ws://127.0.0.1:1/ws", token="token", wire_format="xml")
+
+
+@pytest.mark.asyncio
+async def test_api_error_raises_typed_call_error_with_details():
+    async def handler(websocket: ServerConnection):
+        async for message in websocket:
+            request = decode_message(message)
+            method = request.get("method")
+
+            if method == "auth.login":
+                await websocket.send(
+                    encode_message(
+                        {
+                            "type": "response",
+                            "id": request["id"],
+                            "ok": True,
+                            "result": {"protocol_version": 2, "server_version": "test"},
+                        }
+                    )
+                )
+                continue
+
+            if method == "api.invoke":
+                await websocket.send(
+                    encode_message(
+                        {
+                            "type": "response",
+                            "id": request["id"],
+                            "ok": False,
+                            "error": {
+                                "code": "API_ARGUMENT_COERCION_FAILED",
+                                "message": "Bad arg",
+                                "data": {"arg_index": 0, "expected_type": "int"},
+                            },
+                        }
+                    )
+                )
+                continue
+
+            await websocket.send(
+                encode_message(
+                    {
+                        "type": "response",
+                        "id": request["id"],
+                        "ok": False,
+                        "error": {"code": "METHOD_NOT_FOUND", "message": "Unknown"},
+                    }
+                )
+            )
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        with pytest.raises(TypedCallError) as error:
+            await client.api_invoke("baritone", "plus", "oops")
+
+        assert error.value.code == "API_ARGUMENT_COERCION_FAILED"
+        assert error.value.details["arg_index"] == 0
+        assert error.value.details["expected_type"] == "int"
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_api_release_and_expired_ref_error():
+    released_ids: list[list[str]] = []
+
+    async def handler(websocket: ServerConnection):
+        async for message in websocket:
+            request = decode_message(message)
+            method = request.get("method")
+
+            if method == "auth.login":
+                await websocket.send(
+                    encode_message(
+                        {
+                            "type": "response",
+                            "id": request["id"],
+                            "ok": True,
+                            "result": {"protocol_version": 2, "server_version": "test"},
+                        }
+                    )
+                )
+                continue
+
+            if method == "api.release":
+                released_ids.append(request["params"]["ids"])
+                await websocket.send(
+                    encode_message(
+                        {
+                            "type": "response",
+                            "id": request["id"],
+                            "ok": True,
+                            "result": {"released": 1, "live": 0},
+                        }
+                    )
+                )
+                continue
+
+            if method == "api.invoke":
+                await websocket.send(
+                    encode_message(
+                        {
+                            "type": "response",
+                            "id": request["id"],
+                            "ok": False,
+                            "error": {
+                                "code": "REF_EXPIRED",
+                                "message": "Remote reference expired or was released: ref-1",
+                                "data": {"reference_id": "ref-1"},
+                            },
+                        }
+                    )
+                )
+                continue
+
+            await websocket.send(
+                encode_message(
+                    {
+                        "type": "response",
+                        "id": request["id"],
+                        "ok": False,
+                        "error": {"code": "METHOD_NOT_FOUND", "message": "Unknown"},
+                    }
+                )
+            )
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        assert await client.api_release() == 0
+        assert await client.api_release(RemoteRef("ref-1"), "ref-2") == 1
+        assert released_ids == [["ref-1", "ref-2"]]
+
+        with pytest.raises(RemoteRefExpiredError) as error:
+            await client.api_invoke(RemoteRef("ref-1"), "add", 1)
+        assert isinstance(error.value, TypedCallError)
+        assert error.value.details["reference_id"] == "ref-1"
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+async def _ref_release_handler(websocket: ServerConnection, released_ids: list[list[str]]) -> None:
+    ref_counter = 0
+    async for message in websocket:
+        request = decode_message(message)
+        method = request.get("method")
+        result: dict[str, Any] | None = None
+
+        if method == "auth.login":
+            result = {"protocol_version": 2, "server_version": "test"}
+        elif method == "api.construct":
+            ref_counter += 1
+            result = {"value": {"$pyritone_ref": f"ref-{ref_counter}", "java_type": "demo.Box"}, "java_type": "demo.Box"}
+        elif method == "api.release":
+            released_ids.append(request["params"]["ids"])
+            result = {"released": len(request["params"]["ids"]), "live": 0}
+
+        if result is None:
+            await websocket.send(
+                encode_message(
+                    {
+                        "type": "response",
+                        "id": request["id"],
+                        "ok": False,
+                        "error": {"code": "METHOD_NOT_FOUND", "message": "Unknown"},
+                    }
+                )
+            )
+            continue
+        await websocket.send(encode_message({"type": "response", "id": request["id"], "ok": True, "result": result}))
+
+
+@pytest.mark.asyncio
+async def test_ref_scope_releases_refs_decoded_inside_scope():
+    released_ids: list[list[str]] = []
+
+    async def handler(websocket: ServerConnection):
+        await _ref_release_handler(websocket, released_ids)
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        outside = await client.api_construct("demo.Box", 1)
+        async with client.ref_scope() as scope:
+            first = await client.api_construct("demo.Box", 2)
+            kept = await client.api_construct("demo.Box", 3)
+            async with client.ref_scope() as inner:
+                nested = await client.api_construct("demo.Box", 4)
+                inner.keep(nested)
+            scope.keep(kept)
+            assert scope.refs == (first, nested)
+
+        assert outside == RemoteRef("ref-1", "demo.Box")
+        assert released_ids == [["ref-2", "ref-4"]]
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_release_collected_refs_flushes_unreachable_refs_in_background():
+    released_ids: list[list[str]] = []
+
+    async def handler(websocket: ServerConnection):
+        await _ref_release_handler(websocket, released_ids)
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token", release_collected_refs=True)
+    try:
+        await client.connect()
+        kept = await client.api_construct("demo.Box", 1)
+        dropped = await client.api_construct("demo.Box", 2)
+        assert dropped == RemoteRef("ref-2", "demo.Box")
+
+        del dropped
+        gc.collect()
+        for _ in range(50):
+            if released_ids:
+                break
+            await asyncio.sleep(0.01)
+
+        assert released_ids == [["ref-2"]]
+        assert kept.ref_id == "ref-1"
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+@pytest.mark.asyncio
+async def test_baritone_root_accessors_are_memoized_until_world_changes():
+    invoked_methods: list[str] = []
+    pushed_events = [
+        {"event": "status.update", "data": {"status": {"in_world": True}}},
+        {"event": "minecraft.player_respawn", "data": {}},
+        {"event": "status.update", "data": {"status": {"in_world": False}}},
+    ]
+
+    async def handler(websocket: ServerConnection):
+        async for message in websocket:
+            request = decode_message(message)
+            method = request.get("method")
+            result: dict[str, Any] | None = None
+
+            if method == "auth.login":
+                result = {"protocol_version": 2, "server_version": "test"}
+            elif method == "ping":
+                event = pushed_events.pop(0)
+                await websocket.send(encode_message({"type": "event", "ts": "2026-01-01T00:00:00Z", **event}))
+                result = {"pong": True}
+            elif method == "api.invoke":
+                invoked_methods.append(request["params"]["method"])
+                result = {
+                    "value": {
+                        "$pyritone_ref": f"ref-{len(invoked_methods)}",
+                        "java_type": "baritone.api.behavior.IPathingBehavior",
+                    },
+                    "return_type": "baritone.api.behavior.IPathingBehavior",
+                }
+
+            assert result is not None
+            await websocket.send(encode_message({"type": "response", "id": request["id"], "ok": True, "result": result}))
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        first = await client.baritone.pathing_behavior()
+        second = await client.baritone.pathing_behavior()
+        assert first is second
+        assert invoked_methods == ["getPathingBehavior"]
+
+        await client.ping()
+        assert (await client.baritone.pathing_behavior()) is first
+
+        await client.ping()
+        respawned = await client.baritone.pathing_behavior()
+        assert respawned.ref.ref_id == "ref-2"
+
+        await client.ping()
+        left_world = await client.baritone.pathing_behavior()
+        assert left_world.ref.ref_id == "ref-3"
+
+        assert client.baritone.accessor_cache_stats == {"hits": 2, "misses": 3, "invalidations": 2, "size": 1}
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+@pytest.mark.asyncio
+async def test_baritone_cached_accessor_refetches_expired_ref_once():
+    bridge = LoopbackBridge()
+    invoked: list[tuple[Any, str]] = []
+    evicted = {"ref-1"}
+
+    @bridge.method("api.invoke")
+    def api_invoke(params, session):
+        target = params["target"]
+        invoked.append((target.get("id", target.get("name")), params["method"]))
+        if params["method"] == "getPathingBehavior":
+            ref_id = f"ref-{sum(1 for _, method in invoked if method == 'getPathingBehavior')}"
+            return {"value": {"$pyritone_ref": ref_id, "java_type": "baritone.api.behavior.IPathingBehavior"}}
+        if target.get("id") in evicted:
+            raise BridgeError("REF_EXPIRED", "Reference expired", details={"reference_id": target["id"]})
+        return {"value": True}
+
+    client = AsyncPyritoneClient(transport=bridge)
+    try:
+        await client.connect()
+        behavior = await client.baritone.pathing_behavior()
+        assert await behavior.is_pathing() is True
+        assert behavior.ref.ref_id == "ref-2"
+        assert invoked == [
+            ("baritone", "getPathingBehavior"),
+            ("ref-1", "isPathing"),
+            ("baritone", "getPathingBehavior"),
+            ("ref-2", "isPathing"),
+        ]
+        assert (await client.baritone.pathing_behavior()).ref.ref_id == "ref-2"
+
+        evicted.update({"ref-2", "ref-3"})
+        with pytest.raises(RemoteRefExpiredError):
+            await behavior.is_pathing()
+        assert invoked[-2:] == [("baritone", "getPathingBehavior"), ("ref-3", "isPathing")]
+    finally:
+        await client.close()
+        await bridge.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_sends_one_request_and_resolves_each_call():
+    batch_requests: list[dict[str, Any]] = []
+
+    async def handler(websocket: ServerConnection):
+        async for message in websocket:
+            request = decode_message(message)
+            method = request.get("method")
+
+            if method == "auth.login":
+                await websocket.send(
+                    encode_message(
+                        {
+                            "type": "response",
+                            "id": request["id"],
+                            "ok": True,
+                            "result": {"protocol_version": 2, "server_version": "test"},
+                        }
+                    )
+                )
+                continue
+
+            if method == "api.batch":
+                batch_requests.append(request["params"])
+                await websocket.send(
+                    encode_message(
+                        {
+                            "type": "response",
+                            "id": request["id"],
+                            "ok": True,
+                            "result": {
+                                "results": [
+                                    {"ok": True, "result": {"value": 5}},
+                                    {
+                                        "ok": True,
+                                        "result": {
+                                            "value": {"$pyritone_ref": "ref-1", "java_type": "demo.Box"}
+                                        },
+                                    },
+                                    {
+                                        "ok": False,
+                                        "error": {
+                                            "code": "API_METHOD_NOT_FOUND",
+                                            "message": "No method",
+                                            "data": {"method": "missing"},
+                                        },
+                                    },
+                                ]
+                            },
+                        }
+                    )
+                )
+                continue
+
+            await websocket.send(
+                encode_message(
+                    {
+                        "type": "response",
+                        "id": request["id"],
+                        "ok": False,
+                        "error": {"code": "METHOD_NOT_FOUND", "message": "Unknown"},
+                    }
+                )
+            )
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        async with client.batch() as batch:
+            plus = batch.invoke("baritone", "plus", 2, 3, parameter_types=["int", "int"])
+            box = batch.construct("demo.Box", 1)
+            missing = batch.invoke(RemoteRef("ref-0"), "missing")
+            assert len(batch) == 3
+            assert not plus.done
+
+        assert len(batch_requests) == 1
+        calls = batch_requests[0]["calls"]
+        assert [call["method"] for call in calls] == ["api.invoke", "api.construct", "api.invoke"]
+        assert calls[0]["params"] == {
+            "target": {"kind": "root", "name": "baritone"},
+            "method": "plus",
+            "args": [2, 3],
+            "parameter_types": ["int", "int"],
+        }
+        assert calls[2]["params"]["target"] == {"kind": "ref", "id": "ref-0"}
+
+        assert plus.result() == 5
+        assert box.result() == RemoteRef("ref-1", "demo.Box")
+        assert not missing.ok
+        with pytest.raises(TypedCallError) as error:
+            missing.result()
+        assert error.value.code == "API_METHOD_NOT_FOUND"
+        assert error.value.details["method"] == "missing"
+
+        with pytest.raises(RuntimeError):
+            await batch.send()
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_baritone_pipeline_records_wrapper_chain_in_one_request():
+    pipeline_requests: list[dict[str, Any]] = []
+    ref_results = {
+        "getWorldProvider": ("world-provider", "baritone.api.cache.IWorldProvider"),
+        "getCurrentWorld": ("world-data", "baritone.api.cache.IWorldData"),
+        "getCachedWorld": ("cached-world", "baritone.api.cache.ICachedWorld"),
+    }
+
+    async def handler(websocket: ServerConnection):
+        async for message in websocket:
+            request = decode_message(message)
+            method = request.get("method")
+
+            if method == "auth.login":
+                await websocket.send(
+                    encode_message(
+                        {
+                            "type": "response",
+                            "id": request["id"],
+                            "ok": True,
+                            "result": {"protocol_version": 2, "server_version": "test"},
+                        }
+                    )
+                )
+                continue
+
+            if method == "api.pipeline":
+                pipeline_requests.append(request["params"])
+                results = []
+                for step in request["params"]["steps"]:
+                    invoke_method = step["params"]["method"]
+                    if invoke_method in ref_results:
+                        ref_id, java_type = ref_results[invoke_method]
+                        value: Any = {"$pyritone_ref": ref_id, "java_type": java_type}
+                    else:
+                        value = False
+                    results.append({"ok": True, "result": {"value": value}})
+                await websocket.send(
+                    encode_message(
+                        {
+                            "type": "response",
+                            "id": request["id"],
+                            "ok": True,
+                            "result": {"results": results},
+                        }
+                    )
+                )
+                continue
+
+            await websocket.send(
+                encode_message(
+                    {
+                        "type": "response",
+                        "id": request["id"],
+                        "ok": False,
+                        "error": {"code": "METHOD_NOT_FOUND", "message": "Unknown"},
+                    }
+                )
+            )
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        async with client.baritone.pipeline() as pipeline:
+            world_data = pipeline.world_provider().call("getCurrentWorld")
+            cached_world = world_data.call(
+                "getCachedWorld",
+                wrap=CachedWorldRef,
+                expected_type="baritone.api.cache.ICachedWorld",
+            )
+            is_cached = cached_world.call("isCached", 4, 5, parameter_types=["int", "int"])
+            assert len(pipeline) == 4
+            assert not is_cached.done
+
+        assert len(pipeline_requests) == 1
+        steps = pipeline_requests[0]["steps"]
+        assert [step["params"]["method"] for step in steps] == [
+            "getWorldProvider",
+            "getCurrentWorld",
+            "getCachedWorld",
+            "isCached",
+        ]
+        assert steps[0]["params"]["target"] == {"kind": "root", "name": "baritone"}
+        assert steps[1]["params"]["target"] == {"$step": 0}
+        assert steps[2]["params"]["target"] == {"$step": 1}
+        assert steps[3]["params"]["target"] == {"$step": 2}
+        assert steps[3]["params"]["args"] == [4, 5]
+
+        assert steps[3]["params"]["parameter_types"] == ["int", "int"]
+
+        assert is_cached.result() is False
+        assert world_data.result() == RemoteRef("world-data", "baritone.api.cache.IWorldData")
+        world = cached_world.result()
+        assert isinstance(world, CachedWorldRef)
+        assert world.ref == RemoteRef("cached-world", "baritone.api.cache.ICachedWorld")
+        assert world._client is client
+        assert world._baritone is client.baritone
+        # Recording goes straight to the pipeline; the accessor cache is never consulted.
+        assert client.baritone.accessor_cache_stats == {"hits": 0, "misses": 0, "invalidations": 0, "size": 0}
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_baritone_pipeline_passes_step_values_as_arguments():
+    bridge = LoopbackBridge()
+    pipeline_requests: list[dict[str, Any]] = []
+
+    @bridge.method("api.pipeline")
+    def api_pipeline(params, session):
+        pipeline_requests.append(params)
+        return {
+            "results": [
+                {"ok": True, "result": {"value": {"$pyritone_ref": "block-pos", "java_type": "net.minecraft.class_2338"}}},
+                {"ok": True, "result": {"value": {"$pyritone_ref": "goal-near", "java_type": "baritone.api.pathing.goals.GoalNear"}}},
+                {"ok": True, "result": {"value": {"$pyritone_ref": "custom-goal", "java_type": "baritone.api.process.ICustomGoalProcess"}}},
+                {"ok": True, "result": {"value": None}},
+            ]
+        }
+
+    client = AsyncPyritoneClient(transport=bridge)
+    try:
+        await client.connect()
+        async with client.baritone.pipeline() as pipeline:
+            pos = pipeline.construct("net.minecraft.class_2338", 1, 2, 3, parameter_types=["int", "int", "int"])
+            goal = pipeline.construct(
+                "baritone.api.pathing.goals.GoalNear",
+                pos,
+                4,
+                parameter_types=["net.minecraft.class_2338", "int"],
+                wrap=GoalRef,
+            )
+            process = pipeline.custom_goal_process()
+            set_goal = process.call("setGoal", goal, parameter_types=["baritone.api.pathing.goals.Goal"])
+
+        steps = pipeline_requests[0]["steps"]
+        assert [step["method"] for step in steps] == ["api.construct", "api.construct", "api.invoke", "api.invoke"]
+        assert steps[1]["params"]["args"] == [{"$step": 0}, 4]
+        assert steps[2]["params"]["target"] == {"kind": "root", "name": "baritone"}
+        assert steps[3]["params"]["target"] == {"$step": 2}
+        assert steps[3]["params"]["args"] == [{"$step": 1}]
+
+        assert isinstance(goal.result(), GoalRef)
+        assert goal.result().ref == RemoteRef("goal-near", "baritone.api.pathing.goals.GoalNear")
+        assert isinstance(process.result(), CustomGoalProcessRef)
+        assert set_goal.result() is None
+        with pytest.raises(AttributeError):
+            pipeline.set_goal_and_path
+    finally:
+        await client.close()
+        await bridge.close()
+
+
+@pytest.mark.asyncio
+async def test_wait_for_timeout():
+    async def handler(websocket: ServerConnection):
+        async for message in websocket:
+            request = decode_message(message)
+            if request.get("method") == "auth.login":
+                await websocket.send(
+                    encode_message(
+                        {
+                            "type": "response",
+                            "id": request["id"],
+                            "ok": True,
+                            "result": {"protocol_version": 2, "server_version": "test"},
+                        }
+                    )
+                )
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        with pytest.raises(TimeoutError):
+            await client.wait_for("task.completed", timeout=0.05)
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_baritone_custom_goal_set_goal_and_path_waits_by_default():
+    observed_invokes: list[dict[str, Any]] = []
+    is_pathing_calls = 0
+
+    async def handler(websocket: ServerConnection):
+        nonlocal is_pathing_calls
 
         async for message in websocket:
             request = decode_message(message)
@@ -2457,6 +3698,242 @@ async def test_baritone_explore_dispatch_returns_handle_without_waiting():
         await server.wait_closed()
 
 
+@pytest.mark.asyncio
+async def test_watch_iterates_pushed_changes_and_unwatches_on_exit():
+    observed: list[tuple[str, dict[str, Any]]] = []
+
+    async def handler(websocket: ServerConnection):
+        async for message in websocket:
+            request = decode_message(message)
+            method = request.get("method")
+            params = request.get("params", {})
+            observed.append((method, params))
+
+            if method == "auth.login":
+                result: dict[str, Any] = {"session_id": "s"}
+            elif method == "api.watch":
+                result = {"watch_id": "watch-1", "every_ticks": 5, "value": False, "return_type": "boolean"}
+            elif method == "api.unwatch":
+                result = {"watch_id": params["watch_id"], "removed": True}
+            else:
+                result = {}
+
+            await websocket.send(encode_message({"type": "response", "id": request["id"], "ok": True, "result": result}))
+            if method == "api.watch":
+                # Pushed before the caller has resumed from the api.watch response.
+                for seq, value in ((1, True), (2, False)):
+                    await websocket.send(
+                        encode_message(
+                            {
+                                "type": "event",
+                                "event": "api.watch.changed",
+                                "data": {"watch_id": "watch-1", "seq": seq, "value": value, "active": True},
+                            }
+                        )
+                    )
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        values: list[Any] = []
+        async with client.watch(RemoteRef("ref-1", "baritone.api.behavior.IPathingBehavior"), "isPathing", every_ticks=5) as watch:
+            async for value in watch:
+                values.append(value)
+                if len(values) == 3:
+                    break
+
+        assert values == [False, True, False]
+        assert watch.closed is True
+        assert observed[1] == (
+            "api.watch",
+            {
+                "target": {"kind": "ref", "id": "ref-1"},
+                "method": "isPathing",
+                "args": [],
+                "every_ticks": 5,
+            },
+        )
+        assert observed[-1] == ("api.unwatch", {"watch_id": "watch-1"})
+        assert client._watches == {}
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_typed_task_wait_follows_pathing_activity_events():
+    observed_methods: list[str] = []
+
+    def activity(seq: int, *, pathing: bool, has_path: bool) -> str:
+        return encode_message(
+            {
+                "type": "event",
+                "event": "baritone.pathing_activity",
+                "data": {"seq": seq, "pathing": pathing, "calculating": False, "has_path": has_path, "busy": pathing},
+            }
+        )
+
+    async def handler(websocket: ServerConnection):
+        async for message in websocket:
+            request = decode_message(message)
+            method = request.get("method")
+
+            if method == "auth.login":
+                await websocket.send(
+                    encode_message(
+                        {
+                            "type": "response",
+                            "id": request["id"],
+                            "ok": True,
+                            "result": {"session_id": "s"},
+                        }
+                    )
+                )
+                await websocket.send(activity(0, pathing=False, has_path=False))
+                continue
+
+            if method == "api.invoke":
+                params = request["params"]
+                observed_methods.append(params["method"])
+                if params["method"] == "path":
+                    await websocket.send(
+                        encode_message(
+                            {
+                                "type": "response",
+                                "id": request["id"],
+                                "ok": True,
+                                "result": {"value": None, "return_type": "void"},
+                            }
+                        )
+                    )
+                    # A short task that starts and ends before the waiter wakes up.
+                    await websocket.send(activity(1, pathing=True, has_path=True))
+                    await websocket.send(activity(2, pathing=False, has_path=True))
+                    continue
+
+                if params["method"] in {"getCustomGoalProcess", "getPathingBehavior"}:
+                    ref_id = "custom-1" if params["method"] == "getCustomGoalProcess" else "pathing-1"
+                    await websocket.send(
+                        encode_message(
+                            {
+                                "type": "response",
+                                "id": request["id"],
+                                "ok": True,
+                                "result": {
+                                    "value": {"$pyritone_ref": ref_id, "java_type": "java.lang.Object"},
+                                    "return_type": "java.lang.Object",
+                                },
+                            }
+                        )
+                    )
+                    continue
+
+                if params["method"] == "getGoal":
+                    await websocket.send(
+                        encode_message(
+                            {
+                                "type": "response",
+                                "id": request["id"],
+                                "ok": True,
+                                "result": {"value": None, "return_type": "java.lang.Object"},
+                            }
+                        )
+                    )
+                    continue
+
+            await websocket.send(
+                encode_message(
+                    {
+                        "type": "response",
+                        "id": request["id"],
+                        "ok": False,
+                        "error": {"code": "METHOD_NOT_FOUND", "message": "Unknown"},
+                    }
+                )
+            )
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        process = await client.baritone.custom_goal_process()
+
+        handle = await process.path_dispatch()
+        result = await asyncio.wait_for(handle.wait(startup_timeout=5.0), timeout=1.0)
+
+        assert result.started is True
+        assert result.has_path is True
+        assert observed_methods == ["getCustomGoalProcess", "path", "getPathingBehavior", "getGoal"]
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_process_dispatches_keep_their_own_busy_marks():
+    first_path_id: list[str] = []
+
+    def response(request_id: str, value: Any = None) -> str:
+        return encode_message(
+            {"type": "response", "id": request_id, "ok": True, "result": {"value": value, "return_type": "java.lang.Object"}}
+        )
+
+    def activity(seq: int, *, pathing: bool) -> str:
+        return encode_message(
+            {
+                "type": "event",
+                "event": "baritone.pathing_activity",
+                "data": {"seq": seq, "pathing": pathing, "calculating": False, "has_path": True, "busy": pathing},
+            }
+        )
+
+    async def handler(websocket: ServerConnection):
+        async for message in websocket:
+            request = decode_message(message)
+            if request.get("method") == "auth.login":
+                await websocket.send(response(request["id"]))
+                await websocket.send(activity(0, pathing=False))
+                continue
+
+            method = request["params"].get("method")
+            if method in {"getCustomGoalProcess", "getPathingBehavior"}:
+                ref_id = "custom-1" if method == "getCustomGoalProcess" else "pathing-1"
+                await websocket.send(response(request["id"], {"$pyritone_ref": ref_id, "java_type": "java.lang.Object"}))
+            elif method == "path" and not first_path_id:
+                # The first dispatch starts and finishes a short task before its response arrives.
+                first_path_id.append(request["id"])
+                await websocket.send(activity(1, pathing=True))
+                await websocket.send(activity(2, pathing=False))
+            elif method == "path":
+                await websocket.send(response(request["id"]))
+                await websocket.send(response(first_path_id[0]))
+            else:
+                await websocket.send(response(request["id"]))
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        process = await client.baritone.custom_goal_process()
+
+        first = asyncio.create_task(process.path_dispatch())
+        while not first_path_id:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        await process.path_dispatch()
+        handle = await first
+
+        result = await asyncio.wait_for(handle.wait(startup_timeout=0.5), timeout=2.0)
+        assert result.started is True
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
 @pytest.mark.asyncio
 async def test_baritone_pathing_calc_wrappers_use_explicit_signatures():
     observed_invokes: list[dict[str, Any]] = []
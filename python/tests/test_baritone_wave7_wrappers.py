@@ -5,8 +5,9 @@ from typing import Any
 import pytest
 from websockets.asyncio.server import ServerConnection, serve
 
+from pyritone.baritone import CachedWorldRef
 from pyritone.client_async import AsyncPyritoneClient
-from pyritone.models import RemoteRef
+from pyritone.models import BlockPos, RemoteRef
 from pyritone.protocol import decode_message, encode_message
 
 
@@ -611,3 +612,95 @@ async def test_wave7_provider_schematic_and_utils_wrappers_use_explicit_signatur
         await client.close()
         server.close()
         await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_enum_constants_are_interned_per_session():
+    observed_invokes: list[dict[str, Any]] = []
+
+    async def handler(websocket: ServerConnection):
+        async for message in websocket:
+            request = decode_message(message)
+            method = request.get("method")
+
+            if method == "auth.login":
+                await websocket.send(
+                    encode_message(
+                        _ok_response(request, {"protocol_version": 2, "server_version": "test"}),
+                    )
+                )
+                continue
+
+            params = request["params"]
+            observed_invokes.append(params)
+            if params["method"] == "valueOf":
+                value: Any = params["args"][0]
+            else:
+                value = ["FORWARD", "BACK", "SNEAK"]
+            await websocket.send(encode_message(_ok_response(request, {"value": value, "return_type": "java.lang.Object"})))
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        assert await client.baritone.direction("north") == "NORTH"
+        assert await client.baritone.direction(" North ") == "NORTH"
+
+        interned = await client.baritone.prefetch_enum("baritone.api.utils.input.Input")
+        assert sorted(interned) == ["BACK", "FORWARD", "SNEAK"]
+        assert await client.baritone.input_key("sneak") == "SNEAK"
+
+        assert [call["method"] for call in observed_invokes] == ["valueOf", "values"]
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_materialized_locations_decode_inline_positions():
+    observed_invokes: list[dict[str, Any]] = []
+
+    async def handler(websocket: ServerConnection):
+        async for message in websocket:
+            request = decode_message(message)
+            method = request.get("method")
+
+            if method == "auth.login":
+                await websocket.send(
+                    encode_message(
+                        _ok_response(request, {"protocol_version": 2, "server_version": "test"}),
+                    )
+                )
+                continue
+
+            params = request["params"]
+            observed_invokes.append(params)
+            if params.get("materialize"):
+                value: Any = [
+                    {"$pyritone_value": "block_pos", "v": [1, 64, -3]},
+                    {"$pyritone_value": "block_pos", "v": [2, 65, -4]},
+                ]
+            else:
+                value = [{"$pyritone_ref": "ref-1", "java_type": "net.minecraft.class_2338"}]
+            await websocket.send(encode_message(_ok_response(request, {"value": value, "return_type": "java.util.ArrayList"})))
+
+    server, ws_url = await _start_server(handler)
+    client = AsyncPyritoneClient(ws_url=ws_url, token="token")
+    try:
+        await client.connect()
+        cached_world = CachedWorldRef(client, client.baritone, RemoteRef("cached-1", "baritone.api.cache.ICachedWorld"))
+
+        refs = await cached_world.locations_of("minecraft:diamond_ore", 16, 0, 0, 4)
+        assert refs == [RemoteRef("ref-1", "net.minecraft.class_2338")]
+
+        positions = await cached_world.locations_of("minecraft:diamond_ore", 16, 0, 0, 4, materialize=True)
+        assert positions == [BlockPos(1, 64, -3), BlockPos(2, 65, -4)]
+        assert positions[0].y == 64
+
+        assert "materialize" not in observed_invokes[0]
+        assert observed_invokes[1]["materialize"] is True
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
@@ -69,3 +69,24 @@ def test_ws_url_env_override(monkeypatch):
     assert resolved.port == 40000
     assert resolved.ws_url == "ws://10.0.0.5:40000/custom"
     assert resolved.ws_path == "/custom"
+
+
+def test_line_transport_is_preferred_when_advertised(tmp_path, monkeypatch):
+    info_file = tmp_path / "bridge-info.json"
+    info_file.write_text(
+        '{"host":"127.0.0.1","port":27841,"token":"file-token","transport":"ndjson",'
+        '"tcp_port":27842,"unix_socket":"/tmp/bridge.sock"}',
+        encoding="utf-8",
+    )
+    for name in ("PYRITONE_HOST", "PYRITONE_PORT", "PYRITONE_WS_URL"):
+        monkeypatch.delenv(name, raising=False)
+
+    resolved = discovery.resolve_bridge_info(bridge_info_path=info_file)
+    assert resolved.transport == "ndjson"
+    assert resolved.tcp_port == 27842
+    assert resolved.unix_socket == "/tmp/bridge.sock"
+    assert resolved.ws_url == "ws://127.0.0.1:27841/ws"
+
+    explicit = discovery.resolve_bridge_info(bridge_info_path=info_file, ws_url="ws://127.0.0.1:27841/ws")
+    assert explicit.transport == "websocket"
+    assert explicit.tcp_port is None
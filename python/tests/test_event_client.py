@@ -7,7 +7,7 @@ from typing import Any
 import pytest
 from websockets.asyncio.server import ServerConnection, serve
 
-from pyritone import Client
+from pyritone import Client, LoopbackBridge
 from pyritone.client_event import Client as EventClient
 from pyritone.protocol import decode_message, encode_message
 
@@ -354,3 +354,173 @@ async def test_wait_for_raw_dotted_name_passthrough():
         await asyncio.wait_for(start_task, timeout=1.0)
         server.close()
         await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_event_handlers_get_ordered_bounded_queues():
+    client = EventClient(ws_url="ws://127.0.0.1:1/ws", token="token")
+    release = asyncio.Event()
+    seen_chat: list[str] = []
+    seen_join: list[str] = []
+
+    @client.event(max_queue=2)
+    async def on_chat_message(ctx):
+        await release.wait()
+        seen_chat.append(ctx.message)
+
+    @client.event
+    async def on_player_join(ctx):
+        seen_join.append(ctx.player.name)
+
+    for text in ("a", "b", "c", "d"):
+        client._route_raw_event(  # noqa: SLF001
+            _event("minecraft.chat_message", {"message": text, "author": {"uuid": "u2", "name": "Other"}})
+        )
+        await asyncio.sleep(0)
+    client._route_raw_event(  # noqa: SLF001
+        _event("minecraft.player_join", {"player": {"uuid": "u3", "name": "Alex"}})
+    )
+    await asyncio.sleep(0.01)
+
+    # The blocked chat handler does not hold up other handlers.
+    assert seen_join == ["Alex"]
+    stats = {item["handler"]: item for item in client.handler_stats}
+    assert stats["on_chat_message"]["running"] == 1
+    assert stats["on_chat_message"]["queued"] == 2
+    assert stats["on_chat_message"]["dropped"] == 1
+
+    release.set()
+    await asyncio.sleep(0.01)
+    assert seen_chat == ["a", "c", "d"]
+    stats = {item["handler"]: item for item in client.handler_stats}
+    assert stats["on_chat_message"]["calls"] == 3
+    assert stats["on_chat_message"]["max_queued"] == 2
+    assert stats["on_chat_message"]["max_ms"] >= stats["on_chat_message"]["avg_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_coalesce_handler_only_sees_latest_pending_event():
+    client = EventClient(ws_url="ws://127.0.0.1:1/ws", token="token")
+    release = asyncio.Event()
+    seen: list[int] = []
+
+    @client.event(overflow="coalesce")
+    async def on_status_update(payload):
+        await release.wait()
+        seen.append(payload["data"]["n"])
+
+    for n in range(5):
+        client._route_raw_event(_event("status.update", {"n": n}))  # noqa: SLF001
+        await asyncio.sleep(0)
+    release.set()
+    await asyncio.sleep(0.01)
+
+    assert seen == [0, 4]
+    assert client.handler_stats[0]["dropped"] == 3
+
+    with pytest.raises(ValueError):
+        client.event(overflow="newest")
+
+
+@pytest.mark.asyncio
+async def test_start_returns_after_close_while_handler_is_blocked():
+    bridge = LoopbackBridge()
+    client = EventClient(transport=bridge)
+    handler_started = asyncio.Event()
+    handler_cancelled = asyncio.Event()
+    disconnected = asyncio.Event()
+
+    @client.event
+    async def on_ready():
+        await bridge.publish("task.started", {"task_id": "task-1"})
+        await bridge.publish("task.started", {"task_id": "task-2"})
+
+    @client.event
+    async def on_task_started(ctx):
+        handler_started.set()
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            handler_cancelled.set()
+            raise
+
+    @client.event
+    async def on_disconnect():
+        disconnected.set()
+
+    runner = asyncio.create_task(client.start())
+    try:
+        await asyncio.wait_for(handler_started.wait(), timeout=2.0)
+        await client.close()
+        await asyncio.wait_for(runner, timeout=2.0)
+    finally:
+        await bridge.close()
+
+    assert handler_cancelled.is_set()
+    assert disconnected.is_set()
+    assert client.handler_stats[0]["dropped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_matches_events_during_filter_push_and_bounds_it_by_timeout():
+    bridge = LoopbackBridge()
+    release_subscribe = asyncio.Event()
+    subscribe_calls = 0
+
+    @bridge.method("events.subscribe")
+    async def events_subscribe(params, session):
+        nonlocal subscribe_calls
+        subscribe_calls += 1
+        if subscribe_calls > 1:
+            await release_subscribe.wait()
+        return {"include": params.get("include"), "exclude": params.get("exclude")}
+
+    client = EventClient(transport=bridge)
+    ready = asyncio.Event()
+
+    @client.event
+    async def on_ready():
+        ready.set()
+
+    runner = asyncio.create_task(client.start())
+    try:
+        await asyncio.wait_for(ready.wait(), timeout=1.0)
+        await client.events_subscribe(include=["task.*"])
+
+        message = asyncio.create_task(client.wait_for("message", timeout=1.0))
+        for _ in range(100):
+            if subscribe_calls == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert subscribe_calls == 2
+        await bridge.publish(
+            "minecraft.chat_message",
+            {"message": "hi", "author": {"uuid": "u2", "name": "Other", "self": False}},
+        )
+        context = await asyncio.wait_for(message, timeout=0.5)
+        assert context.message == "hi"
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with pytest.raises(TimeoutError):
+            await client.wait_for("system_message", timeout=0.05)
+        assert loop.time() - started < 0.5
+        assert "minecraft.system_message" in client.event_filter["include"]
+    finally:
+        release_subscribe.set()
+        await client.close()
+        await asyncio.wait_for(runner, timeout=1.0)
+        await bridge.close()
+
+
+def test_player_view_is_memoized_per_state_version():
+    client = EventClient(ws_url="ws://127.0.0.1:1/ws", token="token")
+    assert client.player is None
+
+    client.raw.state._replace({"player": {"uuid": "u1", "name": "Steve", "self": True}})  # noqa: SLF001
+    first = client.player
+    assert first is not None and first.name == "Steve"
+    assert client.player is first
+
+    client.raw.state._replace({"player": {"uuid": "u1", "name": "Alex", "self": True}})  # noqa: SLF001
+    assert client.player.name == "Alex"
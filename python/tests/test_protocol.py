@@ -1,6 +1,19 @@
+import json
+
 import pytest
 
-from pyritone.protocol import decode_line, decode_message, encode_line, encode_message, new_request
+from pyritone import cbor
+from pyritone.protocol import (
+    JsonCodec,
+    decode_binary_message,
+    decode_line,
+    decode_message,
+    encode_binary_message,
+    encode_line,
+    encode_message,
+    get_codec,
+    new_request,
+)
 
 
 def test_new_request_shape():
@@ -51,3 +64,80 @@ def test_decode_line_accepts_text_input():
 def test_decode_line_rejects_non_object_payloads():
     with pytest.raises(ValueError, match="JSON object"):
         decode_line("[]")
+
+
+def test_binary_message_roundtrip():
+    payload = {
+        "type": "event",
+        "event": "baritone.path_event",
+        "data": {"path_event": "CALC_STARTED", "seq": 12, "delta": -3, "percent": 42.5, "goal": None, "ok": True},
+        "ts": "2026-01-01T00:00:00Z",
+    }
+    encoded = encode_binary_message(payload)
+
+    assert isinstance(encoded, bytes)
+    assert len(encoded) < len(encode_message(payload))
+    assert decode_binary_message(encoded) == payload
+
+
+def test_pure_cbor_matches_reference_encoding():
+    assert cbor.dumps({"a": 1}) == bytes.fromhex("a1616101")
+    assert cbor.dumps({"n": 7, "x": 1.5}) == bytes.fromhex("a2616e076178fb3ff8000000000000")
+    assert cbor.dumps([-1, -500, 2**32]) == bytes.fromhex("83203901f31b0000000100000000")
+    assert cbor.loads(bytes.fromhex("f93c00")) == 1.0
+    assert cbor.loads(bytes.fromhex("c11a514b67b0")) == 1363896240
+
+
+def test_decode_binary_message_rejects_non_map_payloads():
+    with pytest.raises(ValueError, match="CBOR map"):
+        decode_binary_message(cbor.dumps([1, 2]))
+    with pytest.raises(ValueError, match="Truncated"):
+        cbor.loads(bytes.fromhex("a161"))
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_json_codecs_roundtrip_raw_bytes(name):
+    if name != "json":
+        pytest.importorskip(name)
+    codec = get_codec(name)
+    payload = {"type": "event", "event": "task.progress", "data": {"task_id": "x", "percent": 0.5, "n": -3}}
+
+    encoded = codec.dumps(payload)
+    raw = encoded if isinstance(encoded, bytes) else encoded.encode("utf-8")
+
+    assert codec.name == name
+    assert decode_message(raw, codec) == payload
+    assert encode_message(payload, codec) == '{"type":"event","event":"task.progress","data":{"task_id":"x","percent":0.5,"n":-3}}'
+    assert codec.dumps_sorted({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_get_codec_resolves_names_and_instances():
+    stdlib = JsonCodec()
+
+    assert get_codec(stdlib) is stdlib
+    assert get_codec().name == "json"
+    assert get_codec(None).name == "json"
+    assert get_codec("auto").name in {"orjson", "msgspec", "json"}
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        get_codec("yaml")
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_json_codecs_encode_non_string_keys_like_stdlib(name):
+    if name != "json":
+        pytest.importorskip(name)
+    codec = get_codec(name)
+
+    assert encode_message({"type": "request", "params": {1: 2}}, codec) == '{"type":"request","params":{"1":2}}'
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_json_codecs_encode_integers_beyond_64_bits_like_stdlib(name):
+    if name != "json":
+        pytest.importorskip(name)
+    codec = get_codec(name)
+    payload = {"type": "request", "params": {"seed": 2**70, "negative": -(2**65)}}
+
+    assert encode_message(payload, codec) == json.dumps(payload, separators=(",", ":"))
@@ -0,0 +1,313 @@
+import asyncio
+import json
+
+import pytest
+
+from pyritone import BridgeError, LoopbackBridge, ReconnectPolicy, RequestInterruptedError
+from pyritone.client_async import AsyncPyritoneClient
+from pyritone.protocol import decode_message, encode_line
+from pyritone.transport import TransportClosed, loopback_pair
+
+
+@pytest.mark.asyncio
+async def test_loopback_pair_delivers_frames_and_reports_clean_close():
+    left, right = loopback_pair()
+
+    await left.send('{"type":"event"}')
+    await right.send(b"\xa0", binary=True)
+    assert await right.recv() == b'{"type":"event"}'
+    assert await left.recv() == b"\xa0"
+
+    await left.close()
+    with pytest.raises(TransportClosed) as closed:
+        await right.recv()
+    assert closed.value.clean is True
+    with pytest.raises(TransportClosed):
+        await right.send("{}")
+
+
+@pytest.mark.asyncio
+async def test_client_runs_requests_and_events_over_loopback_bridge():
+    bridge = LoopbackBridge()
+
+    @bridge.method("status.get")
+    def status_get(params, session):
+        return {"in_world": True, "active_task": None}
+
+    @bridge.method("baritone.execute")
+    async def execute(params, session):
+        raise BridgeError("NOT_IN_WORLD", "Join a world before executing commands")
+
+    client = AsyncPyritoneClient(transport=bridge)
+    try:
+        await client.connect()
+        assert client.bridge_info.transport == "loopback"
+
+        for _ in range(200):
+            assert (await client.ping())["pong"] is True
+        status = await client.status_get()
+        assert status["in_world"] is True
+        assert client.state.snapshot["in_world"] is True
+
+        with pytest.raises(BridgeError) as error:
+            await client.execute("goto 1 2 3")
+        assert error.value.code == "NOT_IN_WORLD"
+
+        event = asyncio.create_task(client.wait_for("task.started", timeout=1.0))
+        await asyncio.sleep(0)
+        await bridge.publish("task.started", {"task_id": "task-1"})
+        assert (await event)["data"]["task_id"] == "task-1"
+        (session,) = bridge.sessions
+        assert session.requests[0] == "auth.login"
+    finally:
+        await client.close()
+        await bridge.close()
+    assert not bridge.sessions
+
+
+@pytest.mark.asyncio
+async def test_loopback_bridge_reports_handler_failures_as_internal_error_and_keeps_serving():
+    bridge = LoopbackBridge()
+    assert bridge.codec.name == "json"
+
+    @bridge.method("status.get")
+    def status_get(params, session):
+        raise KeyError("player")
+
+    client = AsyncPyritoneClient(transport=bridge)
+    try:
+        await client.connect()
+        with pytest.raises(BridgeError) as error:
+            await client.status_get()
+        assert error.value.code == "INTERNAL_ERROR"
+        assert error.value.details["cause_type"] == "KeyError"
+        assert (await client.ping())["pong"] is True
+    finally:
+        await client.close()
+        await bridge.close()
+
+
+@pytest.mark.asyncio
+async def test_loopback_bridge_rejects_wrong_token_and_closing_bridge_disconnects_client():
+    bridge = LoopbackBridge(token="secret")
+
+    async def without_bridge_info(info, **kwargs):
+        return await bridge(info, **kwargs)
+
+    rejected = AsyncPyritoneClient(transport=without_bridge_info, token="wrong", ws_url="ws://127.0.0.1:1/ws")
+    with pytest.raises(BridgeError) as error:
+        await rejected.connect()
+    assert error.value.code == "UNAUTHORIZED"
+
+    client = AsyncPyritoneClient(transport=bridge)
+    await client.connect()
+    pending = asyncio.create_task(client.wait_for("task.completed"))
+    await asyncio.sleep(0)
+    await bridge.close()
+    with pytest.raises(ConnectionError):
+        await pending
+    assert client._closed is True  # noqa: SLF001
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_client_prefers_advertised_line_transport(tmp_path, monkeypatch):
+    for name in ("PYRITONE_HOST", "PYRITONE_PORT", "PYRITONE_WS_URL", "PYRITONE_TOKEN", "PYRITONE_BRIDGE_INFO"):
+        monkeypatch.delenv(name, raising=False)
+    received: list[str] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while line := await reader.readline():
+            request = decode_message(line)
+            received.append(request["method"])
+            result = {"pong": True} if request["method"] == "ping" else {"protocol_version": 2}
+            writer.write(encode_line({"type": "response", "id": request["id"], "ok": True, "result": result}))
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    tcp_port = server.sockets[0].getsockname()[1]
+    info_file = tmp_path / "bridge-info.json"
+    info_file.write_text(
+        json.dumps({"port": 1, "token": "token", "transport": "ndjson", "tcp_port": tcp_port}),
+        encoding="utf-8",
+    )
+
+    client = AsyncPyritoneClient(bridge_info_path=str(info_file))
+    try:
+        await client.connect()
+        assert client.bridge_info.transport == "ndjson"
+        assert (await client.ping())["pong"] is True
+        assert received == ["auth.login", "ping"]
+    finally:
+        await client.close()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_replays_session_and_retries_only_idempotent_requests():
+    bridge = LoopbackBridge()
+    release_first_session = asyncio.Event()
+    sessions = []
+
+    @bridge.method("auth.login")
+    def login(params, session):
+        sessions.append(session)
+        session.authenticated = True
+        return {"protocol_version": 2}
+
+    @bridge.method("status.get")
+    def status_get(params, session):
+        return {"in_world": True, "active_task": None}
+
+    @bridge.method("status.subscribe")
+    def status_subscribe(params, session):
+        return {"status": {"in_world": True, "active_task": None}}
+
+    @bridge.method("events.subscribe")
+    def events_subscribe(params, session):
+        return {"include": params["include"]}
+
+    @bridge.method("entities.list")
+    async def entities_list(params, session):
+        if session is sessions[0]:
+            await release_first_session.wait()
+        return {"entities": []}
+
+    @bridge.method("baritone.execute")
+    def execute(params, session):
+        return {"task_id": "task-1"}
+
+    client = AsyncPyritoneClient(transport=bridge, reconnect=ReconnectPolicy(initial_delay=0.01, jitter=0))
+    try:
+        await client.connect()
+        await client.status_subscribe()
+        await client.events_subscribe(include=["task.*"])
+        waiter = asyncio.create_task(client.wait_for("task.completed", timeout=5.0))
+        listing = asyncio.create_task(client.entities_list())
+        executing = asyncio.create_task(client.execute("goto 1 2 3"))
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        await sessions[0].close()
+        release_first_session.set()
+
+        with pytest.raises(RequestInterruptedError) as interrupted:
+            await executing
+        assert interrupted.value.method == "baritone.execute"
+        assert await listing == []
+        assert len(sessions) == 2
+        assert sessions[1].requests == ["auth.login", "events.subscribe", "status.get", "status.subscribe", "entities.list"]
+
+        await sessions[1].send_event("task.completed", {"task_id": "task-1"})
+        assert (await waiter)["data"]["task_id"] == "task-1"
+        assert client._closed is False  # noqa: SLF001
+    finally:
+        await client.close()
+        await bridge.close()
+    await client.wait_closed()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_gives_up_after_max_attempts():
+    bridge = LoopbackBridge()
+    connects = 0
+
+    async def flaky(info, **kwargs):
+        nonlocal connects
+        connects += 1
+        if connects > 1:
+            raise ConnectionRefusedError("bridge is restarting")
+        return await bridge(info, **kwargs)
+
+    client = AsyncPyritoneClient(
+        transport=flaky,
+        token="loopback",
+        ws_url="ws://127.0.0.1:1/ws",
+        reconnect=ReconnectPolicy(initial_delay=0.01, max_attempts=2),
+    )
+    await client.connect()
+    waiter = asyncio.create_task(client.wait_for("task.completed"))
+    await asyncio.sleep(0)
+    (session,) = bridge.sessions
+    await session.close()
+
+    with pytest.raises(ConnectionError, match="after 2 attempts"):
+        await waiter
+    await asyncio.wait_for(client.wait_closed(), timeout=1.0)
+    assert connects == 3
+    with pytest.raises(RuntimeError):
+        await client.ping()
+    await bridge.close()
+
+
+def test_reconnect_policy_delay_stays_finite_for_long_outages():
+    policy = ReconnectPolicy(jitter=0)
+
+    assert policy.delay(0) == 0.5
+    assert policy.delay(5000) == policy.max_delay
+    assert ReconnectPolicy(multiplier=1e9, jitter=0).delay(100) == policy.max_delay
+
+
+@pytest.mark.asyncio
+async def test_requests_wait_out_reconnect_beyond_timeout_unless_reconnect_wait_caps_it():
+    bridge = LoopbackBridge()
+
+    @bridge.method("status.get")
+    def status_get(params, session):
+        return {"in_world": True, "active_task": None}
+
+    client = AsyncPyritoneClient(
+        transport=bridge,
+        timeout=0.05,
+        reconnect=ReconnectPolicy(initial_delay=0.2, jitter=0),
+    )
+    capped = AsyncPyritoneClient(
+        transport=bridge,
+        timeout=0.05,
+        reconnect=ReconnectPolicy(initial_delay=0.5, jitter=0, reconnect_wait=0.05),
+    )
+    try:
+        await client.connect()
+        await capped.connect()
+        for session in bridge.sessions:
+            await session.close()
+
+        assert (await client.ping())["pong"] is True
+        with pytest.raises(ConnectionError, match="still in progress"):
+            await capped.ping()
+    finally:
+        await client.close()
+        await capped.close()
+        await bridge.close()
+
+
+@pytest.mark.asyncio
+async def test_requests_fail_when_reconnect_supervisor_fails_and_closes_client():
+    class SlowPolicy(ReconnectPolicy):
+        def delay(self, attempt):
+            if attempt:
+                raise RuntimeError("backoff exploded")
+            return 0.2
+
+    bridge = LoopbackBridge()
+    client = AsyncPyritoneClient(transport=bridge, timeout=0.05, reconnect=SlowPolicy())
+    await client.connect()
+    waiter = asyncio.create_task(client.wait_for("task.completed"))
+    await asyncio.sleep(0)
+    (session,) = bridge.sessions
+
+    async def reject_next_login(info, **kwargs):
+        raise ConnectionRefusedError("bridge is restarting")
+
+    client._transport_factory = reject_next_login  # noqa: SLF001
+    await session.close()
+    with pytest.raises(ConnectionError, match="closed before it reconnected"):
+        await client.ping()
+
+    with pytest.raises(ConnectionError, match="backoff exploded"):
+        await waiter
+    await asyncio.wait_for(client.wait_closed(), timeout=1.0)
+    assert client._closed is True  # noqa: SLF001
+    await bridge.close()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from pyritone import cbor as pure_cbor  # noqa: E402
+from pyritone.protocol import get_codec  # noqa: E402
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+# Representative envelopes shaped like the bridge's hot event streams.
+FRAMES: dict[str, dict[str, Any]] = {
+    "task.progress": {
+        "type": "event",
+        "event": "task.progress",
+        "data": {
+            "task_id": "0f5b7d2e-8a41-4c55-9a7e-2f1f0e6d3c11",
+            "command": "goto 100 70 100",
+            "state": "RUNNING",
+            "started_at": "2026-01-01T00:00:00Z",
+            "updated_at": "2026-01-01T00:00:03.250Z",
+            "detail": "Pathing toward goal",
+            "stage": "command_accepted",
+        },
+        "ts": "2026-01-01T00:00:03.251Z",
+    },
+    "status.update": {
+        "type": "event",
+        "event": "status.update",
+        "data": {
+            "protocol_version": 2,
+            "server_version": "0.2.0",
+            "host": "127.0.0.1",
+            "port": 27841,
+            "authenticated": True,
+            "baritone_available": True,
+            "in_world": True,
+            "active_task": {
+                "task_id": "0f5b7d2e-8a41-4c55-9a7e-2f1f0e6d3c11",
+                "command": "goto 100 70 100",
+                "state": "RUNNING",
+                "started_at": "2026-01-01T00:00:00Z",
+                "updated_at": "2026-01-01T00:00:03.250Z",
+            },
+            "watch_patterns": [],
+            "player": {"uuid": "8667ba71-b85a-4004-af54-457a9734eed7", "name": "Steve", "is_self": True},
+        },
+        "ts": "2026-01-01T00:00:03.300Z",
+    },
+    "baritone.path_event": {
+        "type": "event",
+        "event": "baritone.path_event",
+        "data": {"path_event": "CALC_FINISHED_NOW_EXECUTING", "task_id": "0f5b7d2e-8a41-4c55-9a7e-2f1f0e6d3c11"},
+        "ts": "2026-01-01T00:00:03.400Z",
+    },
+    "api.invoke response": {
+        "type": "response",
+        "id": "5d4c2c59-5a0b-4e0e-8d60-0a4d2b2b9f10",
+        "ok": True,
+        "result": {
+            "value": [[x, 64, -x * 3] for x in range(-32, 32)],
+            "return_type": "java.util.List",
+        },
+    },
+}
+
+
+def _per_call_us(fn: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) * 1_000_000 / iterations
+
+
+def _codecs() -> list[tuple[str, Callable[[dict[str, Any]], Any], Callable[[Any], Any]]]:
+    codecs: list[tuple[str, Callable[[dict[str, Any]], Any], Callable[[Any], Any]]] = []
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            json_codec = get_codec(name)
+        except ImportError:
+            continue
+        codecs.append((name, json_codec.dumps, json_codec.loads))
+    codecs.append(("cbor (pure)", pure_cbor.dumps, pure_cbor.loads))
+    if cbor2 is not None:
+        codecs.append(("cbor (cbor2)", cbor2.dumps, cbor2.loads))
+    return codecs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare bridge frame size and codec CPU for the JSON backends and CBOR")
+    parser.add_argument("--iterations", type=int, default=20_000, help="Encode/decode calls per measurement")
+    args = parser.parse_args()
+
+    print(f"{'frame':<22} {'codec':<14} {'bytes':>7} {'saved':>7} {'encode us':>10} {'decode us':>10}")
+    for frame_name, payload in FRAMES.items():
+        baseline_size: int | None = None
+        for codec_name, encode, decode in _codecs():
+            encoded = encode(payload)
+            if isinstance(encoded, str):
+                encoded = encoded.encode("utf-8")
+            assert decode(encoded) == payload, f"{codec_name} failed to round-trip {frame_name}"
+            size = len(encoded)
+            if baseline_size is None:
+                baseline_size = size
+            saved = 1.0 - size / baseline_size
+            encode_us = _per_call_us(lambda: encode(payload), args.iterations)
+            decode_us = _per_call_us(lambda: decode(encoded), args.iterations)
+            print(
+                f"{frame_name:<22} {codec_name:<14} {size:>7} {saved:>6.1%} {encode_us:>10.2f} {decode_us:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
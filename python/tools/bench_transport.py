@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from websockets.asyncio.server import serve  # noqa: E402
+
+from pyritone.client_async import AsyncPyritoneClient  # noqa: E402
+from pyritone.models import BridgeInfo  # noqa: E402
+from pyritone.protocol import decode_message, encode_line, encode_message  # noqa: E402
+from pyritone.transport import LoopbackBridge, resolve_transport_factory  # noqa: E402
+
+TOKEN = "bench-token"
+
+
+def _response(message: bytes | str) -> dict[str, Any]:
+    request = decode_message(message)
+    result = {"pong": True} if request.get("method") == "ping" else {"protocol_version": 2, "server_version": "bench"}
+    return {"type": "response", "id": request["id"], "ok": True, "result": result}
+
+
+class _PinnedTransport:
+    """Named transport factory pinned to a stub endpoint, so the client skips discovery."""
+
+    def __init__(self, name: str, info: BridgeInfo) -> None:
+        self._connect = resolve_transport_factory(name)
+        self.bridge_info = info
+
+    def __call__(self, info: BridgeInfo, **kwargs: Any):
+        return self._connect(info, **kwargs)
+
+
+@contextlib.asynccontextmanager
+async def _websocket_stub() -> AsyncIterator[_PinnedTransport]:
+    async def handler(websocket) -> None:
+        async for message in websocket:
+            await websocket.send(encode_message(_response(message)))
+
+    async with serve(handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        info = BridgeInfo(host="127.0.0.1", port=port, token=TOKEN, ws_url=f"ws://127.0.0.1:{port}/ws")
+        yield _PinnedTransport("websocket", info)
+
+
+async def _line_handler(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    while line := await reader.readline():
+        writer.write(encode_line(_response(line)))
+        await writer.drain()
+    writer.close()
+
+
+@contextlib.asynccontextmanager
+async def _tcp_stub() -> AsyncIterator[_PinnedTransport]:
+    server = await asyncio.start_server(_line_handler, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    info = BridgeInfo(
+        host="127.0.0.1", port=0, token=TOKEN, ws_url="ws://127.0.0.1:0/ws", transport="ndjson", tcp_port=port
+    )
+    try:
+        yield _PinnedTransport("ndjson", info)
+    finally:
+        server.close()
+        await server.wait_closed()
+
+
+@contextlib.asynccontextmanager
+async def _unix_stub() -> AsyncIterator[_PinnedTransport]:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bridge.sock")
+        server = await asyncio.start_unix_server(_line_handler, path)
+        info = BridgeInfo(
+            host="127.0.0.1",
+            port=0,
+            token=TOKEN,
+            ws_url="ws://127.0.0.1:0/ws",
+            transport="ndjson",
+            tcp_port=0,
+            unix_socket=path,
+        )
+        try:
+            yield _PinnedTransport("ndjson", info)
+        finally:
+            server.close()
+            await server.wait_closed()
+
+
+async def _measure(client: AsyncPyritoneClient, iterations: int, warmup: int) -> list[float]:
+    await client.connect()
+    try:
+        for _ in range(warmup):
+            await client.ping()
+        samples: list[float] = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            await client.ping()
+            samples.append((time.perf_counter() - start) * 1_000_000)
+        return samples
+    finally:
+        await client.close()
+
+
+def _report(name: str, samples: list[float]) -> None:
+    ordered = sorted(samples)
+    p50 = statistics.median(ordered)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    rate = 1_000_000 / statistics.fmean(ordered)
+    print(f"{name:<18} {p50:>10.1f} {p99:>10.1f} {rate:>12.0f}")
+
+
+async def _run_stubs(iterations: int, warmup: int) -> None:
+    stubs = [("websocket", _websocket_stub), ("ndjson tcp", _tcp_stub)]
+    if hasattr(asyncio, "start_unix_server"):
+        stubs.append(("ndjson unix", _unix_stub))
+
+    for name, stub in stubs:
+        async with stub() as transport:
+            _report(name, await _measure(AsyncPyritoneClient(transport=transport), iterations, warmup))
+
+    loopback = LoopbackBridge(token=TOKEN)
+    _report("loopback", await _measure(AsyncPyritoneClient(transport=loopback), iterations, warmup))
+    await loopback.close()
+
+
+async def _run_live(iterations: int, warmup: int) -> None:
+    for name in ("websocket", "ndjson"):
+        try:
+            samples = await _measure(AsyncPyritoneClient(transport=name), iterations, warmup)
+        except Exception as error:  # noqa: BLE001 - report and continue with the next transport
+            print(f"{name:<18} unavailable: {error}")
+            continue
+        _report(name, samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare ping round-trip latency over the WebSocket and line transports")
+    parser.add_argument("--iterations", type=int, default=5_000, help="Measured ping round trips per transport")
+    parser.add_argument("--warmup", type=int, default=200, help="Unmeasured round trips before sampling")
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Measure against the running bridge (discovery) instead of in-process echo stubs",
+    )
+    args = parser.parse_args()
+    logging.getLogger("pyritone").setLevel(logging.WARNING)
+
+    print(f"{'transport':<18} {'p50 us':>10} {'p99 us':>10} {'round trips/s':>12}")
+    runner = _run_live if args.live else _run_stubs
+    asyncio.run(runner(args.iterations, args.warmup))
+
+
+if __name__ == "__main__":
+    main()